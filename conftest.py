@@ -2,11 +2,17 @@
 
 pytest_plugins = [
     # Plugins
+    # first, a xdist worker loads its settings when importing it
+    "pytest_plugins.settings_snapshot",
     "pytest_plugins.rerun_rp.rerun_rp",
     "pytest_plugins.markers",
     "pytest_plugins.issue_handlers",
     "pytest_plugins.testimony_markers",
     "pytest_plugins.manual_skipped",
+    "pytest_plugins.cleanup_scheduler",
+    "pytest_plugins.lock_metrics",
+    "pytest_plugins.collection_profile",
+    "pytest_plugins.manifest_pool",
     # Fixtures
     "pytest_fixtures.api_fixtures",
     "pytest_fixtures.xdist",
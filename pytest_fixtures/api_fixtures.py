@@ -2,10 +2,9 @@
 import pytest
 from fauxfactory import gen_string
 from nailgun import entities
-from wrapanapi import AzureSystem
-from wrapanapi import GoogleCloudSystem
 
 from robottelo.api.utils import publish_puppet_module
+from robottelo.config import settings
 from robottelo.constants import AZURERM_RG_DEFAULT
 from robottelo.constants import AZURERM_RHEL7_FT_BYOS_IMG_URN
 from robottelo.constants import AZURERM_RHEL7_FT_CUSTOM_IMG_URN
@@ -23,12 +22,13 @@ from robottelo.constants import RHEL_6_MAJOR_VERSION
 from robottelo.constants import RHEL_7_MAJOR_VERSION
 from robottelo.constants.repos import CUSTOM_PUPPET_REPO
 from robottelo.helpers import download_gce_cert
-from robottelo.test import settings
+from robottelo.utils.lazy import LazyImport
 
-# Global Satellite Entities
+# the cloud SDKs are imported only when a fixture connecting to a cloud is used
+AzureSystem = LazyImport('wrapanapi', 'AzureSystem')
+GoogleCloudSystem = LazyImport('wrapanapi', 'GoogleCloudSystem')
 
-if not settings.configured:
-    settings.configure()
+# Global Satellite Entities
 
 
 @pytest.fixture(scope='session')
@@ -423,12 +423,13 @@ def default_contentview(module_org):
     )
 
 
-@pytest.mark.skipif((not settings.repos_hosting_url), reason='Missing repos_hosting_url')
 @pytest.fixture(scope='module')
 def module_cv_with_puppet_module(module_org):
     """Returns content view entity created by publish_puppet_module with chosen
     name and author of puppet module, custom puppet repository and organization.
     """
+    if not settings.repos_hosting_url:
+        pytest.skip('Missing repos_hosting_url')
     return publish_puppet_module(
         [{'author': 'robottelo', 'name': 'generic_1'}],
         CUSTOM_PUPPET_REPO,
@@ -1,13 +1,19 @@
 """Fixtures specific to or relating to pytest's xdist plugin"""
 import pytest
 
+from pytest_plugins.settings_snapshot import is_snapshot_loaded
+from robottelo.config import compile_settings
 from robottelo.config import settings
 
 
 @pytest.fixture(scope="session", autouse=True)
 def align_xdist_satellites(worker_id):
     """Set a different Satellite per worker when available in robottelo's config"""
+    if is_snapshot_loaded():
+        # already aligned by the settings snapshot sent by the xdist controller
+        return
     settings.configure()
     settings.server.hostname = settings.server.get_hostname(worker_id)
+    compile_settings()
     settings._configure_entities()
     settings._configure_airgun()
@@ -0,0 +1,55 @@
+"""Flush the deferred entities cleanup at the end of the session"""
+import logging
+
+import pytest
+
+from robottelo.cleanup import cleanup_scheduler
+from robottelo.cleanup import format_report
+
+LOGGER = logging.getLogger('robottelo')
+
+WORKEROUTPUT_KEY = 'robottelo_cleanup'
+
+# the cleanup summaries sent by the xdist workers
+_workers_summaries = []
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    """Make the test the owner of the entities it schedules"""
+    cleanup_scheduler.set_owner(item.nodeid)
+    yield
+    cleanup_scheduler.set_owner(None)
+
+
+def pytest_runtest_logfinish(nodeid, location):
+    """Delete the entities of a test in the background once it finished"""
+    cleanup_scheduler.release(nodeid)
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Wait for the scheduled deletions to finish and log the leaked entities,
+    a xdist worker sends them to the controller"""
+    leaked = cleanup_scheduler.flush()
+    if cleanup_scheduler.deleted or leaked:
+        LOGGER.info(cleanup_scheduler.report())
+    if hasattr(session.config, 'workeroutput'):
+        session.config.workeroutput[WORKEROUTPUT_KEY] = cleanup_scheduler.summary()
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    summary = getattr(node, 'workeroutput', {}).get(WORKEROUTPUT_KEY)
+    if summary is not None:
+        _workers_summaries.append(summary)
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    """Report the entities the cleanup schedulers of the controller and of the
+    xdist workers were not able to delete"""
+    if hasattr(config, 'workerinput'):
+        return
+    summaries = [cleanup_scheduler.summary()] + _workers_summaries
+    if any(summary['leaked'] for summary in summaries):
+        terminalreporter.section('leaked entities')
+        terminalreporter.write_line(format_report(summaries))
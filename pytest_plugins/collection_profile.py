@@ -0,0 +1,225 @@
+"""Profile the tests collection, with ``--robottelo-profile-collection``
+
+Report the slowest test modules to import and collect, the time each plugin
+spends in ``pytest_collection_modifyitems`` and the slowest fixtures to set up,
+then write them in a JSON file, to compare the collection time between
+commits::
+
+    pytest --collect-only --robottelo-profile-collection tests/foreman
+
+With xdist, every worker collects the tests: the module and plugin times are
+the slowest of the workers and the fixture times are summed.
+"""
+import json
+import subprocess
+import time
+from collections import defaultdict
+
+import pytest
+
+PROFILER_NAME = 'robottelo_collection_profiler'
+WORKEROUTPUT_KEY = 'robottelo_collection_profile'
+
+
+def pytest_addoption(parser):
+    """Add the options of the collection profile"""
+    group = parser.getgroup('robottelo collection profile')
+    group.addoption(
+        '--robottelo-profile-collection',
+        action='store_true',
+        default=False,
+        help='Report the import time of the test modules, the time of the plugins '
+        'pytest_collection_modifyitems and the slowest fixtures.',
+    )
+    group.addoption(
+        '--robottelo-profile-top',
+        type=int,
+        default=20,
+        help='The number of entries of each report of the collection profile.',
+    )
+    group.addoption(
+        '--robottelo-profile-output',
+        default='collection_profile.json',
+        help='The JSON file the collection profile is written to.',
+    )
+
+
+def pytest_configure(config):
+    if config.getoption('robottelo_profile_collection'):
+        config.pluginmanager.register(CollectionProfiler(config), PROFILER_NAME)
+
+
+def _get_commit():
+    result = subprocess.run(
+        ['git', 'rev-parse', 'HEAD'],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        universal_newlines=True,
+        check=False,
+    )
+    return result.stdout.strip() or None
+
+
+def _top(values, size, key):
+    return dict(sorted(values.items(), key=lambda item: key(item[1]), reverse=True)[:size])
+
+
+class CollectionProfiler:
+    """The pytest plugin measuring the collection, registered by the option"""
+
+    def __init__(self, config):
+        self.config = config
+        self.modules = {}
+        self.modifyitems = defaultdict(float)
+        self.fixtures = defaultdict(lambda: dict(count=0, seconds=0.0, max_seconds=0.0))
+        self.collection_seconds = None
+        self._collection_start = None
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_collection(self, session):
+        self._collection_start = time.perf_counter()
+        yield
+        self.collection_seconds = time.perf_counter() - self._collection_start
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_make_collect_report(self, collector):
+        if not isinstance(collector, pytest.Module):
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            # import the module, it is cached on the collector
+            collector.obj
+        except (Exception, pytest.skip.Exception, pytest.fail.Exception):
+            # reported by the collection of the module
+            pass
+        imported = time.perf_counter()
+        yield
+        self.modules[collector.nodeid] = dict(
+            import_seconds=imported - start, collect_seconds=time.perf_counter() - imported
+        )
+
+    @pytest.hookimpl(hookwrapper=True, tryfirst=True)
+    def pytest_collection_modifyitems(self, session, config, items):
+        hook = config.pluginmanager.hook.pytest_collection_modifyitems
+        # the wrappers, old style and pluggy 1.1 new style, are generators
+        # that run around the other implementations, they are not timed
+        hook_impls = [
+            hook_impl
+            for hook_impl in hook.get_hookimpls()
+            if not hook_impl.hookwrapper and not getattr(hook_impl, 'wrapper', False)
+        ]
+        functions = [hook_impl.function for hook_impl in hook_impls]
+        for hook_impl in hook_impls:
+            hook_impl.function = self._timed(hook_impl.plugin_name, hook_impl.function)
+        try:
+            yield
+        finally:
+            for hook_impl, function in zip(hook_impls, functions):
+                hook_impl.function = function
+
+    def _timed(self, plugin_name, function):
+        def timed(*args):
+            start = time.perf_counter()
+            try:
+                return function(*args)
+            finally:
+                self.modifyitems[plugin_name] += time.perf_counter() - start
+
+        return timed
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_fixture_setup(self, fixturedef, request):
+        start = time.perf_counter()
+        yield
+        self.add_fixture(fixturedef.argname, fixturedef.scope, time.perf_counter() - start)
+
+    def add_fixture(self, name, scope, seconds):
+        fixture = self.fixtures[f'{name} ({scope})']
+        fixture['count'] += 1
+        fixture['seconds'] += seconds
+        fixture['max_seconds'] = max(fixture['max_seconds'], seconds)
+
+    def get_profile(self):
+        """Return the profile, made of builtin types to be sent by the workers"""
+        return dict(
+            collection_seconds=self.collection_seconds,
+            modules=self.modules,
+            modifyitems=dict(self.modifyitems),
+            fixtures=dict(self.fixtures),
+        )
+
+    def merge(self, profile):
+        """Add the profile of a xdist worker"""
+        if profile['collection_seconds'] is not None:
+            self.collection_seconds = max(
+                self.collection_seconds or 0, profile['collection_seconds']
+            )
+        for nodeid, times in profile['modules'].items():
+            current = self.modules.setdefault(nodeid, times)
+            for key, seconds in times.items():
+                current[key] = max(current[key], seconds)
+        for plugin_name, seconds in profile['modifyitems'].items():
+            self.modifyitems[plugin_name] = max(self.modifyitems[plugin_name], seconds)
+        for name, fixture in profile['fixtures'].items():
+            current = self.fixtures[name]
+            current['count'] += fixture['count']
+            current['seconds'] += fixture['seconds']
+            current['max_seconds'] = max(current['max_seconds'], fixture['max_seconds'])
+
+    def get_report(self, size):
+        """Return the slowest entries of the profile"""
+        modules = _top(self.modules, size, lambda times: sum(times.values()))
+        return dict(
+            commit=_get_commit(),
+            created=time.time(),
+            collection_seconds=self.collection_seconds,
+            modules_count=len(self.modules),
+            import_seconds=sum(times['import_seconds'] for times in self.modules.values()),
+            modules=modules,
+            modifyitems=_top(self.modifyitems, size, lambda seconds: seconds),
+            fixtures=_top(self.fixtures, size, lambda fixture: fixture['seconds']),
+        )
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error):
+        profile = getattr(node, 'workeroutput', {}).get(WORKEROUTPUT_KEY)
+        if profile is not None:
+            self.merge(profile)
+
+    def pytest_sessionfinish(self, session):
+        if hasattr(self.config, 'workeroutput'):
+            self.config.workeroutput[WORKEROUTPUT_KEY] = self.get_profile()
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if hasattr(self.config, 'workerinput'):
+            return
+        report = self.get_report(self.config.getoption('robottelo_profile_top'))
+        output = self.config.getoption('robottelo_profile_output')
+        with open(output, 'w') as output_file:
+            json.dump(report, output_file, indent=2)
+
+        write_line = terminalreporter.write_line
+        terminalreporter.section('collection profile')
+        if report['collection_seconds'] is not None:
+            write_line(
+                f'collected {report["modules_count"]} modules in '
+                f'{report["collection_seconds"]:.2f}s, '
+                f'{report["import_seconds"]:.2f}s importing them'
+            )
+        write_line('slowest modules (import + collect):')
+        for nodeid, times in report['modules'].items():
+            write_line(
+                f'  {times["import_seconds"]:8.3f}s + {times["collect_seconds"]:.3f}s  {nodeid}'
+            )
+        write_line('pytest_collection_modifyitems by plugin:')
+        for plugin_name, seconds in report['modifyitems'].items():
+            write_line(f'  {seconds:8.3f}s  {plugin_name}')
+        if report['fixtures']:
+            write_line('slowest fixtures setup (total, count, max):')
+            for name, fixture in report['fixtures'].items():
+                write_line(
+                    f'  {fixture["seconds"]:8.3f}s  {fixture["count"]:5d}  '
+                    f'{fixture["max_seconds"]:.3f}s  {name}'
+                )
+        write_line(f'collection profile written to {output}')
@@ -0,0 +1,25 @@
+"""Report the function locks and semaphores contention at the end of the
+session"""
+from robottelo.decorators import lock_metrics
+
+
+def pytest_configure(config):
+    """Start a lock metrics file for this session, once for all the xdist
+    workers, they inherit it from the controller"""
+    if not hasattr(config, 'workerinput'):
+        lock_metrics.start_session()
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    """Report the most contended locks, the worker-seconds lost waiting for
+    them and the tests that held them the longest"""
+    entries = lock_metrics.read()
+    if entries:
+        terminalreporter.section('lock contention')
+        terminalreporter.write_line(lock_metrics.report(entries))
+
+
+def pytest_unconfigure(config):
+    """Remove the lock metrics file of this session"""
+    if not hasattr(config, 'workerinput'):
+        lock_metrics.end_session()
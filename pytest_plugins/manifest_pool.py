@@ -0,0 +1,17 @@
+"""Stop the generation of the manifest clones at the end of the session"""
+import logging
+import sys
+
+LOGGER = logging.getLogger('robottelo')
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Close the manifest pool, when the manifests were used by the session,
+    and log its hits and misses"""
+    manifests = sys.modules.get('robottelo.manifests')
+    if manifests is None:
+        return
+    stats = manifests._manifest_pool.stats()
+    manifests._manifest_pool.close()
+    if stats['hits'] or stats['misses']:
+        LOGGER.info(f'manifest pool: {stats["hits"]} hits, {stats["misses"]} misses')
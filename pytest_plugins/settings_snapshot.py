@@ -0,0 +1,83 @@
+"""Resolve the settings once in the xdist controller and send them to the
+workers, a worker applies only its own overrides, like its Satellite hostname
+
+A worker imports the plugins, and the modules reading the settings when
+imported, before its ``pytest_configure`` and before it can read its
+``workerinput``. So the controller writes the snapshot of each worker to a
+directory passed in the environment the workers inherit, and this plugin,
+listed first in ``pytest_plugins``, loads it when the worker imports it.
+"""
+import os
+import shutil
+import tempfile
+
+import execnet
+import pytest
+
+from robottelo.config import get_settings_snapshot
+from robottelo.config import get_worker_overrides
+from robottelo.config import load_settings_snapshot
+
+# the directory of the snapshots written by the controller, one file per worker
+SNAPSHOT_DIR_ENV = 'ROBOTTELO_SETTINGS_SNAPSHOT_DIR'
+
+_controller = {}
+_worker = {'loaded': False}
+
+
+def load_worker_snapshot():
+    """Configure the settings of a xdist worker from the snapshot written for
+    it by the controller, if any
+
+    :return: True when the snapshot was loaded
+    """
+    worker_id = os.environ.get('PYTEST_XDIST_WORKER')
+    snapshot_dir = os.environ.get(SNAPSHOT_DIR_ENV)
+    if not (worker_id and snapshot_dir):
+        return False
+    try:
+        with open(os.path.join(snapshot_dir, worker_id), 'rb') as snapshot_file:
+            snapshot, overrides = execnet.loads(snapshot_file.read())
+    except FileNotFoundError:
+        # the settings are not valid, the worker loads them and reports it
+        return False
+    load_settings_snapshot(snapshot, overrides)
+    _worker['loaded'] = True
+    return True
+
+
+def is_snapshot_loaded():
+    """Return True when the settings of this worker come from the controller"""
+    return _worker['loaded']
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_setupnodes(config, specs):
+    """Create the snapshots directory before the workers are started"""
+    _controller['dir'] = os.environ[SNAPSHOT_DIR_ENV] = tempfile.mkdtemp(
+        prefix='robottelo_settings_'
+    )
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """Write the settings snapshot and the overrides of a worker, before it
+    imports the plugins"""
+    if 'snapshot' not in _controller:
+        _controller['snapshot'] = get_settings_snapshot()
+    if _controller['snapshot']['legacy'] is None:
+        # the settings are not valid, let the workers report it
+        return
+    worker_id = node.workerinput['workerid']
+    data = execnet.dumps((_controller['snapshot'], get_worker_overrides(worker_id)))
+    with open(os.path.join(_controller['dir'], worker_id), 'wb') as snapshot_file:
+        snapshot_file.write(data)
+
+
+def pytest_unconfigure(config):
+    if 'dir' in _controller:
+        shutil.rmtree(_controller.pop('dir'), ignore_errors=True)
+        os.environ.pop(SNAPSHOT_DIR_ENV, None)
+
+
+load_worker_snapshot()
@@ -7,8 +7,8 @@ from fauxfactory import gen_string
 from inflector import Inflector
 from nailgun import entities
 from nailgun import entity_mixins
-from nailgun.client import request
 
+from robottelo import http
 from robottelo import ssh
 from robottelo.config import settings
 from robottelo.config.base import ImproperlyConfigured
@@ -20,6 +20,8 @@ from robottelo.constants import REPO_TYPE
 from robottelo.constants import RHEL_6_MAJOR_VERSION
 from robottelo.constants import RHEL_7_MAJOR_VERSION
 from robottelo.constants.repos import FAKE_1_YUM_REPO
+from robottelo.decorators.func_shared import recipe_hash
+from robottelo.decorators.func_shared import shared
 
 
 def call_entity_method_with_timeout(entity_callable, timeout=300, **kwargs):
@@ -265,12 +267,16 @@ def one_to_many_names(name):
     return {name, name + '_ids', Inflector().pluralize(name)}
 
 
-def configure_provisioning(org=None, loc=None, compute=False, os=None):
+def configure_provisioning(org=None, loc=None, compute=False, os=None, reuse=True):
     """Create and configure org, loc, product, repo, cv, env. Update proxy,
     domain, subnet, compute resource, provision templates and medium with
     previously created entities and create a hostgroup using all mentioned
     entities.
 
+    When shared functions are enabled, the provisioning stack is built once per
+    Satellite for the same recipe (org, loc, compute, os and the provisioning
+    settings) and the stored result is returned to any other caller.
+
     :param str org: Default Organization that should be used in both host
         discovering and host provisioning procedures
     :param str loc: Default Location that should be used in both host
@@ -278,9 +284,35 @@ def configure_provisioning(org=None, loc=None, compute=False, os=None):
     :param bool compute: If False creates a default Libvirt compute resource
     :param str os: Specify the os to be used while provisioning and to
         associate related entities to the specified os.
+    :param bool reuse: If False always build a new provisioning stack, to be
+        used by tests that modify the provisioning entities
     :return: List of created entities that can be re-used further in
         provisioning or validation procedure (e.g. hostgroup or domain)
     """
+    if not reuse:
+        return _configure_provisioning(org=org, loc=loc, compute=compute, os=os)
+    recipe = recipe_hash(
+        hostname=settings.server.hostname,
+        org=getattr(org, 'id', None),
+        loc=getattr(loc, 'id', None),
+        compute=compute,
+        os=os,
+        rhel7_os=settings.rhel7_os,
+        network=settings.vlan_networking.subnet,
+    )
+    return _shared_configure_provisioning(org=org, loc=loc, compute=compute, os=os, recipe=recipe)
+
+
+@shared(function_kw=['recipe'])
+def _shared_configure_provisioning(org=None, loc=None, compute=False, os=None, recipe=None):
+    """Shared :func:`configure_provisioning`, the stored result is keyed by
+    the recipe hash
+    """
+    return _configure_provisioning(org=org, loc=loc, compute=compute, os=os)
+
+
+def _configure_provisioning(org=None, loc=None, compute=False, os=None):
+    """Build the provisioning stack, see :func:`configure_provisioning`"""
     # Create new organization and location in case they were not passed
     if org is None:
         org = entities.Organization().create()
@@ -643,13 +675,11 @@ def wait_for_syncplan_tasks(repo_backend_id=None, timeout=10, repo_name=None):
         if time.time() > timeup:
             raise entities.APIResponseError(f'Pulp task with repo_id {repo_backend_id} not found')
         # Send request to pulp API to get the task info
-        req = request(
-            'POST',
+        req = http.post(
             f'{settings.server.get_url()}/pulp/api/v2/tasks/search/',
             verify=False,
             auth=('admin', f'{pulp_pass}'),
-            headers={'content-type': 'application/json'},
-            data=filtered_req,
+            json=filtered_req,
         )
         # Check Status code of response
         if req.status_code != 200:
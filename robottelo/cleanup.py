@@ -1,13 +1,31 @@
 """Cleanup module for different entities"""
 import logging
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 from nailgun import entities
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from requests.exceptions import HTTPError
+from tenacity import retry
+from tenacity import retry_if_exception
+from tenacity import stop_after_attempt
+from tenacity import wait_fixed
 
+from robottelo.cli.base import CLIReturnCodeError
 from robottelo.cli.proxy import Proxy
+from robottelo.http import CLEANUP_MAX_WORKERS
 from robottelo.vm import VirtualMachine
 
 LOGGER = logging.getLogger('robottelo')
 
+# How many times a deletion is attempted before the entity is reported as leaked
+CLEANUP_RETRIES = 3
+# Seconds to wait between two attempts of the same deletion
+CLEANUP_RETRY_DELAY = 5
+# Seconds the background thread waits for new entries before draining the queue
+CLEANUP_INTERVAL = 30
+
 
 def capsule_cleanup(proxy_id=None):
     """Deletes the capsule with the given id"""
@@ -65,3 +83,251 @@ def cleanup_of_provisioned_server(hostname=None, provisioning_server=None, distr
         )
         vm._created = True
         vm.destroy()
+
+
+# The deletion order: entities that depend on others must be deleted first
+CLEANUP_ORDER = ('vm', 'provisioned_server', 'host', 'capsule', 'realm', 'location', 'org')
+# The entities no other entity depends on, deleted in the background during
+# the session. The others are deleted in the background once the test that
+# scheduled them finished, or kept until the end of the session when scheduled
+# outside of a test, by a fixture for example, an entity depending on them may
+# still be scheduled until then.
+CLEANUP_BACKGROUND_KINDS = ('vm', 'provisioned_server')
+
+CLEANUP_HANDLERS = {
+    'vm': vm_cleanup,
+    'provisioned_server': cleanup_of_provisioned_server,
+    'host': host_cleanup,
+    'capsule': capsule_cleanup,
+    'realm': realm_cleanup,
+    'location': location_cleanup,
+    'org': org_cleanup,
+}
+
+
+# hammer errors of an entity that does not exist, like "Error: host not found"
+# or "Could not find organization"
+_CLI_NOT_FOUND = re.compile(r'not found|could not find', re.IGNORECASE)
+
+
+def _is_not_found(exp):
+    """Return True if the exception means the entity does not exist anymore"""
+    if isinstance(exp, CLIReturnCodeError):
+        return bool(_CLI_NOT_FOUND.search(f'{exp.stderr} {exp.msg}'))
+    response = getattr(exp, 'response', None)
+    return isinstance(exp, HTTPError) and response is not None and response.status_code == 404
+
+
+def _is_retryable(exp):
+    """Return True if the deletion may succeed when attempted again"""
+    return isinstance(
+        exp, (HTTPError, CLIReturnCodeError, RequestsConnectionError, ConnectionError)
+    ) and not _is_not_found(exp)
+
+
+class CleanupScheduler:
+    """Record entities to delete and delete them in a background thread.
+
+    Entries are grouped by entity type and the groups are processed following
+    ``order``, so that hosts are deleted before their organization. The
+    ``background_kinds`` entries, and the entries of an owner, a test for
+    example, once it is released, are deleted by the background thread, the
+    others wait for :meth:`flush` at the end of the session. Deletions of the
+    same type run concurrently in a bounded thread pool and are retried on
+    server and connection errors. Entities that could not be deleted are kept
+    in :attr:`leaked`.
+
+    Usage::
+
+        from robottelo.cleanup import schedule_cleanup
+
+        org = make_org()
+        schedule_cleanup('org', org_id=org['id'])
+    """
+
+    def __init__(
+        self,
+        handlers=None,
+        order=CLEANUP_ORDER,
+        background_kinds=CLEANUP_BACKGROUND_KINDS,
+        max_workers=CLEANUP_MAX_WORKERS,
+        retries=CLEANUP_RETRIES,
+        retry_delay=CLEANUP_RETRY_DELAY,
+        interval=CLEANUP_INTERVAL,
+    ):
+        if handlers is None:
+            handlers = CLEANUP_HANDLERS
+        self._handlers = handlers
+        self._order = order
+        self._background_kinds = frozenset(background_kinds)
+        self._max_workers = max_workers
+        self._retries = max(retries, 1)
+        self._retry_delay = retry_delay
+        self._interval = interval
+        self._pending = []
+        self._owner = None
+        self._released = set()
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = None
+        self.deleted = []
+        self.leaked = []
+
+    @property
+    def pending(self):
+        """Return the number of entries waiting for deletion"""
+        with self._lock:
+            return len(self._pending)
+
+    def add(self, kind, *args, **kwargs):
+        """Record an entity to delete, ``args`` and ``kwargs`` are passed to the
+        cleanup handler of ``kind``
+        """
+        if kind not in self._handlers:
+            raise ValueError(
+                'Unknown cleanup kind "{}", available ones are: {}'.format(
+                    kind, ', '.join(self._handlers)
+                )
+            )
+        with self._lock:
+            self._pending.append((kind, args, kwargs, self._owner))
+        if kind in self._background_kinds:
+            self.start()
+
+    def set_owner(self, owner):
+        """Set the owner of the entries added from now on, None for the
+        entries kept until the end of the session
+        """
+        self._owner = owner
+
+    def release(self, owner):
+        """Let the background thread delete the entries of owner"""
+        with self._lock:
+            if not any(entry[3] == owner for entry in self._pending):
+                return
+            self._released.add(owner)
+        self.start()
+        self._wakeup.set()
+
+    def start(self):
+        """Start the background thread if not already running"""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stopped.clear()
+            self._thread = threading.Thread(
+                target=self._run, name='robottelo-cleanup', daemon=True
+            )
+            self._thread.start()
+
+    def _run(self):
+        while not self._stopped.is_set():
+            self._wakeup.wait(self._interval)
+            self._wakeup.clear()
+            self.drain(background=True)
+
+    def _delete(self, kind, args, kwargs):
+        handler = retry(
+            retry=retry_if_exception(_is_retryable),
+            stop=stop_after_attempt(self._retries),
+            wait=wait_fixed(self._retry_delay),
+            reraise=True,
+        )(self._handlers[kind])
+        try:
+            handler(*args, **kwargs)
+        except Exception as err:
+            if _is_not_found(err):
+                LOGGER.debug(f'cleanup {kind} {args} {kwargs}: entity already deleted')
+                return None
+            LOGGER.warning(f'cleanup {kind} {args} {kwargs} failed: {err}')
+            return err
+        return None
+
+    def drain(self, background=False):
+        """Delete the pending entries, group by group, in dependency order
+
+        :param background: delete only the background kinds entries and the
+            entries of the released owners
+        """
+        with self._lock:
+            batch, self._pending = self._pending, []
+            if background:
+                self._pending = [entry for entry in batch if not self._is_background(entry)]
+                batch = [entry for entry in batch if self._is_background(entry)]
+            # all the entries of the released owners are in the batch
+            self._released.clear()
+        if not batch:
+            return
+        groups = {}
+        for kind, args, kwargs, _ in batch:
+            groups.setdefault(kind, []).append((args, kwargs))
+        ordered_kinds = sorted(
+            groups, key=lambda k: self._order.index(k) if k in self._order else len(self._order)
+        )
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            for kind in ordered_kinds:
+                entries = groups[kind]
+                errors = list(executor.map(lambda entry: self._delete(kind, *entry), entries))
+                for (args, kwargs), error in zip(entries, errors):
+                    record = dict(kind=kind, args=args, kwargs=kwargs)
+                    if error is None:
+                        self.deleted.append(record)
+                    else:
+                        record['error'] = str(error)
+                        self.leaked.append(record)
+
+    def _is_background(self, entry):
+        kind, _, _, owner = entry
+        return kind in self._background_kinds or owner in self._released
+
+    def flush(self):
+        """Stop the background thread, delete all the remaining entries and
+        return the list of leaked entities
+        """
+        self._stopped.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.drain()
+        return self.leaked
+
+    def summary(self):
+        """Return the number of deleted entities and the description of the
+        leaked ones, made of builtin types only so a xdist worker can send it
+        to the controller
+        """
+        return dict(
+            deleted=len(self.deleted),
+            leaked=[
+                '{kind} args={args} kwargs={kwargs}: {error}'.format(**record)
+                for record in self.leaked
+            ],
+        )
+
+    def report(self):
+        """Return a human readable report of the leaked entities"""
+        return format_report([self.summary()])
+
+
+def format_report(summaries):
+    """Return a human readable report of the leaked entities of several
+    schedulers, for example the ones of all the xdist workers
+
+    :param list summaries: the ``CleanupScheduler.summary`` of each scheduler
+    """
+    deleted = sum(summary['deleted'] for summary in summaries)
+    leaked = [line for summary in summaries for line in summary['leaked']]
+    return '\n'.join([f'{deleted} entities deleted, {len(leaked)} leaked'] + leaked)
+
+
+cleanup_scheduler = CleanupScheduler()
+
+
+def schedule_cleanup(kind, *args, **kwargs):
+    """Defer the deletion of an entity to the session cleanup scheduler
+
+    :param str kind: one of ``CLEANUP_ORDER`` entity types
+    """
+    cleanup_scheduler.add(kind, *args, **kwargs)
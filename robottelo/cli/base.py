@@ -1,12 +1,19 @@
 """Generic base class for cli hammer commands."""
 import logging
 import re
+import threading
+import weakref
+from contextlib import contextmanager
 
+from requests.exceptions import RequestException
 from wait_for import wait_for
 
+from robottelo import http
 from robottelo import ssh
 from robottelo.cli import hammer
-from robottelo.config import settings
+
+# the compiled settings, read on every command without the settings proxy overhead
+from robottelo.config import compiled_settings as settings
 
 
 class CLIError(Exception):
@@ -58,7 +65,83 @@ class CLIDataBaseError(CLIBaseError):
     """
 
 
-class Base:
+class _ThreadLocalCommandSub:
+    """Data descriptor that keeps the ``command_sub`` of the CLI classes per
+    thread.
+
+    Each CLI class method sets ``cls.command_sub`` just before building its
+    command, keeping the value per thread allows the same CLI class to be
+    used from several threads at once. Reading the attribute follows the
+    classes MRO like a regular class attribute.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+
+    def _values(self):
+        values = getattr(self._local, 'values', None)
+        if values is None:
+            values = self._local.values = weakref.WeakKeyDictionary()
+        return values
+
+    def __get__(self, cls, metacls=None):
+        if cls is None:
+            return self
+        values = self._values()
+        for klass in cls.__mro__:
+            if klass in values:
+                return values[klass]
+            if 'command_sub' in vars(klass):
+                return vars(klass)['command_sub']
+        return None
+
+    def __set__(self, cls, value):
+        self._values()[cls] = value
+
+
+_fast_read = threading.local()
+
+# the number of entities fetched per request by the fast read list
+FAST_READ_PER_PAGE = 1000
+
+
+@contextmanager
+def hammer_reads():
+    """Context manager that disables the fast read path, within it all the
+    reads are done with hammer even when ``fast_read=True`` is requested.
+
+    Use it in tests that assert on hammer output itself::
+
+        with hammer_reads():
+            org = Org.info({'id': org_id}, fast_read=True)
+    """
+    previous = getattr(_fast_read, 'disabled', False)
+    _fast_read.disabled = True
+    try:
+        yield
+    finally:
+        _fast_read.disabled = previous
+
+
+def _api_value(value):
+    """Convert an API value the same way hammer renders it"""
+    if isinstance(value, bool):
+        return 'yes' if value else 'no'
+    if value is None:
+        return ''
+    return hammer._normalize_obj(value)
+
+
+class _BaseMeta(type):
+    """Metaclass of the CLI classes, it keeps their ``command_sub`` per thread
+    as the bulk factories, see :func:`robottelo.cli.factory.create_objects`,
+    run the same CLI class from several threads at once
+    """
+
+    command_sub = _ThreadLocalCommandSub()
+
+
+class Base(metaclass=_BaseMeta):
     """
     @param command_base: base command of hammer.
     See Subcommands section in `hammer --help` output on your Satellite.
@@ -67,6 +150,12 @@ class Base:
     command_base = None  # each inherited instance should define this
     command_sub = None  # specific to instance, like: create, update, etc.
     command_requires_org = False  # True when command requires organization-id
+    # API path of the entity collection, used by the fast read path, e.g.
+    # /api/v2/organizations
+    api_path = None
+    # hammer field -> API field (a dotted path for nested ones) for the fields
+    # whose names differ
+    api_fields = {}
 
     logger = logging.getLogger('robottelo')
     _db_error_regex = re.compile(r'.*INSERT INTO|.*SELECT .*FROM|.*violates foreign key')
@@ -112,9 +201,13 @@ class Base:
         return result
 
     @classmethod
-    def create(cls, options=None, timeout=None):
+    def create(cls, options=None, timeout=None, fields=None):
         """
         Creates a new record using the arguments passed via dictionary.
+
+        :param fields: the fields needed by the caller, when the create output
+            already contains all of them the new record is not fetched with an
+            ``info`` call.
         """
 
         cls.command_sub = 'create'
@@ -124,6 +217,9 @@ class Base:
 
         result = cls.execute(cls._construct_command(options), output_format='csv', timeout=timeout)
 
+        if fields and len(result) > 0 and set(fields).issubset(result[0]):
+            return result
+
         # Extract new object ID if it was successfully created
         if len(result) > 0 and 'id' in result[0]:
             obj_id = result[0]['id']
@@ -250,7 +346,7 @@ class Base:
             return cls._handle_response(response, ignore_stderr=ignore_stderr)
 
     @classmethod
-    def exists(cls, options=None, search=None):
+    def exists(cls, options=None, search=None, fast_read=False):
         """Search for an entity using the query ``search[0]="search[1]"``
 
         Will be used the ``list`` command with the ``--search`` option to do
@@ -259,6 +355,8 @@ class Base:
         If ``options`` argument already have a search key, then the ``search``
         argument will not be evaluated. Which allows different search query.
 
+        :param fast_read: whether to do the search through the API, see
+            :meth:`info`.
         """
 
         if options is None:
@@ -267,15 +365,25 @@ class Base:
         if search is not None and 'search' not in options:
             options.update({'search': '{}=\\"{}\\"'.format(search[0], search[1])})
 
-        result = cls.list(options)
+        if fast_read:
+            result = cls.list(options, fast_read=True)
+        else:
+            result = cls.list(options)
         if result:
             result = result[0]
 
         return result
 
     @classmethod
-    def info(cls, options=None, output_format=None, return_raw_response=None):
-        """Reads the entity information."""
+    def info(cls, options=None, output_format=None, return_raw_response=None, fast_read=False):
+        """Reads the entity information.
+
+        :param fast_read: whether to read the entity through the API instead
+            of starting a hammer process. The API response is mapped to the
+            fields hammer would output, hammer is still used when the entity
+            has no ``api_path``, when an option or output format the API read
+            doesn't handle is given or when the API request fails.
+        """
         cls.command_sub = 'info'
 
         if options is None:
@@ -284,6 +392,11 @@ class Base:
         if cls.command_requires_org and 'organization-id' not in options:
             raise CLIError(f'organization-id option is required for {cls.__name__}.info')
 
+        if fast_read and not output_format and not return_raw_response:
+            result = cls._api_info(options)
+            if result is not None:
+                return result
+
         result = cls.execute(
             command=cls._construct_command(options),
             output_format=output_format,
@@ -294,10 +407,12 @@ class Base:
         return result
 
     @classmethod
-    def list(cls, options=None, per_page=True, output_format='csv'):
+    def list(cls, options=None, per_page=True, output_format='csv', fast_read=False):
         """
         List information.
         @param options: ID (sometimes name works as well) to retrieve info.
+        @param fast_read: whether to list the entities through the API, see
+            :meth:`info`.
         """
 
         cls.command_sub = 'list'
@@ -311,6 +426,11 @@ class Base:
         if cls.command_requires_org and 'organization-id' not in options:
             raise CLIError(f'organization-id option is required for {cls.__name__}.list')
 
+        if fast_read and output_format == 'csv':
+            result = cls._api_list(options)
+            if result is not None:
+                return result
+
         result = cls.execute(cls._construct_command(options), output_format=output_format)
 
         return result
@@ -394,6 +514,99 @@ class Base:
 
         return Wrapper
 
+    @classmethod
+    def _can_fast_read(cls, options, supported_options):
+        """Whether the read can be done through the API"""
+        return (
+            cls.api_path is not None
+            and not getattr(_fast_read, 'disabled', False)
+            and set(options).issubset(supported_options)
+        )
+
+    @classmethod
+    def _api_get(cls, path, params=None):
+        """GET an API path with the credentials hammer would use"""
+        response = http.get(
+            f'{settings.server.get_url()}{path}',
+            params=params,
+            auth=cls._get_username_password(),
+            verify=False,
+        )
+        response.raise_for_status()
+        return response.json()
+
+    @classmethod
+    def _api_params(cls, options):
+        """Convert the hammer read options to API params"""
+        params = {}
+        if 'organization-id' in options:
+            params['organization_id'] = options['organization-id']
+        if 'search' in options:
+            # the search is escaped for the shell hammer runs in
+            params['search'] = options['search'].replace('\\"', '"')
+        return params
+
+    @classmethod
+    def _api_to_hammer(cls, entity):
+        """Map an API entity to the normalised dict of the hammer parsers"""
+        result = {key.replace('_', '-'): _api_value(value) for key, value in entity.items()}
+        for field, api_field in cls.api_fields.items():
+            value = entity
+            for name in api_field.split('.'):
+                value = value.get(name) if isinstance(value, dict) else None
+            result[field] = _api_value(value)
+        return result
+
+    @classmethod
+    def _api_info(cls, options):
+        """Read an entity through the API, return None when hammer must be
+        used instead
+        """
+        if not cls._can_fast_read(options, {'id', 'name', 'organization-id'}):
+            return None
+        params = cls._api_params(options)
+        try:
+            if 'id' in options:
+                entity = cls._api_get(f'{cls.api_path}/{options["id"]}', params)
+            elif 'name' in options:
+                params['search'] = 'name="{}"'.format(options['name'])
+                entities = cls._api_get(cls.api_path, params)['results']
+                if len(entities) != 1:
+                    return None
+                entity = entities[0]
+            else:
+                return None
+        except (RequestException, ValueError) as err:
+            cls.logger.debug(f'Fast read of {cls.__name__} failed, using hammer: {err}')
+            return None
+        return cls._api_to_hammer(entity)
+
+    @classmethod
+    def _api_list(cls, options):
+        """List the entities through the API, return None when hammer must
+        be used instead
+        """
+        if not cls._can_fast_read(options, {'organization-id', 'search', 'per-page'}):
+            return None
+        params = cls._api_params(options)
+        params['per_page'] = options.get('per-page', FAST_READ_PER_PAGE)
+        entities = []
+        page = 1
+        try:
+            while True:
+                params['page'] = page
+                data = cls._api_get(cls.api_path, params)
+                entities.extend(data['results'])
+                if 'per-page' in options or len(entities) >= int(data.get('subtotal') or 0):
+                    break
+                if not data['results']:
+                    break
+                page += 1
+        except (RequestException, ValueError, KeyError) as err:
+            cls.logger.debug(f'Fast read of {cls.__name__} failed, using hammer: {err}')
+            return None
+        return [cls._api_to_hammer(entity) for entity in entities]
+
     @classmethod
     def _construct_command(cls, options=None):
         """Build a hammer cli command based on the options passed"""
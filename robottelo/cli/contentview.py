@@ -37,6 +37,7 @@ Options::
 from robottelo.cli import hammer
 from robottelo.cli.base import Base
 from robottelo.cli.base import CLIError
+from robottelo.decorators.func_locker import throttled
 
 
 class ContentViewFilterRule(Base):
@@ -110,9 +111,16 @@ class ContentView(Base):
 
     @classmethod
     def publish(cls, options, timeout=1500):
-        """Publishes a new version of content-view."""
+        """Publishes a new version of content-view.
+
+        The number of content views published at the same time on the server
+        by all the workers is limited by the ``content_view_publish`` semaphore, when its capacity
+        is set.
+        """
         cls.command_sub = 'publish'
-        return cls.execute(cls._construct_command(options), ignore_stderr=True, timeout=timeout)
+        command = cls._construct_command(options)
+        with throttled('content_view_publish'):
+            return cls.execute(command, ignore_stderr=True, timeout=timeout)
 
     @classmethod
     def version_info(cls, options, output_format=None):
@@ -7,6 +7,7 @@ import os
 import pprint
 import random
 import time
+from concurrent.futures import ThreadPoolExecutor
 from os import chmod
 from tempfile import mkstemp
 from time import sleep
@@ -20,7 +21,6 @@ from fauxfactory import gen_netmask
 from fauxfactory import gen_string
 from fauxfactory import gen_url
 
-from robottelo import manifests
 from robottelo import ssh
 from robottelo.cli.activationkey import ActivationKey
 from robottelo.cli.architecture import Architecture
@@ -91,9 +91,12 @@ from robottelo.constants import TEMPLATE_TYPES
 from robottelo.constants.repos import FAKE_1_YUM_REPO
 from robottelo.datafactory import valid_cron_expressions
 from robottelo.decorators import cacheable
+from robottelo.decorators.func_shared import recipe_hash
+from robottelo.decorators.func_shared import shared
 from robottelo.helpers import default_url_on_new_port
 from robottelo.helpers import get_available_capsule_port
 from robottelo.helpers import update_dictionary
+from robottelo.http import BULK_MAX_WORKERS
 from robottelo.ssh import download_file
 from robottelo.ssh import upload_file
 
@@ -108,7 +111,21 @@ class CLIFactoryError(Exception):
     """Indicates an error occurred while creating an entity using hammer"""
 
 
-def create_object(cli_object, options, values):
+class CLIBulkFactoryError(CLIFactoryError):
+    """Indicates that some entities of a bulk creation could not be created
+
+    :param results: the created entities in input order, ``None`` in place of
+        the failed ones
+    :param errors: a dict of the failed entities index and exception
+    """
+
+    def __init__(self, msg, results, errors):
+        super().__init__(msg)
+        self.results = results
+        self.errors = errors
+
+
+def create_object(cli_object, options, values, fields=None):
     """
     Creates <object> with dictionary of arguments.
 
@@ -116,6 +133,8 @@ def create_object(cli_object, options, values):
     :param dict options: The default options accepted by the cli_object
         create
     :param dict values: Custom values to override default ones.
+    :param fields: The fields needed by the caller, the follow-up ``info`` of
+        the new object is skipped when the create output contains all of them.
     :raise robottelo.cli.factory.CLIFactoryError: Raise an exception if object
         cannot be created.
     :rtype: dict
@@ -130,8 +149,9 @@ def create_object(cli_object, options, values):
                 "a typo or update default options".format(diff)
             )
     update_dictionary(options, values)
+    create_kwargs = {'fields': fields} if fields else {}
     try:
-        result = cli_object.create(options)
+        result = cli_object.create(options, **create_kwargs)
     except CLIReturnCodeError as err:
         # If the object is not created, raise exception, stop the show.
         raise CLIFactoryError(
@@ -161,6 +181,54 @@ def _entity_with_credentials(credentials, cli_entity_cls):
     return cli_entity_cls
 
 
+def create_objects(
+    cli_object, args_factory, options_list, fields=None, max_workers=BULK_MAX_WORKERS
+):
+    """Creates concurrently an <object> for each options of ``options_list``.
+
+    :param cli_object: A valid CLI object.
+    :param args_factory: A callable returning the default options accepted by
+        the cli_object create, called once per object.
+    :param list options_list: Custom values to override default ones, one
+        dict (or None) per object to create.
+    :param fields: The fields needed by the caller, the follow-up ``info`` of
+        the new objects is skipped when the create output contains all of them.
+    :param int max_workers: The maximum number of objects created at once.
+    :raise robottelo.cli.factory.CLIBulkFactoryError: Raise an exception if
+        any object cannot be created, the exception holds the created objects.
+    :rtype: list
+    :return: The newly created resources, in ``options_list`` order.
+    """
+    if not options_list:
+        return []
+
+    def create(values):
+        return create_object(cli_object, args_factory(), dict(values or {}), fields=fields)
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(options_list))) as executor:
+        futures = [executor.submit(create, values) for values in options_list]
+    results = []
+    errors = {}
+    for index, future in enumerate(futures):
+        try:
+            results.append(future.result())
+        except Exception as err:
+            results.append(None)
+            errors[index] = err
+    if errors:
+        raise CLIBulkFactoryError(
+            'Failed to create {} of {} {} objects:\n{}'.format(
+                len(errors),
+                len(options_list),
+                cli_object.__name__,
+                '\n'.join(f'{index}: {err}' for index, err in errors.items()),
+            ),
+            results,
+            errors,
+        )
+    return results
+
+
 @cacheable
 def make_activation_key(options=None):
     """Creates an Activation Key
@@ -169,6 +237,25 @@ def make_activation_key(options=None):
 
     :returns ActivationKey object
     """
+    _check_activation_key_options(options)
+    return create_object(ActivationKey, _activation_key_args(), options)
+
+
+def make_activation_keys(count, options=None, fields=None, max_workers=BULK_MAX_WORKERS):
+    """Creates ``count`` Activation Keys concurrently
+
+    :param options: Check options using `hammer activation-key create --help` on satellite.
+    :param fields: The fields the created objects must have, see :func:`create_objects`.
+
+    :returns list of ActivationKey objects
+    """
+    _check_activation_key_options(options)
+    return create_objects(
+        ActivationKey, _activation_key_args, [options] * count, fields, max_workers
+    )
+
+
+def _check_activation_key_options(options):
     # Organization Name, Label or ID is a required field.
     if (
         not options
@@ -178,7 +265,9 @@ def make_activation_key(options=None):
     ):
         raise CLIFactoryError('Please provide a valid Organization.')
 
-    args = {
+
+def _activation_key_args():
+    return {
         'content-view': None,
         'content-view-id': None,
         'description': None,
@@ -196,8 +285,6 @@ def make_activation_key(options=None):
         'purpose-addons': None,
     }
 
-    return create_object(ActivationKey, args, options)
-
 
 @cacheable
 def make_architecture(options=None):
@@ -228,11 +315,34 @@ def make_content_view_with_credentials(options=None, credentials=None):
 
     If credentials is None, the default credentials in robottelo.properties will be used.
     """
+    _check_content_view_options(options)
+    cv_cls = _entity_with_credentials(credentials, ContentView)
+    return create_object(cv_cls, _content_view_args(), options)
+
+
+def make_content_views(
+    count, options=None, credentials=None, fields=None, max_workers=BULK_MAX_WORKERS
+):
+    """Creates ``count`` Content Views concurrently
+
+    :param options: Check options using `hammer content-view create --help` on satellite.
+    :param fields: The fields the created objects must have, see :func:`create_objects`.
+
+    :returns list of ContentView objects
+    """
+    _check_content_view_options(options)
+    cv_cls = _entity_with_credentials(credentials, ContentView)
+    return create_objects(cv_cls, _content_view_args, [options] * count, fields, max_workers)
+
+
+def _check_content_view_options(options):
     # Organization ID is a required field.
     if not options or not options.get('organization-id'):
         raise CLIFactoryError('Please provide a valid ORG ID.')
 
-    args = {
+
+def _content_view_args():
+    return {
         'component-ids': None,
         'composite': False,
         'description': None,
@@ -247,9 +357,6 @@ def make_content_view_with_credentials(options=None, credentials=None):
         'repository-ids': None,
     }
 
-    cv_cls = _entity_with_credentials(credentials, ContentView)
-    return create_object(cv_cls, args, options)
-
 
 @cacheable
 def make_content_view_filter(options=None):
@@ -813,7 +920,11 @@ def make_host(options=None):
 
     :returns Host object
     """
-    args = {
+    return create_object(Host, _host_args(), options)
+
+
+def _host_args():
+    return {
         'architecture': None,
         'architecture-id': None,
         'ask-root-password': None,
@@ -883,14 +994,30 @@ def make_host(options=None):
         'volume': None,
     }
 
-    return create_object(Host, args, options)
-
 
 @cacheable
 def make_fake_host(options=None):
     """Wrapper function for make_host to pass all required options for creation
     of a fake host
     """
+    return make_host(_fake_host_options(options))
+
+
+def make_fake_hosts(count, options=None, fields=None, max_workers=BULK_MAX_WORKERS):
+    """Creates ``count`` fake hosts concurrently, the required entities are
+    looked up or created once and shared by all the hosts
+
+    :param options: Check options using `hammer host create --help` on satellite.
+    :param fields: The fields the created objects must have, see :func:`create_objects`.
+
+    :returns list of Host objects
+    """
+    options = _fake_host_options(dict(options or {}))
+    return create_objects(Host, _host_args, [options] * count, fields, max_workers)
+
+
+def _fake_host_options(options=None):
+    """Fill options with all the entities required to create a fake host"""
     if options is None:
         options = {}
 
@@ -970,7 +1097,7 @@ def make_fake_host(options=None):
             }
         )['id']
 
-    return make_host(options)
+    return options
 
 
 @cacheable
@@ -981,8 +1108,25 @@ def make_host_collection(options=None):
 
     :returns HostCollection object
     """
+    return create_object(HostCollection, _host_collection_args(), options)
+
+
+def make_host_collections(count, options=None, fields=None, max_workers=BULK_MAX_WORKERS):
+    """Creates ``count`` Host Collections concurrently
+
+    :param options: Check options using `hammer host-collection create  --help` on satellite.
+    :param fields: The fields the created objects must have, see :func:`create_objects`.
+
+    :returns list of HostCollection objects
+    """
+    return create_objects(
+        HostCollection, _host_collection_args, [options] * count, fields, max_workers
+    )
+
+
+def _host_collection_args():
     # Assigning default values for attributes
-    args = {
+    return {
         'description': None,
         'host-collection-ids': None,
         'hosts': None,
@@ -994,8 +1138,6 @@ def make_host_collection(options=None):
         'unlimited-hosts': None,
     }
 
-    return create_object(HostCollection, args, options)
-
 
 @cacheable
 def make_job_invocation(options=None):
@@ -1066,6 +1208,21 @@ def make_user(options=None):
 
     :returns User object
     """
+    return create_object(User, _user_args(), options)
+
+
+def make_users(count, options=None, fields=None, max_workers=BULK_MAX_WORKERS):
+    """Creates ``count`` Users concurrently
+
+    :param options: Check options using `hammer user create --help` on satellite.
+    :param fields: The fields the created objects must have, see :func:`create_objects`.
+
+    :returns list of User objects
+    """
+    return create_objects(User, _user_args, [options] * count, fields, max_workers)
+
+
+def _user_args():
     login = gen_alphanumeric(6)
 
     # Assigning default values for attributes
@@ -1086,8 +1243,7 @@ def make_user(options=None):
     logger.debug(
         'User "{}" password not provided {} was generated'.format(args['login'], args['password'])
     )
-
-    return create_object(User, args, options)
+    return args
 
 
 @cacheable
@@ -1831,6 +1987,9 @@ def _setup_org_for_a_rh_repo(options=None):
         Lifecycle Environment, Organization and Repository
 
     """
+    # imported when used, the manifests module is slow to import
+    from robottelo import manifests
+
     if (
         not options
         or not options.get('product')
@@ -1969,6 +2128,9 @@ def setup_org_for_a_rh_repo(options=None, force_manifest_upload=False, force_use
     :return: a dict with entity ids (see ``_setup_org_for_a_rh_repo`` and
         ``setup_org_for_a_custom_repo``).
     """
+    # imported when used, the manifests module is slow to import
+    from robottelo import manifests
+
     custom_repo_url = None
     if options.get('repository') == REPOS['rhst6']['name']:
         custom_repo_url = settings.sattools_repo['rhel6']
@@ -2005,19 +2167,49 @@ def setup_org_for_a_rh_repo(options=None, force_manifest_upload=False, force_use
         return result
 
 
-def configure_env_for_provision(org=None, loc=None):
+def configure_env_for_provision(org=None, loc=None, reuse=True):
     """Create and configure org, loc, product, repo, env. Update proxy,
     domain, subnet, compute resource, provision templates and medium with
     previously created entities and create a hostgroup using all mentioned
     entities.
 
+    When shared functions are enabled, the provisioning environment is built
+    once per Satellite for the same recipe (org, loc and the provisioning
+    settings) and the stored result is returned to any other caller.
+
     :param org: Default Organization that should be used in both host
         discovering and host provisioning procedures
     :param loc: Default Location that should be used in both host
         discovering and host provisioning procedures
+    :param bool reuse: If False always build a new provisioning environment,
+        to be used by tests that modify the provisioning entities
     :return: List of created entities that can be re-used further in
         provisioning or validation procedure (e.g. hostgroup or subnet)
     """
+    if not reuse:
+        return _configure_env_for_provision(org=org, loc=loc)
+    recipe = recipe_hash(
+        hostname=settings.server.hostname,
+        org=(org or {}).get('id'),
+        loc=(loc or {}).get('id'),
+        rhel7_os=settings.rhel7_os,
+        network=settings.vlan_networking.subnet,
+    )
+    return _shared_configure_env_for_provision(org=org, loc=loc, recipe=recipe)
+
+
+@shared(function_kw=['recipe'])
+def _shared_configure_env_for_provision(org=None, loc=None, recipe=None):
+    """Shared :func:`configure_env_for_provision`, the stored result is keyed
+    by the recipe hash
+    """
+    return _configure_env_for_provision(org=org, loc=loc)
+
+
+def _configure_env_for_provision(org=None, loc=None):
+    """Build the provisioning environment, see
+    :func:`configure_env_for_provision`
+    """
     # Create new organization and location in case they were not passed
     if org is None:
         org = make_org()
@@ -2468,6 +2660,9 @@ def setup_cdn_and_custom_repos_content(
         activation key
     :return: a dict containing the activation key, content view and repos info
     """
+    # imported when used, the manifests module is slow to import
+    from robottelo import manifests
+
     if lce_id is None and not default_cv:
         raise TypeError('lce_id must be specified')
     if repos is None:
@@ -26,10 +26,15 @@ class LifecycleEnvironment(Base):
 
     command_base = 'lifecycle-environment'
     command_requires_org = True
+    api_path = '/katello/api/v2/environments'
+    api_fields = {
+        'organization': 'organization.name',
+        'prior-lifecycle-environment': 'prior.name',
+    }
 
     @classmethod
-    def list(cls, options=None, per_page=False):
-        result = super().list(options, per_page=per_page)
+    def list(cls, options=None, per_page=False, fast_read=False):
+        result = super().list(options, per_page=per_page, fast_read=fast_read)
 
         return result
 
@@ -46,6 +46,7 @@ class Org(Base):
     """Manipulates Foreman's Organizations"""
 
     command_base = 'organization'
+    api_path = '/api/v2/organizations'
 
     @classmethod
     def add_compute_resource(cls, options=None):
@@ -21,6 +21,7 @@ Subcommands::
     upload-content                Upload content into the repository
 """
 from robottelo.cli.base import Base
+from robottelo.decorators.func_locker import throttled
 
 
 class Repository(Base):
@@ -65,15 +66,22 @@ class Repository(Base):
 
     @classmethod
     def synchronize(cls, options, return_raw_response=None, timeout=3600):
-        """Synchronizes a repository."""
+        """Synchronizes a repository.
+
+        The number of repositories synchronized at the same time on the server
+        by all the workers is limited by the ``repository_sync`` semaphore, when its capacity
+        is set.
+        """
         cls.command_sub = 'synchronize'
-        return cls.execute(
-            cls._construct_command(options),
-            output_format='csv',
-            ignore_stderr=True,
-            return_raw_response=return_raw_response,
-            timeout=timeout,
-        )
+        command = cls._construct_command(options)
+        with throttled('repository_sync'):
+            return cls.execute(
+                command,
+                output_format='csv',
+                ignore_stderr=True,
+                return_raw_response=return_raw_response,
+                timeout=timeout,
+            )
 
     @classmethod
     def remove_content(cls, options):
@@ -27,6 +27,13 @@ class Subscription(Base):
     """
 
     command_base = 'subscription'
+    api_path = '/katello/api/v2/subscriptions'
+    api_fields = {
+        'uuid': 'cp_id',
+        'contract': 'contract_number',
+        'account': 'account_number',
+        'support': 'support_level',
+    }
 
     @classmethod
     def upload(cls, options=None, timeout=None):
@@ -1,48 +1,222 @@
+import glob
 import logging
+import os
 
 from dynaconf import LazySettings
+from dynaconf.utils.boxing import DynaBox
 from dynaconf.validator import ValidationError
 
 from .validators import validators
+from robottelo.config.base import get_project_root
 from robottelo.config.base import ImproperlyConfigured
 from robottelo.config.base import Settings as LegacySettings
+from robottelo.config.base import SETTINGS_FILE_NAME
+from robottelo.config.base import to_plain_dict
+from robottelo.config.compiled import CompiledSettings
 from robottelo.config.facade import SettingsFacade
 from robottelo.config.facade import SettingsNodeWrapper
+from robottelo.config.validation_cache import apply_validator_defaults
+from robottelo.config.validation_cache import ValidationCache
 
 logger = logging.getLogger('robottelo.config')
 
 legacy_settings = LegacySettings()
 
+# the dynaconf settings files, relative to the project root
+DYNACONF_SETTINGS_FILE = "settings.yaml"
+DYNACONF_PRELOAD = ["conf/*.yaml"]
+DYNACONF_INCLUDES = ["settings.local.yaml", ".secrets.yaml", ".secrets_*.yaml"]
+
 dynaconf_settings = LazySettings(
     envvar_prefix="ROBOTTELO",
     core_loaders=["YAML"],
-    settings_file="settings.yaml",
-    preload=["conf/*.yaml"],
-    includes=["settings.local.yaml", ".secrets.yaml", ".secrets_*.yaml"],
+    settings_file=DYNACONF_SETTINGS_FILE,
+    preload=DYNACONF_PRELOAD,
+    includes=DYNACONF_INCLUDES,
     envless_mode=True,
     lowercase_read=True,
 )
 dynaconf_settings.validators.register(**validators)
 
-try:
-    legacy_settings.configure()
-except ImproperlyConfigured:
-    logger.warning(
-        (
-            "Legacy Robottelo settings configure() failed, most likely required "
-            "configuration option is not provided. Continuing for the sake of unit tests"
+# generation: changed each time the settings are configured, see get_settings_generation
+_loaded = dict(legacy_settings=False, settings_path=None, generation=0)
+
+
+def _get_validated_paths():
+    """Return the paths of the files the settings and their validation are read from"""
+    config_dir = os.path.dirname(__file__)
+    project_root = get_project_root()
+    return [
+        _loaded['settings_path'] or os.path.join(project_root, SETTINGS_FILE_NAME),
+        *(
+            path
+            for pattern in [DYNACONF_SETTINGS_FILE, *DYNACONF_PRELOAD, *DYNACONF_INCLUDES]
+            for path in glob.glob(os.path.join(project_root, pattern))
         ),
-        exc_info=True,
-    )
+        os.path.join(config_dir, 'base.py'),
+        os.path.join(config_dir, 'validators.py'),
+    ]
+
+
+# the validation results are reused while the configuration does not change
+validation_cache = ValidationCache(
+    os.path.join(get_project_root(), '.robottelo_validation_cache.json'), _get_validated_paths
+)
+
+
+def get_settings_generation():
+    """Return a number changed each time the settings are configured or
+    compiled again, to invalidate the values computed from the settings"""
+    return _loaded['generation']
+
+
+def _configure_legacy_settings(settings_path=None):
+    _loaded['settings_path'] = settings_path
+    _loaded['generation'] += 1
+    try:
+        legacy_settings.configure(settings_path, validation_cache=validation_cache, lazy=True)
+    except ImproperlyConfigured:
+        logger.warning(
+            (
+                "Legacy Robottelo settings configure() failed, most likely required "
+                "configuration option is not provided. Continuing for the sake of unit tests"
+            ),
+            exc_info=True,
+        )
+
+
+def _validate_dynaconf_settings(section):
+    section_validators = validators.get(section)
+    if not section_validators:
+        return
+    errors = validation_cache.get(f'dynaconf.{section}')
+    if errors is None:
+        errors = []
+        # run every validator, the ones after a failed one still set their defaults
+        for validator in section_validators:
+            try:
+                validator.validate(dynaconf_settings)
+            except ValidationError as exp:
+                errors.append(str(exp))
+        validation_cache.set(f'dynaconf.{section}', errors)
+        validation_cache.save()
+    else:
+        for validator in section_validators:
+            apply_validator_defaults(dynaconf_settings, validator)
+    if errors:
+        logger.warning(
+            f"Dynaconf validation of '{section}' failed, continuing for the sake of unit tests: "
+            f"{'; '.join(errors)}"
+        )
+
+
+def _configure_legacy_section(section):
+    try:
+        legacy_settings.configure_feature(section)
+    except ImproperlyConfigured:
+        logger.warning(
+            f"Legacy Robottelo settings of '{section}' are not valid, "
+            "continuing for the sake of unit tests",
+            exc_info=True,
+        )
+
+
+def _load_section(section):
+    """Load the configuration when a section is first read: the legacy general
+    settings are configured once, then only the legacy section and the
+    dynaconf validators of the section are read and run"""
+    if not _loaded['legacy_settings']:
+        _loaded['legacy_settings'] = True
+        _configure_legacy_settings()
+    _configure_legacy_section(section)
+    _validate_dynaconf_settings(section)
 
-try:
-    dynaconf_settings.validators.validate()
-except ValidationError:
-    logger.warning(
-        "Dynaconf validation failed, continuing for the sake of unit tests", exc_info=True
-    )
 
+# the settings files are read and validated when first used, not when imported
 settings_proxy = SettingsFacade()
 settings_proxy.set_configs(dynaconf_settings, legacy_settings)
+settings_proxy.set_section_loader(_load_section)
 
 settings = SettingsNodeWrapper(settings_proxy)
+
+# read only snapshot of the settings for the hot paths, see robottelo.config.compiled
+compiled_settings = CompiledSettings(settings_proxy)
+
+
+def compile_settings():
+    """Rebuild the compiled settings from the current settings, for example
+    after a setting was changed at runtime"""
+    SettingsFacade._cache.clear()
+    compiled_settings.reset()
+    _loaded['generation'] += 1
+
+
+def reconfigure(settings_path=None):
+    """Read again the settings files and rebuild the compiled settings
+
+    :param str settings_path: path to the legacy settings file to read, by
+        default robottelo.properties in the project root
+    """
+    dynaconf_settings.reload()
+    settings_proxy.set_configs(dynaconf_settings, legacy_settings)
+    legacy_settings._configured = False
+    legacy_settings._validation_errors = []
+    validation_cache.reset()
+    _configure_legacy_settings(settings_path)
+    _loaded['legacy_settings'] = True
+    # validate again the sections when read
+    settings_proxy.set_section_loader(_load_section)
+    compile_settings()
+
+
+def get_settings_snapshot():
+    """Return the resolved and validated settings, made of builtin types only,
+    to configure the settings of another process with ``load_settings_snapshot``
+    """
+    settings_proxy.load_sections(*validators, *legacy_settings.all_features)
+    return dict(
+        dynaconf=to_plain_dict(
+            {name.lower(): value for name, value in dynaconf_settings.as_dict().items()}
+        ),
+        legacy=legacy_settings.to_dict() if legacy_settings.configured else None,
+    )
+
+
+def get_worker_overrides(worker_id):
+    """Return the settings that differ between the xdist workers
+
+    :param str worker_id: the xdist worker id, like gw0
+    :return: a dict of the setting values by their dotted path
+    """
+    return {'server.hostname': settings_proxy.get('server.get_hostname')(worker_id)}
+
+
+def _override(values, full_path, value):
+    section, _, key = full_path.rpartition('.')
+    if section:
+        values = values.get(section)
+    if isinstance(values, dict):
+        values[key] = value
+
+
+def load_settings_snapshot(snapshot, overrides=None):
+    """Configure the settings from a snapshot of ``get_settings_snapshot``,
+    without reading the settings files
+
+    :param dict snapshot: the settings snapshot
+    :param dict overrides: the setting values to change in the snapshot, by
+        their dotted path, see ``get_worker_overrides``
+    """
+    dynaconf_values = snapshot['dynaconf']
+    legacy_values = snapshot['legacy']
+    for full_path, value in (overrides or {}).items():
+        _override(dynaconf_values, full_path, value)
+        if legacy_values is not None:
+            _override(legacy_values, full_path, value)
+    settings_proxy.set_configs(DynaBox(dynaconf_values, box_settings={}), legacy_settings)
+    # the snapshot is already validated
+    settings_proxy.set_section_loader(None)
+    _loaded['legacy_settings'] = True
+    if legacy_values is not None:
+        legacy_settings.configure_from_dict(legacy_values)
+    compile_settings()
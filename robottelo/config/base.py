@@ -39,6 +39,33 @@ def get_project_root():
     return os.path.realpath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir))
 
 
+def to_plain_value(value):
+    """Return the value made only of builtin types, that can be sent to another
+    process, for example a xdist worker.
+
+    :raises: TypeError if the value has an object of another type.
+    """
+    if value is None or isinstance(value, (bool, int, float, str, bytes)):
+        return value
+    if isinstance(value, dict):
+        return {to_plain_value(key): to_plain_value(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple, set, frozenset)):
+        container_type = type(value) if type(value) in (tuple, set, frozenset) else list
+        return container_type(to_plain_value(item) for item in value)
+    raise TypeError(f'{type(value).__name__} is not a plain value')
+
+
+def to_plain_dict(values):
+    """Return the items of values that are plain values, see ``to_plain_value``"""
+    plain_values = {}
+    for name, value in values.items():
+        try:
+            plain_values[name] = to_plain_value(value)
+        except TypeError as err:
+            LOGGER.debug(f'setting "{name}" skipped: {err}')
+    return plain_values
+
+
 class INIReader:
     """ConfigParser wrapper able to cast value when reading INI options."""
 
@@ -572,6 +599,7 @@ class FakeManifestSettings(FeatureSettings):
         self.cert_url = None
         self.key_url = None
         self.url = None
+        self.pool_size = 2
 
     def read(self, reader):
         """Read fake manifest settings."""
@@ -583,11 +611,12 @@ class FakeManifestSettings(FeatureSettings):
         except ValueError:
             url['default'] = reader.get('fake_manifest', 'url')
         self.url = url
+        self.pool_size = reader.get('fake_manifest', 'pool_size', 2, int)
 
     def validate(self):
         """Validate fake manifest settings."""
         validation_errors = []
-        if not all(vars(self).values()):
+        if not all((self.cert_url, self.key_url, self.url)):
             validation_errors.append(
                 'All [fake_manifest] cert_url, key_url, url options must be provided.'
             )
@@ -1227,6 +1256,12 @@ class SharedFunctionSettings(FeatureSettings):
         self.redis_db = None
         self.redis_password = None
         self.call_retries = None
+        self.codec = None
+        self.out_of_line_threshold = None
+        self.coordination_host = None
+        self.coordination_port = None
+        self.coordination_token = None
+        self.semaphore_capacity = None
 
     def read(self, reader):
         """Read shared settings."""
@@ -1242,11 +1277,19 @@ class SharedFunctionSettings(FeatureSettings):
         self.redis_db = reader.get('shared_function', 'redis_db', 0, int)
         self.redis_password = reader.get('shared_function', 'redis_password', None)
         self.call_retries = reader.get('shared_function', 'call_retries', 2, int)
+        self.codec = reader.get('shared_function', 'codec', 'json')
+        self.out_of_line_threshold = reader.get(
+            'shared_function', 'out_of_line_threshold', 1048576, int
+        )
+        self.coordination_host = reader.get('shared_function', 'coordination_host', None)
+        self.coordination_port = reader.get('shared_function', 'coordination_port', 7890, int)
+        self.coordination_token = reader.get('shared_function', 'coordination_token', None)
+        self.semaphore_capacity = reader.get('shared_function', 'semaphore_capacity', {}, dict)
 
     def validate(self):
         """Validate the shared settings"""
         validation_errors = []
-        supported_storage_handlers = ['file', 'redis']
+        supported_storage_handlers = ['file', 'redis', 'sqlite', 'coordination']
         if self.storage not in supported_storage_handlers:
             validation_errors.append(
                 f'[shared] storage must be one of {supported_storage_handlers}'
@@ -1256,6 +1299,20 @@ class SharedFunctionSettings(FeatureSettings):
                 importlib.import_module('redis')
             except ImportError:
                 validation_errors.append('[shared] python redis package not installed')
+        if self.storage == 'coordination' and not self.coordination_host:
+            validation_errors.append('[shared] coordination storage needs a coordination_host')
+        if self.coordination_host and not self.coordination_token:
+            validation_errors.append('[shared] coordination_host needs a coordination_token')
+        supported_serializers = ['json', 'pickle', 'msgpack']
+        supported_compressors = ['', 'zlib', 'lz4']
+        serializer, _, compressor = (self.codec or 'json').partition('+')
+        if serializer not in supported_serializers or compressor not in supported_compressors:
+            validation_errors.append(f'[shared] codec "{self.codec}" not supported')
+        for package in {serializer, compressor} & {'msgpack', 'lz4'}:
+            try:
+                importlib.import_module(package)
+            except ImportError:
+                validation_errors.append(f'[shared] python {package} package not installed')
         if self.share_timeout is None:
             self.share_timeout = self.MAX_SHARE_TIMEOUT
         if self.share_timeout > self.MAX_SHARE_TIMEOUT:
@@ -1372,10 +1429,19 @@ class ReportPortalSettings(FeatureSettings):
 class Settings:
     """Robottelo's settings representation."""
 
+    # the feature sections needed to configure the logging, NailGun and
+    # AirGun, always read by configure
+    EAGER_FEATURES = ('server',)
+
     def __init__(self):
         self._all_features = None
         self._configured = False
+        # the feature sections left unread by a lazy configure
+        self._lazy_features = set()
         self._validation_errors = []
+        # the validation errors of the feature settings, by feature name
+        self._feature_errors = {}
+        self._validation_cache = None
         self.browser = None
         self.cdn = None
         self.locale = None
@@ -1443,11 +1509,16 @@ class Settings:
         self.report_portal = ReportPortalSettings()
         self.http_proxy = HttpProxySettings()
 
-    def configure(self, settings_path=None):
+    def configure(self, settings_path=None, validation_cache=None, lazy=False):
         """Read the settings file and parse the configuration.
 
         :param str settings_path: path to settings file to read. If None, looks in the project
             root for a file named 'robottelo.properties'.
+        :param validation_cache: a ``robottelo.config.validation_cache.ValidationCache``
+            to reuse the validation results of a previous run with the same
+            configuration, None to always validate.
+        :param bool lazy: read only the general settings and the ``EAGER_FEATURES``
+            sections, the other sections are read by ``configure_feature``.
 
         :raises: ImproperlyConfigured if any issue is found during the parsing
             or validation of the configuration.
@@ -1464,15 +1535,21 @@ class Settings:
             raise ImproperlyConfigured(f'Not able to find settings file at {settings_path}')
 
         self.reader = INIReader(settings_path)
+        self._feature_errors = {}
+        self._validation_cache = validation_cache
         self._read_robottelo_settings()
-        self._validation_errors.extend(self._validate_robottelo_settings())
+        self._validation_errors.extend(
+            self._validate('robottelo', self._validate_robottelo_settings)
+        )
 
-        attrs = map(lambda attr_name: (attr_name, getattr(self, attr_name)), dir(self))
-        feature_settings = filter(lambda tpl: isinstance(tpl[1], FeatureSettings), attrs)
-        for name, settings in feature_settings:
-            if self.reader.has_section(name) or name == 'server':
-                settings.read(self.reader)
-                self._validation_errors.extend(settings.validate())
+        self._lazy_features = set()
+        for name in sorted(self.all_features):
+            if lazy and name not in self.EAGER_FEATURES:
+                self._lazy_features.add(name)
+            else:
+                self._validation_errors.extend(self._read_feature(name))
+        if validation_cache is not None:
+            validation_cache.save()
 
         if self._validation_errors:
             raise ImproperlyConfigured(
@@ -1571,18 +1648,107 @@ class Settings:
                 )
         return validation_errors
 
+    def _read_feature(self, name):
+        """Read a feature section and return its validation errors"""
+        if not (self.reader.has_section(name) or name == 'server'):
+            return []
+        settings = getattr(self, name)
+        settings.read(self.reader)
+        errors = self._feature_errors[name] = self._validate(name, settings.validate)
+        return errors
+
+    def configure_feature(self, name):
+        """Read and validate a feature section left unread by a lazy configure,
+        once.
+
+        :raises: ImproperlyConfigured if the section is not valid.
+        """
+        if name not in self._lazy_features:
+            return
+        self._lazy_features.discard(name)
+        errors = self._read_feature(name)
+        if self._validation_cache is not None:
+            self._validation_cache.save()
+        if errors:
+            raise ImproperlyConfigured(
+                'Failed to validate the configuration, check the message(s):\n'
+                '{}'.format('\n'.join(errors))
+            )
+
     @property
     def configured(self):
         """Returns True if the settings have already been configured."""
         return self._configured
 
+    def _validate(self, name, validate):
+        """Return the validation errors of a section, from the validation cache
+        when the configuration did not change since it was cached"""
+        cache = self._validation_cache
+        errors = None if cache is None else cache.get(f'legacy.{name}')
+        if errors is None:
+            errors = validate()
+            if cache is not None:
+                cache.set(f'legacy.{name}', errors)
+        return errors
+
+    def get_feature_errors(self, name):
+        """Return the validation errors of a feature settings, an empty list
+        when it is fully set. The feature is validated once per configuration.
+        """
+        try:
+            self.configure_feature(name)
+        except ImproperlyConfigured:
+            pass
+        try:
+            return self._feature_errors[name]
+        except KeyError:
+            pass
+        errors = self._feature_errors[name] = self._validate(name, getattr(self, name).validate)
+        if self._validation_cache is not None:
+            self._validation_cache.save()
+        return errors
+
+    def to_dict(self):
+        """Return the settings values made of builtin types only, to configure
+        the settings of another process with ``configure_from_dict``.
+        """
+        values = {}
+        for name, value in vars(self).items():
+            if name.startswith('_') or name == 'reader':
+                continue
+            if isinstance(value, FeatureSettings):
+                value = to_plain_dict(
+                    {key: item for key, item in vars(value).items() if not key.startswith('_')}
+                )
+            values[name] = value
+        return to_plain_dict(values)
+
+    def configure_from_dict(self, values):
+        """Configure the settings from the values returned by ``to_dict``,
+        without reading and validating the settings file again.
+        """
+        for name, value in values.items():
+            feature_settings = getattr(self, name, None)
+            if isinstance(feature_settings, FeatureSettings):
+                for key, item in value.items():
+                    setattr(feature_settings, key, item)
+            else:
+                setattr(self, name, value)
+        self._feature_errors = {}
+        self._lazy_features = set()
+        self._configure_logging()
+        self._configure_third_party_logging()
+        self._configure_entities()
+        self._configure_airgun()
+        self._configured = True
+
     @property
     def all_features(self):
-        """List all expected feature settings sections."""
+        """The names of all expected feature settings sections."""
         if self._all_features is None:
-            self._all_features = [
+            self._all_features = frozenset(
                 name for name, value in vars(self).items() if isinstance(value, FeatureSettings)
-            ]
+            )
         return self._all_features
 
     def _configure_entities(self):
@@ -0,0 +1,150 @@
+"""Compiled snapshot of the robottelo settings.
+
+Every attribute access on ``robottelo.config.settings`` goes through the
+``SettingsNodeWrapper`` proxy and the ``SettingsFacade`` lookup, that is too
+slow for the hot paths reading several settings per call, like
+``robottelo.ssh.command`` or ``robottelo.cli.base.Base.execute``.
+
+The compiled settings resolve the merged dynaconf and legacy configuration
+once, into a tree of plain nodes: a node per section whose values are its
+instance attributes, read without any lookup or logging. A section is compiled
+when first read, so that only the used sections are loaded. The tree is read
+only and is rebuilt only after an explicit
+``robottelo.config.compile_settings()`` or ``robottelo.config.reconfigure()``.
+
+The keys that are not compiled, like ``server.version`` that is expensive to
+compute, or the methods of the legacy settings, are looked up from the settings
+facade when first read.
+"""
+import logging
+
+from robottelo.config.base import FeatureSettings
+
+logger = logging.getLogger('robottelo.config.compiled')
+
+# the computed settings facade keys that are cheap to compute when compiling
+COMPILED_COMPUTED_KEYS = (
+    'server.get_credentials',
+    'server.get_url',
+    'server.get_pub_url',
+    'server.get_cert_rpm_url',
+    'capsule.hostname',
+    'ssh_client.command_timeout',
+    'ssh_client.connection_timeout',
+)
+
+
+class CompiledSettingsNode:
+    """A read only section of the compiled settings
+
+    The compiled values are instance attributes, the other attributes are
+    looked up from the settings facade and kept in the node.
+    """
+
+    __slots__ = ('__dict__', '_full_path', '_provider')
+
+    def __init__(self, provider, full_path=None):
+        object.__setattr__(self, '_provider', provider)
+        object.__setattr__(self, '_full_path', full_path)
+
+    def _get_full_path(self, name):
+        if self._full_path:
+            return f'{self._full_path}.{name}'
+        return name
+
+    def __getattr__(self, name):
+        if name.startswith('__'):
+            raise AttributeError(name)
+        value = self._provider.get(self._get_full_path(name))
+        self.__dict__[name] = value
+        return value
+
+    def __setattr__(self, name, value):
+        raise AttributeError(
+            f'compiled settings are read only, can not set "{self._get_full_path(name)}", '
+            'use robottelo.config.reconfigure() or compile_settings()'
+        )
+
+    def __delattr__(self, name):
+        raise AttributeError(f'compiled settings are read only, can not delete "{name}"')
+
+    def __dir__(self):
+        return sorted(self.__dict__)
+
+    def __repr__(self):
+        return f'<{type(self).__name__} for "{self._full_path}": {sorted(self.__dict__)}>'
+
+
+class CompiledSettings(CompiledSettingsNode):
+    """The root of the compiled settings, a section is compiled when first
+    read
+
+    :param provider: the settings facade
+    """
+
+    __slots__ = ()
+
+    def __getattr__(self, name):
+        if name.startswith('__'):
+            raise AttributeError(name)
+        value = compile_value(self._provider, name)
+        self.__dict__[name] = value
+        return value
+
+    def reset(self):
+        """Drop the compiled values, they are compiled again when read"""
+        self.__dict__.clear()
+
+
+def _get_config_keys(config):
+    """Return the public setting names of a configuration section"""
+    if isinstance(config, dict):
+        return list(config)
+    return [
+        key
+        for key, value in vars(config).items()
+        if not key.startswith('_') and not callable(value)
+    ]
+
+
+def _get_sections(configs, name):
+    """Return the sections called name of the configuration providers"""
+    sections = []
+    for config in configs:
+        section = getattr(config, name, None)
+        if isinstance(section, (dict, FeatureSettings)):
+            sections.append(section)
+    return sections
+
+
+def _resolve(provider, full_path, values, name):
+    try:
+        values[name] = provider.get(full_path)
+    except (AttributeError, KeyError):
+        pass
+
+
+def compile_value(provider, name):
+    """Return the compiled value of the setting name, a section of the
+    configuration providers is compiled as a CompiledSettingsNode
+
+    :param provider: the settings facade, that gives the value of a key and
+        its configuration providers
+    :raise AttributeError: when no configuration provider has the setting
+    """
+    # read through the facade first, it loads the section configuration
+    value = provider.get(name)
+    sections = _get_sections(provider.get_configs(), name)
+    if not sections:
+        return value
+    node = CompiledSettingsNode(provider, name)
+    for section in sections:
+        for key in _get_config_keys(section):
+            if key not in node.__dict__:
+                _resolve(provider, f'{name}.{key}', node.__dict__, key)
+    for full_path in COMPILED_COMPUTED_KEYS:
+        section_name, key = full_path.split('.')
+        if section_name == name:
+            _resolve(provider, full_path, node.__dict__, key)
+    logger.debug(f'compiled settings section "{name}"')
+    return node
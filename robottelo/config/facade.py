@@ -13,6 +13,7 @@ from robottelo.config.base import SETTINGS_FILE_NAME
 logger = logging.getLogger('robottelo.config.facade')
 
 WRAPPER_EXCEPTIONS = (
+    'all_features',
     'server.hostname',
     'server.ssh_key',
     'server.ssh_password',
@@ -77,6 +78,7 @@ WRAPPER_EXCEPTIONS = (
     'vlan_networking.subnet',
     'vmware.vcenter',
 )
+_WRAPPER_EXCEPTIONS = frozenset(WRAPPER_EXCEPTIONS)
 
 
 class SettingsNodeWrapper(CallableObjectProxy):
@@ -92,10 +94,11 @@ class SettingsNodeWrapper(CallableObjectProxy):
         if self._self_full_path:
             new_path = f"{self._self_full_path}.{name}"
         config_value = self._self_config_provider.get(new_path)
-        if new_path in WRAPPER_EXCEPTIONS:
-            logger.debug(
-                f"Found '{new_path}' in exceptions list - will not wrap in SettingsNodeWrapper"
-            )
+        if new_path in _WRAPPER_EXCEPTIONS:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    f"Found '{new_path}' in exceptions list - will not wrap in SettingsNodeWrapper"
+                )
             return config_value
         return SettingsNodeWrapper(config_value, self._self_config_provider, new_path)
 
@@ -120,15 +123,42 @@ class SettingsNodeWrapper(CallableObjectProxy):
 class SettingsFacade:
     _cache = {}
     _configs = []
+    # called with the name of a section before its first read, to load the
+    # configuration lazily
+    _section_loader = None
+    _loaded_sections = set()
 
     @classmethod
     def set_configs(cls, *configs):
         cls._configs = configs
 
+    @classmethod
+    def get_configs(cls):
+        return cls._configs
+
+    @classmethod
+    def set_section_loader(cls, loader):
+        cls._section_loader = loader
+        cls._loaded_sections = set()
+
+    @classmethod
+    def load_sections(cls, *sections):
+        """Load the sections not loaded yet"""
+        for section in sections:
+            if section not in cls._loaded_sections:
+                cls._loaded_sections.add(section)
+                if cls._section_loader is not None:
+                    cls._section_loader(section)
+
+    @classmethod
+    def _load_section(cls, key):
+        cls.load_sections(key.partition('.')[0])
+
     @classmethod
     def _from_cache(cls, key):
         value = cls._cache[key]
-        logger.debug(f"returning '{key}' from cache")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"returning '{key}' from cache")
         return value
 
     @classmethod
@@ -145,7 +175,7 @@ class SettingsFacade:
         return inner
 
     def __all_features(self):
-        return [name for name in dir(self) if not name.startswith("_")]
+        return frozenset(name for name in dir(self) if not name.startswith("_"))
 
     def __server_get_credentials(self):
         """Return credentials for interacting with a Foreman deployment API.
@@ -285,14 +315,16 @@ class SettingsFacade:
         for config_provider in self._configs:
             try:
                 real_value = reduce(getattr, key.split('.'), config_provider)
-                logger.debug(
-                    f"obtained '{key}' from '{type(config_provider).__name__}' = {real_value}"
-                )
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        f"obtained '{key}' from '{type(config_provider).__name__}' = {real_value}"
+                    )
                 break
             except AttributeError:
                 pass
         else:
-            logger.debug(f"failed to find '{key}' in configuration")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"failed to find '{key}' in configuration")
             msg = f"None of configuration providers has attribute '{key}'"
             raise AttributeError(msg)
         self._add_to_cache(key, real_value)
@@ -304,6 +336,7 @@ class SettingsFacade:
         except KeyError:
             pass
 
+        self._load_section(full_path)
         try:
             return self._dispatch_computed_value(full_path)
         except KeyError:
@@ -313,6 +346,7 @@ class SettingsFacade:
         return value
 
     def __dir__(self):
+        self._load_section('')
         all_keys = []
         for config in self._configs:
             try:
@@ -0,0 +1,141 @@
+"""Cache of the settings validation results
+
+The settings are validated on every process start, each pytest-xdist worker
+and each ``configure``, while the configuration rarely changes between runs.
+``ValidationCache`` keeps the validation errors of each settings section in a
+file, keyed by a hash of the content of the configuration files, of the
+environment overrides, of the validation code, of the python version and of
+the python packages the validation depends on, for example redis for the
+``[shared_function]`` redis storage. The cached results are used as long as
+none of them changed.
+"""
+import hashlib
+import importlib.util
+import json
+import logging
+import os
+import sys
+
+from dynaconf.validator import empty
+
+logger = logging.getLogger('robottelo.config')
+
+#: The environment variables overriding the settings
+ENVIRONMENT_PREFIXES = ('ROBOTTELO_', 'DYNACONF_')
+ENVIRONMENT_SUFFIX = '_FOR_DYNACONF'
+#: The python packages the validation results depend on, installed or not
+PACKAGES = ('dynaconf', 'lz4', 'msgpack', 'redis')
+
+
+def _get_package_state(name):
+    """Return the location and modification time of an installed package,
+    changed when it is installed, upgraded or removed, without importing it:
+    reading the versions from the packages metadata is slower than the
+    validation"""
+    try:
+        spec = importlib.util.find_spec(name)
+    except (ImportError, ValueError):
+        spec = None
+    if spec is None or not spec.origin:
+        return 'not installed'
+    try:
+        return f'{spec.origin} {os.stat(spec.origin).st_mtime_ns}'
+    except OSError:
+        return spec.origin
+
+
+class ValidationCache:
+    """Validation errors of the settings sections, stored in a JSON file
+
+    :param str path: the path of the cache file
+    :param get_paths: a callable returning the paths of the files the settings
+        and their validation are read from, called once per configuration
+    :param packages: the python packages the validation depends on, by
+        default PACKAGES
+    """
+
+    def __init__(self, path, get_paths, packages=PACKAGES):
+        self.path = path
+        self._get_paths = get_paths
+        self._packages = packages
+        self._key = None
+        self._results = None
+        self._changed = False
+
+    def reset(self):
+        """Compute the key again on next use, after the configuration changed"""
+        self._key = None
+        self._results = None
+        self._changed = False
+
+    def get_key(self):
+        """Return the hash of the configuration files, the environment overrides
+        and the python packages"""
+        if self._key is None:
+            digest = hashlib.sha256(sys.version.encode())
+            for name in self._packages:
+                digest.update(f'{name}={_get_package_state(name)}\0'.encode())
+            for path in sorted(set(map(str, self._get_paths()))):
+                digest.update(path.encode())
+                try:
+                    with open(path, 'rb') as config_file:
+                        digest.update(config_file.read())
+                except OSError:
+                    digest.update(b'\0')
+            for name, value in sorted(os.environ.items()):
+                if name.startswith(ENVIRONMENT_PREFIXES) or name.endswith(ENVIRONMENT_SUFFIX):
+                    digest.update(f'{name}={value}\0'.encode())
+            self._key = digest.hexdigest()
+        return self._key
+
+    def _load(self):
+        if self._results is None:
+            self._results = {}
+            try:
+                with open(self.path) as cache_file:
+                    cache = json.load(cache_file)
+            except (OSError, ValueError):
+                return self._results
+            if isinstance(cache, dict) and cache.get('key') == self.get_key():
+                self._results = cache.get('results', {})
+        return self._results
+
+    def get(self, name):
+        """Return the cached validation errors of a section, None when the
+        section was not validated with the current configuration"""
+        errors = self._load().get(name)
+        if errors is not None:
+            logger.debug(f'validation of "{name}" settings read from {self.path}')
+        return errors
+
+    def set(self, name, errors):
+        """Cache the validation errors of a section, until ``save``"""
+        self._load()[name] = list(errors)
+        self._changed = True
+
+    def save(self):
+        """Write the cached validation errors in the cache file"""
+        if not self._changed:
+            return
+        tmp_path = f'{self.path}.{os.getpid()}'
+        try:
+            with open(tmp_path, 'w') as cache_file:
+                json.dump(dict(key=self.get_key(), results=self._results), cache_file)
+            # replaced at once, for the processes reading it concurrently
+            os.replace(tmp_path, self.path)
+        except OSError as err:
+            logger.debug(f'validation cache not saved to {self.path}: {err}')
+        self._changed = False
+
+
+def apply_validator_defaults(settings, validator):
+    """Set the default values of a dynaconf validator, as its validation does,
+    when the validation itself is skipped"""
+    for combined_validator in getattr(validator, 'validators', ()):
+        apply_validator_defaults(settings, combined_validator)
+    if getattr(validator, 'validators', None) is None and validator.default is not empty:
+        for name in validator.names:
+            default = validator.default
+            if callable(default):
+                default = default(settings, validator)
+            settings.setdefault(name, default)
@@ -88,6 +88,7 @@ validators = dict(
         Validator(
             'fake_manifest.cert_url', 'fake_manifest.key_url', 'fake_manifest.url', must_exist=True
         ),
+        Validator('fake_manifest.pool_size', default=2),
     ],
     gce=[
         Validator(
@@ -222,7 +223,11 @@ validators = dict(
         )
     ],
     shared_function=[
-        Validator("shared_function.storage", is_in=("file", "redis"), default='file'),
+        Validator(
+            "shared_function.storage",
+            is_in=("file", "redis", "sqlite", "coordination"),
+            default='file',
+        ),
         Validator("shared_function.share_timeout", lte=86400, default=86400),
         Validator("shared_function.scope", default=None),
         Validator("shared_function.enabled", default=False),
@@ -231,6 +236,12 @@ validators = dict(
         Validator("shared_function.redis_port", default=6379),
         Validator("shared_function.redis_db", default=0),
         Validator("shared_function.call_retries", default=2),
+        Validator("shared_function.codec", default='json'),
+        Validator("shared_function.out_of_line_threshold", default=1048576),
+        Validator("shared_function.coordination_host", default=None),
+        Validator("shared_function.coordination_port", default=7890),
+        Validator("shared_function.coordination_token", default=None),
+        Validator("shared_function.semaphore_capacity", default={}),
     ],
     upgrade=[
         Validator("upgrade.rhev_cap_host", must_exist=False)
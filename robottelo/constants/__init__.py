@@ -1,5 +1,11 @@
-"""Defines various constants"""
-from nailgun import entities
+"""Defines various constants
+
+The large tables are defined in per domain submodules, and the constants
+needing a slow import are looked up from their module, when they are first
+accessed, see ``__getattr__``. ``from robottelo.constants import REPOS`` keeps
+working.
+"""
+import importlib
 
 LOCALES = (
     'ca',
@@ -81,95 +87,6 @@ AWS_EC2_FLAVOR_T2_MICRO = 't2.micro - T2 Micro Instance'
 COMPUTE_PROFILE_LARGE = '3-Large'
 COMPUTE_PROFILE_SMALL = '1-Small'
 
-# GCE specific constants
-_bcds = dict.fromkeys(['us-east1', 'europe-west1'], ['b', 'c', 'd'])
-_abcfs = dict.fromkeys(['us-central1'], ['a', 'b', 'c', 'f'])
-_abcs = dict.fromkeys(
-    [
-        'us-east4',
-        'us-west1',
-        'europe-west4',
-        'europe-west3',
-        'europe-west2',
-        'asia-east1',
-        'asia-southeast1',
-        'asia-northeast1',
-        'asia-south1',
-        'australia-southeast1',
-        'southamerica-east1',
-        'asia-east2',
-        'asia-northeast2',
-        'europe-north1',
-        'europe-west6',
-        'northamerica-northeast1',
-        'us-west2',
-    ],
-    ['a', 'b', 'c'],
-)
-_zones_combo = {**_bcds, **_abcfs, **_abcs}
-VALID_GCE_ZONES = [f'{loc}-{zone}' for loc, zones in _zones_combo.items() for zone in zones]
-LATEST_RHEL7_GCE_IMG_UUID = '7726764279310511390'
-
-GCE_MACHINE_TYPE_DEFAULT = 'f1-micro'
-GCE_NETWORK_DEFAULT = 'default'
-GCE_EXTERNAL_IP_DEFAULT = True
-
-# AzureRM specific constants
-AZURERM_VALID_REGIONS = [
-    'East Asia',
-    'Southeast Asia',
-    'Central US',
-    'East US',
-    'East US 2',
-    'West US',
-    'North Central US',
-    'South Central US',
-    'North Europe',
-    'West Europe',
-    'Japan West',
-    'Japan East',
-    'Brazil South',
-    'Australia East',
-    'Australia Southeast',
-    'South India',
-    'Central India',
-    'West India',
-    'Canada Central',
-    'Canada East',
-    'UK South',
-    'UK West',
-    'West Central US',
-    'West US 2',
-    'Korea Central',
-    'Korea South',
-    'France Central',
-    'France South',
-    'Australia Central',
-    'Australia Central 2',
-    'UAE Central',
-    'UAE North',
-    'South Africa North',
-    'South Africa West',
-    'Switzerland North',
-    'Switzerland West',
-    'Germany North',
-    'Germany West Central',
-    'Norway West',
-    'Norway East',
-]
-AZURERM_RHEL7_FT_IMG_URN = 'marketplace://RedHat:RHEL:7-RAW:latest'
-AZURERM_RHEL7_UD_IMG_URN = 'marketplace://RedHat:RHEL:7-RAW-CI:7.6.2019072418'
-AZURERM_RHEL7_FT_BYOS_IMG_URN = 'marketplace://RedHat:rhel-byos:rhel-lvm78:7.8.20200410'
-AZURERM_RHEL7_FT_CUSTOM_IMG_URN = 'custom://vm1-shared-image-20200514081407'
-AZURERM_RHEL7_FT_GALLERY_IMG_URN = 'gallery://RHEL77img'
-AZURERM_RG_DEFAULT = 'SATQE'
-AZURERM_PLATFORM_DEFAULT = 'Linux'
-AZURERM_VM_SIZE_DEFAULT = 'Standard_B2ms'
-AZURERM_PREMIUM_OS_Disk = True
-AZURERM_FILE_URI = (
-    'https://raw.githubusercontent.com/SatelliteQE/robottelo/master/tests/foreman/data/uri.sh'
-)
-
 HTML_TAGS = [
     'A',
     'ABBR',
@@ -265,8 +182,6 @@ HTML_TAGS = [
     'VAR',
 ]
 
-OPERATING_SYSTEMS = entities._OPERATING_SYSTEMS
-
 TEMPLATE_TYPES = [
     'finish',
     'iPXE',
@@ -367,237 +282,6 @@ SM_OVERALL_STATUS = {
     'unknown': 'Overall Status: Unknown',
 }
 
-REPOS = {
-    'rhel7': {
-        'id': 'rhel-7-server-rpms',
-        'name': 'Red Hat Enterprise Linux 7 Server RPMs x86_64 7Server',
-        'releasever': '7Server',
-        'arch': 'x86_64',
-        'distro': DISTRO_RHEL7,
-        'reposet': REPOSET['rhel7'],
-        'product': PRDS['rhel'],
-        'major_version': RHEL_7_MAJOR_VERSION,
-        'distro_repository': True,
-        'key': 'rhel',
-        'version': '7.7',
-    },
-    'rhel6': {
-        'id': 'rhel-6-server-rpms',
-        'name': 'Red Hat Enterprise Linux 6 Server RPMs x86_64 6Server',
-        'releasever': '6Server',
-        'arch': 'x86_64',
-        'distro': DISTRO_RHEL6,
-        'reposet': REPOSET['rhel6'],
-        'product': PRDS['rhel'],
-        'major_version': RHEL_6_MAJOR_VERSION,
-        'distro_repository': True,
-        'key': 'rhel',
-        'version': '6.8',
-    },
-    'rhsc7': {
-        'id': 'rhel-7-server-satellite-capsule-6.8-rpms',
-        'name': ('Red Hat Satellite Capsule 6.8 for RHEL 7 Server RPMs x86_64'),
-        'version': '6.8',
-        'reposet': REPOSET['rhsc7'],
-        'product': PRDS['rhsc'],
-        'distro': DISTRO_RHEL7,
-        'key': 'rhsc',
-    },
-    'rhsc7_iso': {
-        'id': 'rhel-7-server-satellite-capsule-6.8-isos',
-        'name': ('Red Hat Satellite Capsule 6.8 for RHEL 7 Server ISOs x86_64'),
-    },
-    'rhsc6': {
-        'id': 'rhel-6-server-satellite-capsule-6.8-rpms',
-        'name': ('Red Hat Satellite Capsule 6.8 for RHEL 6 Server RPMs x86_64'),
-        'version': '6.8',
-        'reposet': REPOSET['rhsc6'],
-        'product': PRDS['rhsc'],
-        'distro': DISTRO_RHEL6,
-        'key': 'rhsc',
-    },
-    'rhst7': {
-        'id': 'rhel-7-server-satellite-tools-6.8-rpms',
-        'name': ('Red Hat Satellite Tools 6.8 for RHEL 7 Server RPMs x86_64'),
-        'version': '6.8',
-        'reposet': REPOSET['rhst7'],
-        'product': PRDS['rhel'],
-        'distro': DISTRO_RHEL7,
-        'key': 'rhst',
-    },
-    'rhst7_64': {
-        'id': 'rhel-7-server-satellite-tools-6.4-rpms',
-        'name': ('Red Hat Satellite Tools 6.4 for RHEL 7 Server RPMs x86_64'),
-        'version': '6.4',
-        'reposet': REPOSET['rhst7_64'],
-        'product': PRDS['rhel'],
-        'distro': DISTRO_RHEL7,
-        'key': 'rhst',
-    },
-    'rhst7_65': {
-        'id': 'rhel-7-server-satellite-tools-6.5-rpms',
-        'name': ('Red Hat Satellite Tools 6.5 for RHEL 7 Server RPMs x86_64'),
-        'version': '6.5',
-        'reposet': REPOSET['rhst7_65'],
-        'product': PRDS['rhel'],
-        'distro': DISTRO_RHEL7,
-        'key': 'rhst',
-    },
-    'rhst7_66': {
-        'id': 'rhel-7-server-satellite-tools-6.6-rpms',
-        'name': ('Red Hat Satellite Tools 6.6 for RHEL 7 Server RPMs x86_64'),
-        'version': '6.6',
-        'reposet': REPOSET['rhst7_66'],
-        'product': PRDS['rhel'],
-        'distro': DISTRO_RHEL7,
-        'key': 'rhst',
-    },
-    'rhst7_67': {
-        'id': 'rhel-7-server-satellite-tools-6.7-rpms',
-        'name': ('Red Hat Satellite Tools 6.7 for RHEL 7 Server RPMs x86_64'),
-        'version': '6.7',
-        'reposet': REPOSET['rhst7_67'],
-        'product': PRDS['rhel'],
-        'distro': DISTRO_RHEL7,
-        'key': 'rhst',
-    },
-    'rhst7_68': {
-        'id': 'rhel-7-server-satellite-tools-6.8-rpms',
-        'name': ('Red Hat Satellite Tools 6.8 for RHEL 7 Server RPMs x86_64'),
-        'version': '6.8',
-        'reposet': REPOSET['rhst7_68'],
-        'product': PRDS['rhel'],
-        'distro': DISTRO_RHEL7,
-        'key': 'rhst',
-    },
-    'rhst6': {
-        'id': 'rhel-6-server-satellite-tools-6.8-rpms',
-        'name': ('Red Hat Satellite Tools 6.8 for RHEL 6 Server RPMs x86_64'),
-        'version': '6.8',
-        'reposet': REPOSET['rhst6'],
-        'product': PRDS['rhel'],
-        'distro': DISTRO_RHEL6,
-        'key': 'rhst',
-    },
-    'rhva6': {
-        'id': 'rhel-6-server-rhev-agent-rpms',
-        'name': ('Red Hat Enterprise Virtualization Agents for RHEL 6 Server RPMs x86_64 6Server'),
-        'version': '6.0',
-        'reposet': REPOSET['rhva6'],
-        'product': PRDS['rhel'],
-        'distro': DISTRO_RHEL6,
-        'releasever': '6Server',
-        'key': 'rhva6',
-    },
-    'rhva65': {
-        'name': ('Red Hat Enterprise Virtualization Agents for RHEL 6 Server RPMs x86_64 6.5'),
-        'version': '6.5',
-        'reposet': REPOSET['rhva6'],
-        'product': PRDS['rhel'],
-        'distro': DISTRO_RHEL6,
-        'key': 'rhva65',
-    },
-    'rhva610': {
-        'name': ('Red Hat Enterprise Virtualization Agents for RHEL 6 Server RPMs x86_64 6.10'),
-        'version': '6.10',
-        'reposet': REPOSET['rhva6'],
-        'product': PRDS['rhel'],
-        'distro': DISTRO_RHEL6,
-        'key': 'rhva610',
-    },
-    'rhct6': {
-        'name': 'Red Hat CloudForms Tools for RHEL 6 RPMs x86_64 6Server',
-        'releasever': '6Server',
-        'version': '6Server',
-        'arch': 'x86_64',
-        'reposet': REPOSET['rhct6'],
-        'product': PRDS['rhel'],
-        'distro': DISTRO_RHEL6,
-        'key': 'rhct6',
-    },
-    'rhaht': {'name': ('Red Hat Enterprise Linux Atomic Host Trees')},
-    'rhdt7': {
-        'name': ('Red Hat Developer Tools RPMs for Red Hat Enterprise Linux 7 Server x86_64')
-    },
-    'rhscl7': {
-        'id': 'rhel-server-rhscl-7-rpms',
-        'name': (
-            'Red Hat Software Collections RPMs for Red Hat Enterprise'
-            ' Linux 7 Server x86_64 7Server'
-        ),
-    },
-    'rhae2': {
-        'id': 'rhel-7-server-ansible-2.7-rpms',
-        'name': 'Red Hat Ansible Engine 2.7 RPMs for Red Hat Enterprise Linux 7 Server x86_64',
-        'version': '2.7',
-        'arch': 'x86_64',
-        'reposet': REPOSET['rhae2'],
-        'product': PRDS['rhae'],
-        'distro': DISTRO_RHEL7,
-        'key': 'rhae2',
-    },
-}
-
-DISTRO_REPOS = {
-    # DISTRO_RHEL6: REPOS['rhel6'],
-    DISTRO_RHEL7: REPOS['rhel7']
-}
-
-# The 'create_repos_tree' function under 'sync' module uses the following
-# list of tuples. It actually includes following two repos under
-# Reposet: Red Hat Enterprise Virtualization Agents for RHEL 6 Server RPMs
-#
-# Red Hat Enterprise Virtualization Agents for RHEL 6 Server RPMs x86_64 6.8
-# Red Hat Enterprise Virtualization Agents for RHEL 6 Server RPMs x86_64
-# 6Server
-
-RHVA_REPO_TREE = [
-    (
-        'rhel',
-        'rhva6',
-        'rhva65',
-        'repo_name',
-        'Red Hat Enterprise Virtualization Agents for RHEL 6 Server RPMs x86_64 6.5',
-    ),
-    ('rhel', 'rhva6', 'rhva65', 'repo_arch', 'x86_64'),
-    ('rhel', 'rhva6', 'rhva65', 'repo_ver', '6.5'),
-    (
-        'rhel',
-        'rhva6',
-        'rhva610',
-        'repo_name',
-        'Red Hat Enterprise Virtualization Agents for RHEL 6 Server RPMs x86_64 6.10',
-    ),
-    ('rhel', 'rhva6', 'rhva610', 'repo_arch', 'x86_64'),
-    ('rhel', 'rhva6', 'rhva610', 'repo_ver', '6.10'),
-    (
-        'rhel',
-        'rhva6',
-        'rhva6S',
-        'repo_name',
-        'Red Hat Enterprise Virtualization Agents for RHEL 6 Server RPMs x86_64 6Server',
-    ),
-    ('rhel', 'rhva6', 'rhva6S', 'repo_arch', 'x86_64'),
-    ('rhel', 'rhva6', 'rhva6S', 'repo_ver', '6Server'),
-]
-
-SAT6_TOOLS_TREE = [
-    (
-        'rhel',
-        'rhst6',
-        'rhst6',
-        'repo_name',
-        'Red Hat Satellite Tools 6.8 for RHEL 6 Server RPMs x86_64',
-    ),
-    ('rhel', 'rhst6', 'rhst6', 'repo_arch', 'x86_64'),
-    ('rhel', 'rhst6', 'rhst6', 'repo_ver', '6.8'),
-]
-
-ATOMIC_HOST_TREE = [
-    ('rhah', 'rhaht', 'rhaht', 'repo_name', 'Red Hat Enterprise Linux Atomic Host Trees'),
-    ('rhah', 'rhaht', 'rhaht', 'repo_arch', None),
-    ('rhah', 'rhaht', 'rhaht', 'repo_ver', None),
-]
 #: Name (not label!) of the default organization.
 DEFAULT_ORG = "Default Organization"
 #: Name (not label!) of the default location.
@@ -817,646 +501,6 @@ PULP_PUBLISHED_ISO_REPOS_PATH = '/var/lib/pulp/published/http/isos'
 PULP_PUBLISHED_PUPPET_REPOS_PATH = '/var/lib/pulp/published/puppet/https/repos'
 PULP_PUBLISHED_YUM_REPOS_PATH = '/var/lib/pulp/published/yum/http/repos'
 
-#: All permissions exposed by the server.
-#: :mod:`tests.foreman.api.test_permission` makes use of this.
-PERMISSIONS = {
-    None: [
-        'access_dashboard',
-        'app_root',
-        'attachments',
-        'configuration',
-        'create_arf_reports',
-        'create_recurring_logics',
-        'destroy_arf_reports',
-        'destroy_config_reports',
-        'download_bootdisk',
-        'edit_recurring_logics',
-        'escalate_roles',
-        'generate_ansible_inventory',
-        'logs',
-        'my_organizations',
-        'rh_telemetry_api',
-        'rh_telemetry_configurations',
-        'rh_telemetry_view',
-        'strata_api',
-        'upload_config_reports',
-        'view_arf_reports',
-        'view_cases',
-        'view_config_reports',
-        'view_log_viewer',
-        'view_plugins',
-        'view_recurring_logics',
-        'view_rh_search',
-        'view_tasks',
-        'view_statuses',
-        'generate_foreman_rh_cloud',
-        'forget_status_hosts',
-        'edit_user_mail_notifications',
-        'destroy_vm_compute_resources',
-        'power_vm_compute_resources',
-        'view_foreman_rh_cloud',
-    ],
-    'AnsibleRole': ['view_ansible_roles', 'destroy_ansible_roles', 'import_ansible_roles'],
-    'AnsibleVariable': [
-        'edit_ansible_variables',
-        'view_ansible_variables',
-        'import_ansible_variables',
-        'destroy_ansible_variables',
-        'create_ansible_variables',
-    ],
-    'Architecture': [
-        'view_architectures',
-        'create_architectures',
-        'edit_architectures',
-        'destroy_architectures',
-    ],
-    'Audit': ['view_audit_logs'],
-    'AuthSource': [
-        'view_authenticators',
-        'create_authenticators',
-        'edit_authenticators',
-        'destroy_authenticators',
-    ],
-    'Bookmark': ['view_bookmarks', 'create_bookmarks', 'edit_bookmarks', 'destroy_bookmarks'],
-    'ConfigGroup': [
-        'view_config_groups',
-        'create_config_groups',
-        'edit_config_groups',
-        'destroy_config_groups',
-    ],
-    'ComputeProfile': [
-        'view_compute_profiles',
-        'create_compute_profiles',
-        'edit_compute_profiles',
-        'destroy_compute_profiles',
-    ],
-    'ComputeResource': [
-        'view_compute_resources',
-        'create_compute_resources',
-        'edit_compute_resources',
-        'destroy_compute_resources',
-        'view_compute_resources_vms',
-        'create_compute_resources_vms',
-        'edit_compute_resources_vms',
-        'destroy_compute_resources_vms',
-        'power_compute_resources_vms',
-        'console_compute_resources_vms',
-        'destroy_vm_compute_resources',
-        'power_vm_compute_resources',
-    ],
-    'DiscoveryRule': [
-        'create_discovery_rules',
-        'destroy_discovery_rules',
-        'edit_discovery_rules',
-        'execute_discovery_rules',
-        'view_discovery_rules',
-    ],
-    'Domain': ['view_domains', 'create_domains', 'edit_domains', 'destroy_domains'],
-    'Environment': [
-        'view_environments',
-        'create_environments',
-        'edit_environments',
-        'destroy_environments',
-        'import_environments',
-    ],
-    'ExternalUsergroup': [
-        'view_external_usergroups',
-        'create_external_usergroups',
-        'edit_external_usergroups',
-        'destroy_external_usergroups',
-    ],
-    'FactValue': ['view_facts', 'upload_facts'],
-    'Filter': ['view_filters', 'create_filters', 'edit_filters', 'destroy_filters'],
-    'ForemanTasks::RecurringLogic': [
-        'create_recurring_logics',
-        'view_recurring_logics',
-        'edit_recurring_logics',
-    ],
-    'ForemanOpenscap::ArfReport': [
-        'create_arf_reports',
-        'view_arf_reports',
-        'destroy_arf_reports',
-    ],
-    'ForemanOpenscap::Policy': [
-        'assign_policies',
-        'create_policies',
-        'destroy_policies',
-        'edit_policies',
-        'view_policies',
-    ],
-    'ForemanOpenscap::ScapContent': [
-        'create_scap_contents',
-        'destroy_scap_contents',
-        'edit_scap_contents',
-        'view_scap_contents',
-    ],
-    'ForemanTasks::Task': ['edit_foreman_tasks', 'view_foreman_tasks'],
-    'JobInvocation': ['view_job_invocations', 'create_job_invocations', 'cancel_job_invocations'],
-    'JobTemplate': [
-        'view_job_templates',
-        'edit_job_templates',
-        'destroy_job_templates',
-        'create_job_templates',
-        'lock_job_templates',
-    ],
-    'ConfigReport': ['destroy_config_reports', 'view_config_reports', 'upload_config_reports'],
-    'ForemanVirtWhoConfigure::Config': [
-        "view_virt_who_config",
-        "create_virt_who_config",
-        "edit_virt_who_config",
-        "destroy_virt_who_config",
-    ],
-    "ForemanOpenscap::TailoringFile": [
-        "create_tailoring_files",
-        "view_tailoring_files",
-        "edit_tailoring_files",
-        "destroy_tailoring_files",
-    ],
-    'HostClass': ['edit_classes'],
-    'Hostgroup': [
-        'view_hostgroups',
-        'create_hostgroups',
-        'edit_hostgroups',
-        'destroy_hostgroups',
-        'play_roles_on_hostgroup',
-    ],
-    'HttpProxy': [
-        'view_http_proxies',
-        'create_http_proxies',
-        'edit_http_proxies',
-        'destroy_http_proxies',
-    ],
-    'Image': ['view_images', 'create_images', 'edit_images', 'destroy_images'],
-    'KeyPair': ["view_keypairs", "destroy_keypairs"],
-    'Location': [
-        'view_locations',
-        'create_locations',
-        'edit_locations',
-        'destroy_locations',
-        'assign_locations',
-    ],
-    'MailNotification': ['view_mail_notifications', 'edit_user_mail_notifications'],
-    'Medium': ['view_media', 'create_media', 'edit_media', 'destroy_media'],
-    'Model': ['view_models', 'create_models', 'edit_models', 'destroy_models'],
-    'Operatingsystem': [
-        'view_operatingsystems',
-        'create_operatingsystems',
-        'edit_operatingsystems',
-        'destroy_operatingsystems',
-    ],
-    'Parameter': ['view_params', 'create_params', 'edit_params', 'destroy_params'],
-    'PersonalAccessToken': [
-        'view_personal_access_tokens',
-        'create_personal_access_tokens',
-        'revoke_personal_access_tokens',
-    ],
-    'ProvisioningTemplate': [
-        'view_provisioning_templates',
-        'create_provisioning_templates',
-        'edit_provisioning_templates',
-        'destroy_provisioning_templates',
-        'deploy_provisioning_templates',
-        'lock_provisioning_templates',
-    ],
-    'Ptable': [
-        'view_ptables',
-        'create_ptables',
-        'edit_ptables',
-        'destroy_ptables',
-        'lock_ptables',
-    ],
-    'Puppetclass': [
-        'view_puppetclasses',
-        'create_puppetclasses',
-        'edit_puppetclasses',
-        'destroy_puppetclasses',
-        'import_puppetclasses',
-    ],
-    'PuppetclassLookupKey': [
-        'view_external_parameters',
-        'create_external_parameters',
-        'edit_external_parameters',
-        'destroy_external_parameters',
-    ],
-    'Realm': ['view_realms', 'create_realms', 'edit_realms', 'destroy_realms'],
-    'RemoteExecutionFeature': ['edit_remote_execution_features'],
-    'Report': ['view_reports', 'destroy_reports', 'upload_reports'],
-    'ReportTemplate': [
-        'edit_report_templates',
-        'destroy_report_templates',
-        'generate_report_templates',
-        'create_report_templates',
-        'view_report_templates',
-        'lock_report_templates',
-    ],
-    'Role': ['view_roles', 'create_roles', 'edit_roles', 'destroy_roles'],
-    'Setting': ['view_settings', 'edit_settings'],
-    'SmartProxy': [
-        'view_smart_proxies',
-        'create_smart_proxies',
-        'edit_smart_proxies',
-        'destroy_smart_proxies',
-        'view_smart_proxies_autosign',
-        'create_smart_proxies_autosign',
-        'destroy_smart_proxies_autosign',
-        'view_smart_proxies_puppetca',
-        'edit_smart_proxies_puppetca',
-        'destroy_smart_proxies_puppetca',
-        'manage_capsule_content',
-        'view_capsule_content',
-        'view_openscap_proxies',
-    ],
-    'SshKey': ["view_ssh_keys", "create_ssh_keys", "destroy_ssh_keys"],
-    'Subnet': [
-        'view_subnets',
-        'create_subnets',
-        'edit_subnets',
-        'destroy_subnets',
-        'import_subnets',
-    ],
-    'Template': ['export_templates', 'import_templates', 'view_template_syncs'],
-    'TemplateInvocation': [
-        'filter_autocompletion_for_template_invocation',
-        'create_template_invocations',
-        'view_template_invocations',
-    ],
-    'Usergroup': ['view_usergroups', 'create_usergroups', 'edit_usergroups', 'destroy_usergroups'],
-    'User': ['view_users', 'create_users', 'edit_users', 'destroy_users'],
-    'Host': [
-        'auto_provision_discovered_hosts',
-        'build_hosts',
-        'cockpit_hosts',
-        'console_hosts',
-        'create_hosts',
-        'destroy_discovered_hosts',
-        'destroy_hosts',
-        'edit_discovered_hosts',
-        'edit_hosts',
-        'ipmi_boot_hosts',
-        'play_roles_on_host',
-        'power_hosts',
-        'provision_discovered_hosts',
-        'submit_discovered_hosts',
-        'view_discovered_hosts',
-        'view_hosts',
-        'forget_status_hosts',
-    ],
-    'Katello::ActivationKey': [
-        'view_activation_keys',
-        'create_activation_keys',
-        'edit_activation_keys',
-        'destroy_activation_keys',
-    ],
-    'Katello::ContentView': [
-        'view_content_views',
-        'create_content_views',
-        'edit_content_views',
-        'destroy_content_views',
-        'publish_content_views',
-        'promote_or_remove_content_views',
-        'export_content_views',
-    ],
-    'Katello::GpgKey': [
-        'view_content_credentials',
-        'create_content_credentials',
-        'edit_content_credentials',
-        'destroy_content_credentials',
-    ],
-    'Katello::HostCollection': [
-        'view_host_collections',
-        'create_host_collections',
-        'edit_host_collections',
-        'destroy_host_collections',
-    ],
-    'Katello::KTEnvironment': [
-        'view_lifecycle_environments',
-        'create_lifecycle_environments',
-        'edit_lifecycle_environments',
-        'destroy_lifecycle_environments',
-        'promote_or_remove_content_views_to_environments',
-    ],
-    'Katello::Product': [
-        'view_products',
-        'create_products',
-        'edit_products',
-        'destroy_products',
-        'sync_products',
-        'export_products',
-    ],
-    'Katello::Subscription': [
-        'view_subscriptions',
-        'attach_subscriptions',
-        'unattach_subscriptions',
-        'import_manifest',
-        'delete_manifest',
-        'manage_subscription_allocations',
-    ],
-    'Organization': [
-        'view_organizations',
-        'create_organizations',
-        'edit_organizations',
-        'destroy_organizations',
-        'assign_organizations',
-    ],
-    'Katello::SyncPlan': [
-        'view_sync_plans',
-        'create_sync_plans',
-        'edit_sync_plans',
-        'destroy_sync_plans',
-        'sync_sync_plans',
-    ],
-}
-
-PERMISSIONS_UI = {
-    '(Miscellaneous)': [
-        'access_dashboard',
-        'app_root',
-        'attachments',
-        'configuration',
-        'download_bootdisk',
-        'escalate_roles',
-        'generate_ansible_inventory',
-        'logs',
-        'my_organizations',
-        'rh_telemetry_api',
-        'rh_telemetry_configurations',
-        'rh_telemetry_view',
-        'view_cases',
-        'view_log_viewer',
-        'view_plugins',
-        'view_rh_search',
-        'view_tasks',
-        'view_statuses',
-    ],
-    'Activation Keys': [
-        'view_activation_keys',
-        'create_activation_keys',
-        'edit_activation_keys',
-        'destroy_activation_keys',
-    ],
-    'Architecture': [
-        'view_architectures',
-        'create_architectures',
-        'edit_architectures',
-        'destroy_architectures',
-    ],
-    'Audit': ['view_audit_logs'],
-    'Auth source ldap': [
-        'view_authenticators',
-        'create_authenticators',
-        'edit_authenticators',
-        'destroy_authenticators',
-    ],
-    'Bookmark': ['view_bookmarks', 'create_bookmarks', 'edit_bookmarks', 'destroy_bookmarks'],
-    'Capsule': [
-        'view_smart_proxies',
-        'create_smart_proxies',
-        'edit_smart_proxies',
-        'destroy_smart_proxies',
-        'view_smart_proxies_autosign',
-        'create_smart_proxies_autosign',
-        'destroy_smart_proxies_autosign',
-        'view_smart_proxies_puppetca',
-        'edit_smart_proxies_puppetca',
-        'destroy_smart_proxies_puppetca',
-        'manage_capsule_content',
-        'view_capsule_content',
-        'view_openscap_proxies',
-    ],
-    'Compute profile': [
-        'view_compute_profiles',
-        'create_compute_profiles',
-        'edit_compute_profiles',
-        'destroy_compute_profiles',
-    ],
-    'Compute resource': [
-        'view_compute_resources',
-        'create_compute_resources',
-        'edit_compute_resources',
-        'destroy_compute_resources',
-        'view_compute_resources_vms',
-        'create_compute_resources_vms',
-        'edit_compute_resources_vms',
-        'destroy_compute_resources_vms',
-        'power_compute_resources_vms',
-        'console_compute_resources_vms',
-    ],
-    'Config group': [
-        'view_config_groups',
-        'create_config_groups',
-        'edit_config_groups',
-        'destroy_config_groups',
-    ],
-    'Config report': ['view_config_reports', 'destroy_config_reports', 'upload_config_reports'],
-    'Content Views': [
-        'view_content_views',
-        'create_content_views',
-        'edit_content_views',
-        'destroy_content_views',
-        'publish_content_views',
-        'promote_or_remove_content_views',
-        'export_content_views',
-    ],
-    'Discovery rule': [
-        'view_discovery_rules',
-        'create_discovery_rules',
-        'edit_discovery_rules',
-        'execute_discovery_rules',
-        'destroy_discovery_rules',
-    ],
-    'Domain': ['view_domains', 'create_domains', 'edit_domains', 'destroy_domains'],
-    'Environment': [
-        'view_environments',
-        'create_environments',
-        'edit_environments',
-        'destroy_environments',
-        'import_environments',
-    ],
-    'External usergroup': [
-        'view_external_usergroups',
-        'create_external_usergroups',
-        'edit_external_usergroups',
-        'destroy_external_usergroups',
-    ],
-    'Fact value': ['view_facts', 'upload_facts'],
-    'Filter': ['view_filters', 'create_filters', 'edit_filters', 'destroy_filters'],
-    'Host': [
-        'view_hosts',
-        'create_hosts',
-        'edit_hosts',
-        'destroy_hosts',
-        'build_hosts',
-        'power_hosts',
-        'console_hosts',
-        'ipmi_boot_hosts',
-        'view_discovered_hosts',
-        'submit_discovered_hosts',
-        'auto_provision_discovered_hosts',
-        'provision_discovered_hosts',
-        'edit_discovered_hosts',
-        'destroy_discovered_hosts',
-    ],
-    'Host Collections': [
-        'view_host_collections',
-        'create_host_collections',
-        'edit_host_collections',
-        'destroy_host_collections',
-    ],
-    'Host Group': [
-        'view_hostgroups',
-        'create_hostgroups',
-        'edit_hostgroups',
-        'destroy_hostgroups',
-    ],
-    'Host сlass': ['edit_classes'],
-    'Image': ['view_images', 'create_images', 'edit_images', 'destroy_images'],
-    'Job invocation': ['create_job_invocations', 'view_job_invocations'],
-    'Job template': [
-        'view_job_templates',
-        'create_job_templates',
-        'edit_job_templates',
-        'destroy_job_templates',
-        'lock_job_templates',
-    ],
-    'Key pair': ["view_keypairs", "destroy_keypairs"],
-    'Lifecycle Environment': [
-        'view_lifecycle_environments',
-        'create_lifecycle_environments',
-        'edit_lifecycle_environments',
-        'destroy_lifecycle_environments',
-        'promote_or_remove_content_views_to_environments',
-    ],
-    'Location': [
-        'view_locations',
-        'create_locations',
-        'edit_locations',
-        'destroy_locations',
-        'assign_locations',
-    ],
-    'Mail notification': ['view_mail_notifications'],
-    'Medium': ['view_media', 'create_media', 'edit_media', 'destroy_media'],
-    'Model': ['view_models', 'create_models', 'edit_models', 'destroy_models'],
-    'Operatingsystem': [
-        'view_operatingsystems',
-        'create_operatingsystems',
-        'edit_operatingsystems',
-        'destroy_operatingsystems',
-    ],
-    'Organization': [
-        'view_organizations',
-        'create_organizations',
-        'edit_organizations',
-        'destroy_organizations',
-        'assign_organizations',
-    ],
-    'Parameter': ['view_params', 'create_params', 'edit_params', 'destroy_params'],
-    'Partition Table': [
-        'view_ptables',
-        'create_ptables',
-        'edit_ptables',
-        'destroy_ptables',
-        'lock_ptables',
-    ],
-    'Product and Repositories': [
-        'view_products',
-        'create_products',
-        'edit_products',
-        'destroy_products',
-        'sync_products',
-        'export_products',
-    ],
-    'Provisioning template': [
-        'view_provisioning_templates',
-        'create_provisioning_templates',
-        'edit_provisioning_templates',
-        'destroy_provisioning_templates',
-        'deploy_provisioning_templates',
-        'lock_provisioning_templates',
-    ],
-    'Puppet class': [
-        'view_puppetclasses',
-        'create_puppetclasses',
-        'edit_puppetclasses',
-        'destroy_puppetclasses',
-        'import_puppetclasses',
-    ],
-    'Realm': ['view_realms', 'create_realms', 'edit_realms', 'destroy_realms'],
-    'Remote execution feature': ['edit_remote_execution_features'],
-    'Report': ['view_reports', 'destroy_reports', 'upload_reports'],
-    'Role': ['view_roles', 'create_roles', 'edit_roles', 'destroy_roles'],
-    'Satellite openscap/arf report': [
-        'create_arf_reports',
-        'view_arf_reports',
-        'destroy_arf_reports',
-    ],
-    'Satellite openscap/policy': [
-        'view_policies',
-        'edit_policies',
-        'create_policies',
-        'destroy_policies',
-        'assign_policies',
-    ],
-    'Satellite openscap/scap content': [
-        'create_scap_contents',
-        'destroy_scap_contents',
-        'edit_scap_contents',
-        'view_scap_contents',
-    ],
-    'Satellite openscap/tailoring file': [
-        "create_tailoring_files",
-        "view_tailoring_files",
-        "edit_tailoring_files",
-        "destroy_tailoring_files",
-    ],
-    'Satellite tasks/recurring logic': [
-        'create_recurring_logics',
-        'view_recurring_logics',
-        'edit_recurring_logics',
-    ],
-    'Satellite tasks/task': ['view_foreman_tasks', 'edit_foreman_tasks'],
-    'Satellite virt who configure/config': [
-        "view_virt_who_config",
-        "create_virt_who_config",
-        "edit_virt_who_config",
-        "destroy_virt_who_config",
-    ],
-    'Smart class parameter': [
-        'view_external_parameters',
-        'create_external_parameters',
-        'edit_external_parameters',
-        'destroy_external_parameters',
-    ],
-    'Ssh key': ["view_ssh_keys", "create_ssh_keys", "destroy_ssh_keys"],
-    'Subnet': [
-        'view_subnets',
-        'create_subnets',
-        'edit_subnets',
-        'destroy_subnets',
-        'import_subnets',
-    ],
-    'Subscription': [
-        'view_subscriptions',
-        'attach_subscriptions',
-        'unattach_subscriptions',
-        'import_manifest',
-        'delete_manifest',
-    ],
-    'Sync Plans': [
-        'view_sync_plans',
-        'create_sync_plans',
-        'edit_sync_plans',
-        'destroy_sync_plans',
-        'sync_sync_plans',
-    ],
-    'Template invocation': [
-        'execute_template_invocation',
-        'filter_autocompletion_for_template_invocation',
-    ],
-    'User': ['view_users', 'create_users', 'edit_users', 'destroy_users'],
-    'Usergroup': ['view_usergroups', 'create_usergroups', 'edit_usergroups', 'destroy_usergroups'],
-}
-
-
 ANY_CONTEXT = {'org': "Any Organization", 'location': "Any Location"}
 
 SUBNET_IPAM_TYPES = {'dhcp': 'DHCP', 'internal': 'Internal DB', 'none': 'None'}
@@ -1567,93 +611,6 @@ ROLES_LOCKED = [
     'Viewer',
 ]
 
-BOOKMARK_ENTITIES = [
-    {'name': 'ActivationKey', 'controller': 'katello_activation_keys'},
-    {'name': 'Dashboard', 'controller': 'dashboard', 'skip_for_ui': True},
-    {'name': 'Fact', 'controller': 'fact_values', 'skip_for_ui': True},
-    {'name': 'Audit', 'controller': 'audits', 'skip_for_ui': True},
-    {'name': 'Report', 'controller': 'config_reports', 'skip_for_ui': True},
-    {'name': 'Task', 'controller': 'foreman_tasks_tasks', 'skip_for_ui': True},
-    {'name': 'Subscriptions', 'controller': 'katello_subscriptions', 'skip_for_ui': True},
-    {'name': 'Product', 'controller': 'katello_products'},
-    {'name': 'Repository', 'controller': 'katello_repositories', 'skip_for_ui': True},
-    {'name': 'ContentCredential', 'controller': 'katello_gpg_keys'},
-    {'name': 'SyncPlan', 'controller': 'katello_sync_plans'},
-    {'name': 'ContentView', 'controller': 'katello_content_views'},
-    {'name': 'Errata', 'controller': 'katello_errata', 'skip_for_ui': True},
-    {'name': 'Package', 'controller': 'katello_erratum_packages', 'skip_for_ui': True},
-    {'name': 'PuppetModule', 'controller': 'katello_puppet_modules', 'skip_for_ui': True},
-    {'name': 'ContainerImageTag', 'controller': 'katello_docker_tags', 'skip_for_ui': True},
-    {'name': 'Host', 'controller': 'hosts', 'setup': entities.Host},
-    {'name': 'ContentHost', 'controller': 'hosts', 'skip_for_ui': True},
-    {'name': 'HostCollection', 'controller': 'katello_host_collections'},
-    {'name': 'Architecture', 'controller': 'architectures'},
-    {
-        'name': 'HardwareModel',
-        'controller': 'models',
-        'setup': entities.Model,
-        'skip_for_ui': True,
-    },
-    {
-        'name': 'InstallationMedia',
-        'controller': 'media',
-        'setup': entities.Media,
-        'skip_for_ui': True,
-    },
-    {'name': 'OperatingSystem', 'controller': 'operatingsystems'},
-    {
-        'name': 'PartitionTable',
-        'controller': 'ptables',
-        'setup': entities.PartitionTable,
-        'skip_for_ui': False,
-    },
-    {'name': 'ProvisioningTemplate', 'controller': 'provisioning_templates'},
-    {
-        'name': 'HostGroup',
-        'controller': 'hostgroups',
-        'setup': entities.HostGroup,
-        'skip_for_ui': True,
-    },
-    {
-        'name': 'DiscoveryRule',
-        'controller': 'discovery_rules',
-        'skip_for_ui': True,
-        'setup': entities.DiscoveryRule,
-    },
-    {
-        'name': 'GlobalParameter',
-        'controller': 'common_parameters',
-        'setup': entities.CommonParameter,
-        'skip_for_ui': True,
-    },
-    {
-        'name': 'ConfigGroup',
-        'controller': 'config_groups',
-        'setup': entities.ConfigGroup,
-        'skip_for_ui': True,
-    },
-    {'name': 'PuppetEnvironment', 'controller': 'environments', 'setup': entities.Environment},
-    {'name': 'PuppetClass', 'controller': 'puppetclasses', 'setup': entities.PuppetClass},
-    {'name': 'Role', 'controller': 'ansible_roles', 'setup': entities.Role},
-    {'name': 'Variables', 'controller': 'ansible_variables', 'skip_for_ui': True},
-    {'name': 'SmartProxy', 'controller': 'smart_proxies', 'skip_for_ui': True},
-    {
-        'name': 'ComputeResource',
-        'controller': 'compute_resources',
-        'setup': entities.LibvirtComputeResource,
-    },
-    {'name': 'ComputeProfile', 'controller': 'compute_profiles', 'setup': entities.ComputeProfile},
-    {'name': 'Subnet', 'controller': 'subnets', 'setup': entities.Subnet},
-    {'name': 'Domain', 'controller': 'domains', 'setup': entities.Domain},
-    {'name': 'Realm', 'controller': 'realms', 'setup': entities.Realm, 'skip_for_ui': True},
-    {'name': 'Location', 'controller': 'locations'},
-    {'name': 'Organization', 'controller': 'organizations'},
-    {'name': 'User', 'controller': 'users'},
-    {'name': 'UserGroup', 'controller': 'usergroups', 'setup': entities.UserGroup},
-    {'name': 'Role', 'controller': 'roles'},
-    {'name': 'Settings', 'controller': 'settings', 'skip_for_ui': True},
-]
-
 STRING_TYPES = ['alpha', 'numeric', 'alphanumeric', 'latin1', 'utf8', 'cjk', 'html']
 
 REAL_4_ERRATA_DETAILS = [
@@ -1867,3 +824,58 @@ FOREMAN_ANSIBLE_MODULES = [
 FAM_MODULE_PATH = (
     '/usr/share/ansible/collections/ansible_collections/redhat/satellite/plugins/modules'
 )
+
+
+def _lazy_constants(module_name, *names):
+    return {name: (module_name, name) for name in names}
+
+
+#: The module and attribute name of the constants built on first access
+_LAZY_CONSTANTS = {
+    'OPERATING_SYSTEMS': ('nailgun.entities', '_OPERATING_SYSTEMS'),
+    **_lazy_constants('robottelo.constants.bookmarks', 'BOOKMARK_ENTITIES'),
+    **_lazy_constants(
+        'robottelo.constants.cloud',
+        'VALID_GCE_ZONES',
+        'LATEST_RHEL7_GCE_IMG_UUID',
+        'GCE_MACHINE_TYPE_DEFAULT',
+        'GCE_NETWORK_DEFAULT',
+        'GCE_EXTERNAL_IP_DEFAULT',
+        'AZURERM_VALID_REGIONS',
+        'AZURERM_RHEL7_FT_IMG_URN',
+        'AZURERM_RHEL7_UD_IMG_URN',
+        'AZURERM_RHEL7_FT_BYOS_IMG_URN',
+        'AZURERM_RHEL7_FT_CUSTOM_IMG_URN',
+        'AZURERM_RHEL7_FT_GALLERY_IMG_URN',
+        'AZURERM_RG_DEFAULT',
+        'AZURERM_PLATFORM_DEFAULT',
+        'AZURERM_VM_SIZE_DEFAULT',
+        'AZURERM_PREMIUM_OS_Disk',
+        'AZURERM_FILE_URI',
+    ),
+    **_lazy_constants('robottelo.constants.permissions', 'PERMISSIONS', 'PERMISSIONS_UI'),
+    **_lazy_constants(
+        'robottelo.constants.rh_repos',
+        'REPOS',
+        'DISTRO_REPOS',
+        'RHVA_REPO_TREE',
+        'SAT6_TOOLS_TREE',
+        'ATOMIC_HOST_TREE',
+    ),
+}
+
+
+def __getattr__(name):
+    """Import the constants built on first access, and keep them as globals
+    so that they are looked up once.
+    """
+    try:
+        module_name, attribute = _LAZY_CONSTANTS[name]
+    except KeyError:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = globals()[name] = getattr(importlib.import_module(module_name), attribute)
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_CONSTANTS))
@@ -0,0 +1,89 @@
+"""Entities with bookmarks, and their controllers"""
+from nailgun import entities
+
+BOOKMARK_ENTITIES = [
+    {'name': 'ActivationKey', 'controller': 'katello_activation_keys'},
+    {'name': 'Dashboard', 'controller': 'dashboard', 'skip_for_ui': True},
+    {'name': 'Fact', 'controller': 'fact_values', 'skip_for_ui': True},
+    {'name': 'Audit', 'controller': 'audits', 'skip_for_ui': True},
+    {'name': 'Report', 'controller': 'config_reports', 'skip_for_ui': True},
+    {'name': 'Task', 'controller': 'foreman_tasks_tasks', 'skip_for_ui': True},
+    {'name': 'Subscriptions', 'controller': 'katello_subscriptions', 'skip_for_ui': True},
+    {'name': 'Product', 'controller': 'katello_products'},
+    {'name': 'Repository', 'controller': 'katello_repositories', 'skip_for_ui': True},
+    {'name': 'ContentCredential', 'controller': 'katello_gpg_keys'},
+    {'name': 'SyncPlan', 'controller': 'katello_sync_plans'},
+    {'name': 'ContentView', 'controller': 'katello_content_views'},
+    {'name': 'Errata', 'controller': 'katello_errata', 'skip_for_ui': True},
+    {'name': 'Package', 'controller': 'katello_erratum_packages', 'skip_for_ui': True},
+    {'name': 'PuppetModule', 'controller': 'katello_puppet_modules', 'skip_for_ui': True},
+    {'name': 'ContainerImageTag', 'controller': 'katello_docker_tags', 'skip_for_ui': True},
+    {'name': 'Host', 'controller': 'hosts', 'setup': entities.Host},
+    {'name': 'ContentHost', 'controller': 'hosts', 'skip_for_ui': True},
+    {'name': 'HostCollection', 'controller': 'katello_host_collections'},
+    {'name': 'Architecture', 'controller': 'architectures'},
+    {
+        'name': 'HardwareModel',
+        'controller': 'models',
+        'setup': entities.Model,
+        'skip_for_ui': True,
+    },
+    {
+        'name': 'InstallationMedia',
+        'controller': 'media',
+        'setup': entities.Media,
+        'skip_for_ui': True,
+    },
+    {'name': 'OperatingSystem', 'controller': 'operatingsystems'},
+    {
+        'name': 'PartitionTable',
+        'controller': 'ptables',
+        'setup': entities.PartitionTable,
+        'skip_for_ui': False,
+    },
+    {'name': 'ProvisioningTemplate', 'controller': 'provisioning_templates'},
+    {
+        'name': 'HostGroup',
+        'controller': 'hostgroups',
+        'setup': entities.HostGroup,
+        'skip_for_ui': True,
+    },
+    {
+        'name': 'DiscoveryRule',
+        'controller': 'discovery_rules',
+        'skip_for_ui': True,
+        'setup': entities.DiscoveryRule,
+    },
+    {
+        'name': 'GlobalParameter',
+        'controller': 'common_parameters',
+        'setup': entities.CommonParameter,
+        'skip_for_ui': True,
+    },
+    {
+        'name': 'ConfigGroup',
+        'controller': 'config_groups',
+        'setup': entities.ConfigGroup,
+        'skip_for_ui': True,
+    },
+    {'name': 'PuppetEnvironment', 'controller': 'environments', 'setup': entities.Environment},
+    {'name': 'PuppetClass', 'controller': 'puppetclasses', 'setup': entities.PuppetClass},
+    {'name': 'Role', 'controller': 'ansible_roles', 'setup': entities.Role},
+    {'name': 'Variables', 'controller': 'ansible_variables', 'skip_for_ui': True},
+    {'name': 'SmartProxy', 'controller': 'smart_proxies', 'skip_for_ui': True},
+    {
+        'name': 'ComputeResource',
+        'controller': 'compute_resources',
+        'setup': entities.LibvirtComputeResource,
+    },
+    {'name': 'ComputeProfile', 'controller': 'compute_profiles', 'setup': entities.ComputeProfile},
+    {'name': 'Subnet', 'controller': 'subnets', 'setup': entities.Subnet},
+    {'name': 'Domain', 'controller': 'domains', 'setup': entities.Domain},
+    {'name': 'Realm', 'controller': 'realms', 'setup': entities.Realm, 'skip_for_ui': True},
+    {'name': 'Location', 'controller': 'locations'},
+    {'name': 'Organization', 'controller': 'organizations'},
+    {'name': 'User', 'controller': 'users'},
+    {'name': 'UserGroup', 'controller': 'usergroups', 'setup': entities.UserGroup},
+    {'name': 'Role', 'controller': 'roles'},
+    {'name': 'Settings', 'controller': 'settings', 'skip_for_ui': True},
+]
@@ -0,0 +1,90 @@
+"""Cloud compute resources constants, GCE and AzureRM"""
+
+# GCE specific constants
+_bcds = dict.fromkeys(['us-east1', 'europe-west1'], ['b', 'c', 'd'])
+_abcfs = dict.fromkeys(['us-central1'], ['a', 'b', 'c', 'f'])
+_abcs = dict.fromkeys(
+    [
+        'us-east4',
+        'us-west1',
+        'europe-west4',
+        'europe-west3',
+        'europe-west2',
+        'asia-east1',
+        'asia-southeast1',
+        'asia-northeast1',
+        'asia-south1',
+        'australia-southeast1',
+        'southamerica-east1',
+        'asia-east2',
+        'asia-northeast2',
+        'europe-north1',
+        'europe-west6',
+        'northamerica-northeast1',
+        'us-west2',
+    ],
+    ['a', 'b', 'c'],
+)
+_zones_combo = {**_bcds, **_abcfs, **_abcs}
+VALID_GCE_ZONES = [f'{loc}-{zone}' for loc, zones in _zones_combo.items() for zone in zones]
+LATEST_RHEL7_GCE_IMG_UUID = '7726764279310511390'
+
+GCE_MACHINE_TYPE_DEFAULT = 'f1-micro'
+GCE_NETWORK_DEFAULT = 'default'
+GCE_EXTERNAL_IP_DEFAULT = True
+
+# AzureRM specific constants
+AZURERM_VALID_REGIONS = [
+    'East Asia',
+    'Southeast Asia',
+    'Central US',
+    'East US',
+    'East US 2',
+    'West US',
+    'North Central US',
+    'South Central US',
+    'North Europe',
+    'West Europe',
+    'Japan West',
+    'Japan East',
+    'Brazil South',
+    'Australia East',
+    'Australia Southeast',
+    'South India',
+    'Central India',
+    'West India',
+    'Canada Central',
+    'Canada East',
+    'UK South',
+    'UK West',
+    'West Central US',
+    'West US 2',
+    'Korea Central',
+    'Korea South',
+    'France Central',
+    'France South',
+    'Australia Central',
+    'Australia Central 2',
+    'UAE Central',
+    'UAE North',
+    'South Africa North',
+    'South Africa West',
+    'Switzerland North',
+    'Switzerland West',
+    'Germany North',
+    'Germany West Central',
+    'Norway West',
+    'Norway East',
+]
+AZURERM_RHEL7_FT_IMG_URN = 'marketplace://RedHat:RHEL:7-RAW:latest'
+AZURERM_RHEL7_UD_IMG_URN = 'marketplace://RedHat:RHEL:7-RAW-CI:7.6.2019072418'
+AZURERM_RHEL7_FT_BYOS_IMG_URN = 'marketplace://RedHat:rhel-byos:rhel-lvm78:7.8.20200410'
+AZURERM_RHEL7_FT_CUSTOM_IMG_URN = 'custom://vm1-shared-image-20200514081407'
+AZURERM_RHEL7_FT_GALLERY_IMG_URN = 'gallery://RHEL77img'
+AZURERM_RG_DEFAULT = 'SATQE'
+AZURERM_PLATFORM_DEFAULT = 'Linux'
+AZURERM_VM_SIZE_DEFAULT = 'Standard_B2ms'
+AZURERM_PREMIUM_OS_Disk = True
+AZURERM_FILE_URI = (
+    'https://raw.githubusercontent.com/SatelliteQE/robottelo/master/tests/foreman/data/uri.sh'
+)
@@ -0,0 +1,640 @@
+"""Permissions exposed by the server"""
+
+#: All permissions exposed by the server.
+#: :mod:`tests.foreman.api.test_permission` makes use of this.
+PERMISSIONS = {
+    None: [
+        'access_dashboard',
+        'app_root',
+        'attachments',
+        'configuration',
+        'create_arf_reports',
+        'create_recurring_logics',
+        'destroy_arf_reports',
+        'destroy_config_reports',
+        'download_bootdisk',
+        'edit_recurring_logics',
+        'escalate_roles',
+        'generate_ansible_inventory',
+        'logs',
+        'my_organizations',
+        'rh_telemetry_api',
+        'rh_telemetry_configurations',
+        'rh_telemetry_view',
+        'strata_api',
+        'upload_config_reports',
+        'view_arf_reports',
+        'view_cases',
+        'view_config_reports',
+        'view_log_viewer',
+        'view_plugins',
+        'view_recurring_logics',
+        'view_rh_search',
+        'view_tasks',
+        'view_statuses',
+        'generate_foreman_rh_cloud',
+        'forget_status_hosts',
+        'edit_user_mail_notifications',
+        'destroy_vm_compute_resources',
+        'power_vm_compute_resources',
+        'view_foreman_rh_cloud',
+    ],
+    'AnsibleRole': ['view_ansible_roles', 'destroy_ansible_roles', 'import_ansible_roles'],
+    'AnsibleVariable': [
+        'edit_ansible_variables',
+        'view_ansible_variables',
+        'import_ansible_variables',
+        'destroy_ansible_variables',
+        'create_ansible_variables',
+    ],
+    'Architecture': [
+        'view_architectures',
+        'create_architectures',
+        'edit_architectures',
+        'destroy_architectures',
+    ],
+    'Audit': ['view_audit_logs'],
+    'AuthSource': [
+        'view_authenticators',
+        'create_authenticators',
+        'edit_authenticators',
+        'destroy_authenticators',
+    ],
+    'Bookmark': ['view_bookmarks', 'create_bookmarks', 'edit_bookmarks', 'destroy_bookmarks'],
+    'ConfigGroup': [
+        'view_config_groups',
+        'create_config_groups',
+        'edit_config_groups',
+        'destroy_config_groups',
+    ],
+    'ComputeProfile': [
+        'view_compute_profiles',
+        'create_compute_profiles',
+        'edit_compute_profiles',
+        'destroy_compute_profiles',
+    ],
+    'ComputeResource': [
+        'view_compute_resources',
+        'create_compute_resources',
+        'edit_compute_resources',
+        'destroy_compute_resources',
+        'view_compute_resources_vms',
+        'create_compute_resources_vms',
+        'edit_compute_resources_vms',
+        'destroy_compute_resources_vms',
+        'power_compute_resources_vms',
+        'console_compute_resources_vms',
+        'destroy_vm_compute_resources',
+        'power_vm_compute_resources',
+    ],
+    'DiscoveryRule': [
+        'create_discovery_rules',
+        'destroy_discovery_rules',
+        'edit_discovery_rules',
+        'execute_discovery_rules',
+        'view_discovery_rules',
+    ],
+    'Domain': ['view_domains', 'create_domains', 'edit_domains', 'destroy_domains'],
+    'Environment': [
+        'view_environments',
+        'create_environments',
+        'edit_environments',
+        'destroy_environments',
+        'import_environments',
+    ],
+    'ExternalUsergroup': [
+        'view_external_usergroups',
+        'create_external_usergroups',
+        'edit_external_usergroups',
+        'destroy_external_usergroups',
+    ],
+    'FactValue': ['view_facts', 'upload_facts'],
+    'Filter': ['view_filters', 'create_filters', 'edit_filters', 'destroy_filters'],
+    'ForemanTasks::RecurringLogic': [
+        'create_recurring_logics',
+        'view_recurring_logics',
+        'edit_recurring_logics',
+    ],
+    'ForemanOpenscap::ArfReport': [
+        'create_arf_reports',
+        'view_arf_reports',
+        'destroy_arf_reports',
+    ],
+    'ForemanOpenscap::Policy': [
+        'assign_policies',
+        'create_policies',
+        'destroy_policies',
+        'edit_policies',
+        'view_policies',
+    ],
+    'ForemanOpenscap::ScapContent': [
+        'create_scap_contents',
+        'destroy_scap_contents',
+        'edit_scap_contents',
+        'view_scap_contents',
+    ],
+    'ForemanTasks::Task': ['edit_foreman_tasks', 'view_foreman_tasks'],
+    'JobInvocation': ['view_job_invocations', 'create_job_invocations', 'cancel_job_invocations'],
+    'JobTemplate': [
+        'view_job_templates',
+        'edit_job_templates',
+        'destroy_job_templates',
+        'create_job_templates',
+        'lock_job_templates',
+    ],
+    'ConfigReport': ['destroy_config_reports', 'view_config_reports', 'upload_config_reports'],
+    'ForemanVirtWhoConfigure::Config': [
+        "view_virt_who_config",
+        "create_virt_who_config",
+        "edit_virt_who_config",
+        "destroy_virt_who_config",
+    ],
+    "ForemanOpenscap::TailoringFile": [
+        "create_tailoring_files",
+        "view_tailoring_files",
+        "edit_tailoring_files",
+        "destroy_tailoring_files",
+    ],
+    'HostClass': ['edit_classes'],
+    'Hostgroup': [
+        'view_hostgroups',
+        'create_hostgroups',
+        'edit_hostgroups',
+        'destroy_hostgroups',
+        'play_roles_on_hostgroup',
+    ],
+    'HttpProxy': [
+        'view_http_proxies',
+        'create_http_proxies',
+        'edit_http_proxies',
+        'destroy_http_proxies',
+    ],
+    'Image': ['view_images', 'create_images', 'edit_images', 'destroy_images'],
+    'KeyPair': ["view_keypairs", "destroy_keypairs"],
+    'Location': [
+        'view_locations',
+        'create_locations',
+        'edit_locations',
+        'destroy_locations',
+        'assign_locations',
+    ],
+    'MailNotification': ['view_mail_notifications', 'edit_user_mail_notifications'],
+    'Medium': ['view_media', 'create_media', 'edit_media', 'destroy_media'],
+    'Model': ['view_models', 'create_models', 'edit_models', 'destroy_models'],
+    'Operatingsystem': [
+        'view_operatingsystems',
+        'create_operatingsystems',
+        'edit_operatingsystems',
+        'destroy_operatingsystems',
+    ],
+    'Parameter': ['view_params', 'create_params', 'edit_params', 'destroy_params'],
+    'PersonalAccessToken': [
+        'view_personal_access_tokens',
+        'create_personal_access_tokens',
+        'revoke_personal_access_tokens',
+    ],
+    'ProvisioningTemplate': [
+        'view_provisioning_templates',
+        'create_provisioning_templates',
+        'edit_provisioning_templates',
+        'destroy_provisioning_templates',
+        'deploy_provisioning_templates',
+        'lock_provisioning_templates',
+    ],
+    'Ptable': [
+        'view_ptables',
+        'create_ptables',
+        'edit_ptables',
+        'destroy_ptables',
+        'lock_ptables',
+    ],
+    'Puppetclass': [
+        'view_puppetclasses',
+        'create_puppetclasses',
+        'edit_puppetclasses',
+        'destroy_puppetclasses',
+        'import_puppetclasses',
+    ],
+    'PuppetclassLookupKey': [
+        'view_external_parameters',
+        'create_external_parameters',
+        'edit_external_parameters',
+        'destroy_external_parameters',
+    ],
+    'Realm': ['view_realms', 'create_realms', 'edit_realms', 'destroy_realms'],
+    'RemoteExecutionFeature': ['edit_remote_execution_features'],
+    'Report': ['view_reports', 'destroy_reports', 'upload_reports'],
+    'ReportTemplate': [
+        'edit_report_templates',
+        'destroy_report_templates',
+        'generate_report_templates',
+        'create_report_templates',
+        'view_report_templates',
+        'lock_report_templates',
+    ],
+    'Role': ['view_roles', 'create_roles', 'edit_roles', 'destroy_roles'],
+    'Setting': ['view_settings', 'edit_settings'],
+    'SmartProxy': [
+        'view_smart_proxies',
+        'create_smart_proxies',
+        'edit_smart_proxies',
+        'destroy_smart_proxies',
+        'view_smart_proxies_autosign',
+        'create_smart_proxies_autosign',
+        'destroy_smart_proxies_autosign',
+        'view_smart_proxies_puppetca',
+        'edit_smart_proxies_puppetca',
+        'destroy_smart_proxies_puppetca',
+        'manage_capsule_content',
+        'view_capsule_content',
+        'view_openscap_proxies',
+    ],
+    'SshKey': ["view_ssh_keys", "create_ssh_keys", "destroy_ssh_keys"],
+    'Subnet': [
+        'view_subnets',
+        'create_subnets',
+        'edit_subnets',
+        'destroy_subnets',
+        'import_subnets',
+    ],
+    'Template': ['export_templates', 'import_templates', 'view_template_syncs'],
+    'TemplateInvocation': [
+        'filter_autocompletion_for_template_invocation',
+        'create_template_invocations',
+        'view_template_invocations',
+    ],
+    'Usergroup': ['view_usergroups', 'create_usergroups', 'edit_usergroups', 'destroy_usergroups'],
+    'User': ['view_users', 'create_users', 'edit_users', 'destroy_users'],
+    'Host': [
+        'auto_provision_discovered_hosts',
+        'build_hosts',
+        'cockpit_hosts',
+        'console_hosts',
+        'create_hosts',
+        'destroy_discovered_hosts',
+        'destroy_hosts',
+        'edit_discovered_hosts',
+        'edit_hosts',
+        'ipmi_boot_hosts',
+        'play_roles_on_host',
+        'power_hosts',
+        'provision_discovered_hosts',
+        'submit_discovered_hosts',
+        'view_discovered_hosts',
+        'view_hosts',
+        'forget_status_hosts',
+    ],
+    'Katello::ActivationKey': [
+        'view_activation_keys',
+        'create_activation_keys',
+        'edit_activation_keys',
+        'destroy_activation_keys',
+    ],
+    'Katello::ContentView': [
+        'view_content_views',
+        'create_content_views',
+        'edit_content_views',
+        'destroy_content_views',
+        'publish_content_views',
+        'promote_or_remove_content_views',
+        'export_content_views',
+    ],
+    'Katello::GpgKey': [
+        'view_content_credentials',
+        'create_content_credentials',
+        'edit_content_credentials',
+        'destroy_content_credentials',
+    ],
+    'Katello::HostCollection': [
+        'view_host_collections',
+        'create_host_collections',
+        'edit_host_collections',
+        'destroy_host_collections',
+    ],
+    'Katello::KTEnvironment': [
+        'view_lifecycle_environments',
+        'create_lifecycle_environments',
+        'edit_lifecycle_environments',
+        'destroy_lifecycle_environments',
+        'promote_or_remove_content_views_to_environments',
+    ],
+    'Katello::Product': [
+        'view_products',
+        'create_products',
+        'edit_products',
+        'destroy_products',
+        'sync_products',
+        'export_products',
+    ],
+    'Katello::Subscription': [
+        'view_subscriptions',
+        'attach_subscriptions',
+        'unattach_subscriptions',
+        'import_manifest',
+        'delete_manifest',
+        'manage_subscription_allocations',
+    ],
+    'Organization': [
+        'view_organizations',
+        'create_organizations',
+        'edit_organizations',
+        'destroy_organizations',
+        'assign_organizations',
+    ],
+    'Katello::SyncPlan': [
+        'view_sync_plans',
+        'create_sync_plans',
+        'edit_sync_plans',
+        'destroy_sync_plans',
+        'sync_sync_plans',
+    ],
+}
+
+PERMISSIONS_UI = {
+    '(Miscellaneous)': [
+        'access_dashboard',
+        'app_root',
+        'attachments',
+        'configuration',
+        'download_bootdisk',
+        'escalate_roles',
+        'generate_ansible_inventory',
+        'logs',
+        'my_organizations',
+        'rh_telemetry_api',
+        'rh_telemetry_configurations',
+        'rh_telemetry_view',
+        'view_cases',
+        'view_log_viewer',
+        'view_plugins',
+        'view_rh_search',
+        'view_tasks',
+        'view_statuses',
+    ],
+    'Activation Keys': [
+        'view_activation_keys',
+        'create_activation_keys',
+        'edit_activation_keys',
+        'destroy_activation_keys',
+    ],
+    'Architecture': [
+        'view_architectures',
+        'create_architectures',
+        'edit_architectures',
+        'destroy_architectures',
+    ],
+    'Audit': ['view_audit_logs'],
+    'Auth source ldap': [
+        'view_authenticators',
+        'create_authenticators',
+        'edit_authenticators',
+        'destroy_authenticators',
+    ],
+    'Bookmark': ['view_bookmarks', 'create_bookmarks', 'edit_bookmarks', 'destroy_bookmarks'],
+    'Capsule': [
+        'view_smart_proxies',
+        'create_smart_proxies',
+        'edit_smart_proxies',
+        'destroy_smart_proxies',
+        'view_smart_proxies_autosign',
+        'create_smart_proxies_autosign',
+        'destroy_smart_proxies_autosign',
+        'view_smart_proxies_puppetca',
+        'edit_smart_proxies_puppetca',
+        'destroy_smart_proxies_puppetca',
+        'manage_capsule_content',
+        'view_capsule_content',
+        'view_openscap_proxies',
+    ],
+    'Compute profile': [
+        'view_compute_profiles',
+        'create_compute_profiles',
+        'edit_compute_profiles',
+        'destroy_compute_profiles',
+    ],
+    'Compute resource': [
+        'view_compute_resources',
+        'create_compute_resources',
+        'edit_compute_resources',
+        'destroy_compute_resources',
+        'view_compute_resources_vms',
+        'create_compute_resources_vms',
+        'edit_compute_resources_vms',
+        'destroy_compute_resources_vms',
+        'power_compute_resources_vms',
+        'console_compute_resources_vms',
+    ],
+    'Config group': [
+        'view_config_groups',
+        'create_config_groups',
+        'edit_config_groups',
+        'destroy_config_groups',
+    ],
+    'Config report': ['view_config_reports', 'destroy_config_reports', 'upload_config_reports'],
+    'Content Views': [
+        'view_content_views',
+        'create_content_views',
+        'edit_content_views',
+        'destroy_content_views',
+        'publish_content_views',
+        'promote_or_remove_content_views',
+        'export_content_views',
+    ],
+    'Discovery rule': [
+        'view_discovery_rules',
+        'create_discovery_rules',
+        'edit_discovery_rules',
+        'execute_discovery_rules',
+        'destroy_discovery_rules',
+    ],
+    'Domain': ['view_domains', 'create_domains', 'edit_domains', 'destroy_domains'],
+    'Environment': [
+        'view_environments',
+        'create_environments',
+        'edit_environments',
+        'destroy_environments',
+        'import_environments',
+    ],
+    'External usergroup': [
+        'view_external_usergroups',
+        'create_external_usergroups',
+        'edit_external_usergroups',
+        'destroy_external_usergroups',
+    ],
+    'Fact value': ['view_facts', 'upload_facts'],
+    'Filter': ['view_filters', 'create_filters', 'edit_filters', 'destroy_filters'],
+    'Host': [
+        'view_hosts',
+        'create_hosts',
+        'edit_hosts',
+        'destroy_hosts',
+        'build_hosts',
+        'power_hosts',
+        'console_hosts',
+        'ipmi_boot_hosts',
+        'view_discovered_hosts',
+        'submit_discovered_hosts',
+        'auto_provision_discovered_hosts',
+        'provision_discovered_hosts',
+        'edit_discovered_hosts',
+        'destroy_discovered_hosts',
+    ],
+    'Host Collections': [
+        'view_host_collections',
+        'create_host_collections',
+        'edit_host_collections',
+        'destroy_host_collections',
+    ],
+    'Host Group': [
+        'view_hostgroups',
+        'create_hostgroups',
+        'edit_hostgroups',
+        'destroy_hostgroups',
+    ],
+    'Host сlass': ['edit_classes'],
+    'Image': ['view_images', 'create_images', 'edit_images', 'destroy_images'],
+    'Job invocation': ['create_job_invocations', 'view_job_invocations'],
+    'Job template': [
+        'view_job_templates',
+        'create_job_templates',
+        'edit_job_templates',
+        'destroy_job_templates',
+        'lock_job_templates',
+    ],
+    'Key pair': ["view_keypairs", "destroy_keypairs"],
+    'Lifecycle Environment': [
+        'view_lifecycle_environments',
+        'create_lifecycle_environments',
+        'edit_lifecycle_environments',
+        'destroy_lifecycle_environments',
+        'promote_or_remove_content_views_to_environments',
+    ],
+    'Location': [
+        'view_locations',
+        'create_locations',
+        'edit_locations',
+        'destroy_locations',
+        'assign_locations',
+    ],
+    'Mail notification': ['view_mail_notifications'],
+    'Medium': ['view_media', 'create_media', 'edit_media', 'destroy_media'],
+    'Model': ['view_models', 'create_models', 'edit_models', 'destroy_models'],
+    'Operatingsystem': [
+        'view_operatingsystems',
+        'create_operatingsystems',
+        'edit_operatingsystems',
+        'destroy_operatingsystems',
+    ],
+    'Organization': [
+        'view_organizations',
+        'create_organizations',
+        'edit_organizations',
+        'destroy_organizations',
+        'assign_organizations',
+    ],
+    'Parameter': ['view_params', 'create_params', 'edit_params', 'destroy_params'],
+    'Partition Table': [
+        'view_ptables',
+        'create_ptables',
+        'edit_ptables',
+        'destroy_ptables',
+        'lock_ptables',
+    ],
+    'Product and Repositories': [
+        'view_products',
+        'create_products',
+        'edit_products',
+        'destroy_products',
+        'sync_products',
+        'export_products',
+    ],
+    'Provisioning template': [
+        'view_provisioning_templates',
+        'create_provisioning_templates',
+        'edit_provisioning_templates',
+        'destroy_provisioning_templates',
+        'deploy_provisioning_templates',
+        'lock_provisioning_templates',
+    ],
+    'Puppet class': [
+        'view_puppetclasses',
+        'create_puppetclasses',
+        'edit_puppetclasses',
+        'destroy_puppetclasses',
+        'import_puppetclasses',
+    ],
+    'Realm': ['view_realms', 'create_realms', 'edit_realms', 'destroy_realms'],
+    'Remote execution feature': ['edit_remote_execution_features'],
+    'Report': ['view_reports', 'destroy_reports', 'upload_reports'],
+    'Role': ['view_roles', 'create_roles', 'edit_roles', 'destroy_roles'],
+    'Satellite openscap/arf report': [
+        'create_arf_reports',
+        'view_arf_reports',
+        'destroy_arf_reports',
+    ],
+    'Satellite openscap/policy': [
+        'view_policies',
+        'edit_policies',
+        'create_policies',
+        'destroy_policies',
+        'assign_policies',
+    ],
+    'Satellite openscap/scap content': [
+        'create_scap_contents',
+        'destroy_scap_contents',
+        'edit_scap_contents',
+        'view_scap_contents',
+    ],
+    'Satellite openscap/tailoring file': [
+        "create_tailoring_files",
+        "view_tailoring_files",
+        "edit_tailoring_files",
+        "destroy_tailoring_files",
+    ],
+    'Satellite tasks/recurring logic': [
+        'create_recurring_logics',
+        'view_recurring_logics',
+        'edit_recurring_logics',
+    ],
+    'Satellite tasks/task': ['view_foreman_tasks', 'edit_foreman_tasks'],
+    'Satellite virt who configure/config': [
+        "view_virt_who_config",
+        "create_virt_who_config",
+        "edit_virt_who_config",
+        "destroy_virt_who_config",
+    ],
+    'Smart class parameter': [
+        'view_external_parameters',
+        'create_external_parameters',
+        'edit_external_parameters',
+        'destroy_external_parameters',
+    ],
+    'Ssh key': ["view_ssh_keys", "create_ssh_keys", "destroy_ssh_keys"],
+    'Subnet': [
+        'view_subnets',
+        'create_subnets',
+        'edit_subnets',
+        'destroy_subnets',
+        'import_subnets',
+    ],
+    'Subscription': [
+        'view_subscriptions',
+        'attach_subscriptions',
+        'unattach_subscriptions',
+        'import_manifest',
+        'delete_manifest',
+    ],
+    'Sync Plans': [
+        'view_sync_plans',
+        'create_sync_plans',
+        'edit_sync_plans',
+        'destroy_sync_plans',
+        'sync_sync_plans',
+    ],
+    'Template invocation': [
+        'execute_template_invocation',
+        'filter_autocompletion_for_template_invocation',
+    ],
+    'User': ['view_users', 'create_users', 'edit_users', 'destroy_users'],
+    'Usergroup': ['view_usergroups', 'create_usergroups', 'edit_usergroups', 'destroy_usergroups'],
+}
@@ -0,0 +1,239 @@
+"""Red Hat repositories constants"""
+from robottelo.constants import DISTRO_RHEL6
+from robottelo.constants import DISTRO_RHEL7
+from robottelo.constants import PRDS
+from robottelo.constants import REPOSET
+from robottelo.constants import RHEL_6_MAJOR_VERSION
+from robottelo.constants import RHEL_7_MAJOR_VERSION
+
+REPOS = {
+    'rhel7': {
+        'id': 'rhel-7-server-rpms',
+        'name': 'Red Hat Enterprise Linux 7 Server RPMs x86_64 7Server',
+        'releasever': '7Server',
+        'arch': 'x86_64',
+        'distro': DISTRO_RHEL7,
+        'reposet': REPOSET['rhel7'],
+        'product': PRDS['rhel'],
+        'major_version': RHEL_7_MAJOR_VERSION,
+        'distro_repository': True,
+        'key': 'rhel',
+        'version': '7.7',
+    },
+    'rhel6': {
+        'id': 'rhel-6-server-rpms',
+        'name': 'Red Hat Enterprise Linux 6 Server RPMs x86_64 6Server',
+        'releasever': '6Server',
+        'arch': 'x86_64',
+        'distro': DISTRO_RHEL6,
+        'reposet': REPOSET['rhel6'],
+        'product': PRDS['rhel'],
+        'major_version': RHEL_6_MAJOR_VERSION,
+        'distro_repository': True,
+        'key': 'rhel',
+        'version': '6.8',
+    },
+    'rhsc7': {
+        'id': 'rhel-7-server-satellite-capsule-6.8-rpms',
+        'name': ('Red Hat Satellite Capsule 6.8 for RHEL 7 Server RPMs x86_64'),
+        'version': '6.8',
+        'reposet': REPOSET['rhsc7'],
+        'product': PRDS['rhsc'],
+        'distro': DISTRO_RHEL7,
+        'key': 'rhsc',
+    },
+    'rhsc7_iso': {
+        'id': 'rhel-7-server-satellite-capsule-6.8-isos',
+        'name': ('Red Hat Satellite Capsule 6.8 for RHEL 7 Server ISOs x86_64'),
+    },
+    'rhsc6': {
+        'id': 'rhel-6-server-satellite-capsule-6.8-rpms',
+        'name': ('Red Hat Satellite Capsule 6.8 for RHEL 6 Server RPMs x86_64'),
+        'version': '6.8',
+        'reposet': REPOSET['rhsc6'],
+        'product': PRDS['rhsc'],
+        'distro': DISTRO_RHEL6,
+        'key': 'rhsc',
+    },
+    'rhst7': {
+        'id': 'rhel-7-server-satellite-tools-6.8-rpms',
+        'name': ('Red Hat Satellite Tools 6.8 for RHEL 7 Server RPMs x86_64'),
+        'version': '6.8',
+        'reposet': REPOSET['rhst7'],
+        'product': PRDS['rhel'],
+        'distro': DISTRO_RHEL7,
+        'key': 'rhst',
+    },
+    'rhst7_64': {
+        'id': 'rhel-7-server-satellite-tools-6.4-rpms',
+        'name': ('Red Hat Satellite Tools 6.4 for RHEL 7 Server RPMs x86_64'),
+        'version': '6.4',
+        'reposet': REPOSET['rhst7_64'],
+        'product': PRDS['rhel'],
+        'distro': DISTRO_RHEL7,
+        'key': 'rhst',
+    },
+    'rhst7_65': {
+        'id': 'rhel-7-server-satellite-tools-6.5-rpms',
+        'name': ('Red Hat Satellite Tools 6.5 for RHEL 7 Server RPMs x86_64'),
+        'version': '6.5',
+        'reposet': REPOSET['rhst7_65'],
+        'product': PRDS['rhel'],
+        'distro': DISTRO_RHEL7,
+        'key': 'rhst',
+    },
+    'rhst7_66': {
+        'id': 'rhel-7-server-satellite-tools-6.6-rpms',
+        'name': ('Red Hat Satellite Tools 6.6 for RHEL 7 Server RPMs x86_64'),
+        'version': '6.6',
+        'reposet': REPOSET['rhst7_66'],
+        'product': PRDS['rhel'],
+        'distro': DISTRO_RHEL7,
+        'key': 'rhst',
+    },
+    'rhst7_67': {
+        'id': 'rhel-7-server-satellite-tools-6.7-rpms',
+        'name': ('Red Hat Satellite Tools 6.7 for RHEL 7 Server RPMs x86_64'),
+        'version': '6.7',
+        'reposet': REPOSET['rhst7_67'],
+        'product': PRDS['rhel'],
+        'distro': DISTRO_RHEL7,
+        'key': 'rhst',
+    },
+    'rhst7_68': {
+        'id': 'rhel-7-server-satellite-tools-6.8-rpms',
+        'name': ('Red Hat Satellite Tools 6.8 for RHEL 7 Server RPMs x86_64'),
+        'version': '6.8',
+        'reposet': REPOSET['rhst7_68'],
+        'product': PRDS['rhel'],
+        'distro': DISTRO_RHEL7,
+        'key': 'rhst',
+    },
+    'rhst6': {
+        'id': 'rhel-6-server-satellite-tools-6.8-rpms',
+        'name': ('Red Hat Satellite Tools 6.8 for RHEL 6 Server RPMs x86_64'),
+        'version': '6.8',
+        'reposet': REPOSET['rhst6'],
+        'product': PRDS['rhel'],
+        'distro': DISTRO_RHEL6,
+        'key': 'rhst',
+    },
+    'rhva6': {
+        'id': 'rhel-6-server-rhev-agent-rpms',
+        'name': ('Red Hat Enterprise Virtualization Agents for RHEL 6 Server RPMs x86_64 6Server'),
+        'version': '6.0',
+        'reposet': REPOSET['rhva6'],
+        'product': PRDS['rhel'],
+        'distro': DISTRO_RHEL6,
+        'releasever': '6Server',
+        'key': 'rhva6',
+    },
+    'rhva65': {
+        'name': ('Red Hat Enterprise Virtualization Agents for RHEL 6 Server RPMs x86_64 6.5'),
+        'version': '6.5',
+        'reposet': REPOSET['rhva6'],
+        'product': PRDS['rhel'],
+        'distro': DISTRO_RHEL6,
+        'key': 'rhva65',
+    },
+    'rhva610': {
+        'name': ('Red Hat Enterprise Virtualization Agents for RHEL 6 Server RPMs x86_64 6.10'),
+        'version': '6.10',
+        'reposet': REPOSET['rhva6'],
+        'product': PRDS['rhel'],
+        'distro': DISTRO_RHEL6,
+        'key': 'rhva610',
+    },
+    'rhct6': {
+        'name': 'Red Hat CloudForms Tools for RHEL 6 RPMs x86_64 6Server',
+        'releasever': '6Server',
+        'version': '6Server',
+        'arch': 'x86_64',
+        'reposet': REPOSET['rhct6'],
+        'product': PRDS['rhel'],
+        'distro': DISTRO_RHEL6,
+        'key': 'rhct6',
+    },
+    'rhaht': {'name': ('Red Hat Enterprise Linux Atomic Host Trees')},
+    'rhdt7': {
+        'name': ('Red Hat Developer Tools RPMs for Red Hat Enterprise Linux 7 Server x86_64')
+    },
+    'rhscl7': {
+        'id': 'rhel-server-rhscl-7-rpms',
+        'name': (
+            'Red Hat Software Collections RPMs for Red Hat Enterprise'
+            ' Linux 7 Server x86_64 7Server'
+        ),
+    },
+    'rhae2': {
+        'id': 'rhel-7-server-ansible-2.7-rpms',
+        'name': 'Red Hat Ansible Engine 2.7 RPMs for Red Hat Enterprise Linux 7 Server x86_64',
+        'version': '2.7',
+        'arch': 'x86_64',
+        'reposet': REPOSET['rhae2'],
+        'product': PRDS['rhae'],
+        'distro': DISTRO_RHEL7,
+        'key': 'rhae2',
+    },
+}
+
+DISTRO_REPOS = {
+    # DISTRO_RHEL6: REPOS['rhel6'],
+    DISTRO_RHEL7: REPOS['rhel7']
+}
+
+# The 'create_repos_tree' function under 'sync' module uses the following
+# list of tuples. It actually includes following two repos under
+# Reposet: Red Hat Enterprise Virtualization Agents for RHEL 6 Server RPMs
+#
+# Red Hat Enterprise Virtualization Agents for RHEL 6 Server RPMs x86_64 6.8
+# Red Hat Enterprise Virtualization Agents for RHEL 6 Server RPMs x86_64
+# 6Server
+
+RHVA_REPO_TREE = [
+    (
+        'rhel',
+        'rhva6',
+        'rhva65',
+        'repo_name',
+        'Red Hat Enterprise Virtualization Agents for RHEL 6 Server RPMs x86_64 6.5',
+    ),
+    ('rhel', 'rhva6', 'rhva65', 'repo_arch', 'x86_64'),
+    ('rhel', 'rhva6', 'rhva65', 'repo_ver', '6.5'),
+    (
+        'rhel',
+        'rhva6',
+        'rhva610',
+        'repo_name',
+        'Red Hat Enterprise Virtualization Agents for RHEL 6 Server RPMs x86_64 6.10',
+    ),
+    ('rhel', 'rhva6', 'rhva610', 'repo_arch', 'x86_64'),
+    ('rhel', 'rhva6', 'rhva610', 'repo_ver', '6.10'),
+    (
+        'rhel',
+        'rhva6',
+        'rhva6S',
+        'repo_name',
+        'Red Hat Enterprise Virtualization Agents for RHEL 6 Server RPMs x86_64 6Server',
+    ),
+    ('rhel', 'rhva6', 'rhva6S', 'repo_arch', 'x86_64'),
+    ('rhel', 'rhva6', 'rhva6S', 'repo_ver', '6Server'),
+]
+
+SAT6_TOOLS_TREE = [
+    (
+        'rhel',
+        'rhst6',
+        'rhst6',
+        'repo_name',
+        'Red Hat Satellite Tools 6.8 for RHEL 6 Server RPMs x86_64',
+    ),
+    ('rhel', 'rhst6', 'rhst6', 'repo_arch', 'x86_64'),
+    ('rhel', 'rhst6', 'rhst6', 'repo_ver', '6.8'),
+]
+
+ATOMIC_HOST_TREE = [
+    ('rhah', 'rhaht', 'rhaht', 'repo_name', 'Red Hat Enterprise Linux Atomic Host Trees'),
+    ('rhah', 'rhaht', 'rhaht', 'repo_arch', None),
+    ('rhah', 'rhaht', 'rhaht', 'repo_ver', None),
+]
@@ -0,0 +1,469 @@
+"""Coordination server shared by the test runs of many machines.
+
+A lightweight asyncio TCP server that keeps the shared function values and the
+locks and semaphores in memory, so that the xdist workers of several executor
+machines testing the same Satellite can share the ``@shared`` results and the
+function locks. It can be used as a stand-in for Redis in tests.
+
+Start it with::
+
+    ROBOTTELO_COORDINATION_TOKEN=<secret> \
+        python scripts/coordination_server.py --host 0.0.0.0 --port 7890
+
+and set ``coordination_host``, ``coordination_token`` (and
+``coordination_port``) in the ``[shared_function]`` section of
+robottelo.properties of every machine. The server listens on the loopback
+interface unless told otherwise, and every connection must first authenticate
+with the shared token: the values it keeps may be unpickled by its clients.
+
+The protocol is one json object per line. A request has an ``op`` and its
+arguments, the response has a ``result`` or an ``error``. A client sends its
+next request once it got the response of the previous one::
+
+    {"op": "auth", "token": "..."}
+    {"op": "set", "key": "k", "value": {"text": "..."}}
+    {"op": "get", "key": "k"}
+    {"op": "acquire", "name": "n", "owner": "o", "capacity": 1, "timeout": 60}
+    {"op": "refresh", "name": "n", "owner": "o"}
+    {"op": "release", "name": "n", "owner": "o"}
+    {"op": "stats", "name": "n"}
+
+A lock is a semaphore of capacity one. The waiters are served in order. A
+holder keeps its lease by refreshing it, the holders that do not refresh their
+lease for lease.LEASE_TIMEOUT seconds, or whose connection is closed, are
+released. A waiter whose connection is closed leaves the queue.
+"""
+import asyncio
+import atexit
+import base64
+import collections
+import contextlib
+import hmac
+import json
+import logging
+import os
+import socket
+import threading
+import time
+import uuid
+
+from robottelo.decorators import lease
+
+logger = logging.getLogger('robottelo')
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 7890
+LOCK_TIMEOUT = 7200
+# how often the server releases the holders with an expired lease
+EXPIRE_INTERVAL = 1
+
+
+class CoordinationError(Exception):
+    """The coordination server returned an error"""
+
+
+class CoordinationLockTimeout(CoordinationError):
+    """The lock was not acquired in time"""
+
+
+class _ConnectionClosed(Exception):
+    """The client connection must be closed"""
+
+
+def _encode_value(value):
+    if value is None:
+        return None
+    if isinstance(value, bytes):
+        return dict(base64=base64.b64encode(value).decode())
+    return dict(text=value)
+
+
+def _decode_value(value):
+    if value is None:
+        return None
+    if 'base64' in value:
+        return base64.b64decode(value['base64'])
+    return value['text']
+
+
+class _Semaphore:
+    def __init__(self):
+        # owner: (lease expiry time, the set of the owner connection holdings)
+        self.holders = {}
+        # (owner, future, the set of the owner connection holdings)
+        self.waiters = collections.deque()
+        self.capacity = 1
+
+
+class CoordinationServer:
+    """The coordination server
+
+    :param host: the address to listen on
+    :param port: the port to listen on, 0 for any free port
+    :param lease_timeout: the seconds after which a holder that did not
+        refresh its lease is released, by default lease.LEASE_TIMEOUT
+    :param token: the secret shared with the clients, required
+    """
+
+    def __init__(self, host=DEFAULT_HOST, port=DEFAULT_PORT, lease_timeout=None, token=None):
+        if not token:
+            raise ValueError('the coordination server needs a shared token')
+        self.host = host
+        self.port = port
+        self._lease_timeout = lease_timeout
+        self._token = token
+        self._values = {}
+        self._semaphores = {}
+        self._server = None
+        self._expire_task = None
+        self._loop = None
+        self._thread = None
+
+    @property
+    def lease_timeout(self):
+        if self._lease_timeout is None:
+            return lease.LEASE_TIMEOUT
+        return self._lease_timeout
+
+    def _grant(self, semaphore, name, owner, holdings):
+        semaphore.holders[owner] = (time.time() + self.lease_timeout, holdings)
+        holdings.add((name, owner))
+
+    def _wake(self, semaphore, name):
+        """Grant the free slots to the first waiters"""
+        while semaphore.waiters and len(semaphore.holders) < semaphore.capacity:
+            owner, future, holdings = semaphore.waiters.popleft()
+            if future.done():
+                # the waiter timed out
+                continue
+            self._grant(semaphore, name, owner, holdings)
+            future.set_result(True)
+
+    async def _acquire(self, name, owner, holdings, reader, capacity=1, timeout=LOCK_TIMEOUT):
+        semaphore = self._semaphores.setdefault(name, _Semaphore())
+        semaphore.capacity = capacity
+        if owner in semaphore.holders:
+            raise CoordinationError(f'"{name}" already held by "{owner}"')
+        if not semaphore.waiters and len(semaphore.holders) < capacity:
+            self._grant(semaphore, name, owner, holdings)
+            return True
+        loop = asyncio.get_event_loop()
+        future = loop.create_future()
+        semaphore.waiters.append((owner, future, holdings))
+        # the client sends nothing while waiting, the read only ends when the
+        # connection is closed, for example when the client is killed
+        closed = loop.create_task(reader.read(1))
+        try:
+            await asyncio.wait(
+                [future, closed], timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+        finally:
+            closed.cancel()
+            # the reader is free for the next request once the read is done
+            with contextlib.suppress(asyncio.CancelledError):
+                await closed
+        if closed.done() and not closed.cancelled():
+            # closed, or a request sent while waiting, out of the protocol
+            future.cancel()
+            raise _ConnectionClosed(f'connection closed while waiting for "{name}"')
+        if future.done():
+            return True
+        # timed out, leave the queue
+        future.cancel()
+        return False
+
+    def _release(self, name, owner):
+        semaphore = self._semaphores.get(name)
+        if semaphore is None or owner not in semaphore.holders:
+            return False
+        _, holdings = semaphore.holders.pop(owner)
+        holdings.discard((name, owner))
+        self._wake(semaphore, name)
+        if not semaphore.holders and not semaphore.waiters:
+            del self._semaphores[name]
+        return True
+
+    def _refresh(self, name, owner):
+        semaphore = self._semaphores.get(name)
+        if semaphore is None or owner not in semaphore.holders:
+            return False
+        _, holdings = semaphore.holders[owner]
+        semaphore.holders[owner] = (time.time() + self.lease_timeout, holdings)
+        return True
+
+    def _stats(self, name):
+        semaphore = self._semaphores.get(name)
+        if semaphore is None:
+            return dict(holders=0, waiters=0)
+        waiters = sum(1 for _, future, _ in semaphore.waiters if not future.done())
+        return dict(holders=len(semaphore.holders), waiters=waiters)
+
+    async def _expire_leases(self):
+        while True:
+            await asyncio.sleep(EXPIRE_INTERVAL)
+            now = time.time()
+            for name, semaphore in list(self._semaphores.items()):
+                for owner, (expiry, _) in list(semaphore.holders.items()):
+                    if expiry < now:
+                        logger.warning(f'"{name}" owner "{owner}" lease expired, released')
+                        self._release(name, owner)
+
+    async def _dispatch(self, request, holdings, reader):
+        op = request.pop('op')
+        if op == 'get':
+            return _encode_value(self._values.get(request['key']))
+        if op == 'set':
+            self._values[request['key']] = _decode_value(request['value'])
+            return True
+        if op == 'acquire':
+            return await self._acquire(holdings=holdings, reader=reader, **request)
+        if op == 'release':
+            return self._release(**request)
+        if op == 'refresh':
+            return self._refresh(**request)
+        if op == 'stats':
+            return self._stats(**request)
+        raise CoordinationError(f'unknown operation "{op}"')
+
+    async def _handle_connection(self, reader, writer):
+        # the locks acquired through this connection, released when the
+        # connection is closed, for example when the client process is killed
+        holdings = set()
+        try:
+            if not await self._authenticate(reader, writer):
+                return
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    result = await self._dispatch(json.loads(line), holdings, reader)
+                    response = dict(result=result)
+                except _ConnectionClosed:
+                    break
+                except Exception as exp:
+                    response = dict(error=f'{type(exp).__name__}: {exp}')
+                writer.write(json.dumps(response).encode() + b'\n')
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            for name, owner in list(holdings):
+                self._release(name, owner)
+            writer.close()
+
+    async def _authenticate(self, reader, writer):
+        """Return whether the first request of the connection authenticates
+        it with the shared token, answer it"""
+        line = await reader.readline()
+        try:
+            request = json.loads(line)
+            token = request['token'] if request.get('op') == 'auth' else None
+        except (ValueError, TypeError, KeyError, AttributeError):
+            token = None
+        authenticated = isinstance(token, str) and hmac.compare_digest(
+            token.encode(), self._token.encode()
+        )
+        if authenticated:
+            response = dict(result=True)
+        else:
+            peer = writer.get_extra_info('peername')
+            logger.warning(f'coordination server connection from {peer} not authenticated')
+            response = dict(error='CoordinationError: not authenticated')
+        writer.write(json.dumps(response).encode() + b'\n')
+        await writer.drain()
+        return authenticated
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._expire_task = asyncio.get_event_loop().create_task(self._expire_leases())
+        logger.info(f'coordination server listening on {self.host}:{self.port}')
+
+    async def close(self):
+        self._expire_task.cancel()
+        self._server.close()
+        await self._server.wait_closed()
+
+    def serve_forever(self):
+        """Run the server in the current thread until interrupted"""
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        loop.run_until_complete(self.start())
+        try:
+            loop.run_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            loop.run_until_complete(self.close())
+            loop.close()
+
+    def start_in_thread(self):
+        """Run the server in a background thread and return its port"""
+        started = threading.Event()
+
+        def run():
+            self._loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(self._loop)
+            self._loop.run_until_complete(self.start())
+            started.set()
+            self._loop.run_forever()
+            self._loop.run_until_complete(self.close())
+            self._loop.close()
+
+        self._thread = threading.Thread(target=run, name='robottelo-coordination', daemon=True)
+        self._thread.start()
+        started.wait()
+        return self.port
+
+    def stop(self):
+        """Stop the server started in a background thread"""
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+
+
+class CoordinationClient:
+    """Client of the coordination server, a connection is opened per process
+    and thread, and the lease heartbeats of all the held locks share one more
+    connection. Use :func:`get_client` to share the client of a server.
+
+    :param host: the coordination server host
+    :param port: the coordination server port
+    :param token: the secret shared with the server
+    """
+
+    def __init__(self, host=DEFAULT_HOST, port=DEFAULT_PORT, token=None):
+        self.host = host
+        self.port = port
+        self._token = token
+        self._connections = threading.local()
+        # the connections opened by this client, closed by close()
+        self._opened = []
+        self._opened_lock = threading.Lock()
+        self._heartbeat = dict(connection=None, pid=None)
+        self._heartbeat_lock = threading.Lock()
+
+    def _connect(self):
+        """Open and authenticate a new connection"""
+        sock = socket.create_connection((self.host, self.port))
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        connection = sock.makefile('rwb')
+        sock.close()
+        with self._opened_lock:
+            self._opened.append(connection)
+        try:
+            self._send(connection, dict(op='auth', token=self._token))
+        except BaseException:
+            self._discard(connection)
+            raise
+        return connection
+
+    def _discard(self, connection):
+        with self._opened_lock:
+            if connection in self._opened:
+                self._opened.remove(connection)
+        try:
+            connection.close()
+        except OSError:
+            pass
+
+    def _get_connection(self):
+        connection = getattr(self._connections, 'connection', None)
+        # a connection must not be used across a fork
+        if connection is None or connection.closed or self._connections.pid != os.getpid():
+            self._connections.connection = connection = self._connect()
+            self._connections.pid = os.getpid()
+        return connection
+
+    def close(self):
+        """Close all the connections of the client, a new one is opened by
+        the next request"""
+        with self._opened_lock:
+            connections, self._opened = self._opened, []
+        for connection in connections:
+            try:
+                connection.close()
+            except OSError:
+                pass
+
+    def request(self, op, **kwargs):
+        """Send a request and return its result"""
+        return self._send(self._get_connection(), dict(op=op, **kwargs))
+
+    def _refresh(self, name, owner):
+        """Refresh the lease of a held lock through the heartbeat connection"""
+        with self._heartbeat_lock:
+            connection = self._heartbeat['connection']
+            if connection is None or connection.closed or self._heartbeat['pid'] != os.getpid():
+                connection = self._connect()
+                self._heartbeat.update(connection=connection, pid=os.getpid())
+            return self._send(connection, dict(op='refresh', name=name, owner=owner))
+
+    def _send(self, connection, request):
+        try:
+            connection.write(json.dumps(request).encode() + b'\n')
+            connection.flush()
+            line = connection.readline()
+        except OSError:
+            self._discard(connection)
+            raise
+        if not line:
+            self._discard(connection)
+            raise CoordinationError('connection closed by the coordination server')
+        response = json.loads(line)
+        if 'error' in response:
+            raise CoordinationError(response['error'])
+        return response['result']
+
+    def get(self, key):
+        return _decode_value(self.request('get', key=key))
+
+    def set(self, key, value):
+        self.request('set', key=key, value=_encode_value(value))
+
+    def stats(self, name):
+        """Return the number of holders and waiters of the lock name"""
+        return self.request('stats', name=name)
+
+    @contextlib.contextmanager
+    def lock(self, name, capacity=1, timeout=LOCK_TIMEOUT):
+        """Hold one of the capacity slots of the lock name, the lease of the
+        slot is refreshed by a heartbeat while held
+
+        :raise CoordinationLockTimeout: when not acquired in timeout seconds
+        """
+        owner = f'{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex}'
+        if not self.request('acquire', name=name, owner=owner, capacity=capacity, timeout=timeout):
+            raise CoordinationLockTimeout(f'"{name}" not acquired in {timeout} seconds')
+        try:
+            with lease.Heartbeat(lambda: self._refresh(name, owner)):
+                yield owner
+        finally:
+            self.request('release', name=name, owner=owner)
+
+
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def get_client(host=DEFAULT_HOST, port=DEFAULT_PORT, token=None):
+    """Return the client of this process for the server, created once and
+    closed at exit"""
+    key = (host, port, token)
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = _clients[key] = CoordinationClient(host=host, port=port, token=token)
+    return client
+
+
+def close_clients():
+    """Close the connections of the clients returned by get_client"""
+    with _clients_lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for client in clients:
+        client.close()
+
+
+atexit.register(close_clients)
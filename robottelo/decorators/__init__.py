@@ -1,25 +1,47 @@
 """Implements various decorators"""
 import logging
+import sys
 from functools import wraps
 
 import unittest2
 
+from robottelo.config import get_settings_generation
 from robottelo.config import settings
 
 LOGGER = logging.getLogger('robottelo')
 OBJECT_CACHE = {}
+# whether the feature settings are set, by feature name, for a settings generation
+_FEATURES_SET = dict(generation=None, features={})
+
+
+def _get_features_set():
+    """Return the features set dict of the current settings generation"""
+    generation = get_settings_generation()
+    if _FEATURES_SET['generation'] != generation:
+        _FEATURES_SET['generation'] = generation
+        _FEATURES_SET['features'] = {}
+    return _FEATURES_SET['features']
 
 
 def setting_is_set(option):
     """Return either ``True`` or ``False`` if a Robottelo section setting is
     set or not respectively.
+
+    The section is validated once per settings generation, see
+    ``robottelo.config.get_settings_generation``, the following calls return
+    the stored result.
     """
+    try:
+        return _get_features_set()[option]
+    except KeyError:
+        pass
     if not settings.configured:
         settings.configure()
-    # Example: `settings.clients`
-    if getattr(settings, option).validate():
-        return False
-    return True
+    # Example: `settings.get_feature_errors('clients')`
+    is_set = not settings.get_feature_errors(option)
+    # read the generation again, the first read of the settings configures them
+    _get_features_set()[option] = is_set
+    return is_set
 
 
 def skip_if_not_set(*options):
@@ -71,24 +93,26 @@ def skip_if_not_set(*options):
         `hostname` attribute is not set, then a test that expects it will be
         skipped.
     """
-    options_set = set(options)
-    if not options_set.issubset(settings.all_features):
-        invalid = options_set.difference(settings.all_features)
+    all_features = settings.all_features
+    invalid = set(options).difference(all_features)
+    if invalid:
         raise ValueError(
             'Feature(s): "{}" not found. Available ones are: "{}".'.format(
-                ', '.join(invalid), ', '.join(settings.all_features)
+                ', '.join(sorted(invalid)), ', '.join(sorted(all_features))
             )
         )
 
     def decorator(func):
+        # the missing features, computed once per settings generation
+        missing_features = dict(generation=None, missing=None)
+
         @wraps(func)
         def wrapper(*args, **kwargs):
-            missing = []
-            for option in options:
-                # Example: `settings.clients`
-                if not setting_is_set(option):
-                    # List of all sections that are not fully configured
-                    missing.append(option)
+            if missing_features['generation'] != get_settings_generation():
+                # List of all sections that are not fully configured
+                missing = [option for option in options if not setting_is_set(option)]
+                missing_features.update(generation=get_settings_generation(), missing=missing)
+            missing = missing_features['missing']
             if not missing:
                 return func(*args, **kwargs)
             raise unittest2.SkipTest('Missing configuration for: {}.'.format(', '.join(missing)))
@@ -98,6 +122,27 @@ def skip_if_not_set(*options):
     return decorator
 
 
+def get_caller_class_name(depth=3):
+    """Return the dotted name of the nested classes in which the function
+    calling this one is called, at most depth - 1 classes, an empty string
+    when called at module level.
+
+    The decorators use it at decoration time to name the decorated methods,
+    the frames are walked without loading their source context as
+    ``inspect.getouterframes`` does, which is slow at tests collection.
+    """
+    class_names = []
+    # skip this function and its caller frames
+    frame = sys._getframe(2)
+    while (
+        frame is not None and len(class_names) < depth - 1 and frame.f_code.co_name != '<module>'
+    ):
+        class_names.append(frame.f_code.co_name)
+        frame = frame.f_back
+    class_names.reverse()
+    return '.'.join(class_names)
+
+
 def cacheable(func):
     """Decorator that makes an optional object cache available"""
 
@@ -1,4 +1,7 @@
-"""Implements test function locking, using pytest_services file locking
+"""Implements test function locking, using lease based file locking, see
+:mod:`robottelo.decorators.lease`, or a :mod:`robottelo.coordination` server
+shared by many machines when ``coordination_host`` is set in the
+``[shared_function]`` settings
 
 Usage::
 
@@ -38,17 +41,50 @@ Usage::
        def test_that_conflict_with_test_to_lock(self)
             with locking_function(self.test_to_lock):
                 # do some operations that conflict with test_to_lock
+
+    # under heavy contention, serve the waiters in the order they started to
+    # wait, the queue depth shows how many are waiting
+    @lock_function(fair=True)
+    def upload_manifest():
+        pass
+
+    get_lock_queue_depth(upload_manifest)
+
+    # the server degrades when too many operations of the same resource class
+    # run at the same time, limit them with a counting semaphore
+    @throttle('repository_sync')
+    def sync_repository(repo_id):
+        pass
+
+    def publish_content_view(cv_id):
+        with semaphore('content_view_publish', capacity=2):
+            # call the publish function
+
+    # limit the operations only when a capacity is set for their resource
+    # class, with set_semaphore_capacity or the semaphore_capacity setting
+    def promote_content_view(cv_id):
+        with throttled('content_view_promote'):
+            # call the promote function
 """
+import contextlib
 import functools
-import inspect
 import logging
 import os
+import random
 import tempfile
+import time
 from contextlib import contextmanager
 
-from pytest_services.locks import file_lock
+import zc.lockfile
 
 from robottelo.config import settings
+from robottelo.coordination import get_client
+from robottelo.coordination import CoordinationLockTimeout
+from robottelo.decorators import get_caller_class_name
+from robottelo.decorators import lease
+from robottelo.decorators import lock_metrics
+from robottelo.decorators import setting_is_set
+from robottelo.decorators.lease import file_lock
 
 logger = logging.getLogger('robottelo')
 
@@ -61,6 +97,29 @@ LOCK_DEFAULT_SCOPE = None
 
 _DEFAULT_CLASS_NAME_DEPTH = 3
 
+SEMAPHORE_FILE_NAME_EXT = 'semaphore'
+SEMAPHORE_DEFAULT_CAPACITY = 1
+# the number of operations of a resource class that can run at the same time
+# on a server, before the server degrades. The semaphore_capacity setting of
+# the [shared_function] section is added when first used, for example
+# semaphore_capacity=repository_sync=4,content_view_publish=4
+SEMAPHORE_CAPACITY = {}
+_semaphore_capacity_configured = False
+SEMAPHORE_POLL_INTERVAL = 0.5
+
+# the fair locks waiters take a ticket in the lock queue directory and only
+# the first ticket owner tries to acquire the lock
+LOCK_QUEUE_DIR_EXT = 'queue'
+LOCK_QUEUE_POLL_INTERVAL = 0.1
+
+# when set, the locks and semaphores are held by this coordination server
+# client instead of the local lock files, and are shared by many machines
+COORDINATION_CLIENT = None
+_coordination_configured = False
+
+# the semaphore wait times of this process by resource class name
+_semaphore_wait_times = {}
+
 
 class FunctionLockerError(Exception):
     """the default function locker error"""
@@ -75,6 +134,55 @@ def set_default_scope(value):
     LOCK_DEFAULT_SCOPE = value
 
 
+def set_semaphore_capacity(name, capacity):
+    """Set the capacity of the resource class semaphore name
+
+    :type name: str
+    :type capacity: int
+    """
+    if capacity < 1:
+        raise FunctionLockerError(f'semaphore "{name}" capacity must be at least 1')
+    SEMAPHORE_CAPACITY[name] = capacity
+
+
+def _configure_semaphore_capacity():
+    """Add the capacities of the semaphore_capacity setting, once"""
+    global _semaphore_capacity_configured
+    if not _semaphore_capacity_configured:
+        if setting_is_set('shared_function'):
+            capacities = settings.shared_function.semaphore_capacity or {}
+            for name, capacity in capacities.items():
+                SEMAPHORE_CAPACITY.setdefault(name, int(capacity))
+        _semaphore_capacity_configured = True
+
+
+def set_coordination_client(client):
+    """Hold the locks and semaphores in a coordination server, None to use
+    the local lock files
+
+    :type client: robottelo.coordination.CoordinationClient
+    """
+    global COORDINATION_CLIENT
+    global _coordination_configured
+    COORDINATION_CLIENT = client
+    _coordination_configured = True
+
+
+def _get_coordination_client():
+    """Return the coordination server client, None if not configured"""
+    global COORDINATION_CLIENT
+    global _coordination_configured
+    if not _coordination_configured:
+        if setting_is_set('shared_function') and settings.shared_function.coordination_host:
+            COORDINATION_CLIENT = get_client(
+                host=settings.shared_function.coordination_host,
+                port=settings.shared_function.coordination_port,
+                token=settings.shared_function.coordination_token,
+            )
+        _coordination_configured = True
+    return COORDINATION_CLIENT
+
+
 def _get_default_scope():
     # this is the default locking scope
     if LOCK_DEFAULT_SCOPE is None:
@@ -186,13 +294,176 @@ def _check_deadlock(lock_file_path, process_id):
             )
 
 
-def _write_content(handler, content):
-    """write content to locked file"""
-    handler.seek(0)
-    handler.truncate()
-    if content:
-        handler.write(content)
-    handler.flush()
+def _take_ticket(queue_dir, timeout):
+    """Add a ticket to the end of the lock queue and return its path
+
+    The tickets are numbered in the order they are taken, the ticket file
+    content is the waiter pid and its modification time the waiter lease
+    heartbeat.
+    """
+    if not os.path.exists(queue_dir):
+        try:
+            # it can happen that the workers try to create this path at the
+            # same time
+            os.makedirs(queue_dir)
+        except OSError:
+            if not os.path.exists(queue_dir):
+                raise
+    with file_lock(os.path.join(queue_dir, '.counter.lock'), timeout=timeout):
+        counter_path = os.path.join(queue_dir, '.counter')
+        number = 0
+        if os.path.exists(counter_path):
+            with open(counter_path) as counter_file:
+                number = int(counter_file.read() or 0)
+        number += 1
+        with open(counter_path, 'w') as counter_file:
+            counter_file.write(str(number))
+        # the ticket is created before the next one can be taken, a waiter is
+        # never overtaken by a later one
+        ticket_path = os.path.join(queue_dir, f'{number:012d}')
+        file_descriptor, tmp_ticket_path = tempfile.mkstemp(prefix='.ticket.', dir=queue_dir)
+        with os.fdopen(file_descriptor, 'w') as ticket_file:
+            ticket_file.write(str(os.getpid()))
+        os.replace(tmp_ticket_path, ticket_path)
+    return ticket_path
+
+
+def _remove_ticket(ticket_path):
+    try:
+        os.remove(ticket_path)
+    except FileNotFoundError:
+        pass
+
+
+def _get_queue(queue_dir):
+    """Return the paths of the tickets of the lock queue in order, the tickets
+    of the dead or hung waiters are removed
+    """
+    if not os.path.exists(queue_dir):
+        return []
+    queue = []
+    for ticket_name in sorted(os.listdir(queue_dir)):
+        if ticket_name.startswith('.'):
+            continue
+        ticket_path = os.path.join(queue_dir, ticket_name)
+        pid, heartbeat, _ = lease.read_lease(ticket_path)
+        if heartbeat is None:
+            # the ticket was removed
+            continue
+        if lease.is_lease_stale(pid, heartbeat):
+            logger.warning(f'lock queue ticket {ticket_path} of pid {pid} is stale, removed')
+            _remove_ticket(ticket_path)
+            continue
+        queue.append(ticket_path)
+    return queue
+
+
+def _get_queue_depth(queue_dir):
+    return len(_get_queue(queue_dir))
+
+
+def _wait_in_queue(queue_dir, try_acquire, name, timeout):
+    """Wait for the ticket of this process to be the first of the lock queue
+    and call try_acquire until it returns the lock handler
+
+    :param try_acquire: a callable that returns the lock handler, None if the
+        lock is not free
+    :param name: the lock name
+    :param timeout: the time in seconds to wait for acquiring the lock
+    """
+    start = time.time()
+    ticket_path = _take_ticket(queue_dir, timeout)
+    try:
+        with lease.Heartbeat(lambda: os.utime(ticket_path)):
+            queue = _get_queue(queue_dir)
+            logger.info(
+                f'process id: {os.getpid()} - lock: {name} - '
+                f'queued behind {max(len(queue) - 1, 0)} waiters'
+            )
+            while True:
+                # a ticket removed as stale is served as the first one
+                if ticket_path not in queue or queue.index(ticket_path) == 0:
+                    handler = try_acquire()
+                    if handler is not None:
+                        return handler
+                if time.time() - start >= timeout:
+                    raise FunctionLockerError(
+                        f'lock "{name}" not acquired in {timeout} seconds, '
+                        f'{len(queue)} waiters in queue'
+                    )
+                time.sleep(LOCK_QUEUE_POLL_INTERVAL)
+                queue = _get_queue(queue_dir)
+    finally:
+        # the ticket of the lock owner is removed too, the next waiter is the
+        # first to acquire the lock when released
+        _remove_ticket(ticket_path)
+
+
+def _try_file_lock(stack, lock_file_path):
+    """Lock the file and return its handler, None if already locked"""
+    try:
+        return stack.enter_context(file_lock(lock_file_path, timeout=0))
+    except zc.lockfile.LockError:
+        return None
+
+
+def _get_coordination_lock_name(lock_file_path):
+    """Return the coordination server lock name of the lock file, its path in
+    the lock functions dir
+    """
+    return os.path.relpath(lock_file_path, _get_temp_lock_function_dir())
+
+
+def _enter_coordination_lock(stack, client, lock_file_path, timeout, capacity=1):
+    """Acquire the coordination server lock of the lock file and return its
+    owner
+    """
+    try:
+        return stack.enter_context(
+            client.lock(
+                _get_coordination_lock_name(lock_file_path), capacity=capacity, timeout=timeout
+            )
+        )
+    except CoordinationLockTimeout as exp:
+        raise FunctionLockerError(str(exp))
+
+
+def _get_lock_queue_dir(lock_file_path):
+    return f'{lock_file_path}.{LOCK_QUEUE_DIR_EXT}'
+
+
+@contextmanager
+def _measured_file_lock(function_name, lock_file_path, timeout, fair=False):
+    """Lock the file and record the lock wait and hold times to the lock
+    metrics
+
+    When fair, the waiters acquire the lock in the order they started to
+    wait for it, the coordination server locks are always fair.
+    """
+    start = time.time()
+    client = _get_coordination_client()
+    with contextlib.ExitStack() as stack:
+        if client is not None:
+            handler = _enter_coordination_lock(stack, client, lock_file_path, timeout)
+        elif fair:
+            handler = _wait_in_queue(
+                _get_lock_queue_dir(lock_file_path),
+                lambda: _try_file_lock(stack, lock_file_path),
+                function_name,
+                timeout,
+            )
+        else:
+            handler = stack.enter_context(file_lock(lock_file_path, timeout=timeout))
+        acquired = time.time()
+        try:
+            yield handler
+        finally:
+            lock_metrics.record(
+                function_name,
+                os.path.dirname(lock_file_path),
+                wait_time=acquired - start,
+                hold_time=time.time() - acquired,
+            )
 
 
 def lock_function(
@@ -201,6 +472,7 @@ def lock_function(
     scope_context=None,
     scope_kwargs=None,
     timeout=LOCK_DEFAULT_TIMEOUT,
+    fair=False,
 ):
     """Generic function locker, lock any decorated function. Any parallel
      pytest xdist worker will wait for this function to finish
@@ -217,18 +489,10 @@ def lock_function(
            lock in combination with scope and function.
     :param scope_kwargs: kwargs to be passed to scope if is a callable
     :param timeout: the time in seconds to wait for acquiring the lock
+    :param fair: whether the waiters acquire the lock in the order they
+           started to wait for it
     """
-    class_names = []
-    class_name = None
-    index = 1
-    while class_name != '<module>' and index <= _DEFAULT_CLASS_NAME_DEPTH:
-        if class_name:
-            class_names.append(class_name)
-        class_name = inspect.getouterframes(inspect.currentframe())[index][3]
-        index += 1
-
-    class_names.reverse()
-    class_name = '.'.join(class_names)
+    class_name = get_caller_class_name(_DEFAULT_CLASS_NAME_DEPTH)
 
     def main_wrapper(func):
 
@@ -246,20 +510,16 @@ def lock_function(
             # check if the same process is trying to acquire the lock
             _check_deadlock(lock_file_path, process_id)
 
-            with file_lock(lock_file_path, remove=False, timeout=timeout) as handler:
+            # the lock file content is the process id that locked this
+            # function, the lock is taken over if this process dies or hangs
+            with _measured_file_lock(function_name, lock_file_path, timeout, fair=fair):
                 logger.info(
                     'process id: {} lock function using file path: {}'.format(
                         process_id, lock_file_path
                     )
                 )
-                # write the process id that locked this function
-                _write_content(handler, process_id)
                 # call the locked function
-                try:
-                    res = func(*args, **kwargs)
-                finally:
-                    # clear the file
-                    _write_content(handler, None)
+                res = func(*args, **kwargs)
 
             return res
 
@@ -281,6 +541,7 @@ def locking_function(
     scope_context=None,
     scope_kwargs=None,
     timeout=LOCK_DEFAULT_TIMEOUT,
+    fair=False,
 ):
     """Lock a function in combination with a scope and scope_context.
     Any parallel pytest xdist worker will wait for this function to finish.
@@ -297,6 +558,8 @@ def locking_function(
            lock in combination with scope and function.
     :param scope_kwargs: kwargs to be passed to scope if is a callable
     :param timeout: the time in seconds to wait for acquiring the lock
+    :param fair: whether the waiters acquire the lock in the order they
+           started to wait for it
     """
     if not getattr(function, '__function_locked__', False):
         raise FunctionLockerError('Cannot ensure locking when using a non locked function')
@@ -310,17 +573,218 @@ def locking_function(
     # check if the same process is trying to acquire the lock
     _check_deadlock(lock_file_path, process_id)
 
-    with file_lock(lock_file_path, remove=False, timeout=timeout) as handler:
+    # the lock file content is the process id that locked this function, the
+    # lock is taken over if this process dies or hangs
+    with _measured_file_lock(function_name, lock_file_path, timeout, fair=fair) as handler:
         logger.info(
             'process id: {} - lock function name:{}  - using file path: {}'.format(
                 process_id, function_name, lock_file_path
             )
         )
-        # write the process id that locked this function
-        _write_content(handler, process_id)
         # let the locked code run
+        yield handler
+
+
+def _record_semaphore_wait_time(name, wait_time):
+    stats = _semaphore_wait_times.setdefault(name, dict(count=0, total=0.0, max=0.0))
+    stats['count'] += 1
+    stats['total'] += wait_time
+    stats['max'] = max(stats['max'], wait_time)
+
+
+def get_semaphore_wait_times():
+    """Return the semaphore wait times of this process
+
+    :return: a dict by resource class name of dicts with the count of
+        acquisitions and the total and max seconds waited to acquire
+    """
+    return {name: dict(stats) for name, stats in _semaphore_wait_times.items()}
+
+
+def _acquire_semaphore_slot(stack, slot_paths):
+    """Lock the first free slot file and return its handler, None if all the
+    slots are locked
+    """
+    # do not start by the same slot in all the processes
+    for slot_path in random.sample(slot_paths, len(slot_paths)):
+        handler = _try_file_lock(stack, slot_path)
+        if handler is not None:
+            return handler
+    return None
+
+
+def _get_semaphore_lock_path(scope_path, name):
+    return os.path.join(scope_path, f'{name}.{SEMAPHORE_FILE_NAME_EXT}')
+
+
+def _get_semaphore_queue_dir(scope_path, name):
+    return os.path.join(scope_path, f'{name}.{SEMAPHORE_FILE_NAME_EXT}.{LOCK_QUEUE_DIR_EXT}')
+
+
+@contextmanager
+def semaphore(
+    name,
+    capacity=None,
+    scope=_get_default_scope,
+    scope_kwargs=None,
+    timeout=LOCK_DEFAULT_TIMEOUT,
+    fair=False,
+):
+    """Counting semaphore of a resource class. At most capacity parallel
+    pytest xdist workers can hold the semaphore name of the same scope, the
+    others wait for a slot to be released.
+
+    Each slot is a lease based file lock, the slot of a dead or hung worker
+    is taken over.
+
+    :type name: str
+    :type capacity: int
+    :type scope: str or callable
+    :type scope_kwargs: dict
+    :type timeout: int
+
+    :param name: the resource class name
+    :param capacity: the number of slots, by default SEMAPHORE_CAPACITY[name]
+    :param scope: this parameter will define the namespace of the semaphore,
+           by default the server hostname
+    :param scope_kwargs: kwargs to be passed to scope if is a callable
+    :param timeout: the time in seconds to wait for acquiring a slot
+    :param fair: whether the waiters acquire a slot in the order they started
+           to wait for it
+    """
+    if capacity is None:
+        capacity = SEMAPHORE_CAPACITY.get(name, SEMAPHORE_DEFAULT_CAPACITY)
+    if capacity < 1:
+        raise FunctionLockerError(f'semaphore "{name}" capacity must be at least 1')
+    scope_path = _get_scope_path(scope, scope_kwargs=scope_kwargs)
+    slot_paths = [
+        os.path.join(scope_path, f'{name}.{slot}.{SEMAPHORE_FILE_NAME_EXT}')
+        for slot in range(capacity)
+    ]
+    start = time.time()
+    client = _get_coordination_client()
+    with contextlib.ExitStack() as stack:
+        if client is not None:
+            handler = _enter_coordination_lock(
+                stack,
+                client,
+                _get_semaphore_lock_path(scope_path, name),
+                timeout,
+                capacity=capacity,
+            )
+        elif fair:
+            handler = _wait_in_queue(
+                _get_semaphore_queue_dir(scope_path, name),
+                lambda: _acquire_semaphore_slot(stack, slot_paths),
+                name,
+                timeout,
+            )
+        else:
+            handler = _acquire_semaphore_slot(stack, slot_paths)
+        while handler is None:
+            if time.time() - start >= timeout:
+                raise FunctionLockerError(f'semaphore "{name}" not acquired in {timeout} seconds')
+            time.sleep(SEMAPHORE_POLL_INTERVAL)
+            handler = _acquire_semaphore_slot(stack, slot_paths)
+        acquired = time.time()
+        wait_time = acquired - start
+        _record_semaphore_wait_time(name, wait_time)
+        logger.info(
+            f'process id: {os.getpid()} - semaphore: {name} - capacity: {capacity} '
+            f'- waited: {wait_time:.2f}s - using: {getattr(handler, "name", handler)}'
+        )
         try:
             yield handler
         finally:
-            # clear the file
-            _write_content(handler, None)
+            lock_metrics.record(
+                name,
+                scope_path,
+                wait_time=wait_time,
+                hold_time=time.time() - acquired,
+                kind='semaphore',
+            )
+
+
+def throttle(
+    name,
+    capacity=None,
+    scope=_get_default_scope,
+    scope_kwargs=None,
+    timeout=LOCK_DEFAULT_TIMEOUT,
+    fair=False,
+):
+    """Decorator that runs the decorated function while holding the
+    resource class semaphore name, see :func:`semaphore`
+    """
+
+    def main_wrapper(func):
+        @functools.wraps(func)
+        def function_wrapper(*args, **kwargs):
+            with semaphore(
+                name,
+                capacity=capacity,
+                scope=scope,
+                scope_kwargs=scope_kwargs,
+                timeout=timeout,
+                fair=fair,
+            ):
+                return func(*args, **kwargs)
+
+        return function_wrapper
+
+    return main_wrapper
+
+
+@contextmanager
+def throttled(name, **kwargs):
+    """Hold the resource class semaphore name, see :func:`semaphore`, only
+    when a capacity is set for it with :func:`set_semaphore_capacity` or the
+    semaphore_capacity setting, otherwise run without any lock
+
+    :param name: the resource class name
+    :param kwargs: the :func:`semaphore` arguments
+    """
+    _configure_semaphore_capacity()
+    if name not in SEMAPHORE_CAPACITY:
+        yield None
+        return
+    with semaphore(name, **kwargs) as handler:
+        yield handler
+
+
+def get_lock_queue_depth(
+    function, scope=_get_default_scope, scope_context=None, scope_kwargs=None
+):
+    """Return the number of processes waiting in the fair lock queue of the
+    locked function
+
+    :type function: callable
+    :type scope: str or callable
+    :type scope_kwargs: dict
+    :type scope_context: str
+    """
+    class_name = getattr(function, '__class_name__', None)
+    function_name = _get_function_name(function, class_name=class_name)
+    lock_file_path = _get_function_name_lock_path(
+        function_name, scope=scope, scope_kwargs=scope_kwargs, scope_context=scope_context
+    )
+    client = _get_coordination_client()
+    if client is not None:
+        return client.stats(_get_coordination_lock_name(lock_file_path))['waiters']
+    return _get_queue_depth(_get_lock_queue_dir(lock_file_path))
+
+
+def get_semaphore_queue_depth(name, scope=_get_default_scope, scope_kwargs=None):
+    """Return the number of processes waiting in the fair queue of the
+    resource class semaphore name
+
+    :type name: str
+    :type scope: str or callable
+    :type scope_kwargs: dict
+    """
+    scope_path = _get_scope_path(scope, scope_kwargs=scope_kwargs)
+    client = _get_coordination_client()
+    if client is not None:
+        lock_path = _get_semaphore_lock_path(scope_path, name)
+        return client.stats(_get_coordination_lock_name(lock_path))['waiters']
+    return _get_queue_depth(_get_semaphore_queue_dir(scope_path, name))
@@ -1,3 +1,5 @@
+from robottelo.decorators.func_shared.shared import clear_local_cache  # noqa
+from robottelo.decorators.func_shared.shared import recipe_hash  # noqa
 from robottelo.decorators.func_shared.shared import shared  # noqa
 from robottelo.decorators.func_shared.shared import SharedFunctionError  # noqa
 from robottelo.decorators.func_shared.shared import SharedFunctionException  # noqa
@@ -1,14 +1,16 @@
-import json
+from robottelo.decorators.func_shared.serializers import Codec
 
 
 class BaseStorageHandler:
-    @staticmethod
-    def encode(data):
-        return json.dumps(data)
+    # the default codec, the handlers that store the values on the local
+    # machine can store the large values out of line
+    codec = Codec()
 
-    @staticmethod
-    def decode(data):
-        return json.loads(data)
+    def encode(self, data):
+        return self.codec.encode(data)
+
+    def decode(self, data):
+        return self.codec.decode(data)
 
     def lock(self, lock_key):
         """Return the storage locker context manager"""
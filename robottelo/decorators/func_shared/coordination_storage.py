@@ -0,0 +1,73 @@
+"""Coordination server key value storage handler.
+
+The values and locks are kept by a :mod:`robottelo.coordination` server, that
+can be shared by the workers of many machines.
+"""
+from robottelo.coordination import get_client
+from robottelo.decorators.func_shared.base import BaseStorageHandler
+from robottelo.decorators.func_shared.serializers import Codec
+
+COORDINATION_HOST = 'localhost'
+COORDINATION_PORT = 7890
+COORDINATION_TOKEN = None
+LOCK_TIMEOUT = 7200
+
+
+class CoordinationStorageHandler(BaseStorageHandler):
+    """Coordination server Key value storage handler"""
+
+    def __init__(
+        self,
+        host=None,
+        port=None,
+        lock_timeout=None,
+        codec=None,
+        token=None,
+    ):
+        if host is None:
+            host = COORDINATION_HOST
+        if port is None:
+            port = COORDINATION_PORT
+        if token is None:
+            token = COORDINATION_TOKEN
+        if lock_timeout is None:
+            lock_timeout = LOCK_TIMEOUT
+        self._lock_timeout = lock_timeout
+        # a handler is created by each shared function call, they share the
+        # connections of the process client
+        self._client = get_client(host=host, port=port, token=token)
+        # the server can be shared by many machines, all the values are
+        # stored in line
+        self.codec = Codec(codec)
+
+    @property
+    def client(self):
+        return self._client
+
+    def lock(self, key, timeout=None):
+        """Return the storage locker context manager"""
+        if timeout is None:
+            timeout = self._lock_timeout
+        return self.client.lock(f'{key}.lock', timeout=timeout)
+
+    def when_lock_acquired(self, lock_object):
+        # do nothing
+        pass
+
+    def get(self, key):
+        """Return the key value
+
+        :type key: str
+        """
+        value = self.client.get(key)
+        if value is not None:
+            value = self.decode(value)
+        return value
+
+    def set(self, key, value):
+        """Write the value of key
+
+        :type key: str
+        :type value: object
+        """
+        self.client.set(key, self.encode(value))
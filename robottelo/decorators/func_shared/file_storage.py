@@ -2,13 +2,15 @@ import logging
 import os
 import tempfile
 
-from pytest_services.locks import file_lock
-
 from robottelo.config import settings
 from robottelo.decorators.func_shared.base import BaseStorageHandler
+from robottelo.decorators.func_shared.serializers import Codec
+from robottelo.decorators.lease import file_lock
 
 TEMP_ROOT_DIR = 'robottelo'
 TEMP_FUNC_SHARED_DIR = 'shared_functions'
+# the directory of the large values stored out of line, in the root dir
+OUT_OF_LINE_DIR = '.out_of_line'
 SHARED_DIR = None
 
 logger = logging.getLogger('robottelo')
@@ -46,7 +48,7 @@ def _get_root_dir(create=True):
 class FileStorageHandler(BaseStorageHandler):
     """Key value file storage handler."""
 
-    def __init__(self, root_dir=None, create=True, lock_timeout=LOCK_TIMEOUT):
+    def __init__(self, root_dir=None, create=True, lock_timeout=LOCK_TIMEOUT, codec=None):
 
         if root_dir is None:
             root_dir = _get_root_dir()
@@ -56,6 +58,7 @@ class FileStorageHandler(BaseStorageHandler):
 
         self._lock_timeout = lock_timeout
         self._root_dir = root_dir
+        self.codec = Codec(codec, out_of_line_dir=os.path.join(root_dir, OUT_OF_LINE_DIR))
 
     @property
     def root_dir(self):
@@ -67,27 +70,25 @@ class FileStorageHandler(BaseStorageHandler):
     def lock(self, key):
         """Return the storage locker context manager"""
         lock_key = f'{key}.lock'
-        return file_lock(
-            self.get_key_file_path(lock_key), remove=False, timeout=self._lock_timeout
-        )
+        return file_lock(self.get_key_file_path(lock_key), timeout=self._lock_timeout)
 
     def when_lock_acquired(self, handler):
-        """Write the process id to file handler"""
-        handler.seek(0)
-        handler.truncate()
-        handler.write(str(os.getpid()))
-        handler.flush()
+        # the process id is written to the lock file when the lock is acquired
+        pass
+
+    def _read(self, key):
+        """Return the encoded value of key, None if not set"""
+        try:
+            with open(self.get_key_file_path(key), 'rb') as file_handler:
+                return file_handler.read()
+        except FileNotFoundError:
+            return None
 
     def get(self, key):
         """Return the key value
         :type key: str
         """
-        value = None
-        key_file_path = self.get_key_file_path(key)
-        if os.path.exists(key_file_path):
-            with open(key_file_path) as file_handler:
-                value = file_handler.read()
-
+        value = self._read(key)
         if value is not None:
             value = self.decode(value)
         return value
@@ -99,6 +100,22 @@ class FileStorageHandler(BaseStorageHandler):
         :type value: object
         """
         value = self.encode(value)
+        previous_value = self._read(key)
         key_file_path = self.get_key_file_path(key)
-        with open(key_file_path, 'w') as file_handler:
-            file_handler.write(value)
+        # write to a temporary file and rename it, the rename is atomic and
+        # the value can be read without locking
+        file_descriptor, tmp_file_path = tempfile.mkstemp(
+            prefix=f'.{key}.', suffix='.tmp', dir=self._root_dir
+        )
+        try:
+            # the value is json text or bytes depending on the codec
+            mode = 'w' if isinstance(value, str) else 'wb'
+            with os.fdopen(file_descriptor, mode) as file_handler:
+                file_handler.write(value)
+            os.replace(tmp_file_path, key_file_path)
+        except BaseException:
+            if os.path.exists(tmp_file_path):
+                os.remove(tmp_file_path)
+            self.codec.remove_out_of_line(value)
+            raise
+        self.codec.remove_out_of_line(previous_value)
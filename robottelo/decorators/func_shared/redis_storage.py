@@ -1,9 +1,13 @@
+from contextlib import contextmanager
+
 try:
     import redis
 except ImportError:
     redis = None
 
+from robottelo.decorators import lease
 from robottelo.decorators.func_shared.base import BaseStorageHandler
+from robottelo.decorators.func_shared.serializers import Codec
 
 REDIS_HOST = 'localhost'
 REDIS_PORT = 6379
@@ -22,10 +26,14 @@ class RedisStorageHandler(BaseStorageHandler):
         db=REDIS_DB,
         password=REDIS_PASSWORD,
         lock_timeout=LOCK_TIMEOUT,
+        codec=None,
     ):
 
         self._lock_timeout = lock_timeout
         self._client = redis.StrictRedis(host=host, port=port, db=db, password=password)
+        # the redis server can be shared by many machines, all the values are
+        # stored in line
+        self.codec = Codec(codec)
 
     @property
     def client(self):
@@ -37,8 +45,18 @@ class RedisStorageHandler(BaseStorageHandler):
             timeout = self._lock_timeout
 
         lock_key = f'{key}.lock'
-        # If acquired the lock will be acquired until release
-        return self.client.lock(lock_key, timeout=None, blocking_timeout=timeout)
+        # The lock expires after the lease timeout, the owner heartbeat
+        # resets its ttl until release
+        return self._lease_lock(
+            self.client.lock(lock_key, timeout=lease.LEASE_TIMEOUT, blocking_timeout=timeout)
+        )
+
+    @staticmethod
+    @contextmanager
+    def _lease_lock(lock):
+        with lock:
+            with lease.Heartbeat(lock.reacquire):
+                yield lock
 
     def when_lock_acquired(self, lock_object):
         # do nothing
@@ -61,4 +79,5 @@ class RedisStorageHandler(BaseStorageHandler):
         :type value: object
         """
         value = self.encode(value)
+        # SET is atomic, the value can be read without locking
         self.client.set(key, value)
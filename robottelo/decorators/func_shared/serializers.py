@@ -0,0 +1,252 @@
+"""Codecs of the shared function values.
+
+A codec is a serializer, optionally followed by a compressor, named
+``serializer+compressor``, for example ``json``, ``pickle+zlib`` or
+``msgpack+lz4``. The available serializers are json, pickle (highest
+protocol), msgpack when installed, and the compressors zlib and lz4 when
+installed.
+
+The default ``json`` codec encodes the small values as plain json text, as
+the storage handlers always did. The other values are encoded as bytes,
+prefixed by a header line naming their codec. A handler decodes the json and
+msgpack values whatever its own codec, but the pickle values only when its own
+codec is pickle: the storage is shared with other processes and machines,
+unpickling a value written by any of them would run its code.
+
+When the storage handler is local to the machine, the encoded payloads larger
+than the out of line threshold are written to a file of their own in the out
+of line directory, and only a reference to that file is kept in the storage.
+The file is memory mapped when decoded, and removed by the storage handler
+with the value referencing it.
+"""
+import json
+import logging
+import mmap
+import os
+import pickle
+import tempfile
+import time
+import uuid
+import zlib
+
+try:
+    import lz4.frame
+except ImportError:
+    lz4 = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+logger = logging.getLogger('robottelo')
+
+DEFAULT_CODEC = 'json'
+# the encoded payloads larger than this number of bytes are stored out of line
+OUT_OF_LINE_THRESHOLD = 1024 * 1024
+
+_HEADER_MAGIC = b'robottelo-shared-value'
+_INLINE = b'inline'
+_OUT_OF_LINE = b'out-of-line'
+_NO_COMPRESSOR = 'none'
+# the serializers decoding data without running code, accepted by any codec
+_SAFE_SERIALIZERS = frozenset(['json', 'msgpack'])
+
+
+def _json_loads(data):
+    if isinstance(data, memoryview):
+        data = bytes(data)
+    return json.loads(data)
+
+
+_serializers = {
+    'json': (lambda data: json.dumps(data).encode(), _json_loads),
+    'pickle': (lambda data: pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL), pickle.loads),
+}
+if msgpack is not None:
+    _serializers['msgpack'] = (
+        lambda data: msgpack.packb(data, use_bin_type=True),
+        lambda data: msgpack.unpackb(data, raw=False),
+    )
+
+_compressors = {
+    _NO_COMPRESSOR: (lambda data: data, lambda data: data),
+    # favor the speed, the values are compressed once and decompressed by
+    # every worker
+    'zlib': (lambda data: zlib.compress(data, 1), zlib.decompress),
+}
+if lz4 is not None:
+    _compressors['lz4'] = (lz4.frame.compress, lz4.frame.decompress)
+
+_metrics = dict(
+    encoded=0,
+    decoded=0,
+    serialized_bytes=0,
+    stored_bytes=0,
+    out_of_line=0,
+    encode_seconds=0.0,
+    decode_seconds=0.0,
+)
+
+
+class CodecError(ValueError):
+    """The codec is not available or the value can not be decoded"""
+
+
+def get_metrics():
+    """Return the encoding metrics of this process
+
+    :return: a dict with the count of encoded, decoded and out of line
+        values, the serialized and stored (compressed) bytes and the seconds
+        spent encoding and decoding
+    """
+    return dict(_metrics)
+
+
+def reset_metrics():
+    for name, value in _metrics.items():
+        _metrics[name] = type(value)()
+
+
+def _parse_codec_name(name):
+    serializer, _, compressor = name.partition('+')
+    compressor = compressor or _NO_COMPRESSOR
+    if serializer not in _serializers:
+        raise CodecError(f'serializer "{serializer}" of codec "{name}" not available')
+    if compressor not in _compressors:
+        raise CodecError(f'compressor "{compressor}" of codec "{name}" not available')
+    return serializer, compressor
+
+
+def _write_out_of_line(directory, payload):
+    """Write the payload to a new file and return its name, the file belongs
+    to the value referencing it"""
+    file_name = uuid.uuid4().hex
+    os.makedirs(directory, exist_ok=True)
+    # write to a temporary file and rename it, a reader never sees a
+    # partially written payload
+    file_descriptor, tmp_file_path = tempfile.mkstemp(
+        prefix=f'.{file_name}.', suffix='.tmp', dir=directory
+    )
+    try:
+        with os.fdopen(file_descriptor, 'wb') as file_handler:
+            file_handler.write(payload)
+        os.replace(tmp_file_path, os.path.join(directory, file_name))
+    except BaseException:
+        if os.path.exists(tmp_file_path):
+            os.remove(tmp_file_path)
+        raise
+    return file_name
+
+
+def _is_encoded(data):
+    """Return whether the data is encoded with a header, not plain json text"""
+    return isinstance(data, bytes) and data.startswith(_HEADER_MAGIC + b' ')
+
+
+class Codec:
+    """Encode and decode the shared function values
+
+    :param name: the codec name, serializer+compressor
+    :param out_of_line_dir: the directory of the out of line payloads, None
+        to store all the payloads in line
+    :param out_of_line_threshold: the size in bytes above which a payload is
+        stored out of line, by default OUT_OF_LINE_THRESHOLD
+    """
+
+    def __init__(self, name=None, out_of_line_dir=None, out_of_line_threshold=None):
+        if name is None:
+            name = DEFAULT_CODEC
+        if out_of_line_threshold is None:
+            out_of_line_threshold = OUT_OF_LINE_THRESHOLD
+        self.name = name
+        self._serializer, self._compressor = _parse_codec_name(name)
+        self.allowed_serializers = _SAFE_SERIALIZERS | {self._serializer}
+        self.out_of_line_dir = out_of_line_dir
+        self.out_of_line_threshold = out_of_line_threshold
+
+    def encode(self, data):
+        start = time.time()
+        dumps, _ = _serializers[self._serializer]
+        compress, _ = _compressors[self._compressor]
+        serialized = dumps(data)
+        payload = compress(serialized)
+        location = _INLINE
+        if self.out_of_line_dir and len(payload) > self.out_of_line_threshold:
+            location = _OUT_OF_LINE
+            payload = _write_out_of_line(self.out_of_line_dir, payload).encode()
+            _metrics['out_of_line'] += 1
+        if self._serializer == 'json' and self._compressor == _NO_COMPRESSOR:
+            if location == _INLINE:
+                # plain json text, readable by any version
+                payload = payload.decode()
+        if not isinstance(payload, str):
+            header = b' '.join(
+                [_HEADER_MAGIC, self._serializer.encode(), self._compressor.encode(), location]
+            )
+            payload = header + b'\n' + payload
+        _metrics['encoded'] += 1
+        _metrics['serialized_bytes'] += len(serialized)
+        _metrics['stored_bytes'] += len(payload)
+        _metrics['encode_seconds'] += time.time() - start
+        return payload
+
+    def _get_out_of_line_path(self, file_name):
+        # the name is read from the storage, never a path out of the directory
+        return os.path.join(self.out_of_line_dir, os.path.basename(file_name))
+
+    def _decode_out_of_line(self, file_name, loads, decompress):
+        if not self.out_of_line_dir:
+            raise CodecError(f'out of line value "{file_name}" not readable by this handler')
+        file_path = self._get_out_of_line_path(file_name)
+        try:
+            file_handler = open(file_path, 'rb')
+        except FileNotFoundError:
+            raise CodecError(f'out of line value file "{file_path}" not found')
+        with file_handler:
+            with mmap.mmap(file_handler.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                with memoryview(mapped) as payload:
+                    return loads(decompress(payload))
+
+    def decode(self, data):
+        start = time.time()
+        if not _is_encoded(data):
+            # plain json text
+            value = json.loads(data)
+        else:
+            header, _, payload = data.partition(b'\n')
+            try:
+                _, serializer, compressor, location = header.decode().split(' ')
+                _, loads = _serializers[serializer]
+                _, decompress = _compressors[compressor]
+            except (ValueError, KeyError):
+                raise CodecError(f'value encoded with "{header.decode()}" not decodable')
+            if serializer not in self.allowed_serializers:
+                raise CodecError(
+                    f'value serialized with "{serializer}" refused by the "{self.name}" codec, '
+                    f'only {", ".join(sorted(self.allowed_serializers))} values are decoded'
+                )
+            if location == _OUT_OF_LINE.decode():
+                value = self._decode_out_of_line(payload.decode(), loads, decompress)
+            else:
+                value = loads(decompress(payload))
+        _metrics['decoded'] += 1
+        _metrics['decode_seconds'] += time.time() - start
+        return value
+
+    def remove_out_of_line(self, data):
+        """Remove the out of line file of an encoded value, once the value is
+        deleted or replaced in the storage
+
+        :param data: the encoded value, as read from the storage, nothing is
+            removed when it is not stored out of line
+        """
+        if not self.out_of_line_dir or not _is_encoded(data):
+            return
+        header, _, payload = data.partition(b'\n')
+        if not header.endswith(b' ' + _OUT_OF_LINE):
+            return
+        try:
+            os.remove(self._get_out_of_line_path(payload.decode()))
+        except FileNotFoundError:
+            pass
@@ -84,13 +84,15 @@ Usage::
 
             return dict(org=cls.org, repo=cls.repo}
 """
+import copy
 import datetime
 import functools
 import hashlib
-import inspect
+import json
 import logging
 import os
 import sys
+import time
 import traceback
 import uuid
 from importlib import import_module
@@ -98,15 +100,26 @@ from importlib import import_module
 from nailgun.entities import Entity
 
 from robottelo.config import settings
+from robottelo.decorators import get_caller_class_name
 from robottelo.decorators import setting_is_set
+from robottelo.decorators.func_shared import coordination_storage
 from robottelo.decorators.func_shared import file_storage
 from robottelo.decorators.func_shared import redis_storage
+from robottelo.decorators.func_shared import serializers
+from robottelo.decorators.func_shared import sqlite_storage
+from robottelo.decorators.func_shared.coordination_storage import CoordinationStorageHandler
 from robottelo.decorators.func_shared.file_storage import FileStorageHandler
 from robottelo.decorators.func_shared.redis_storage import RedisStorageHandler
+from robottelo.decorators.func_shared.sqlite_storage import SQLiteStorageHandler
 
 logger = logging.getLogger('robottelo')
 
-_storage_handlers = {'file': FileStorageHandler, 'redis': RedisStorageHandler}
+_storage_handlers = {
+    'file': FileStorageHandler,
+    'redis': RedisStorageHandler,
+    'sqlite': SQLiteStorageHandler,
+    'coordination': CoordinationStorageHandler,
+}
 
 DEFAULT_STORAGE_HANDLER = 'file'
 # by default using the shared data is disabled
@@ -128,6 +141,17 @@ _DATETIME_FORMAT = '%Y-%m-%dT%H:%M:%S'
 
 _SERVER_CERT_MD5 = None
 
+# in process cache of the ready results read from or written to the storage,
+# keyed by function key, that way the storage lock and read are paid only once
+# per process and key
+_local_cache = {}
+# after this number of seconds a cached result is checked again against the
+# storage, and replaced if an other process stored a new one
+LOCAL_CACHE_TIMEOUT = 60
+
+# the types of the results that can be returned from the cache without copy
+_IMMUTABLE_TYPES = (type(None), bool, int, float, str, bytes)
+
 
 def _set_configured(value):
     global _configured
@@ -149,10 +173,18 @@ def _check_config():
         DEFAULT_CALL_RETRIES = settings.shared_function.call_retries
         file_storage.LOCK_TIMEOUT = settings.shared_function.lock_timeout
         redis_storage.LOCK_TIMEOUT = settings.shared_function.lock_timeout
+        sqlite_storage.LOCK_TIMEOUT = settings.shared_function.lock_timeout
+        coordination_storage.LOCK_TIMEOUT = settings.shared_function.lock_timeout
         redis_storage.REDIS_HOST = settings.shared_function.redis_host
         redis_storage.REDIS_PORT = settings.shared_function.redis_port
         redis_storage.REDIS_DB = settings.shared_function.redis_db
         redis_storage.REDIS_PASSWORD = settings.shared_function.redis_password
+        if settings.shared_function.coordination_host:
+            coordination_storage.COORDINATION_HOST = settings.shared_function.coordination_host
+        coordination_storage.COORDINATION_PORT = settings.shared_function.coordination_port
+        coordination_storage.COORDINATION_TOKEN = settings.shared_function.coordination_token
+        serializers.DEFAULT_CODEC = settings.shared_function.codec
+        serializers.OUT_OF_LINE_THRESHOLD = settings.shared_function.out_of_line_threshold
         _set_configured(True)
 
 
@@ -183,6 +215,25 @@ def _get_default_scope():
     return str(format(os.getppid()))
 
 
+def clear_local_cache():
+    """Clear the in process cache of the shared functions results"""
+    _local_cache.clear()
+
+
+def _copy_result(result):
+    """Return a copy of a cached result, the json like results are copied
+    without the deepcopy memo overhead
+    """
+    if isinstance(result, _IMMUTABLE_TYPES):
+        return result
+    result_type = type(result)
+    if result_type is dict:
+        return {key: _copy_result(value) for key, value in result.items()}
+    if result_type is list:
+        return [_copy_result(value) for value in result]
+    return copy.deepcopy(result)
+
+
 def _get_default_storage_handler():
     """Return the storage handler instance"""
     if DEFAULT_STORAGE_HANDLER not in _storage_handlers:
@@ -218,11 +269,6 @@ class _SharedFunction:
         injected_kw='_inject',
     ):
 
-        if storage_handler is None:
-            storage_handler = _get_default_storage_handler()
-
-        if storage_handler is None:
-            raise SharedFunctionError('storage_handler not supplied')
         if args is None:
             args = ()
         if kwargs is None:
@@ -242,6 +288,12 @@ class _SharedFunction:
 
     @property
     def storage(self):
+        # the default storage handler is created only when the storage is
+        # needed, results cached in process do not need it
+        if self._storage_handler is None:
+            self._storage_handler = _get_default_storage_handler()
+            if self._storage_handler is None:
+                raise SharedFunctionError('storage_handler not supplied')
         return self._storage_handler
 
     @property
@@ -298,71 +350,56 @@ class _SharedFunction:
 
         return False
 
+    def _get_local_value(self):
+        """Return the in process cached value, None if not cached, expired or
+        to be checked against the storage
+        """
+        cached = _local_cache.get(self.key)
+        if cached is None:
+            return None
+        if self._has_result_expired(cached['creation_datetime']):
+            _local_cache.pop(self.key, None)
+            return None
+        if time.monotonic() - cached['checked_at'] >= LOCAL_CACHE_TIMEOUT:
+            # keep it, it is kept as is if the stored value did not change
+            return None
+        return cached
+
+    def _set_local_value(self, value, creation_datetime):
+        """Cache in process the stored value if ready, or invalidate the
+        cached one
+        """
+        cached = _local_cache.get(self.key)
+        if value is None or value['state'] != _STATE_READY:
+            _local_cache.pop(self.key, None)
+        elif cached is None or cached['id'] != value['id']:
+            _local_cache[self.key] = dict(
+                id=value['id'],
+                creation_datetime=creation_datetime,
+                checked_at=time.monotonic(),
+                result=_copy_result(value['result']),
+            )
+        else:
+            cached['checked_at'] = time.monotonic()
+
     def __call__(self):
-        # this lock prevent any other process to run the function,
-        # and if an other process is running the function, I should wait it
-        # to finish
-        # note: when results are ready this lock has a very short time
-        with self.storage.lock(self.key) as data:
-            self.storage.when_lock_acquired(data)
-            # first must investigate, call the function or use the results
-            result = None
+        cached = self._get_local_value()
+        if cached is not None:
+            # the cached result is never returned as is, the caller may
+            # modify it
+            result = _copy_result(cached['result'])
+            call_function = False
             error = None
-            traceback_text = ''
-            error_class_name = None
-            exp = None
-            pid = None
-            value = self.storage.get(self.key)
-            if value is None:
-                call_function = True
-            else:
-                state = value['state']
-                result = value['result']
-                error = value['error']
-                traceback_text = value.get('traceback', '')
-                error_class_name = value.get('error_class_name')
-                pid = value['pid']
-                creation_datetime = datetime.datetime.strptime(
-                    value['creation_datetime'], _DATETIME_FORMAT
-                )
-
-                if state in [_STATE_READY, _STATE_FAILED] and not self._has_result_expired(
-                    creation_datetime
-                ):
-                    call_function = False
-                else:
-                    call_function = True
-
-            if call_function is True:
-                result, exp, traceback_text = self._call_function()
-                creation_datetime = datetime.datetime.utcnow().strftime(_DATETIME_FORMAT)
-                if exp:
-                    error = str(exp) or 'error occurred'
-                    error_class_name = '{}.{}'.format(
-                        exp.__class__.__module__, exp.__class__.__name__
-                    )
-                    value = dict(
-                        state=_STATE_FAILED,
-                        id=self.transaction,
-                        result=None,
-                        error=error,
-                        error_class_name=error_class_name,
-                        traceback=traceback_text,
-                        pid=os.getpid(),
-                        creation_datetime=creation_datetime,
-                    )
-                else:
-                    error = None
-                    result = self._encode_result_kwargs(result)
-                    value = dict(
-                        state=_STATE_READY,
-                        id=self.transaction,
-                        result=result,
-                        error=error,
-                        pid=os.getpid(),
-                        creation_datetime=creation_datetime,
-                    )
-                self.storage.set(self.key, value)
+        else:
+            (
+                result,
+                call_function,
+                exp,
+                error,
+                error_class_name,
+                traceback_text,
+                pid,
+            ) = self._call_with_storage()
 
         if call_function and exp:
             # i'am in the first launched process
@@ -413,6 +450,88 @@ class _SharedFunction:
 
         return result
 
+    def _get_stored_value(self):
+        """Return the stored value if ready or failed and not expired"""
+        value = self.storage.get(self.key)
+        if value is None or value['state'] not in [_STATE_READY, _STATE_FAILED]:
+            return None
+        creation_datetime = datetime.datetime.strptime(
+            value['creation_datetime'], _DATETIME_FORMAT
+        )
+        if self._has_result_expired(creation_datetime):
+            return None
+        self._set_local_value(value, creation_datetime)
+        return value
+
+    @staticmethod
+    def _get_stored_results(value):
+        return (
+            value['result'],
+            False,
+            None,
+            value['error'],
+            value.get('error_class_name'),
+            value.get('traceback', ''),
+            value['pid'],
+        )
+
+    def _call_with_storage(self):
+        """Return the stored results or call the function and store them"""
+        # the storage handlers write the values atomically, a value that is
+        # already ready can be read without waiting for the lock
+        try:
+            value = self._get_stored_value()
+        except ValueError:
+            # a value written by a non atomic storage handler may be read
+            # while being written
+            value = None
+        if value is not None:
+            return self._get_stored_results(value)
+        # this lock prevent any other process to run the function,
+        # and if an other process is running the function, I should wait it
+        # to finish
+        with self.storage.lock(self.key) as data:
+            self.storage.when_lock_acquired(data)
+            # an other process may have stored the results while waiting for
+            # the lock
+            value = self._get_stored_value()
+            if value is not None:
+                return self._get_stored_results(value)
+
+            error = None
+            error_class_name = None
+            result, exp, traceback_text = self._call_function()
+            creation_datetime = datetime.datetime.utcnow().strftime(_DATETIME_FORMAT)
+            if exp:
+                error = str(exp) or 'error occurred'
+                error_class_name = '{}.{}'.format(exp.__class__.__module__, exp.__class__.__name__)
+                value = dict(
+                    state=_STATE_FAILED,
+                    id=self.transaction,
+                    result=None,
+                    error=error,
+                    error_class_name=error_class_name,
+                    traceback=traceback_text,
+                    pid=os.getpid(),
+                    creation_datetime=creation_datetime,
+                )
+            else:
+                result = self._encode_result_kwargs(result)
+                value = dict(
+                    state=_STATE_READY,
+                    id=self.transaction,
+                    result=result,
+                    error=error,
+                    pid=os.getpid(),
+                    creation_datetime=creation_datetime,
+                )
+            self.storage.set(self.key, value)
+            self._set_local_value(
+                value, datetime.datetime.strptime(creation_datetime, _DATETIME_FORMAT)
+            )
+
+        return result, True, exp, error, error_class_name, traceback_text, os.getpid()
+
 
 def _get_kwargs_md5(**kwargs):
     """Create an md5 hexdigest from kwargs"""
@@ -424,6 +543,22 @@ def _get_kwargs_md5(**kwargs):
     return hd
 
 
+def recipe_hash(**recipe):
+    """Return an md5 hexdigest that identify a recipe, to be used as shared
+    function kw when the function kwargs are not json compatible
+
+    Usage::
+
+        @shared(function_kw=['recipe'])
+        def _shared_build_env(org=None, recipe=None):
+            return build_env(org)
+
+        _shared_build_env(org=org, recipe=recipe_hash(org=org.id))
+    """
+    text = json.dumps(recipe, sort_keys=True, default=str)
+    return hashlib.md5(text.encode()).hexdigest()
+
+
 def _get_scope_name(scope=None, scope_kwargs=None, scope_context=None):
     if scope_kwargs is None:
         scope_kwargs = {}
@@ -523,16 +658,7 @@ def shared(
         the kwargs was injected from a saved storage
     """
     _check_config()
-    class_names = []
-    class_name = None
-    index = 1
-    while class_name != '<module>' and index <= _DEFAULT_CLASS_NAME_DEPTH:
-        if class_name:
-            class_names.append(class_name)
-        class_name = inspect.getouterframes(inspect.currentframe())[index][3]
-        index += 1
-    class_names.reverse()
-    class_name = '.'.join(class_names)
+    class_name = get_caller_class_name(_DEFAULT_CLASS_NAME_DEPTH)
     if function_kw is None:
         function_kw = []
 
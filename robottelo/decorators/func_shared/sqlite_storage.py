@@ -0,0 +1,286 @@
+"""SQLite key value storage handler.
+
+All the shared function values and locks are kept in a single SQLite database
+in WAL mode, one row per key, that can be used by all the xdist workers of a
+machine without any extra service.
+
+The database can be inspected and purged from the command line with
+``scripts/shared_storage.py``.
+"""
+import datetime
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+
+from robottelo.decorators import lease
+from robottelo.decorators.func_shared.base import BaseStorageHandler
+from robottelo.decorators.func_shared.file_storage import _get_root_dir
+from robottelo.decorators.func_shared.file_storage import OUT_OF_LINE_DIR
+from robottelo.decorators.func_shared.serializers import Codec
+
+DB_FILE_NAME = 'shared_functions.sqlite'
+# the database file path, by default DB_FILE_NAME in the file storage directory
+DB_PATH = None
+LOCK_TIMEOUT = 7200
+LOCK_POLL_INTERVAL = 0.1
+# how much time to wait for an other connection write to finish
+BUSY_TIMEOUT = 60
+
+logger = logging.getLogger('robottelo')
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS shared_values (
+    key TEXT PRIMARY KEY,
+    value TEXT,
+    state TEXT,
+    owner TEXT,
+    owner_pid INTEGER,
+    owner_host TEXT,
+    updated REAL NOT NULL
+)
+'''
+
+_HOSTNAME = socket.gethostname()
+
+_connections = threading.local()
+
+
+class SQLiteLockTimeout(Exception):
+    """The lock of a key was not acquired in time"""
+
+
+def _get_db_path():
+    return DB_PATH or os.path.join(_get_root_dir(), DB_FILE_NAME)
+
+
+def _get_connection(db_path):
+    """Return the connection of the current process and thread to db_path"""
+    connections = getattr(_connections, 'connections', None)
+    if connections is None or _connections.pid != os.getpid():
+        # connections must not be used across a fork
+        connections = _connections.connections = {}
+        _connections.pid = os.getpid()
+    connection = connections.get(db_path)
+    if connection is None:
+        connection = sqlite3.connect(db_path, timeout=BUSY_TIMEOUT, isolation_level=None)
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.execute('PRAGMA synchronous=NORMAL')
+        connection.execute(_SCHEMA)
+        try:
+            # databases created before the lease owner host was stored
+            connection.execute('ALTER TABLE shared_values ADD COLUMN owner_host TEXT')
+        except sqlite3.OperationalError:
+            pass
+        connections[db_path] = connection
+    return connection
+
+
+class _SQLiteLock:
+    """Lock of a key, acquired by atomically setting the row owner when the
+    row has no owner or when the owner lease is stale.
+
+    The owner refreshes the row updated time while holding the lock, the
+    lease is stale when the owner pid is dead on this host or when the row
+    was not updated since lease.LEASE_TIMEOUT.
+    """
+
+    def __init__(self, handler, key, timeout):
+        self._handler = handler
+        self._key = key
+        self._timeout = timeout
+        self._heartbeat = None
+        self.owner = uuid.uuid4().hex
+
+    def _claim(self, current_owner):
+        """Set this lock as the row owner if the owner is current_owner"""
+        cursor = self._handler.connection.execute(
+            'UPDATE shared_values SET owner = ?, owner_pid = ?, owner_host = ?, updated = ? '
+            'WHERE key = ? AND owner IS ?',
+            (self.owner, os.getpid(), _HOSTNAME, time.time(), self._key, current_owner),
+        )
+        return cursor.rowcount == 1
+
+    def acquire(self):
+        connection = self._handler.connection
+        connection.execute(
+            'INSERT OR IGNORE INTO shared_values (key, updated) VALUES (?, ?)',
+            (self._key, time.time()),
+        )
+        if self._claim(None):
+            return True
+        row = connection.execute(
+            'SELECT owner, owner_pid, owner_host, updated FROM shared_values WHERE key = ?',
+            (self._key,),
+        ).fetchone()
+        if row is None:
+            return False
+        owner, owner_pid, owner_host, updated = row
+        if owner_host != _HOSTNAME:
+            # the pid of an other host owner can not be checked
+            owner_pid = None
+        if owner is not None and lease.is_lease_stale(owner_pid, updated):
+            if self._claim(owner):
+                logger.warning(
+                    f'key "{self._key}" lock owner pid {owner_pid} lease is stale, '
+                    'lock taken over'
+                )
+                return True
+        return False
+
+    def refresh(self):
+        self._handler.connection.execute(
+            'UPDATE shared_values SET updated = ? WHERE key = ? AND owner = ?',
+            (time.time(), self._key, self.owner),
+        )
+
+    def release(self):
+        self._handler.connection.execute(
+            'UPDATE shared_values SET owner = NULL, owner_pid = NULL, owner_host = NULL '
+            'WHERE key = ? AND owner = ?',
+            (self._key, self.owner),
+        )
+
+    def __enter__(self):
+        start = time.time()
+        while not self.acquire():
+            if time.time() - start >= self._timeout:
+                raise SQLiteLockTimeout(f'lock of key "{self._key}" not acquired in time')
+            time.sleep(LOCK_POLL_INTERVAL)
+        self._heartbeat = lease.Heartbeat(self.refresh)
+        self._heartbeat.__enter__()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._heartbeat.__exit__(exc_type, exc_value, traceback)
+        self.release()
+
+
+class SQLiteStorageHandler(BaseStorageHandler):
+    """SQLite Key value storage handler"""
+
+    def __init__(self, db_path=None, lock_timeout=None, codec=None):
+        if db_path is None:
+            db_path = _get_db_path()
+        if lock_timeout is None:
+            lock_timeout = LOCK_TIMEOUT
+        self._db_path = db_path
+        self._lock_timeout = lock_timeout
+        self.codec = Codec(
+            codec, out_of_line_dir=os.path.join(os.path.dirname(db_path), OUT_OF_LINE_DIR)
+        )
+
+    @property
+    def connection(self):
+        return _get_connection(self._db_path)
+
+    def lock(self, key, timeout=None):
+        """Return the storage locker context manager"""
+        if timeout is None:
+            timeout = self._lock_timeout
+        return _SQLiteLock(self, key, timeout)
+
+    def when_lock_acquired(self, lock_object):
+        # the owner pid is written when the lock is acquired
+        pass
+
+    def get(self, key):
+        """Return the key value
+
+        :type key: str
+        """
+        row = self.connection.execute(
+            'SELECT value FROM shared_values WHERE key = ?', (key,)
+        ).fetchone()
+        if row is None or row[0] is None:
+            return None
+        return self.decode(row[0])
+
+    def set(self, key, value):
+        """Write the value of key
+
+        :type key: str
+        :type value: object
+        """
+        state = value.get('state') if isinstance(value, dict) else None
+        encoded_value = self.encode(value)
+        connection = self.connection
+        connection.execute('BEGIN IMMEDIATE')
+        try:
+            row = connection.execute(
+                'SELECT value FROM shared_values WHERE key = ?', (key,)
+            ).fetchone()
+            connection.execute(
+                'INSERT OR IGNORE INTO shared_values (key, updated) VALUES (?, ?)',
+                (key, time.time()),
+            )
+            connection.execute(
+                'UPDATE shared_values SET value = ?, state = ?, updated = ? WHERE key = ?',
+                (encoded_value, state, time.time(), key),
+            )
+        except BaseException:
+            connection.execute('ROLLBACK')
+            self.codec.remove_out_of_line(encoded_value)
+            raise
+        connection.execute('COMMIT')
+        if row is not None:
+            self.codec.remove_out_of_line(row[0])
+
+    def _delete(self, condition, parameters):
+        """Delete the unlocked entries matching the condition and their out
+        of line values, return the number of deleted entries"""
+        connection = self.connection
+        connection.execute('BEGIN IMMEDIATE')
+        try:
+            values = connection.execute(
+                f'SELECT value FROM shared_values WHERE owner IS NULL AND {condition}',
+                parameters,
+            ).fetchall()
+            connection.execute(
+                f'DELETE FROM shared_values WHERE owner IS NULL AND {condition}', parameters
+            )
+        except BaseException:
+            connection.execute('ROLLBACK')
+            raise
+        connection.execute('COMMIT')
+        for (value,) in values:
+            self.codec.remove_out_of_line(value)
+        return len(values)
+
+    def items(self, pattern='*'):
+        """Return the entries with a key matching the glob pattern
+
+        :return: a list of dicts with the key, state, owner_pid and updated
+            datetime of each entry
+        """
+        rows = self.connection.execute(
+            'SELECT key, state, owner_pid, updated FROM shared_values '
+            'WHERE key GLOB ? ORDER BY key',
+            (pattern,),
+        )
+        return [
+            dict(
+                key=key,
+                state=state,
+                owner_pid=owner_pid,
+                updated=datetime.datetime.utcfromtimestamp(updated),
+            )
+            for key, state, owner_pid, updated in rows
+        ]
+
+    def expire(self, max_age):
+        """Delete the unlocked entries not updated since max_age seconds
+
+        :return: the number of deleted entries
+        """
+        return self._delete('updated < ?', (time.time() - max_age,))
+
+    def purge(self, pattern='*'):
+        """Delete the unlocked entries with a key matching the glob pattern
+
+        :return: the number of deleted entries
+        """
+        return self._delete('key GLOB ?', (pattern,))
@@ -0,0 +1,199 @@
+"""Lease based ownership of the function locks and shared function locks.
+
+The lock owner holds a lease: its pid and a heartbeat timestamp refreshed by a
+background thread while the lock is held. A waiter that fails to acquire the
+lock checks the lease of the current owner and takes the lock over when the
+lease is stale, instead of waiting for the lock timeout.
+
+Lease states as seen by a waiter::
+
+    FREE     no owner, the lock is acquired normally
+    HELD     the owner pid is alive and its heartbeat is recent, wait
+    STALE    the owner pid is dead, or its heartbeat is older than
+             LEASE_TIMEOUT (the owner is hung), break the lock and acquire it
+
+For the file locks the lease is the lock file itself: its content is the owner
+pid and its modification time the heartbeat. Only the heartbeat is checked:
+the kernel releases the lock of a dead owner, and a forked child of the owner
+may still hold it. The owner writes its pid once the lock is acquired, until
+then the file has no pid and the modification time of the previous release,
+its lease starts when a waiter first sees it.
+"""
+import contextlib
+import logging
+import os
+import threading
+import time
+import uuid
+from random import random
+
+import zc.lockfile
+
+logger = logging.getLogger('robottelo')
+
+# the time in seconds without heartbeat after which a lease is stale
+LEASE_TIMEOUT = 60
+# the time in seconds between two heartbeats of the lease owner
+HEARTBEAT_INTERVAL = 10
+
+
+def is_process_alive(pid):
+    """Return whether the process pid is running on this host"""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        # the process exists but is owned by an other user
+        return True
+    return True
+
+
+def is_lease_stale(pid, heartbeat, lease_timeout=None):
+    """Return whether the lease owner is dead or hung
+
+    :param pid: the owner pid, None if unknown
+    :param heartbeat: the owner last heartbeat timestamp, None if unknown
+    """
+    if lease_timeout is None:
+        lease_timeout = LEASE_TIMEOUT
+    if pid and not is_process_alive(pid):
+        return True
+    if heartbeat is not None and time.time() - heartbeat > lease_timeout:
+        return True
+    return False
+
+
+class Heartbeat:
+    """Context manager that calls refresh every interval seconds in a
+    background thread
+    """
+
+    def __init__(self, refresh, interval=None):
+        if interval is None:
+            interval = HEARTBEAT_INTERVAL
+        self._refresh = refresh
+        self._interval = interval
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def _run(self):
+        while not self._stopped.wait(self._interval):
+            try:
+                self._refresh()
+            except Exception as exp:
+                logger.warning(f'lease heartbeat failed: {exp}')
+
+    def __enter__(self):
+        self._thread = threading.Thread(target=self._run, name='robottelo-lease', daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._stopped.set()
+        self._thread.join()
+
+
+def read_lease(path):
+    """Return the owner pid, the heartbeat and the inode of the lock file"""
+    try:
+        with open(path) as file_handler:
+            content = file_handler.read().strip()
+            stat = os.fstat(file_handler.fileno())
+    except OSError:
+        return None, None, None
+    pid = int(content) if content.isdigit() else None
+    return pid, stat.st_mtime, stat.st_ino
+
+
+def _read_file_lease(path, owners_seen):
+    """Return the owner pid, the heartbeat and the inode of a locked file
+
+    :param owners_seen: the time this waiter first saw each lock file without
+        pid, by inode and modification time, used as the heartbeat of its
+        owner
+    """
+    pid, heartbeat, inode = read_lease(path)
+    if pid is None and heartbeat is not None:
+        heartbeat = owners_seen.setdefault((inode, heartbeat), time.time())
+    return pid, heartbeat, inode
+
+
+def _is_file_lease_stale(heartbeat, lease_timeout):
+    # the owner pid is not checked, the lock of a dead owner is released
+    return is_lease_stale(None, heartbeat, lease_timeout)
+
+
+def _break_stale_lock(path, inode, lease_timeout, owners_seen):
+    """Move away the lock file of a stale lease, a new lock file is created by
+    the next acquire
+
+    Return whether the lock was broken.
+    """
+    # only one waiter must break the lock, an other one could else move away
+    # the new lock file of the first one
+    try:
+        break_lock = zc.lockfile.SimpleLockFile(f'{path}.break')
+    except zc.lockfile.LockError:
+        return False
+    with contextlib.closing(break_lock):
+        pid, heartbeat, current_inode = _read_file_lease(path, owners_seen)
+        if current_inode != inode or not _is_file_lease_stale(heartbeat, lease_timeout):
+            return False
+        stale_path = f'{path}.stale.{uuid.uuid4().hex}'
+        os.rename(path, stale_path)
+        os.remove(stale_path)
+    logger.warning(f'lock file {path} owner pid {pid} lease is hung, lock taken over')
+    return True
+
+
+def _write_content(handler, content):
+    """write content to locked file"""
+    handler.seek(0)
+    handler.truncate()
+    if content:
+        handler.write(content)
+    handler.flush()
+
+
+@contextlib.contextmanager
+def file_lock(path, timeout, lease_timeout=None):
+    """A file lock shared across processes, taken over when the owner lease
+    is stale
+
+    While the lock is held the file content is the owner pid and the file
+    modification time is refreshed by the owner heartbeat.
+
+    :param path: the path of the file to lock
+    :param timeout: the time in seconds to wait for acquiring the lock
+    :param lease_timeout: the time in seconds without heartbeat after which
+        the owner lease is stale
+    """
+    total_seconds_slept = 0
+    owners_seen = {}
+    while True:
+        try:
+            lock_file = zc.lockfile.SimpleLockFile(path)
+            break
+        except zc.lockfile.LockError:
+            _, heartbeat, inode = _read_file_lease(path, owners_seen)
+            if _is_file_lease_stale(heartbeat, lease_timeout) and _break_stale_lock(
+                path, inode, lease_timeout, owners_seen
+            ):
+                continue
+            if total_seconds_slept >= timeout:
+                raise
+        seconds_to_sleep = random() * 0.1 + 0.05
+        total_seconds_slept += seconds_to_sleep
+        time.sleep(seconds_to_sleep)
+
+    handler = lock_file._fp
+    try:
+        _write_content(handler, str(os.getpid()))
+        # touch the locked file and not the path, that may be an other lock
+        # file if this lock was taken over
+        with Heartbeat(lambda: os.utime(handler.fileno())):
+            yield handler
+    finally:
+        _write_content(handler, None)
+        lock_file.close()
@@ -0,0 +1,175 @@
+"""Lock contention metrics of the function locks and semaphores.
+
+Each lock acquisition of :mod:`robottelo.decorators.func_locker` is appended as
+a json line to a metrics file in the robottelo temp dir, shared by all the
+xdist workers of a session. The ``pytest_plugins.lock_metrics`` plugin names
+the file after the session, reports the most contended locks in the terminal
+summary and removes the file at the end of the session.
+"""
+import json
+import logging
+import os
+import tempfile
+import time
+
+from robottelo.config import settings
+
+logger = logging.getLogger('robottelo')
+
+TEMP_ROOT_DIR = 'robottelo'
+METRICS_FILE_NAME = 'lock_metrics_{session}.jsonl'
+# the session of the metrics file, set by the xdist controller for its workers,
+# by default the current process
+SESSION_ENV = 'ROBOTTELO_LOCK_METRICS_SESSION'
+# the metrics file path, by default METRICS_FILE_NAME in the robottelo temp dir
+METRICS_FILE_PATH = None
+# the number of locks shown in the report
+REPORT_SIZE = 10
+
+
+def get_temp_dir():
+    tmp_dir = settings.tmp_dir
+    if not tmp_dir:
+        tmp_dir = tempfile.gettempdir()
+    return tmp_dir
+
+
+def get_metrics_file_path():
+    if METRICS_FILE_PATH is not None:
+        return METRICS_FILE_PATH
+    session = os.environ.get(SESSION_ENV) or os.getpid()
+    return os.path.join(get_temp_dir(), TEMP_ROOT_DIR, METRICS_FILE_NAME.format(session=session))
+
+
+def start_session():
+    """Make this process and the processes it starts, the xdist workers,
+    record their lock acquisitions to the metrics file of this process
+    """
+    os.environ[SESSION_ENV] = str(os.getpid())
+    # a previous process with the same pid may have left its file
+    reset()
+
+
+def end_session():
+    """Remove the metrics file of the session started by this process"""
+    if os.environ.get(SESSION_ENV) == str(os.getpid()):
+        reset()
+        os.environ.pop(SESSION_ENV)
+
+
+def _current_test():
+    """Return the node id of the test running in this process, if any"""
+    current_test = os.environ.get('PYTEST_CURRENT_TEST')
+    if current_test:
+        # the value is the node id followed by the test stage: "nodeid (call)"
+        current_test = current_test.rsplit(' ', 1)[0]
+    return current_test
+
+
+def record(name, scope_path, wait_time, hold_time, kind='lock'):
+    """Append a lock acquisition to the metrics file
+
+    :param name: the locked function name or the semaphore name
+    :param scope_path: the directory of the lock files
+    :param wait_time: the seconds waited to acquire the lock
+    :param hold_time: the seconds the lock was held
+    :param kind: lock or semaphore
+    """
+    line = json.dumps(
+        dict(
+            name=name,
+            kind=kind,
+            scope_path=scope_path,
+            pid=os.getpid(),
+            test=_current_test(),
+            wait=round(wait_time, 3),
+            hold=round(hold_time, 3),
+            time=time.time(),
+        )
+    )
+    path = get_metrics_file_path()
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # a single write to a file opened in append mode is not interleaved
+        # with the writes of the other workers
+        file_descriptor = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(file_descriptor, f'{line}\n'.encode())
+        finally:
+            os.close(file_descriptor)
+    except OSError as exp:
+        # the metrics must not break the locking
+        logger.warning(f'lock metrics not recorded: {exp}')
+
+
+def read():
+    """Return the recorded lock acquisitions"""
+    try:
+        with open(get_metrics_file_path()) as file_handler:
+            lines = file_handler.readlines()
+    except FileNotFoundError:
+        return []
+    entries = []
+    for line in lines:
+        try:
+            entries.append(json.loads(line))
+        except ValueError:
+            # a line partially written by a killed worker
+            continue
+    return entries
+
+
+def reset():
+    """Remove the recorded lock acquisitions"""
+    try:
+        os.remove(get_metrics_file_path())
+    except FileNotFoundError:
+        pass
+
+
+def summarize(entries):
+    """Return the contention summary of the lock acquisitions by lock, the
+    most contended first
+
+    :return: a list of dicts with the lock name, kind, scope_path, count of
+        acquisitions, total and max wait, and the longest hold with its test
+    """
+    locks = {}
+    for entry in entries:
+        key = (entry['kind'], entry['scope_path'], entry['name'])
+        lock = locks.setdefault(
+            key,
+            dict(
+                name=entry['name'],
+                kind=entry['kind'],
+                scope_path=entry['scope_path'],
+                count=0,
+                total_wait=0.0,
+                max_wait=0.0,
+                max_hold=0.0,
+                max_hold_test=None,
+            ),
+        )
+        lock['count'] += 1
+        lock['total_wait'] += entry['wait']
+        lock['max_wait'] = max(lock['max_wait'], entry['wait'])
+        if lock['max_hold_test'] is None or entry['hold'] > lock['max_hold']:
+            lock['max_hold'] = entry['hold']
+            lock['max_hold_test'] = entry['test'] or f'pid {entry["pid"]}'
+    return sorted(locks.values(), key=lambda lock: lock['total_wait'], reverse=True)
+
+
+def report(entries, size=None):
+    """Return the text report of the most contended locks"""
+    if size is None:
+        size = REPORT_SIZE
+    locks = summarize(entries)
+    total_wait = sum(lock['total_wait'] for lock in locks)
+    lines = [f'worker-seconds lost waiting for locks: {total_wait:.1f}']
+    for lock in locks[:size]:
+        lines.append(
+            f'{lock["kind"]} {lock["name"]}: {lock["count"]} acquisitions, '
+            f'waited {lock["total_wait"]:.1f}s (max {lock["max_wait"]:.1f}s), '
+            f'longest hold {lock["max_hold"]:.1f}s by {lock["max_hold_test"]}'
+        )
+    return '\n'.join(lines)
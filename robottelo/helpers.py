@@ -10,6 +10,7 @@ from urllib.parse import urljoin  # noqa
 import requests
 from nailgun.config import ServerConfig
 
+from robottelo import http
 from robottelo import ssh
 from robottelo.cli.base import CLIReturnCodeError
 from robottelo.cli.proxy import CapsuleTunnelError
@@ -69,7 +70,7 @@ class ServerFileDownloader:
         if not self.file_downloaded:  # pragma: no cover
             self.fd, self.file_path = mkstemp(suffix=f'.{extention}')
             fileobj = os.fdopen(self.fd, 'wb')
-            fileobj.write(requests.get(fileurl).content)
+            fileobj.write(http.get(fileurl).content)
             fileobj.close()
             if os.path.exists(self.file_path):
                 self.file_downloaded = True
@@ -104,7 +105,7 @@ def file_downloader(file_url, local_path=None, file_name=None, hostname=None):
     # download on localhost
     if hostname is None:
         with open(f'{local_path}{file_name}', 'wb') as fileobj:
-            r = requests.get(file_url)
+            r = http.get(file_url)
             r.raise_for_status()
             fileobj.write(r.content)
             fileobj.close()
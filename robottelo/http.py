@@ -0,0 +1,160 @@
+"""Shared HTTP sessions with connection pooling.
+
+All the HTTP requests made by robottelo helpers (Pulp, Bugzilla, Report
+Portal, manifests and files downloads) should go through this module, that
+way the connections to a given host are kept alive and reused between calls
+instead of paying a new TCP connection and TLS handshake for each request.
+
+Usage::
+
+    from robottelo import http
+
+    response = http.get(url, params={'id': 1}, verify=False)
+    response = http.request('POST', url, json=data, auth=auth)
+
+    # requests and connections opened per host since the process start
+    http.get_stats()
+
+The entities requests of nailgun are not sent through this module, nailgun
+sends them with the ``requests`` module functions and has no way to be given
+a session.
+"""
+import logging
+import os
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+LOGGER = logging.getLogger('robottelo')
+
+# the maximum number of entities created at once by the bulk factories
+BULK_MAX_WORKERS = 8
+# the number of deletions of the same entity type that may run at the same
+# time in the cleanup scheduler
+CLEANUP_MAX_WORKERS = 4
+# the number of connections kept alive per host, one per thread of a worker
+# that may send requests at once: the test thread, the bulk factories threads,
+# the cleanup scheduler deletion threads and the manifest pool thread
+POOL_MAXSIZE = 1 + BULK_MAX_WORKERS + CLEANUP_MAX_WORKERS + 1
+# the number of hosts pools cached by a session
+POOL_CONNECTIONS = 10
+# retry idempotent requests on connection errors and on these status codes
+RETRY_TOTAL = 3
+RETRY_BACKOFF_FACTOR = 0.5
+RETRY_STATUS_FORCELIST = (502, 503, 504)
+
+_lock = threading.Lock()
+_sessions = {}
+_stats = {}
+
+
+def _get_host_key(url):
+    """Return the (scheme, host) part of the url"""
+    parts = urlsplit(url)
+    return parts.scheme, parts.netloc
+
+
+def _new_session():
+    """Return a session with a pooled and retrying adapter mounted"""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        max_retries=Retry(
+            total=RETRY_TOTAL,
+            backoff_factor=RETRY_BACKOFF_FACTOR,
+            status_forcelist=RETRY_STATUS_FORCELIST,
+            raise_on_status=False,
+        ),
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def get_session(url):
+    """Return the session shared by all the requests to the host of url
+
+    Sessions are never shared between processes, a forked xdist worker gets
+    its own sessions.
+    """
+    key = (os.getpid(),) + _get_host_key(url)
+    session = _sessions.get(key)
+    if session is None:
+        with _lock:
+            session = _sessions.get(key)
+            if session is None:
+                session = _sessions[key] = _new_session()
+    return session
+
+
+def request(method, url, **kwargs):
+    """Send a request using the shared session of the url host
+
+    Accept the same arguments as ``requests.request``.
+    """
+    session = get_session(url)
+    start = time.time()
+    try:
+        return session.request(method, url, **kwargs)
+    finally:
+        elapsed = time.time() - start
+        host = '://'.join(_get_host_key(url))
+        with _lock:
+            host_stats = _stats.setdefault(host, {'requests': 0, 'elapsed': 0.0})
+            host_stats['requests'] += 1
+            host_stats['elapsed'] += elapsed
+        LOGGER.debug(f'{method} {url} took {elapsed:.3f}s')
+
+
+def get(url, **kwargs):
+    """Send a GET request using the shared session of the url host"""
+    return request('GET', url, **kwargs)
+
+
+def post(url, **kwargs):
+    """Send a POST request using the shared session of the url host"""
+    return request('POST', url, **kwargs)
+
+
+def get_stats():
+    """Return per host statistics of the current process.
+
+    :return: a dict keyed by ``scheme://host`` with the number of requests
+        sent, the number of connections opened (each one is a TCP connection
+        and, for https, a TLS handshake, None when it cannot be read from
+        urllib3) and the total time spent.
+    """
+    stats = {}
+    with _lock:
+        for host, host_stats in _stats.items():
+            stats[host] = dict(host_stats, connections=0)
+        for (pid, scheme, netloc), session in _sessions.items():
+            if pid != os.getpid():
+                continue
+            host_stats = stats.setdefault(
+                f'{scheme}://{netloc}', {'requests': 0, 'elapsed': 0.0, 'connections': 0}
+            )
+            adapter = session.get_adapter(f'{scheme}://{netloc}')
+            # urllib3 has no public way to list the pools without reordering
+            # them, its container is read if it is still there
+            pools = getattr(getattr(adapter.poolmanager, 'pools', None), '_container', None)
+            if pools is None:
+                host_stats['connections'] = None
+                continue
+            for pool in list(pools.values()):
+                host_stats['connections'] += getattr(pool, 'num_connections', 0)
+    return stats
+
+
+def close_sessions():
+    """Close all the sessions of the current process and reset the stats"""
+    with _lock:
+        for key in list(_sessions):
+            if key[0] == os.getpid():
+                _sessions.pop(key).close()
+        _stats.clear()
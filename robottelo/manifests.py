@@ -1,17 +1,25 @@
 """Manifest clonning tools.."""
+import atexit
 import io
 import json
+import logging
+import struct
+import threading
 import time
 import uuid
 import zipfile
+from collections import defaultdict
+from collections import deque
+from concurrent.futures import CancelledError
+from concurrent.futures import ThreadPoolExecutor
 
-import requests
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric import padding
 from nailgun import entities
 
+from robottelo import http
 from robottelo.cli.subscription import Subscription
 from robottelo.config import settings
 from robottelo.constants import INTERFACE_API
@@ -19,6 +27,125 @@ from robottelo.constants import INTERFACE_CLI
 from robottelo.decorators.func_locker import lock_function
 from robottelo.ssh import upload_file
 
+logger = logging.getLogger('robottelo')
+
+CONSUMER_NAME = 'export/consumer.json'
+_LOCAL_HEADER_SIGNATURE = b'PK\x03\x04'
+_LOCAL_HEADER_SIZE = 30
+_DATA_DESCRIPTOR_SIGNATURE = b'PK\x07\x08'
+_DATA_DESCRIPTOR_FLAG = 0x08
+_ZIP64_EXTRA_ID = 0x0001
+_CENTRAL_HEADER = struct.Struct('<4s4B4H3L5H2L')
+_CENTRAL_HEADER_SIGNATURE = b'PK\x01\x02'
+_END_RECORD = struct.Struct('<4s4H2LH')
+_END_RECORD_SIGNATURE = b'PK\x05\x06'
+
+
+def _get_raw_entry(content, info):
+    """Return a zip entry as it is in the zip content: its local header, its
+    compressed data and its data descriptor"""
+    start = info.header_offset
+    if not content.startswith(_LOCAL_HEADER_SIGNATURE, start):
+        raise zipfile.BadZipFile(f'bad local header of {info.filename}')
+    filename_length, extra_length = struct.unpack_from('<2H', content, start + 26)
+    end = start + _LOCAL_HEADER_SIZE + filename_length + extra_length + info.compress_size
+    if info.flag_bits & _DATA_DESCRIPTOR_FLAG:
+        # crc and sizes, after an optional signature
+        end += 16 if content.startswith(_DATA_DESCRIPTOR_SIGNATURE, end) else 12
+    return memoryview(content)[start:end]
+
+
+def _compress_entry(info, data):
+    """Return the zip entry info and the raw entry of the data compressed"""
+    entry_zip_content = io.BytesIO()
+    with zipfile.ZipFile(entry_zip_content, 'w') as entry_zip:
+        entry_zip.writestr(info, data)
+    entry_zip_content = entry_zip_content.getvalue()
+    with zipfile.ZipFile(io.BytesIO(entry_zip_content)) as entry_zip:
+        info = entry_zip.infolist()[0]
+    return info, _get_raw_entry(entry_zip_content, info)
+
+
+def _strip_zip64_extra(extra):
+    """Return the extra fields of a central directory record without the
+    zip64 one, its sizes and offset are the ones of the source zip"""
+    fields = []
+    position = 0
+    while position + 4 <= len(extra):
+        header_id, size = struct.unpack_from('<2H', extra, position)
+        end = position + 4 + size
+        if header_id != _ZIP64_EXTRA_ID:
+            fields.append(extra[position:end])
+        position = end
+    return b''.join(fields)
+
+
+def _write_raw_zip(output, entries):
+    """Write a zip file made of raw zip entries, as they are in their source,
+    and its central directory
+
+    :param output: the file-like object the zip file is written to
+    :param entries: the ``(ZipInfo, raw entry)`` of the zip entries in order,
+        see ``_get_raw_entry``
+    :raise zipfile.LargeZipFile: when the zip file would need zip64
+    """
+    central_directory = []
+    for info, raw_entry in entries:
+        offset = output.tell()
+        output.write(raw_entry)
+        if max(offset, info.compress_size, info.file_size) >= zipfile.ZIP64_LIMIT:
+            raise zipfile.LargeZipFile(f'{info.filename} would need zip64')
+        # the name as encoded in the local header
+        filename_length = struct.unpack_from('<H', raw_entry, 26)[0]
+        filename_end = _LOCAL_HEADER_SIZE + filename_length
+        filename = bytes(raw_entry[_LOCAL_HEADER_SIZE:filename_end])
+        extra = _strip_zip64_extra(info.extra)
+        year, month, day, hour, minute, second = info.date_time
+        central_directory.append(
+            _CENTRAL_HEADER.pack(
+                _CENTRAL_HEADER_SIGNATURE,
+                info.create_version,
+                info.create_system,
+                info.extract_version,
+                info.reserved,
+                info.flag_bits,
+                info.compress_type,
+                hour << 11 | minute << 5 | second // 2,
+                (year - 1980) << 9 | month << 5 | day,
+                info.CRC,
+                info.compress_size,
+                info.file_size,
+                len(filename),
+                len(extra),
+                len(info.comment),
+                0,
+                info.internal_attr,
+                info.external_attr,
+                offset,
+            )
+            + filename
+            + extra
+            + info.comment
+        )
+    central_directory_offset = output.tell()
+    for record in central_directory:
+        output.write(record)
+    central_directory_size = output.tell() - central_directory_offset
+    if len(entries) > 0xFFFF or central_directory_offset >= zipfile.ZIP64_LIMIT:
+        raise zipfile.LargeZipFile('the zip file would need zip64')
+    output.write(
+        _END_RECORD.pack(
+            _END_RECORD_SIGNATURE,
+            0,
+            0,
+            len(entries),
+            len(entries),
+            central_directory_size,
+            central_directory_offset,
+            0,
+        )
+    )
+
 
 class ManifestCloner:
     """Manifest clonning utility class."""
@@ -27,14 +154,39 @@ class ManifestCloner:
         self.template = template
         self.signing_key = signing_key
         self.private_key = private_key
+        self._consumer_exports = {}
+
+    def _get_consumer_export(self, name):
+        """Return the ``consumer_export.zip`` of a template manifest, parsed
+        once per template: its raw entries, the consumer data and the
+        compression of the consumer export in the manifest"""
+        template = self.template[name]
+        cached = self._consumer_exports.get(name)
+        if cached is None or cached[0] is not template:
+            with zipfile.ZipFile(io.BytesIO(template)) as template_zip:
+                content = template_zip.read('consumer_export.zip')
+            with zipfile.ZipFile(io.BytesIO(content)) as consumer_export_zip:
+                infos = consumer_export_zip.infolist()
+                consumer = consumer_export_zip.read(CONSUMER_NAME).decode('utf-8')
+            entries = [(info, _get_raw_entry(content, info)) for info in infos]
+            # compressing the consumer export again gains nothing when its
+            # entries are compressed
+            compress_type = (
+                zipfile.ZIP_DEFLATED
+                if any(info.compress_type == zipfile.ZIP_STORED for info in infos)
+                else zipfile.ZIP_STORED
+            )
+            cached = (template, entries, consumer, compress_type)
+            self._consumer_exports[name] = cached
+        return cached[1:]
 
     def _download_manifest_info(self, name='default'):
         """Download and cache the manifest information."""
         if self.template is None:
             self.template = {}
-        self.template[name] = requests.get(settings.fake_manifest.url[name]).content
+        self.template[name] = http.get(settings.fake_manifest.url[name]).content
         if self.signing_key is None:
-            self.signing_key = requests.get(settings.fake_manifest.key_url).content
+            self.signing_key = http.get(settings.fake_manifest.key_url).content
         if self.private_key is None:
             self.private_key = serialization.load_pem_private_key(
                 self.signing_key, password=None, backend=default_backend()
@@ -62,36 +214,34 @@ class ManifestCloner:
         if self.signing_key is None or self.template is None or self.template.get(name) is None:
             self._download_manifest_info(name)
 
-        template_zip = zipfile.ZipFile(io.BytesIO(self.template[name]))
-        # Extract the consumer_export.zip from the template manifest.
-        consumer_export_zip = zipfile.ZipFile(io.BytesIO(template_zip.read('consumer_export.zip')))
+        entries, consumer, compress_type = self._get_consumer_export(name)
+        consumer_data = json.loads(consumer)
+        consumer_data['uuid'] = str(uuid.uuid1())
+        if org_environment_access:
+            consumer_data['contentAccessMode'] = 'org_environment'
+            consumer_data['owner']['contentAccessModeList'] = 'entitlement,org_environment'
 
         # Generate a new consumer_export.zip file changing the consumer
-        # uuid.
+        # uuid, the other entries are copied without decompressing them.
+        consumer_export_entries = []
+        for info, raw_entry in entries:
+            if info.filename == CONSUMER_NAME:
+                consumer_info = zipfile.ZipInfo(CONSUMER_NAME, time.localtime(time.time())[:6])
+                consumer_info.compress_type = info.compress_type
+                consumer_info.external_attr = 0o600 << 16
+                info, raw_entry = _compress_entry(consumer_info, json.dumps(consumer_data))
+            consumer_export_entries.append((info, raw_entry))
         consumer_export = io.BytesIO()
-        with zipfile.ZipFile(consumer_export, 'w') as new_consumer_export_zip:
-            for name in consumer_export_zip.namelist():
-                if name == 'export/consumer.json':
-                    consumer_data = json.loads(consumer_export_zip.read(name).decode('utf-8'))
-                    consumer_data['uuid'] = str(uuid.uuid1())
-                    if org_environment_access:
-                        consumer_data['contentAccessMode'] = 'org_environment'
-                        consumer_data['owner'][
-                            'contentAccessModeList'
-                        ] = 'entitlement,org_environment'
-                    new_consumer_export_zip.writestr(name, json.dumps(consumer_data))
-                else:
-                    new_consumer_export_zip.writestr(name, consumer_export_zip.read(name))
+        _write_raw_zip(consumer_export, consumer_export_entries)
 
         # Generate a new manifest.zip file with the generated
         # consumer_export.zip and new signature.
         manifest = io.BytesIO()
-        with zipfile.ZipFile(manifest, 'w', zipfile.ZIP_DEFLATED) as manifest_zip:
-            consumer_export.seek(0)
-            manifest_zip.writestr('consumer_export.zip', consumer_export.read())
-            consumer_export.seek(0)
+        consumer_export_content = consumer_export.getvalue()
+        with zipfile.ZipFile(manifest, 'w', compress_type) as manifest_zip:
+            manifest_zip.writestr('consumer_export.zip', consumer_export_content)
             signature = self.private_key.sign(
-                consumer_export.read(), padding.PKCS1v15(), hashes.SHA256()
+                consumer_export_content, padding.PKCS1v15(), hashes.SHA256()
             )
             manifest_zip.writestr('signature', signature)
         # Make sure that the file-like object is at the beginning and
@@ -116,9 +266,108 @@ class ManifestCloner:
         return io.BytesIO(self.template[name])
 
 
+class ManifestPool:
+    """Clones of the manifests generated in a background thread and kept ready
+    to be handed out, by manifest name and ``org_environment_access`` flag.
+
+    The first clone of a manifest is generated by the caller, it downloads
+    the template, then ``size`` clones are kept ready: each one handed out is
+    replaced by a new one generated in the background, off the critical path
+    of the tests, for example while they wait for the manifest upload lock.
+
+    ``hits`` counts the clones handed out ready, ``misses`` the ones the
+    caller had to wait for. ``close`` stops the generation of the clones, at
+    the end of the session.
+
+    :param cloner: the ``ManifestCloner`` generating the clones
+    :param int size: the number of clones kept ready for each manifest name and
+        flag, by default ``fake_manifest.pool_size`` setting, 0 to disable the
+        pool
+    """
+
+    def __init__(self, cloner, size=None):
+        self.cloner = cloner
+        self._size = size
+        self.hits = 0
+        self.misses = 0
+        self._clones = defaultdict(deque)
+        self._lock = threading.Lock()
+        self._executor = None
+        self._closed = False
+
+    @property
+    def size(self):
+        if self._size is None:
+            self._size = settings.fake_manifest.pool_size
+        return self._size
+
+    def _fill(self, key):
+        """Generate in the background the clones missing to the pool"""
+        name, org_environment_access = key
+        clones = self._clones[key]
+        while not self._closed and len(clones) < self.size:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix='manifest_pool'
+                )
+            clones.append(
+                self._executor.submit(
+                    self.cloner.clone, org_environment_access=org_environment_access, name=name
+                )
+            )
+
+    def get(self, org_environment_access=False, name='default'):
+        """Return a clone of a manifest, see ``ManifestCloner.clone``"""
+        key = (name, bool(org_environment_access))
+        with self._lock:
+            clones = self._clones[key]
+            clone = clones.popleft() if clones else None
+            if clone is not None and clone.done():
+                self.hits += 1
+            else:
+                self.misses += 1
+            hits, misses = self.hits, self.misses
+        content = None
+        if clone is not None:
+            try:
+                content = clone.result()
+            except (Exception, CancelledError) as err:
+                logger.debug(f'manifest "{name}" background clone failed: {err!r}')
+        if content is None:
+            content = self.cloner.clone(org_environment_access=org_environment_access, name=name)
+        with self._lock:
+            self._fill(key)
+        logger.debug(f'manifest "{name}" clone from the pool: {hits} hits, {misses} misses')
+        return content
+
+    def stats(self):
+        """Return the hits and misses of the pool, and the clones ready"""
+        with self._lock:
+            ready = sum(clone.done() for clones in self._clones.values() for clone in clones)
+            return dict(hits=self.hits, misses=self.misses, ready=ready)
+
+    def close(self):
+        """Stop generating clones: the clones not started are cancelled and the
+        one in progress is not waited for"""
+        with self._lock:
+            self._closed = True
+            for clones in self._clones.values():
+                for clone in clones:
+                    clone.cancel()
+            self._clones.clear()
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
 # Cache the ManifestCloner in order to avoid downloading the manifest template
 # every single time.
 _manifest_cloner = ManifestCloner()
+_manifest_pool = ManifestPool(_manifest_cloner)
+# the python 3.9+ executors wait for their queued clones before the atexit
+# functions are called, the pool is closed at the end of the pytest session
+# too, see pytest_plugins.manifest_pool
+atexit.register(_manifest_pool.close)
 
 
 class Manifest:
@@ -137,7 +386,7 @@ class Manifest:
         self.filename = filename
 
         if self._content is None:
-            self._content = _manifest_cloner.clone(
+            self._content = _manifest_pool.get(
                 org_environment_access=org_environment_access, name=name
             )
         if self.filename is None:
@@ -194,7 +443,7 @@ def original_manifest(name='default'):
     return Manifest(_manifest_cloner.original(name=name))
 
 
-@lock_function
+@lock_function(fair=True)
 def upload_manifest_locked(org_id, manifest=None, interface=INTERFACE_API, timeout=None):
     """Upload a manifest with locking, using the requested interface.
 
@@ -206,7 +455,7 @@ def upload_manifest_locked(org_id, manifest=None, interface=INTERFACE_API, timeo
     :returns: the upload result
 
     Note: The manifest uploading is strictly locked only when using this
-        function
+        function. The waiting uploads are served in order.
 
     Usage::
 
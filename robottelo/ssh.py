@@ -10,7 +10,9 @@ from fnmatch import fnmatch
 import paramiko
 
 from robottelo.cli import hammer
-from robottelo.config import settings
+
+# the compiled settings, read on every command without the settings proxy overhead
+from robottelo.config import compiled_settings as settings
 
 logger = logging.getLogger('robottelo')
 
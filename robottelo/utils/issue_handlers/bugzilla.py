@@ -3,12 +3,12 @@ import re
 from collections import defaultdict
 
 import pytest
-import requests
 from packaging.version import Version
 from tenacity import retry
 from tenacity import stop_after_attempt
 from tenacity import wait_fixed
 
+from robottelo import http
 from robottelo.config import settings
 from robottelo.constants import CLOSED_STATUSES
 from robottelo.constants import OPEN_STATUSES
@@ -244,7 +244,7 @@ def get_data_bz(bz_numbers, cached_data=None):  # pragma: no cover
     for field in ('is_open', 'clones', 'version'):
         assert field not in bz_fields
 
-    response = requests.get(
+    response = http.get(
         f"{settings.bugzilla.url}/rest/bug",
         params={
             "id": ",".join(set(bz_numbers)),
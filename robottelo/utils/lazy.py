@@ -0,0 +1,51 @@
+"""Lazy imports of the modules and objects that are slow to import.
+
+A ``LazyImport`` stands for an object of a module that is imported only when
+the object is first used, for example::
+
+    Org = LazyImport('robottelo.cli.org', 'Org')
+
+    def make_org(options=None):
+        return Org.create(options)
+
+imports ``robottelo.cli.org`` on the first ``make_org`` call, not when the
+module defining ``make_org`` is imported. The attribute accesses and the calls
+are forwarded to the imported object.
+"""
+import importlib
+
+
+class LazyImport:
+    """An object imported on first use
+
+    :param module_name: the name of the module to import
+    :param name: the name of the object in the module, None for the module
+        itself
+    """
+
+    __slots__ = ('_module_name', '_name', '_object')
+
+    def __init__(self, module_name, name=None):
+        self._module_name = module_name
+        self._name = name
+        self._object = None
+
+    def _resolve(self):
+        if self._object is None:
+            obj = importlib.import_module(self._module_name)
+            if self._name is not None:
+                obj = getattr(obj, self._name)
+            self._object = obj
+        return self._object
+
+    def __getattr__(self, name):
+        return getattr(self._resolve(), name)
+
+    def __call__(self, *args, **kwargs):
+        return self._resolve()(*args, **kwargs)
+
+    def __repr__(self):
+        target = self._module_name
+        if self._name is not None:
+            target = f'{target}.{self._name}'
+        return f'<{type(self).__name__} of {target}>'
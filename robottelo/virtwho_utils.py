@@ -18,8 +18,25 @@ from robottelo.config.virtwho import VirtwhoSettings
 from robottelo.constants import DEFAULT_ORG
 
 VIRTWHO_SYSCONFIG = "/etc/sysconfig/virt-who"
-virtwho = VirtwhoSettings()
-virtwho.configure()
+_virtwho = None
+
+
+def get_virtwho_settings():
+    """Return the virtwho settings, virtwho.properties is read when first called"""
+    global _virtwho
+    if _virtwho is None:
+        virtwho = VirtwhoSettings()
+        virtwho.configure()
+        _virtwho = virtwho
+    return _virtwho
+
+
+def __getattr__(name):
+    # ``from robottelo.virtwho_utils import virtwho`` reads the settings on use,
+    # not when this module is imported
+    if name == 'virtwho':
+        return get_virtwho_settings()
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
 
 
 class VirtWhoError(Exception):
@@ -42,11 +59,12 @@ def get_system(system_type):
     :raises: VirtWhoError: If wrong ``system_type`` specified.
     """
     if system_type in ['esx', 'xen', 'hyperv', 'rhevm', 'libvirt', 'kubevirt']:
+        hypervisor = getattr(get_virtwho_settings(), system_type)
         return {
-            'hostname': getattr(virtwho, system_type).guest,
-            'username': getattr(virtwho, system_type).guest_username,
-            'password': getattr(virtwho, system_type).guest_password,
-            'port': getattr(virtwho, system_type).guest_port,
+            'hostname': hypervisor.guest,
+            'username': hypervisor.guest_username,
+            'password': hypervisor.guest_password,
+            'port': hypervisor.guest_port,
         }
     elif system_type == 'satellite':
         return {
@@ -0,0 +1,104 @@
+"""Benchmark the tests collection with the decoration time class name lookup.
+
+Compare the collection time of a tests tree when the ``@shared`` and
+``@lock_function`` decorators resolve the decorated function class name with
+``inspect.getouterframes``, as they used to, and by walking the frames with
+``robottelo.decorators.get_caller_class_name``.
+
+Usage::
+
+    python scripts/benchmark_collection.py --repeat 3 tests/foreman
+"""
+import argparse
+import inspect
+import statistics
+import subprocess
+import sys
+import time
+import timeit
+
+
+def legacy_get_caller_class_name(depth=3):
+    """The class name lookup that loads the source context of the whole
+    stack"""
+    class_names = []
+    class_name = None
+    # skip this function frame
+    index = 2
+    while class_name != '<module>' and index <= depth + 1:
+        if class_name:
+            class_names.append(class_name)
+        class_name = inspect.getouterframes(inspect.currentframe())[index][3]
+        index += 1
+    class_names.reverse()
+    return '.'.join(class_names)
+
+
+def _use_legacy_lookup():
+    # the decorators modules import the lookup function, patch it before
+    from robottelo import decorators
+
+    decorators.get_caller_class_name = legacy_get_caller_class_name
+
+
+def collect(path, legacy):
+    """Collect the tests of path, in this process"""
+    import pytest
+
+    if legacy:
+        _use_legacy_lookup()
+    return pytest.main(['--collect-only', '-q', '-p', 'no:cacheprovider', path])
+
+
+def run_collection(path, legacy, repeat):
+    durations = []
+    for _ in range(repeat):
+        command = [sys.executable, __file__, '--collect', path]
+        if legacy:
+            command.append('--legacy')
+        start = time.time()
+        subprocess.run(command, stdout=subprocess.DEVNULL, check=False)
+        durations.append(time.time() - start)
+    return statistics.median(durations)
+
+
+def _nested_call(depth, func):
+    if depth:
+        return _nested_call(depth - 1, func)
+    return func()
+
+
+def run_lookup(func, stack_depth, number):
+    """Return the seconds per lookup with stack_depth frames on the stack"""
+    seconds = timeit.timeit(lambda: _nested_call(stack_depth, func), number=number)
+    return seconds / number
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('path', nargs='?', default='tests/foreman')
+    parser.add_argument('--repeat', type=int, default=3)
+    # the pytest stack depth at decoration time when importing a test module
+    parser.add_argument('--stack-depth', type=int, default=60)
+    parser.add_argument('--collect', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('--legacy', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.collect:
+        sys.exit(collect(args.path, args.legacy))
+
+    from robottelo.decorators import get_caller_class_name
+
+    for name, func in (
+        ('getouterframes', legacy_get_caller_class_name),
+        ('frame walk', get_caller_class_name),
+    ):
+        lookup = run_lookup(func, args.stack_depth, number=200)
+        print(f'{name}: {lookup * 1000:.3f}ms per lookup, stack depth {args.stack_depth}')
+    legacy = run_collection(args.path, True, args.repeat)
+    current = run_collection(args.path, False, args.repeat)
+    print(f'getouterframes: {args.path} collected in {legacy:.2f}s')
+    print(f'frame walk: {args.path} collected in {current:.2f}s ({legacy / current:.2f}x)')
+
+
+if __name__ == '__main__':
+    main()
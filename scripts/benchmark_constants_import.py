@@ -0,0 +1,93 @@
+"""Benchmark the import time and memory of the constants module.
+
+Import ``robottelo.constants`` in new interpreters, as each pytest-xdist worker
+does, and report the import time, the resident memory it adds to the process
+and the number of modules it imports. With ``--access``, every constant is
+also read, to measure the cost of the tables built on first access. With
+``--preload``, the modules that a worker imports anyway are imported before the
+measure, to only count what the constants add.
+
+Usage::
+
+    python scripts/benchmark_constants_import.py --repeat 10 --preload robottelo.config
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+MODULE = 'robottelo.constants'
+
+
+def _rss_kb():
+    """Return the resident memory of this process in kB"""
+    with open('/proc/self/status') as status:
+        for line in status:
+            if line.startswith('VmRSS:'):
+                return int(line.split()[1])
+
+
+def measure(access, preload):
+    """Import the module, in this process, and print the measures as JSON"""
+    import importlib
+    import time
+
+    for module_name in preload:
+        importlib.import_module(module_name)
+    modules, rss = len(sys.modules), _rss_kb()
+    start = time.perf_counter()
+    module = importlib.import_module(MODULE)
+    if access:
+        for name in getattr(module, '__all__', dir(module)):
+            getattr(module, name)
+    duration = time.perf_counter() - start
+    print(
+        json.dumps(
+            dict(ms=duration * 1000, rss_kb=_rss_kb() - rss, modules=len(sys.modules) - modules)
+        )
+    )
+
+
+def run(access, preload, repeat):
+    command = [sys.executable, __file__, '--measure']
+    if access:
+        command.append('--access')
+    for module_name in preload:
+        command.extend(['--preload', module_name])
+    runs = []
+    for _ in range(repeat):
+        result = subprocess.run(
+            command,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            universal_newlines=True,
+            check=True,
+        )
+        runs.append(json.loads(result.stdout.splitlines()[-1]))
+    return {key: statistics.median(values[key] for values in runs) for key in runs[0]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=10)
+    parser.add_argument('--access', action='store_true', help='read every constant')
+    parser.add_argument(
+        '--preload', action='append', default=[], help='a module imported before the measure'
+    )
+    parser.add_argument('--measure', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.measure:
+        return measure(args.access, args.preload)
+
+    for access in sorted({False, args.access}):
+        name = 'import and read every constant' if access else 'import'
+        values = run(access, args.preload, args.repeat)
+        print(
+            f'{MODULE} {name}: {values["ms"]:.1f}ms, {values["rss_kb"] / 1024:.1f}MB resident, '
+            f'{values["modules"]:.0f} modules imported'
+        )
+
+
+if __name__ == '__main__':
+    main()
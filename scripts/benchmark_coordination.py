@@ -0,0 +1,113 @@
+"""Benchmark the coordination server locks and values.
+
+Measure the round trip latency of an uncontended lock acquire and release and
+of a value get, and the locks throughput of many processes, on a contended
+lock and on a lock per process, for the coordination server and for the
+local lease file locks.
+
+Usage::
+
+    python scripts/benchmark_coordination.py --processes 8 --locks 500
+    python scripts/benchmark_coordination.py --host server.example.com --port 7890
+"""
+import argparse
+import multiprocessing
+import os
+import statistics
+import tempfile
+import time
+
+from robottelo.coordination import CoordinationClient
+from robottelo.coordination import CoordinationServer
+from robottelo.decorators.lease import file_lock
+
+
+def _percentiles(durations):
+    durations = sorted(durations)
+    return (
+        statistics.median(durations) * 1000000,
+        durations[int(len(durations) * 0.99) - 1] * 1000000,
+    )
+
+
+def _lock_round_trip(client):
+    with client.lock('benchmark.latency'):
+        pass
+
+
+def run_latency(host, port, count):
+    client = CoordinationClient(host=host, port=port)
+    client.set('benchmark.value', 'x' * 1024)
+    for name, operation in (
+        ('lock round trip', lambda: _lock_round_trip(client)),
+        ('get round trip', lambda: client.get('benchmark.value')),
+    ):
+        durations = []
+        for _ in range(count):
+            start = time.perf_counter()
+            operation()
+            durations.append(time.perf_counter() - start)
+        median, p99 = _percentiles(durations)
+        print(f'{name}: median {median:.0f}us, p99 {p99:.0f}us')
+
+
+def _server_locks(host, port, name, count):
+    client = CoordinationClient(host=host, port=port)
+    for _ in range(count):
+        with client.lock(name):
+            pass
+
+
+def _file_locks(lock_dir, name, count):
+    for _ in range(count):
+        with file_lock(os.path.join(lock_dir, name), timeout=600):
+            pass
+
+
+def run_throughput(label, func, args_list):
+    with multiprocessing.Pool(len(args_list)) as pool:
+        start = time.time()
+        pool.starmap(func, args_list)
+        elapsed = time.time() - start
+    total = sum(args[-1] for args in args_list)
+    print(f'{label}: {total} locks in {elapsed:.2f}s, {total / elapsed:.0f} locks/s')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--host', help='an already running server, by default a local one')
+    parser.add_argument('--port', type=int, default=None)
+    parser.add_argument('--processes', type=int, default=8)
+    parser.add_argument('--locks', type=int, default=500, help='the locks per process')
+    args = parser.parse_args()
+    server = None
+    host, port = args.host, args.port
+    if host is None:
+        server = CoordinationServer(host='127.0.0.1', port=0)
+        host, port = '127.0.0.1', server.start_in_thread()
+    try:
+        run_latency(host, port, args.locks)
+        for contended in (True, False):
+            kind = 'contended' if contended else 'lock per process'
+            names = [
+                'benchmark.throughput' if contended else f'benchmark.throughput.{index}'
+                for index in range(args.processes)
+            ]
+            run_throughput(
+                f'server, {kind}',
+                _server_locks,
+                [(host, port, name, args.locks) for name in names],
+            )
+            with tempfile.TemporaryDirectory() as lock_dir:
+                run_throughput(
+                    f'file locks, {kind}',
+                    _file_locks,
+                    [(lock_dir, name, args.locks) for name in names],
+                )
+    finally:
+        if server is not None:
+            server.stop()
+
+
+if __name__ == '__main__':
+    main()
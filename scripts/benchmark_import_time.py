@@ -0,0 +1,76 @@
+"""Benchmark the import time of the robottelo modules.
+
+Import the modules in a new interpreter with ``python -X importtime`` and
+report their cumulative import time, and the modules slowest to import. With
+``--max-ms``, exit with an error when a module takes longer to import, to be
+used as a regression gate.
+
+Usage::
+
+    python scripts/benchmark_import_time.py --repeat 5 --max-ms 800 robottelo.config
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+
+DEFAULT_MODULES = ['robottelo.config', 'robottelo.ssh', 'robottelo.cli.base']
+
+
+def parse_import_time(output):
+    """Return the self and cumulative import microseconds by module name
+
+    The ``-X importtime`` lines are ``import time: self [us] | cumulative |
+    imported package``.
+    """
+    times = {}
+    for line in output.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        fields = line.partition(':')[2].split('|')
+        try:
+            self_time, cumulative = int(fields[0]), int(fields[1])
+        except ValueError:
+            # the header line
+            continue
+        times[fields[2].strip()] = (self_time, cumulative)
+    return times
+
+
+def import_module(module):
+    """Import the module in a new interpreter and return its import times"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+    return parse_import_time(result.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('modules', nargs='*', default=DEFAULT_MODULES)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--top', type=int, default=10, help='the number of slowest modules shown')
+    parser.add_argument(
+        '--max-ms', type=float, help='fail when a module import takes longer, in milliseconds'
+    )
+    args = parser.parse_args()
+    failed = []
+    for module in args.modules:
+        runs = [import_module(module) for _ in range(args.repeat)]
+        cumulative = statistics.median(times[module][1] for times in runs) / 1000
+        print(f'{module}: imported in {cumulative:.0f}ms')
+        slowest = sorted(runs[-1].items(), key=lambda item: item[1][0], reverse=True)
+        for name, (self_time, _) in slowest[: args.top]:
+            print(f'    {name}: {self_time / 1000:.1f}ms')
+        if args.max_ms is not None and cumulative > args.max_ms:
+            failed.append(module)
+    if failed:
+        sys.exit(f'imported in more than {args.max_ms:.0f}ms: {", ".join(failed)}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,92 @@
+"""Benchmark the tests collection with the lazy imports.
+
+Compare the collection time of tests trees, and the number of modules imported
+by ``robottelo.cli.factory`` and the fixtures plugins, when the
+``robottelo.utils.lazy.LazyImport`` objects are imported on first use and when
+they are imported at once, as the plain imports they replace.
+
+Usage::
+
+    python scripts/benchmark_lazy_imports.py --repeat 3 tests/robottelo tests/foreman/api
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+IMPORTED_MODULES = ['robottelo.cli.factory', 'pytest_fixtures.api_fixtures']
+
+
+def _use_eager_imports():
+    from robottelo.utils import lazy
+
+    init = lazy.LazyImport.__init__
+
+    def eager_init(self, module_name, name=None):
+        init(self, module_name, name)
+        self._resolve()
+
+    lazy.LazyImport.__init__ = eager_init
+
+
+def collect(paths, eager):
+    """Collect the tests of paths, in this process"""
+    import pytest
+
+    if eager:
+        _use_eager_imports()
+    return pytest.main(['--collect-only', '-q', '-p', 'no:cacheprovider'] + paths)
+
+
+def count_modules(eager):
+    """Import the modules, in this process, and print the count of modules"""
+    import importlib
+
+    if eager:
+        _use_eager_imports()
+    before = len(sys.modules)
+    for module_name in IMPORTED_MODULES:
+        importlib.import_module(module_name)
+    print(len(sys.modules) - before)
+
+
+def run(mode, args, eager, repeat=1):
+    command = [sys.executable, __file__, mode] + args
+    if eager:
+        command.append('--eager')
+    durations = []
+    for _ in range(repeat):
+        start = time.time()
+        result = subprocess.run(
+            command, stdout=subprocess.PIPE, universal_newlines=True, check=False
+        )
+        durations.append(time.time() - start)
+    return statistics.median(durations), result.stdout
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('paths', nargs='*', default=['tests/robottelo', 'tests/foreman/api'])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--collect', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('--count-modules', action='store_true', help=argparse.SUPPRESS)
+    parser.add_argument('--eager', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.collect:
+        sys.exit(collect(args.paths, args.eager))
+    if args.count_modules:
+        sys.exit(count_modules(args.eager))
+
+    for eager in (True, False):
+        name = 'eager' if eager else 'lazy'
+        duration, output = run('--count-modules', [], eager)
+        print(f'{name}: {output.strip()} modules imported by {", ".join(IMPORTED_MODULES)}')
+    for path in args.paths:
+        eager, _ = run('--collect', [path], True, args.repeat)
+        lazy, _ = run('--collect', [path], False, args.repeat)
+        print(f'{path}: collected in {eager:.2f}s eager, {lazy:.2f}s lazy ({eager / lazy:.2f}x)')
+
+
+if __name__ == '__main__':
+    main()
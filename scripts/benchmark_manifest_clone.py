@@ -0,0 +1,118 @@
+"""Benchmark the manifests cloning.
+
+Clone a synthetic manifest, a ``consumer_export.zip`` holding a
+``consumer.json`` and ``--entitlements`` certificates signed by a generated
+key, and report the clones per second and the time to get each clone, directly
+from ``ManifestCloner.clone`` and from the ``ManifestPool``. ``--work-ms``
+simulates the work of a test between two manifests, the upload for example,
+during which the pool generates the next clones in the background.
+
+Usage::
+
+    python scripts/benchmark_manifest_clone.py --clones 50 --work-ms 100
+"""
+import argparse
+import base64
+import io
+import json
+import os
+import statistics
+import time
+import zipfile
+
+from cryptography.hazmat.backends import default_backend
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from robottelo.manifests import ManifestCloner
+from robottelo.manifests import ManifestPool
+
+
+def make_template(entitlements):
+    """Return the content of a synthetic manifest template"""
+    consumer_export = io.BytesIO()
+    with zipfile.ZipFile(consumer_export, 'w', zipfile.ZIP_DEFLATED) as consumer_export_zip:
+        consumer = dict(
+            uuid='template', owner=dict(key='template'), contentAccessMode='entitlement'
+        )
+        consumer_export_zip.writestr('export/consumer.json', json.dumps(consumer))
+        consumer_export_zip.writestr('export/meta.json', json.dumps(dict(version='6.9')))
+        for number in range(entitlements):
+            certificate = base64.encodebytes(os.urandom(3072)).decode()
+            consumer_export_zip.writestr(
+                f'export/entitlement_certificates/{number}.pem',
+                f'-----BEGIN CERTIFICATE-----\n{certificate}-----END CERTIFICATE-----\n',
+            )
+            consumer_export_zip.writestr(
+                f'export/entitlements/{number}.json',
+                json.dumps(dict(id=number, pool=dict(id=number, quantity=100))),
+            )
+    template = io.BytesIO()
+    with zipfile.ZipFile(template, 'w', zipfile.ZIP_DEFLATED) as template_zip:
+        template_zip.writestr('consumer_export.zip', consumer_export.getvalue())
+        template_zip.writestr('signature', b'signature')
+    return template.getvalue()
+
+
+def make_cloner(entitlements):
+    """Return a ``ManifestCloner`` of a synthetic template, with a generated key"""
+    private_key = rsa.generate_private_key(
+        public_exponent=65537, key_size=2048, backend=default_backend()
+    )
+    signing_key = private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.TraditionalOpenSSL,
+        serialization.NoEncryption(),
+    )
+    return ManifestCloner(
+        template={'default': make_template(entitlements)},
+        private_key=private_key,
+        signing_key=signing_key,
+    )
+
+
+def run(get_clone, clones, work_seconds):
+    """Get the clones, working between them, and return the time of each get"""
+    durations = []
+    for _ in range(clones):
+        start = time.perf_counter()
+        get_clone().close()
+        durations.append(time.perf_counter() - start)
+        time.sleep(work_seconds)
+    return durations
+
+
+def report(name, durations, work_seconds):
+    total = sum(durations) + work_seconds * len(durations)
+    print(
+        f'{name}: {len(durations) / total:.1f} clones/s, '
+        f'{statistics.median(durations) * 1000:.2f}ms median get, '
+        f'{max(durations) * 1000:.2f}ms max get'
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--clones', type=int, default=50)
+    parser.add_argument('--entitlements', type=int, default=50)
+    parser.add_argument('--pool-size', type=int, default=2)
+    parser.add_argument(
+        '--work-ms', type=float, default=0, help='the time spent between two clones'
+    )
+    args = parser.parse_args()
+    cloner = make_cloner(args.entitlements)
+    work_seconds = args.work_ms / 1000
+    print(
+        f'template: {len(cloner.template["default"]) / 1024:.0f}kB, '
+        f'clone: {len(cloner.clone().getvalue()) / 1024:.0f}kB'
+    )
+
+    report('clone', run(cloner.clone, args.clones, work_seconds), work_seconds)
+
+    pool = ManifestPool(cloner, size=args.pool_size)
+    report(f'pool of {args.pool_size}', run(pool.get, args.clones, work_seconds), work_seconds)
+    print(f'pool: {pool.hits} hits, {pool.misses} misses')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+"""Benchmark the settings attribute access cost.
+
+Compare the cost of reading the settings used by the hot paths, like
+``robottelo.ssh.command`` and ``robottelo.cli.base.Base.execute``, through the
+``robottelo.config.settings`` proxy and through the compiled settings.
+
+Usage::
+
+    python scripts/benchmark_settings_access.py --number 100000
+"""
+import argparse
+import timeit
+from functools import partial
+from operator import attrgetter
+
+KEYS = (
+    'server.hostname',
+    'server.admin_username',
+    'server.ssh_username',
+    'ssh_client.command_timeout',
+    'ssh_client.connection_timeout',
+    'locale',
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--number', type=int, default=100000)
+    args = parser.parse_args()
+
+    from robottelo.config import compiled_settings
+    from robottelo.config import settings
+
+    for key in KEYS:
+        timings = []
+        for settings_object in (settings, compiled_settings):
+            read = partial(attrgetter(key), settings_object)
+            read()
+            timings.append(timeit.timeit(read, number=args.number) / args.number)
+        proxy, compiled = timings
+        print(
+            f'{key}: proxy {proxy * 1e6:.2f}us, compiled {compiled * 1e6:.3f}us '
+            f'per access ({proxy / compiled:.0f}x)'
+        )
+    start = timeit.default_timer()
+    from robottelo.config import compile_settings
+
+    compile_settings()
+    print(f'settings compiled in {(timeit.default_timer() - start) * 1000:.1f}ms')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+"""Benchmark the shared function values codecs on a large result.
+
+Store and read a shared function result of about 10 MB of json with the file
+storage handler, with each available codec, in line and out of line.
+
+Usage::
+
+    python scripts/benchmark_shared_codecs.py --size 10 --reads 20
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from robottelo.decorators.func_shared import serializers
+from robottelo.decorators.func_shared.file_storage import FileStorageHandler
+
+KEY = 'benchmark.shared_function.large'
+
+
+def make_result(size):
+    """Return an entities dump of about size MB of json"""
+    hosts = []
+    index = 0
+    length = 0
+    while length < size * 1024 * 1024:
+        host = dict(
+            id=index,
+            name=f'host{index}.example.com',
+            organization={'id': 1, 'name': 'Default Organization'},
+            facts={f'fact_{fact}': f'value {index} {fact}' for fact in range(10)},
+        )
+        hosts.append(host)
+        length += len(repr(host))
+        index += 1
+    return dict(state='READY', result={'hosts': hosts})
+
+
+def run(codec_name, value, reads, out_of_line_threshold):
+    with tempfile.TemporaryDirectory() as root_dir:
+        handler = FileStorageHandler(root_dir=root_dir, codec=codec_name)
+        handler.codec.out_of_line_threshold = out_of_line_threshold
+        serializers.reset_metrics()
+        handler.set(KEY, value)
+        start = time.time()
+        for _ in range(reads):
+            handler.get(KEY)
+        read_seconds = (time.time() - start) / reads
+        metrics = serializers.get_metrics()
+        stored = sum(
+            os.path.getsize(os.path.join(path, name))
+            for path, _, names in os.walk(root_dir)
+            for name in names
+        )
+    location = 'out of line' if metrics['out_of_line'] else 'in line'
+    print(
+        f'{codec_name} ({location}): '
+        f'{metrics["serialized_bytes"] / 1024 / 1024:.1f} MB serialized, '
+        f'{stored / 1024 / 1024:.1f} MB stored, '
+        f'encode {metrics["encode_seconds"] * 1000:.0f}ms, '
+        f'read {read_seconds * 1000:.0f}ms '
+        f'(decode {metrics["decode_seconds"] / reads * 1000:.0f}ms)'
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--size', type=int, default=10, help='the result json size in MB')
+    parser.add_argument('--reads', type=int, default=20)
+    args = parser.parse_args()
+    start = time.time()
+    value = make_result(args.size)
+    print(f'result of {args.size} MB built in {time.time() - start:.1f}s')
+    codec_names = ['json', 'json+zlib', 'pickle', 'pickle+zlib']
+    if serializers.msgpack is not None:
+        codec_names.extend(['msgpack', 'msgpack+zlib'])
+    if serializers.lz4 is not None:
+        codec_names.extend(['pickle+lz4'])
+    for codec_name in codec_names:
+        for out_of_line_threshold in (float('inf'), 0):
+            run(codec_name, value, args.reads, out_of_line_threshold)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""Benchmark the concurrent reads of a ready shared function result.
+
+Compare the time spent by many processes reading the same ready result of a
+shared function when each read takes the storage lock and when the result is
+read without locking.
+
+Usage::
+
+    python scripts/benchmark_shared_read.py --processes 16 --reads 200
+"""
+import argparse
+import datetime
+import multiprocessing
+import tempfile
+import time
+
+from robottelo.decorators.func_shared.file_storage import FileStorageHandler
+from robottelo.decorators.func_shared.shared import _DATETIME_FORMAT
+from robottelo.decorators.func_shared.shared import _SharedFunction
+from robottelo.decorators.func_shared.shared import _STATE_READY
+from robottelo.decorators.func_shared.shared import clear_local_cache
+
+KEY = 'benchmark.shared_function.ready'
+
+
+def _locked_reads(root_dir, reads):
+    storage = FileStorageHandler(root_dir=root_dir)
+    start = time.time()
+    for _ in range(reads):
+        with storage.lock(KEY) as data:
+            storage.when_lock_acquired(data)
+            storage.get(KEY)
+    return time.time() - start
+
+
+def _lock_free_reads(root_dir, reads):
+    storage = FileStorageHandler(root_dir=root_dir)
+    start = time.time()
+    for _ in range(reads):
+        # measure the storage path, not the in process cache
+        clear_local_cache()
+        _SharedFunction(KEY, None, storage_handler=storage)()
+    return time.time() - start
+
+
+def run(func, root_dir, processes, reads):
+    with multiprocessing.Pool(processes) as pool:
+        start = time.time()
+        durations = pool.starmap(func, [(root_dir, reads)] * processes)
+        elapsed = time.time() - start
+    total_reads = processes * reads
+    print(
+        f'{func.__name__}: {total_reads} reads in {elapsed:.2f}s, '
+        f'{total_reads / elapsed:.0f} reads/s, '
+        f'slowest process {max(durations):.2f}s'
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--processes', type=int, default=16)
+    parser.add_argument('--reads', type=int, default=200)
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as root_dir:
+        FileStorageHandler(root_dir=root_dir).set(
+            KEY,
+            dict(
+                state=_STATE_READY,
+                id='benchmark',
+                result={'org': {'id': 1}},
+                error=None,
+                pid=0,
+                creation_datetime=datetime.datetime.utcnow().strftime(_DATETIME_FORMAT),
+            ),
+        )
+        run(_locked_reads, root_dir, args.processes, args.reads)
+        run(_lock_free_reads, root_dir, args.processes, args.reads)
+
+
+if __name__ == '__main__':
+    main()
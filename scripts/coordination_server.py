@@ -0,0 +1,50 @@
+"""Run the robottelo coordination server.
+
+The server keeps the shared function values and the function locks of the
+test runs of many machines, see :mod:`robottelo.coordination`. The clients
+authenticate with a token shared with the server, read from the
+ROBOTTELO_COORDINATION_TOKEN environment variable, to keep it out of the
+process list.
+
+Usage::
+
+    ROBOTTELO_COORDINATION_TOKEN=<secret> \
+        python scripts/coordination_server.py --host 0.0.0.0 --port 7890
+"""
+import argparse
+import logging
+import os
+
+from robottelo.coordination import CoordinationServer
+from robottelo.coordination import DEFAULT_HOST
+from robottelo.coordination import DEFAULT_PORT
+
+TOKEN_VARIABLE = 'ROBOTTELO_COORDINATION_TOKEN'
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description='Run the robottelo coordination server')
+    parser.add_argument(
+        '--host',
+        default=DEFAULT_HOST,
+        help='the address to listen on, 0.0.0.0 to serve other machines',
+    )
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument(
+        '--lease-timeout',
+        type=int,
+        default=None,
+        help='the seconds after which a lock holder that did not refresh its lease is released',
+    )
+    args = parser.parse_args(args)
+    token = os.environ.get(TOKEN_VARIABLE)
+    if not token:
+        parser.error(f'the shared token must be set in the {TOKEN_VARIABLE} environment variable')
+    logging.basicConfig(level=logging.INFO)
+    CoordinationServer(
+        host=args.host, port=args.port, lease_timeout=args.lease_timeout, token=token
+    ).serve_forever()
+
+
+if __name__ == '__main__':
+    main()
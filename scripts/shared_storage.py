@@ -0,0 +1,43 @@
+"""Inspect and purge the shared functions data of the SQLite storage.
+
+Usage::
+
+    python scripts/shared_storage.py list
+    python scripts/shared_storage.py list '*.shared_function.*org*'
+    python scripts/shared_storage.py expire 3600
+    python scripts/shared_storage.py purge '<scope>.*'
+"""
+import argparse
+
+from robottelo.decorators.func_shared.sqlite_storage import SQLiteStorageHandler
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description='Inspect and purge the shared functions data')
+    parser.add_argument('--db', help='the database path', default=None)
+    subparsers = parser.add_subparsers(dest='command')
+    subparsers.required = True
+    list_parser = subparsers.add_parser('list', help='list the entries')
+    list_parser.add_argument('pattern', nargs='?', default='*', help='keys glob pattern')
+    expire_parser = subparsers.add_parser('expire', help='delete the old entries')
+    expire_parser.add_argument('max_age', type=int, help='the entries max age in seconds')
+    purge_parser = subparsers.add_parser('purge', help='delete the entries')
+    purge_parser.add_argument('pattern', nargs='?', default='*', help='keys glob pattern')
+    args = parser.parse_args(args)
+
+    handler = SQLiteStorageHandler(db_path=args.db)
+    if args.command == 'list':
+        for item in handler.items(args.pattern):
+            print(
+                '{key} {state} {owner} {updated:%Y-%m-%dT%H:%M:%S}'.format(
+                    owner=item['owner_pid'] or '-', **item
+                )
+            )
+    elif args.command == 'expire':
+        print(f'{handler.expire(args.max_age)} entries deleted')
+    else:
+        print(f'{handler.purge(args.pattern)} entries deleted')
+
+
+if __name__ == '__main__':
+    main()
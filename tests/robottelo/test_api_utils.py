@@ -1,4 +1,8 @@
 """Unit tests for :mod:`robottelo.api.utils`."""
+from unittest import mock
+
+import pytest
+
 from robottelo.api import utils
 
 
@@ -10,3 +14,32 @@ def test_one_to_one_names():
 def test_one_to_many_names():
     """Test :func:`robottelo.api.utils.one_to_many_names`."""
     assert utils.one_to_many_names('person') == {'person', 'person_ids', 'people'}
+
+
+class TestConfigureProvisioning:
+    """Tests for :func:`robottelo.api.utils.configure_provisioning` reuse."""
+
+    @pytest.fixture
+    def builders(self):
+        with mock.patch.object(utils, 'settings'), mock.patch.object(
+            utils, '_configure_provisioning'
+        ) as build, mock.patch.object(utils, '_shared_configure_provisioning') as shared_build:
+            yield build, shared_build
+
+    def test_not_reused(self, builders):
+        """reuse=False builds a new stack without the shared store"""
+        build, shared_build = builders
+        org = mock.Mock(id=1)
+        assert utils.configure_provisioning(org=org, reuse=False) is build.return_value
+        build.assert_called_once_with(org=org, loc=None, compute=False, os=None)
+        shared_build.assert_not_called()
+
+    def test_recipe_per_org(self, builders):
+        """The shared stack is keyed by the organization"""
+        build, shared_build = builders
+        for org_id in (1, 1, 2):
+            utils.configure_provisioning(org=mock.Mock(id=org_id))
+        build.assert_not_called()
+        recipes = [call[1]['recipe'] for call in shared_build.call_args_list]
+        assert recipes[0] == recipes[1]
+        assert recipes[0] != recipes[2]
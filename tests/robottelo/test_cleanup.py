@@ -0,0 +1,183 @@
+"""Tests for module ``robottelo.cleanup``."""
+import threading
+import time
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+from requests.exceptions import HTTPError
+
+from pytest_plugins import cleanup_scheduler as plugin
+from robottelo.cleanup import CleanupScheduler
+from robottelo.cleanup import format_report
+from robottelo.cli.base import CLIReturnCodeError
+
+
+class FakeHandlers:
+    """Record the deletions, failing the ones listed in ``failing``"""
+
+    def __init__(self, failing=None):
+        self.calls = []
+        self.attempts = {}
+        self.failing = failing or {}
+        self._lock = threading.Lock()
+
+    def handler(self, kind):
+        def delete(entity_id=None):
+            with self._lock:
+                attempt = self.attempts.get((kind, entity_id), 0) + 1
+                self.attempts[(kind, entity_id)] = attempt
+            if attempt <= self.failing.get((kind, entity_id), 0):
+                raise HTTPError(
+                    f'{kind} {entity_id} still in use', response=mock.MagicMock(status_code=422)
+                )
+            with self._lock:
+                self.calls.append((kind, entity_id))
+
+        return delete
+
+    def handlers(self, *kinds):
+        return {kind: self.handler(kind) for kind in kinds}
+
+
+def _scheduler(fake, **kwargs):
+    kwargs.setdefault('retry_delay', 0)
+    kwargs.setdefault('interval', 3600)
+    return CleanupScheduler(
+        handlers=fake.handlers('host', 'location', 'org'),
+        order=('host', 'location', 'org'),
+        **kwargs,
+    )
+
+
+class TestCleanupScheduler:
+    """Tests for class ``CleanupScheduler``."""
+
+    def test_unknown_kind(self):
+        scheduler = _scheduler(FakeHandlers())
+        with pytest.raises(ValueError, match=r'Unknown cleanup kind "subnet".*'):
+            scheduler.add('subnet', entity_id=1)
+
+    def test_dependency_order(self):
+        """Hosts are deleted before locations and organizations"""
+        fake = FakeHandlers()
+        scheduler = _scheduler(fake)
+        scheduler.add('org', entity_id=1)
+        scheduler.add('location', entity_id=2)
+        for host_id in range(10):
+            scheduler.add('host', entity_id=host_id)
+        assert scheduler.flush() == []
+        kinds = [kind for kind, _ in fake.calls]
+        assert kinds == ['host'] * 10 + ['location', 'org']
+        assert sorted(entity_id for kind, entity_id in fake.calls if kind == 'host') == list(
+            range(10)
+        )
+        assert len(scheduler.deleted) == 12
+        assert scheduler.pending == 0
+
+    def test_retry_transient_failure(self):
+        fake = FakeHandlers(failing={('org', 1): 2})
+        scheduler = _scheduler(fake, retries=3)
+        scheduler.add('org', entity_id=1)
+        assert scheduler.flush() == []
+        assert fake.attempts[('org', 1)] == 3
+        assert fake.calls == [('org', 1)]
+
+    def test_leaked_report(self):
+        fake = FakeHandlers(failing={('org', 1): 5})
+        scheduler = _scheduler(fake, retries=2)
+        scheduler.add('org', entity_id=1)
+        scheduler.add('org', entity_id=2)
+        leaked = scheduler.flush()
+        assert fake.attempts[('org', 1)] == 2
+        assert [record['kwargs'] for record in leaked] == [{'entity_id': 1}]
+        assert 'still in use' in leaked[0]['error']
+        assert scheduler.report().startswith('1 entities deleted, 1 leaked')
+
+    def test_no_retry_on_error(self):
+        """Only the server and connection errors are retried"""
+        delete = mock.MagicMock(side_effect=TypeError('unexpected keyword argument'))
+        scheduler = CleanupScheduler(handlers={'org': delete}, order=('org',), retry_delay=0)
+        scheduler.add('org', org_id=1)
+        leaked = scheduler.flush()
+        assert [record['kwargs'] for record in leaked] == [{'org_id': 1}]
+        delete.assert_called_once_with(org_id=1)
+
+    def test_not_found_is_not_leaked(self):
+        response = mock.MagicMock(status_code=404)
+        delete = mock.MagicMock(side_effect=HTTPError(response=response))
+        scheduler = CleanupScheduler(handlers={'org': delete}, order=('org',), retry_delay=0)
+        scheduler.add('org', org_id=1)
+        assert scheduler.flush() == []
+        delete.assert_called_once_with(org_id=1)
+
+    def test_cli_not_found_is_not_leaked(self):
+        delete = mock.MagicMock(
+            side_effect=CLIReturnCodeError(70, 'Error: host not found', 'Command failed')
+        )
+        scheduler = CleanupScheduler(handlers={'host': delete}, order=('host',), retry_delay=0)
+        scheduler.add('host', host_id=1)
+        assert scheduler.flush() == []
+        delete.assert_called_once_with(host_id=1)
+
+    def test_parents_kept_until_flush(self):
+        """The background thread deletes only the entities nothing depends on,
+        a host scheduled later is still deleted before its organization"""
+        fake = FakeHandlers()
+        scheduler = _scheduler(fake, background_kinds=('host',), interval=0.01)
+        scheduler.add('org', entity_id=1)
+        assert scheduler._thread is None
+        scheduler.add('host', entity_id=1)
+        for _ in range(500):
+            if fake.calls:
+                break
+            time.sleep(0.01)
+        assert fake.calls == [('host', 1)]
+        scheduler.add('host', entity_id=2)
+        assert scheduler.flush() == []
+        assert fake.calls == [('host', 1), ('host', 2), ('org', 1)]
+
+    def test_released_owner_deleted(self):
+        """The entities of a released owner are deleted in the background in
+        dependency order, the ones without owner are kept until flush"""
+        fake = FakeHandlers()
+        scheduler = _scheduler(fake, interval=0.01)
+        scheduler.set_owner('test_a')
+        scheduler.add('org', entity_id=1)
+        scheduler.add('host', entity_id=1)
+        scheduler.set_owner(None)
+        scheduler.add('org', entity_id=2)
+        assert scheduler._thread is None
+        scheduler.release('test_a')
+        for _ in range(500):
+            if len(fake.calls) == 2:
+                break
+            time.sleep(0.01)
+        assert fake.calls == [('host', 1), ('org', 1)]
+        assert scheduler.pending == 1
+        assert scheduler.flush() == []
+        assert fake.calls == [('host', 1), ('org', 1), ('org', 2)]
+
+    def test_workers_report(self):
+        """The leaked entities of the xdist workers are reported by the controller"""
+        fake = FakeHandlers(failing={('org', 1): 5})
+        scheduler = _scheduler(fake, retries=1)
+        scheduler.add('org', entity_id=1)
+        scheduler.add('org', entity_id=2)
+        scheduler.flush()
+        summary = scheduler.summary()
+        assert summary['deleted'] == 1
+        assert len(summary['leaked']) == 1
+        assert format_report([summary, summary]).startswith('2 entities deleted, 2 leaked')
+
+        config = SimpleNamespace()
+        terminalreporter = mock.MagicMock()
+        with mock.patch.object(plugin, '_workers_summaries', []):
+            plugin.pytest_testnodedown(
+                SimpleNamespace(workeroutput={plugin.WORKEROUTPUT_KEY: summary}), None
+            )
+            plugin.pytest_terminal_summary(terminalreporter, 0, config)
+        terminalreporter.section.assert_called_once_with('leaked entities')
+        report = terminalreporter.write_line.call_args[0][0]
+        assert '1 leaked' in report
+        assert 'still in use' in report
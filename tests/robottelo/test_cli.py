@@ -1,14 +1,17 @@
+import threading
 from functools import partial
 from unittest import mock
 
 import pytest
 import unittest2
+from requests.exceptions import RequestException
 
 from robottelo.cli.base import Base
 from robottelo.cli.base import CLIBaseError
 from robottelo.cli.base import CLIDataBaseError
 from robottelo.cli.base import CLIError
 from robottelo.cli.base import CLIReturnCodeError
+from robottelo.cli.base import hammer_reads
 
 
 class CLIClass(Base):
@@ -18,6 +21,15 @@ class CLIClass(Base):
     foreman_admin_password = 'adminpassword'
 
 
+class FastReadClass(Base):
+    """Class used for the fast read tests"""
+
+    command_base = 'fastread'
+    command_requires_org = False
+    api_path = '/api/v2/fastreads'
+    api_fields = {'organization': 'organization.name'}
+
+
 class BaseCliTestCase(unittest2.TestCase):
     """Tests for the Base cli class"""
 
@@ -216,6 +228,33 @@ class BaseCliTestCase(unittest2.TestCase):
         construct.called_once_with({})
         execute.called_once_with(construct.return_value, output_format='csv')
 
+    @mock.patch('robottelo.cli.base.Base.info')
+    @mock.patch('robottelo.cli.base.Base.execute')
+    @mock.patch('robottelo.cli.base.Base._construct_command')
+    def test_add_create_with_fields_in_result(self, construct, execute, info):
+        """Check command create does not call info when the result already
+        has the requested fields
+        """
+        execute.return_value = [{'id': 'foo', 'name': 'bar'}]
+        Base.command_requires_org = False
+        assert execute.return_value == Base.create(fields=['id', 'name'])
+        assert not info.called
+
+    def test_command_sub_is_thread_local(self):
+        """Check command_sub set in a thread is not seen by the other ones"""
+        Base.command_sub = 'subcommand'
+        thread_command_sub = []
+
+        def set_command_sub():
+            Base.command_sub = 'list'
+            thread_command_sub.append(Base.command_sub)
+
+        thread = threading.Thread(target=set_command_sub)
+        thread.start()
+        thread.join()
+        assert thread_command_sub == ['list']
+        assert 'subcommand' == Base.command_sub
+
     def assert_cmd_execution(
         self, construct, execute, base_method, cmd_sub, ignore_stderr=False, **base_method_kwargs
     ):
@@ -292,6 +331,51 @@ class BaseCliTestCase(unittest2.TestCase):
         lst_method.assert_called_once_with(my_options)
         assert 1 == response
 
+    @mock.patch('robottelo.cli.base.settings')
+    @mock.patch('robottelo.cli.base.http.get')
+    @mock.patch('robottelo.cli.base.Base.execute')
+    def test_info_fast_read(self, execute, http_get, settings):
+        """Check info with fast_read maps the API entity to hammer fields"""
+        settings.server.get_url.return_value = 'https://sat.example.com'
+        http_get.return_value.json.return_value = {
+            'id': 1,
+            'name': 'foo',
+            'auto_attach': True,
+            'organization': {'id': 2, 'name': 'bar'},
+        }
+        result = FastReadClass.info({'id': 1}, fast_read=True)
+        assert not execute.called
+        assert http_get.call_args[0][0] == 'https://sat.example.com/api/v2/fastreads/1'
+        assert result == {'id': '1', 'name': 'foo', 'auto-attach': 'yes', 'organization': 'bar'}
+
+    @mock.patch('robottelo.cli.base.settings')
+    @mock.patch('robottelo.cli.base.http.get')
+    @mock.patch('robottelo.cli.base.Base.execute')
+    def test_list_fast_read_search(self, execute, http_get, settings):
+        """Check list with fast_read sends the unescaped search to the API"""
+        http_get.return_value.json.return_value = {'results': [{'id': 1}], 'subtotal': 1}
+        result = FastReadClass.list({'search': 'name=\\"foo\\"'}, fast_read=True)
+        assert not execute.called
+        assert http_get.call_args[1]['params']['search'] == 'name="foo"'
+        assert result == [{'id': '1', 'organization': ''}]
+
+    @mock.patch('robottelo.cli.base.hammer.parse_info')
+    @mock.patch('robottelo.cli.base.settings')
+    @mock.patch('robottelo.cli.base.http.get')
+    @mock.patch('robottelo.cli.base.Base.execute')
+    def test_info_fast_read_fallback(self, execute, http_get, settings, parse_info):
+        """Check info with fast_read uses hammer when the API request fails,
+        when an option is not supported or within hammer_reads
+        """
+        http_get.side_effect = RequestException
+        assert parse_info.return_value == FastReadClass.info({'id': 1}, fast_read=True)
+        http_get.reset_mock()
+        FastReadClass.info({'id': 1, 'fields': 'name'}, fast_read=True)
+        with hammer_reads():
+            FastReadClass.info({'id': 1}, fast_read=True)
+        assert not http_get.called
+        assert execute.call_count == 3
+
     @mock.patch('robottelo.cli.base.Base.command_requires_org')
     def test_info_requires_organization_id(self, _):
         """Check info raises CLIError with organization-id is not present in
@@ -0,0 +1,48 @@
+"""Tests for module ``robottelo.cli.factory``."""
+from unittest import mock
+
+import pytest
+
+from robottelo.cli import factory
+
+
+class TestConfigureEnvForProvision:
+    """Tests for :func:`robottelo.cli.factory.configure_env_for_provision` reuse."""
+
+    @pytest.fixture
+    def builders(self):
+        with mock.patch.object(factory, 'settings'), mock.patch.object(
+            factory, '_configure_env_for_provision'
+        ) as build, mock.patch.object(
+            factory, '_shared_configure_env_for_provision'
+        ) as shared_build:
+            yield build, shared_build
+
+    def test_not_reused(self, builders):
+        """reuse=False builds a new environment without the shared store"""
+        build, shared_build = builders
+        org = {'id': '1'}
+        assert factory.configure_env_for_provision(org=org, reuse=False) is build.return_value
+        build.assert_called_once_with(org=org, loc=None)
+        shared_build.assert_not_called()
+
+    def test_recipe_per_org(self, builders):
+        """The shared environment is keyed by the organization"""
+        build, shared_build = builders
+        for org_id in ('1', '1', '2'):
+            factory.configure_env_for_provision(org={'id': org_id}, loc={'id': '3'})
+        build.assert_not_called()
+        recipes = [call[1]['recipe'] for call in shared_build.call_args_list]
+        assert recipes[0] == recipes[1]
+        assert recipes[0] != recipes[2]
+
+
+def test_cli_classes():
+    """The factory binds the hammer command classes themselves"""
+    from robottelo.cli.base import Base
+    from robottelo.cli.org import Org
+
+    assert factory.Org is Org
+    assert issubclass(factory.Org, Base)
+    with mock.patch('robottelo.cli.factory.Org') as org:
+        assert factory.Org is org
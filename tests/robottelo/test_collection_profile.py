@@ -0,0 +1,85 @@
+"""Tests for plugin ``pytest_plugins.collection_profile``."""
+from types import SimpleNamespace
+
+from pytest_plugins.collection_profile import CollectionProfiler
+from pytest_plugins.collection_profile import WORKEROUTPUT_KEY
+
+
+def make_profiler():
+    return CollectionProfiler(SimpleNamespace())
+
+
+def test_modifyitems_time():
+    profiler = make_profiler()
+    timed = profiler._timed('pytest_plugins.issue_handlers', lambda items: items.reverse())
+    items = [1, 2]
+    timed(items)
+    timed(items)
+    assert items == [1, 2]
+    assert list(profiler.modifyitems) == ['pytest_plugins.issue_handlers']
+    assert profiler.modifyitems['pytest_plugins.issue_handlers'] > 0
+
+
+def test_merge_workers_profiles():
+    """The slowest module and plugin times of the workers are kept, the
+    fixtures times are summed"""
+    profiler = make_profiler()
+    for import_seconds, fixture_seconds in ((0.5, 2.0), (0.7, 1.0)):
+        worker = make_profiler()
+        worker.collection_seconds = import_seconds * 2
+        worker.modules['tests/foreman/api/test_host.py'] = dict(
+            import_seconds=import_seconds, collect_seconds=0.1
+        )
+        worker.modifyitems['pytest_plugins.testimony_markers'] = import_seconds
+        worker.add_fixture('module_org', 'module', fixture_seconds)
+        profiler.pytest_testnodedown(
+            SimpleNamespace(workeroutput={WORKEROUTPUT_KEY: worker.get_profile()}), None
+        )
+    profiler.pytest_testnodedown(SimpleNamespace(workeroutput={}), None)
+    assert profiler.collection_seconds == 1.4
+    assert profiler.modules == {
+        'tests/foreman/api/test_host.py': dict(import_seconds=0.7, collect_seconds=0.1)
+    }
+    assert profiler.modifyitems == {'pytest_plugins.testimony_markers': 0.7}
+    assert profiler.fixtures == {
+        'module_org (module)': dict(count=2, seconds=3.0, max_seconds=2.0)
+    }
+
+
+def test_report_top():
+    profiler = make_profiler()
+    for index in range(5):
+        profiler.modules[f'test_{index}.py'] = dict(import_seconds=index, collect_seconds=1)
+        profiler.add_fixture(f'fixture_{index}', 'function', index)
+    report = profiler.get_report(2)
+    assert list(report['modules']) == ['test_4.py', 'test_3.py']
+    assert list(report['fixtures']) == ['fixture_4 (function)', 'fixture_3 (function)']
+    assert report['modules_count'] == 5
+    assert report['import_seconds'] == 10
+
+
+def test_modifyitems_wrappers_not_timed():
+    """Only the plain implementations are timed, not the hook wrappers"""
+
+    def function(session, config, items):
+        pass
+
+    hook_impls = [
+        SimpleNamespace(plugin_name='plain', function=function, hookwrapper=False),
+        SimpleNamespace(plugin_name='old_style', function=function, hookwrapper=True),
+        SimpleNamespace(
+            plugin_name='new_style', function=function, hookwrapper=False, wrapper=True
+        ),
+    ]
+    hook = SimpleNamespace(get_hookimpls=lambda: hook_impls)
+    config = SimpleNamespace(
+        pluginmanager=SimpleNamespace(hook=SimpleNamespace(pytest_collection_modifyitems=hook))
+    )
+    profiler = make_profiler()
+    wrapper = profiler.pytest_collection_modifyitems(None, config, [])
+    next(wrapper)
+    assert [hook_impl.function is function for hook_impl in hook_impls] == [False, True, True]
+    hook_impls[0].function(None, config, [])
+    assert list(profiler.modifyitems) == ['plain']
+    wrapper.close()
+    assert all(hook_impl.function is function for hook_impl in hook_impls)
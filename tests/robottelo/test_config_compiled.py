@@ -0,0 +1,115 @@
+"""Tests for module ``robottelo.config.compiled``."""
+from functools import reduce
+
+import pytest
+
+from robottelo.config.base import FeatureSettings
+from robottelo.config.compiled import CompiledSettings
+from robottelo.config.compiled import CompiledSettingsNode
+
+
+class LegacyServerSettings(FeatureSettings):
+    def __init__(self):
+        self.hostname = 'legacy.example.com'
+        self.ssh_username = 'root'
+
+    def get_hostname(self, key='hostname'):
+        return getattr(self, key)
+
+
+class LegacySettings:
+    def __init__(self):
+        self._configured = True
+        self.locale = 'en_US'
+        self.server = LegacyServerSettings()
+
+
+class FakeProvider:
+    """Resolve a key from the configs in order, like the settings facade"""
+
+    def __init__(self, *configs):
+        self.configs = configs
+        self.calls = []
+
+    def get_configs(self):
+        return self.configs
+
+    def get(self, full_path):
+        self.calls.append(full_path)
+        if full_path == 'server.get_url':
+            return lambda: f'https://{self.get("server.hostname")}'
+        for config in self.configs:
+            try:
+                if isinstance(config, dict):
+                    return reduce(lambda value, key: value[key], full_path.split('.'), config)
+                return reduce(getattr, full_path.split('.'), config)
+            except (AttributeError, KeyError):
+                pass
+        raise AttributeError(full_path)
+
+
+@pytest.fixture
+def configs():
+    return dict(server={'hostname': 'dynaconf.example.com', 'port': 443}), LegacySettings()
+
+
+@pytest.fixture
+def compiled(configs):
+    return CompiledSettings(FakeProvider(*configs))
+
+
+def test_compiled_values(compiled):
+    assert isinstance(compiled.server, CompiledSettingsNode)
+    # the first config has precedence, the other ones complete it
+    assert compiled.server.hostname == 'dynaconf.example.com'
+    assert compiled.server.port == 443
+    assert compiled.server.ssh_username == 'root'
+    assert compiled.locale == 'en_US'
+    assert compiled.server.get_url() == 'https://dynaconf.example.com'
+
+
+def test_compiled_access_without_lookup(compiled):
+    compiled.server.hostname
+    compiled.locale
+    provider = compiled._provider
+    calls = len(provider.calls)
+    for _ in range(10):
+        assert compiled.server.hostname == 'dynaconf.example.com'
+        assert compiled.locale == 'en_US'
+    assert len(provider.calls) == calls
+
+
+def test_compiled_fallback(compiled):
+    """The keys that are not compiled are looked up once"""
+    assert 'get_hostname' not in dir(compiled.server)
+    assert compiled.server.get_hostname('ssh_username') == 'root'
+    assert compiled.server.get_hostname('ssh_username') == 'root'
+    assert compiled._provider.calls.count('server.get_hostname') == 1
+    with pytest.raises(AttributeError):
+        compiled.server.unknown
+
+
+def test_compiled_read_only(compiled):
+    with pytest.raises(AttributeError):
+        compiled.server.hostname = 'other.example.com'
+    with pytest.raises(AttributeError):
+        compiled.locale = 'fr_FR'
+    assert compiled.server.hostname == 'dynaconf.example.com'
+
+
+def test_compiled_on_first_read(compiled):
+    """Only the read sections are compiled"""
+    assert compiled.locale == 'en_US'
+    assert dir(compiled) == ['locale']
+    assert 'server.hostname' not in compiled._provider.calls
+
+
+def test_compiled_rebuilt_on_reset(configs, compiled):
+    dynaconf_config, legacy_config = configs
+    assert compiled.server.hostname == 'dynaconf.example.com'
+    dynaconf_config['server']['hostname'] = 'other.example.com'
+    legacy_config.locale = 'fr_FR'
+    assert compiled.server.hostname == 'dynaconf.example.com'
+    compiled.reset()
+    assert compiled.server.hostname == 'other.example.com'
+    assert compiled.locale == 'fr_FR'
@@ -3,9 +3,13 @@ from unittest import mock
 
 import pytest
 
+from robottelo.config.base import ClientsSettings
 from robottelo.config.base import ImproperlyConfigured
 from robottelo.config.base import INIReader
+from robottelo.config.base import ServerSettings
 from robottelo.config.base import Settings
+from robottelo.config.base import to_plain_value
+from robottelo.config.validation_cache import ValidationCache
 
 builtin_open = 'builtins.open'
 
@@ -54,6 +58,80 @@ class TestSettings:
             assert settings.server.hostname == 'example.com'
             assert settings.server.ssh_password == '1234'
 
+    @mock.patch(builtin_open, new_callable=lambda: get_valid_ini)
+    def test_configure_from_dict(self, mock_open):
+        with mock.patch('os.path.isfile', return_value=True):
+            settings = Settings()
+            settings.configure()
+        values = settings.to_dict()
+        assert 'reader' not in values
+        assert values['server']['hostname'] == 'example.com'
+        assert to_plain_value(values) == values
+        values['server']['hostname'] = 'gw0.example.com'
+        other_settings = Settings()
+        with mock.patch('robottelo.config.base.INIReader') as reader_mock:
+            other_settings.configure_from_dict(values)
+        reader_mock.assert_not_called()
+        assert other_settings.configured
+        assert other_settings.server.hostname == 'gw0.example.com'
+        assert other_settings.server.ssh_password == '1234'
+        assert other_settings.locale == settings.locale
+
+
+def test_configure_validation_cache(tmp_path):
+    """The features are validated once while the configuration does not change"""
+    settings_path = tmp_path / 'robottelo.properties'
+    settings_path.write_text('\n'.join(get_valid_ini(None)))
+    cache_path = str(tmp_path / 'validation_cache.json')
+    settings = Settings()
+    settings.configure(str(settings_path), ValidationCache(cache_path, lambda: [settings_path]))
+    assert settings.get_feature_errors('server') == []
+    other_settings = Settings()
+    with mock.patch.object(ServerSettings, 'validate') as validate_mock:
+        other_settings.configure(
+            str(settings_path), ValidationCache(cache_path, lambda: [settings_path])
+        )
+        assert other_settings.get_feature_errors('server') == []
+    validate_mock.assert_not_called()
+    assert other_settings.server.hostname == 'example.com'
+
+
+def test_configure_lazy(tmp_path):
+    """A lazy configure reads and validates a feature section only when it is
+    configured"""
+    settings_path = tmp_path / 'robottelo.properties'
+    settings_path.write_text(
+        '\n'.join(get_valid_ini(None)) + '\n[shared_function]\nstorage=unknown\n'
+    )
+    with pytest.raises(ImproperlyConfigured, match=r'.*storage must be one of.*'):
+        Settings().configure(str(settings_path))
+    settings = Settings()
+    settings.configure(str(settings_path), lazy=True)
+    assert settings.configured
+    assert settings.server.hostname == 'example.com'
+    assert settings.shared_function.storage is None
+    with pytest.raises(ImproperlyConfigured, match=r'.*storage must be one of.*'):
+        settings.configure_feature('shared_function')
+    assert settings.shared_function.storage == 'unknown'
+    assert len(settings.get_feature_errors('shared_function')) == 1
+    settings.configure_feature('shared_function')
+
+
+def test_feature_errors():
+    """The validation errors of a feature are kept until configured again"""
+    settings = Settings()
+    with mock.patch.object(ClientsSettings, 'validate', return_value=['error']) as validate_mock:
+        assert settings.get_feature_errors('clients') == ['error']
+        assert settings.get_feature_errors('clients') == ['error']
+    assert validate_mock.call_count == 1
+
+
+def test_to_plain_value():
+    assert to_plain_value({'a': (1, 'b'), 'c': [None, 1.5]}) == {'a': (1, 'b'), 'c': [None, 1.5]}
+    assert type(to_plain_value({'a': {'b': 1}})['a']) is dict
+    with pytest.raises(TypeError):
+        to_plain_value({'a': object()})
+
 
 class FakeOpen:
     def __init__(self, lines, *args, **kwargs):
@@ -0,0 +1,91 @@
+"""Tests for module ``robottelo.config.validation_cache``."""
+import importlib
+
+from dynaconf import Validator
+
+from robottelo.config.validation_cache import apply_validator_defaults
+from robottelo.config.validation_cache import ValidationCache
+
+
+def make_cache(tmp_path, config_path):
+    return ValidationCache(str(tmp_path / 'validation_cache.json'), lambda: [config_path])
+
+
+def test_cached_errors(tmp_path):
+    config_path = tmp_path / 'settings.yaml'
+    config_path.write_text('server:\n  hostname: example.com\n')
+    cache = make_cache(tmp_path, config_path)
+    assert cache.get('dynaconf.server') is None
+    cache.set('dynaconf.server', [])
+    cache.set('legacy.clients', ['[clients] provisioning_server must be provided.'])
+    cache.save()
+    cache = make_cache(tmp_path, config_path)
+    assert cache.get('dynaconf.server') == []
+    assert cache.get('legacy.clients') == ['[clients] provisioning_server must be provided.']
+    assert cache.get('legacy.server') is None
+
+
+def test_cache_key(tmp_path, monkeypatch):
+    """The cached errors are not used once the configuration changed"""
+    config_path = tmp_path / 'settings.yaml'
+    config_path.write_text('server:\n  hostname: example.com\n')
+    cache = make_cache(tmp_path, config_path)
+    cache.set('dynaconf.server', [])
+    cache.save()
+    key = cache.get_key()
+
+    config_path.write_text('server:\n  hostname: other.example.com\n')
+    cache = make_cache(tmp_path, config_path)
+    assert cache.get_key() != key
+    assert cache.get('dynaconf.server') is None
+
+    config_path.write_text('server:\n  hostname: example.com\n')
+    monkeypatch.setenv('ROBOTTELO_SERVER__HOSTNAME', 'env.example.com')
+    cache.reset()
+    assert cache.get_key() != key
+    assert cache.get('dynaconf.server') is None
+
+    monkeypatch.delenv('ROBOTTELO_SERVER__HOSTNAME')
+    cache.reset()
+    assert cache.get_key() == key
+    assert cache.get('dynaconf.server') == []
+
+
+def test_cache_key_packages(tmp_path, monkeypatch):
+    """The cached errors are not used once a package the validation depends
+    on is installed"""
+    config_path = tmp_path / 'settings.yaml'
+    config_path.write_text('server:\n  hostname: example.com\n')
+    packages = ('robottelo_validation_package',)
+    cache = ValidationCache(str(tmp_path / 'cache.json'), lambda: [config_path], packages)
+    key = cache.get_key()
+    package_dir = tmp_path / 'site-packages' / 'robottelo_validation_package'
+    package_dir.mkdir(parents=True)
+    (package_dir / '__init__.py').write_text('')
+    monkeypatch.syspath_prepend(str(package_dir.parent))
+    importlib.invalidate_caches()
+    cache.reset()
+    assert cache.get_key() != key
+
+
+def test_invalid_cache_file(tmp_path):
+    cache = make_cache(tmp_path, tmp_path / 'settings.yaml')
+    (tmp_path / 'validation_cache.json').write_text('{"key":')
+    assert cache.get('dynaconf.server') is None
+
+
+def test_apply_validator_defaults():
+    settings = {'server.scheme': 'http'}
+    validators = [
+        Validator('server.hostname', must_exist=True),
+        Validator('server.scheme', default='https'),
+        Validator('server.ssh_username', default='root'),
+        Validator('server.port', must_exist=True) | Validator('server.timeout', default=10),
+    ]
+    for validator in validators:
+        apply_validator_defaults(settings, validator)
+    assert settings == {
+        'server.scheme': 'http',
+        'server.ssh_username': 'root',
+        'server.timeout': 10,
+    }
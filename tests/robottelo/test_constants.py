@@ -0,0 +1,58 @@
+"""Tests for module ``robottelo.constants``."""
+import importlib
+import subprocess
+import sys
+
+import pytest
+
+from robottelo import constants
+
+SUBMODULES = sorted(
+    {
+        module_name
+        for module_name, _ in constants._LAZY_CONSTANTS.values()
+        if module_name.startswith('robottelo.constants.')
+    }
+)
+
+
+@pytest.mark.parametrize('module_name', SUBMODULES)
+def test_lazy_constants_of_submodules(module_name):
+    """All the constants of the submodules are available from the package"""
+    module = importlib.import_module(module_name)
+    lazy_names = {
+        name
+        for name, (lazy_module_name, _) in constants._LAZY_CONSTANTS.items()
+        if lazy_module_name == module_name
+    }
+    # the constants the submodule imports from the package are not its own
+    module_names = {
+        name
+        for name in vars(module)
+        if name[0].isupper() and (name in constants._LAZY_CONSTANTS or name not in vars(constants))
+    }
+    assert lazy_names == module_names
+    for name in lazy_names:
+        assert getattr(constants, name) is getattr(module, name)
+        assert name in dir(constants)
+
+
+def test_lazy_constants_on_first_access():
+    """The large tables and their imports are not loaded on import"""
+    code = (
+        'import sys\n'
+        'from robottelo import constants\n'
+        'assert "nailgun.entities" not in sys.modules\n'
+        'assert "robottelo.constants.permissions" not in sys.modules\n'
+        'from robottelo.constants import PERMISSIONS\n'
+        'assert "robottelo.constants.permissions" in sys.modules\n'
+        'assert vars(constants)["PERMISSIONS"] is PERMISSIONS\n'
+    )
+    subprocess.run([sys.executable, '-c', code], check=True)
+
+
+def test_unknown_constant():
+    with pytest.raises(AttributeError):
+        constants.UNKNOWN_CONSTANT
+    with pytest.raises(ImportError):
+        from robottelo.constants import UNKNOWN_CONSTANT  # noqa: F401
@@ -0,0 +1,215 @@
+import multiprocessing
+import os
+import signal
+import threading
+import time
+
+import pytest
+
+from robottelo.coordination import CoordinationClient
+from robottelo.coordination import CoordinationError
+from robottelo.coordination import CoordinationLockTimeout
+from robottelo.coordination import CoordinationServer
+from robottelo.coordination import close_clients
+from robottelo.coordination import get_client
+from robottelo.decorators import func_locker
+from robottelo.decorators import lease
+from robottelo.decorators.func_shared.coordination_storage import CoordinationStorageHandler
+from robottelo.decorators.func_shared.shared import _SharedFunction
+from robottelo.decorators.func_shared.shared import clear_local_cache
+
+TOKEN = 'unittest token'
+
+
+@pytest.fixture
+def server():
+    server = CoordinationServer(host='127.0.0.1', port=0, lease_timeout=1, token=TOKEN)
+    server.start_in_thread()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def client(server):
+    client = CoordinationClient(host='127.0.0.1', port=server.port, token=TOKEN)
+    yield client
+    client.close()
+
+
+def hold_lock(port, name, ready_event):
+    """Notify that the lock is acquired and hold it"""
+    client = CoordinationClient(host='127.0.0.1', port=port, token=TOKEN)
+    with client.lock(name):
+        ready_event.set()
+        time.sleep(60)
+
+
+def wait_lock(port, name):
+    CoordinationClient(host='127.0.0.1', port=port, token=TOKEN).lock(name).__enter__()
+
+
+@pytest.mark.parametrize('token', [None, 'wrong token'])
+def test_not_authenticated(server, token):
+    client = CoordinationClient(host='127.0.0.1', port=server.port, token=token)
+    for _ in range(2):
+        with pytest.raises(CoordinationError, match='not authenticated'):
+            client.get('key')
+
+
+def test_token_required():
+    with pytest.raises(ValueError):
+        CoordinationServer(host='127.0.0.1', port=0)
+
+
+def test_get_set(client):
+    assert client.get('key') is None
+    client.set('key', 'text value')
+    assert client.get('key') == 'text value'
+    client.set('key', b'\x00bytes value')
+    assert client.get('key') == b'\x00bytes value'
+
+
+def test_lock_exclusive(client):
+    with client.lock('name'):
+        with pytest.raises(CoordinationLockTimeout):
+            with client.lock('name', timeout=0.5):
+                pass
+        assert client.stats('name') == dict(holders=1, waiters=0)
+    with client.lock('name', timeout=0.5):
+        pass
+
+
+def test_lock_fifo(server, client):
+    """The waiters acquire the lock in the order they started to wait"""
+    order = []
+
+    def wait_lock(index):
+        client = CoordinationClient(host='127.0.0.1', port=server.port, token=TOKEN)
+        with client.lock('name', timeout=10):
+            order.append(index)
+
+    threads = []
+    with client.lock('name'):
+        for index in range(4):
+            thread = threading.Thread(target=wait_lock, args=(index,))
+            thread.start()
+            threads.append(thread)
+            while client.stats('name')['waiters'] <= index:
+                time.sleep(0.01)
+    for thread in threads:
+        thread.join(10)
+    assert order == [0, 1, 2, 3]
+
+
+def test_semaphore_capacity(client):
+    with client.lock('name', capacity=2):
+        with client.lock('name', capacity=2):
+            with pytest.raises(CoordinationLockTimeout):
+                with client.lock('name', capacity=2, timeout=0.5):
+                    pass
+
+
+@pytest.mark.parametrize('owner_signal', [signal.SIGKILL, signal.SIGSTOP], ids=['killed', 'hung'])
+def test_lock_owner_released(server, client, monkeypatch, owner_signal):
+    """The lock is released when its owner connection is closed or when its
+    owner stops refreshing its lease, and not before"""
+    monkeypatch.setattr(lease, 'HEARTBEAT_INTERVAL', 0.2)
+    ready_event = multiprocessing.Event()
+    owner = multiprocessing.Process(target=hold_lock, args=(server.port, 'name', ready_event))
+    owner.start()
+    try:
+        assert ready_event.wait(10)
+        with pytest.raises(CoordinationLockTimeout):
+            with client.lock('name', timeout=2):
+                pass
+        os.kill(owner.pid, owner_signal)
+        start = time.time()
+        with client.lock('name', timeout=10):
+            assert time.time() - start < 5
+    finally:
+        os.kill(owner.pid, signal.SIGKILL)
+        owner.join()
+
+
+def test_waiter_killed(server, client):
+    """A waiter leaves the queue when its connection is closed, the lock is
+    not granted to it"""
+    with client.lock('name'):
+        waiter = multiprocessing.Process(target=wait_lock, args=(server.port, 'name'))
+        waiter.start()
+        start = time.time()
+        while client.stats('name')['waiters'] < 1:
+            assert time.time() - start < 10
+            time.sleep(0.01)
+        os.kill(waiter.pid, signal.SIGKILL)
+        waiter.join()
+        while client.stats('name')['waiters']:
+            assert time.time() - start < 10
+            time.sleep(0.01)
+    assert client.stats('name') == dict(holders=0, waiters=0)
+
+
+def test_heartbeats_share_connection(client, monkeypatch):
+    """The lease heartbeats of all the held locks use one more connection"""
+    monkeypatch.setattr(lease, 'HEARTBEAT_INTERVAL', 0.05)
+    with client.lock('first'), client.lock('second'):
+        time.sleep(0.3)
+        assert len(client._opened) == 2
+    with client.lock('third'):
+        time.sleep(0.3)
+    assert len(client._opened) == 2
+    client.close()
+    assert client._opened == []
+    assert client.get('key') is None
+
+
+def test_shared_client(server):
+    """The storage handlers of the shared function calls share the client of
+    the process and its connections"""
+    storages = [
+        CoordinationStorageHandler(host='127.0.0.1', port=server.port, token=TOKEN)
+        for _ in range(3)
+    ]
+    try:
+        assert storages[0].client is get_client('127.0.0.1', server.port, TOKEN)
+        assert all(storage.client is storages[0].client for storage in storages)
+        for storage in storages:
+            storage.set('key', 'value')
+        assert len(storages[0].client._opened) == 1
+    finally:
+        close_clients()
+    assert storages[0].client._opened == []
+    assert get_client('127.0.0.1', server.port, TOKEN) is not storages[0].client
+    close_clients()
+
+
+def test_shared_function(server):
+    storage = CoordinationStorageHandler(
+        host='127.0.0.1', port=server.port, codec='pickle', token=TOKEN
+    )
+    calls = []
+
+    def function():
+        calls.append(1)
+        return {'id': len(calls)}
+
+    for _ in range(2):
+        # read the result from the server, not from the in process cache
+        clear_local_cache()
+        result = _SharedFunction('coordination.shared', function, storage_handler=storage)()
+        assert result == {'id': 1}
+    assert len(calls) == 1
+
+
+def test_func_locker_semaphore(client, monkeypatch):
+    monkeypatch.setattr(func_locker, 'COORDINATION_CLIENT', client)
+    monkeypatch.setattr(func_locker, '_coordination_configured', True)
+    with func_locker.semaphore('unittest_coordination', capacity=1, scope='scope'):
+        with pytest.raises(func_locker.FunctionLockerError):
+            with func_locker.semaphore(
+                'unittest_coordination', capacity=1, scope='scope', timeout=0.5
+            ):
+                pass
+        assert client.stats(os.path.join('scope', 'unittest_coordination.semaphore')) == dict(
+            holders=1, waiters=0
+        )
@@ -8,6 +8,47 @@ from unittest2 import SkipTest
 from robottelo import decorators
 
 
+def _class_name_decorator(func):
+    func.class_name = decorators.get_caller_class_name()
+    return func
+
+
+@_class_name_decorator
+def module_function():
+    pass
+
+
+class Outer:
+    @_class_name_decorator
+    def outer_method(self):
+        pass
+
+    class Inner:
+        @_class_name_decorator
+        def inner_method(self):
+            pass
+
+        class Deepest:
+            @_class_name_decorator
+            def deepest_method(self):
+                pass
+
+
+@pytest.mark.parametrize(
+    'function, class_name',
+    [
+        (module_function, ''),
+        (Outer.outer_method, 'Outer'),
+        (Outer.Inner.inner_method, 'Outer.Inner'),
+        (Outer.Inner.Deepest.deepest_method, 'Inner.Deepest'),
+    ],
+)
+def test_get_caller_class_name(function, class_name):
+    """The class names are those of the decorated function classes, at most
+    two of the innermost ones"""
+    assert function.class_name == class_name
+
+
 class TestCacheable:
     """Tests for :func:`robottelo.decorators.cacheable`."""
 
@@ -58,9 +99,15 @@ class TestSkipIfNotSet:
 
         mocked_settings_patcher.stop()
 
+    @pytest.fixture(autouse=True)
+    def features_set(self):
+        """Forget the features set by the previous tests"""
+        with mock.patch.dict(decorators._FEATURES_SET, generation=None, features={}):
+            yield
+
     def test_raise_skip_if_method(self, settings):
         """Skip a test method if configuration is missing."""
-        settings.clients.validate.side_effect = ['Validation error']
+        settings.get_feature_errors.side_effect = [['Validation error']]
 
         @decorators.skip_if_not_set('clients')
         def dummy():
@@ -71,7 +118,7 @@ class TestSkipIfNotSet:
 
     def test_raise_skip_if_setup(self, settings):
         """Skip setUp method if configuration is missing."""
-        settings.clients.validate.side_effect = ['Validation error']
+        settings.get_feature_errors.side_effect = [['Validation error']]
 
         class MyTestCase:
             @decorators.skip_if_not_set('clients')
@@ -84,7 +131,7 @@ class TestSkipIfNotSet:
 
     def test_raise_skip_if_setupclass(self, settings):
         """Skip setUpClass method if configuration is missing."""
-        settings.clients.validate.side_effect = ['Validation error']
+        settings.get_feature_errors.side_effect = [['Validation error']]
 
         class MyTestCase:
             @classmethod
@@ -97,7 +144,7 @@ class TestSkipIfNotSet:
 
     def test_not_raise_skip_if(self, settings):
         """Don't skip if configuration is available."""
-        settings.clients.validate.side_effect = [[]]
+        settings.get_feature_errors.side_effect = [[]]
 
         @decorators.skip_if_not_set('clients')
         def dummy():
@@ -115,7 +162,7 @@ class TestSkipIfNotSet:
 
     def test_configure_settings(self, settings):
         """Call settings.configure() if settings is not configured."""
-        settings.clients.validate.side_effect = [[]]
+        settings.get_feature_errors.side_effect = [[]]
         settings.configured = False
 
         @decorators.skip_if_not_set('clients')
@@ -125,6 +172,27 @@ class TestSkipIfNotSet:
         assert dummy() == 'ok'
         settings.configure.called_once_with()
 
+    def test_validated_once_per_generation(self, settings):
+        """The features are validated again only when configured again"""
+        settings.get_feature_errors.reset_mock()
+        settings.get_feature_errors.side_effect = [[], ['Validation error']]
+
+        @decorators.skip_if_not_set('clients')
+        def dummy():
+            return 'ok'
+
+        with mock.patch('robottelo.decorators.get_settings_generation', return_value=1):
+            for _ in range(3):
+                assert dummy() == 'ok'
+                assert decorators.setting_is_set('clients')
+        assert settings.get_feature_errors.call_count == 1
+        with mock.patch('robottelo.decorators.get_settings_generation', return_value=2):
+            for _ in range(3):
+                with pytest.raises(SkipTest):
+                    dummy()
+                assert not decorators.setting_is_set('clients')
+        assert settings.get_feature_errors.call_count == 2
+
 
 class TestHostSkipIf:
     """Tests for :func:`robottelo.decorators.host.skip_if_host_is` when host
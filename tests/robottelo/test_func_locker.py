@@ -1,11 +1,15 @@
+import contextlib
 import multiprocessing
 import os
+import signal
 import tempfile
 import time
 
 import pytest
+import zc.lockfile
 
 from robottelo.decorators import func_locker
+from robottelo.decorators import lease
 
 _this_module_name_string = 'tests.robottelo.test_func_locker'
 
@@ -185,6 +189,48 @@ def simple_scoped_locking_function():
     return None
 
 
+@func_locker.lock_function
+def simple_long_locked_function(ready_event):
+    """Notify that the lock is acquired and hold it"""
+    ready_event.set()
+    time.sleep(60)
+
+
+def _start_lock_owner():
+    """Start a process holding simple_long_locked_function lock"""
+    ready_event = multiprocessing.Event()
+    owner = multiprocessing.Process(target=simple_long_locked_function, args=(ready_event,))
+    owner.start()
+    assert ready_event.wait(10)
+    return owner
+
+
+def _hold_lock_without_pid(lock_file_path, ready_event):
+    """Hold the lock file as an owner that did not write its pid yet, the
+    file modification time is the one of an old release"""
+    lock_file = zc.lockfile.SimpleLockFile(lock_file_path)
+    old_time = time.time() - 3600
+    os.utime(lock_file_path, (old_time, old_time))
+    ready_event.set()
+    time.sleep(30)
+    lock_file.close()
+
+
+@func_locker.throttle('unittest_resource', capacity=2)
+def simple_throttled_function(index=None):
+    """Return the time interval of the function run"""
+    start = time.time()
+    time.sleep(0.2)
+    return start, time.time()
+
+
+@func_locker.lock_function(fair=True)
+def simple_fair_locked_function(index, order_file_path):
+    """Append the index to the order file"""
+    with open(order_file_path, 'a') as order_file:
+        order_file.write(f'{index}\n')
+
+
 def simple_function_not_locked():
     """This function do nothing, when called with locking, exception must be
     raised that this function is not locked
@@ -413,3 +459,156 @@ class TestFuncLocker:
         with pytest.raises(func_locker.FunctionLockerError, match=r'.*Cannot ensure locking.*'):
             with func_locker.locking_function(simple_function_not_locked):
                 pass
+
+    def test_lock_owner_killed(self):
+        """Ensure that the lock is acquired as soon as its owner is killed"""
+        owner = _start_lock_owner()
+        os.kill(owner.pid, signal.SIGKILL)
+        owner.join()
+        start = time.time()
+        with func_locker.locking_function(simple_long_locked_function, timeout=30):
+            assert time.time() - start < 5
+
+    def test_lock_owner_hung(self, monkeypatch):
+        """Ensure that the lock is taken over when its owner stops its lease
+        heartbeat, and not before
+        """
+        monkeypatch.setattr(lease, 'LEASE_TIMEOUT', 1)
+        monkeypatch.setattr(lease, 'HEARTBEAT_INTERVAL', 0.2)
+        owner = _start_lock_owner()
+        try:
+            with pytest.raises(zc.lockfile.LockError):
+                with func_locker.locking_function(simple_long_locked_function, timeout=2):
+                    pass
+            os.kill(owner.pid, signal.SIGSTOP)
+            start = time.time()
+            with func_locker.locking_function(simple_long_locked_function, timeout=30):
+                assert time.time() - start < 5
+        finally:
+            os.kill(owner.pid, signal.SIGKILL)
+            owner.join()
+
+    def test_lock_owner_without_pid(self, tmp_path):
+        """Ensure that the lock is not taken over while its new owner did not
+        write its pid, and is once the owner is hung past the lease timeout
+        """
+        lock_file_path = str(tmp_path / 'owner.lock')
+        ready_event = multiprocessing.Event()
+        owner = multiprocessing.Process(
+            target=_hold_lock_without_pid, args=(lock_file_path, ready_event)
+        )
+        owner.start()
+        try:
+            assert ready_event.wait(10)
+            start = time.time()
+            with pytest.raises(zc.lockfile.LockError):
+                with lease.file_lock(lock_file_path, timeout=0.5, lease_timeout=1):
+                    pass
+            with lease.file_lock(lock_file_path, timeout=10, lease_timeout=1):
+                assert time.time() - start >= 1
+        finally:
+            owner.kill()
+            owner.join()
+
+    def test_semaphore_in_multiprocess(self, count_and_pool):
+        """Ensure that no more than the semaphore capacity throttled functions
+        run at the same time in different processes
+        """
+        intervals = count_and_pool.map(simple_throttled_function, range(POOL_SIZE))
+        max_running = max(
+            sum(1 for start, end in intervals if start <= moment < end) for moment, _ in intervals
+        )
+        assert max_running == 2
+
+    def test_semaphore_timeout(self):
+        """Ensure that the semaphore is not acquired when all its slots are
+        held and that the wait time is recorded"""
+        with func_locker.semaphore('unittest_timeout', capacity=1):
+            with pytest.raises(func_locker.FunctionLockerError, match=r'.*not acquired.*'):
+                with func_locker.semaphore('unittest_timeout', capacity=1, timeout=1):
+                    pass
+        with func_locker.semaphore('unittest_timeout', capacity=1, timeout=1):
+            pass
+        wait_times = func_locker.get_semaphore_wait_times()['unittest_timeout']
+        assert wait_times['count'] == 2
+        assert wait_times['max'] < 1
+
+    def test_fair_lock_order(self, tmp_path):
+        """Ensure that the fair lock waiters acquire the lock in the order they
+        started to wait for it
+        """
+        order_file_path = str(tmp_path / 'order')
+        waiters = []
+        with func_locker.locking_function(simple_fair_locked_function, fair=True):
+            for index in range(4):
+                waiter = multiprocessing.Process(
+                    target=simple_fair_locked_function, args=(index, order_file_path)
+                )
+                waiter.start()
+                waiters.append(waiter)
+                start = time.time()
+                while func_locker.get_lock_queue_depth(simple_fair_locked_function) <= index:
+                    assert time.time() - start < 10
+                    time.sleep(0.05)
+        for waiter in waiters:
+            waiter.join(30)
+        with open(order_file_path) as order_file:
+            assert order_file.read().split() == ['0', '1', '2', '3']
+        assert func_locker.get_lock_queue_depth(simple_fair_locked_function) == 0
+
+    def test_ticket_taken_under_counter_lock(self, tmp_path, monkeypatch):
+        """Ensure that the ticket exists before the next one can be taken"""
+        queue_dir = str(tmp_path)
+        released_with = []
+        file_lock = func_locker.file_lock
+
+        @contextlib.contextmanager
+        def recorded_file_lock(*args, **kwargs):
+            with file_lock(*args, **kwargs) as handler:
+                yield handler
+                released_with.append(sorted(os.listdir(queue_dir)))
+
+        monkeypatch.setattr(func_locker, 'file_lock', recorded_file_lock)
+        first_ticket = func_locker._take_ticket(queue_dir, timeout=10)
+        second_ticket = func_locker._take_ticket(queue_dir, timeout=10)
+        assert first_ticket < second_ticket
+        for tickets, ticket_path in zip(released_with, [first_ticket, second_ticket]):
+            assert os.path.basename(ticket_path) in tickets
+
+    def test_fair_semaphore_timeout(self):
+        """Ensure that a fair semaphore waiter leaves the queue on timeout"""
+        with func_locker.semaphore('unittest_fair', capacity=1, fair=True):
+            with pytest.raises(func_locker.FunctionLockerError, match=r'.*not acquired.*'):
+                with func_locker.semaphore('unittest_fair', capacity=1, timeout=1, fair=True):
+                    pass
+            assert func_locker.get_semaphore_queue_depth('unittest_fair') == 0
+
+    def test_throttled_without_capacity(self, monkeypatch):
+        """Ensure that the operations of a resource class without a capacity
+        run without taking the semaphore"""
+        monkeypatch.setattr(func_locker, '_semaphore_capacity_configured', True)
+
+        def semaphore(*args, **kwargs):
+            raise AssertionError('the semaphore was taken')
+
+        monkeypatch.setattr(func_locker, 'semaphore', semaphore)
+        with func_locker.throttled('unittest_not_throttled') as handler:
+            assert handler is None
+
+    def test_throttled_with_capacity(self, monkeypatch):
+        """Ensure that the operations of a resource class with a capacity
+        take the semaphore"""
+        monkeypatch.setattr(func_locker, '_semaphore_capacity_configured', True)
+        monkeypatch.setitem(func_locker.SEMAPHORE_CAPACITY, 'unittest_throttled', 1)
+        with func_locker.throttled('unittest_throttled') as handler:
+            assert handler is not None
+            with pytest.raises(func_locker.FunctionLockerError, match=r'.*not acquired.*'):
+                with func_locker.throttled('unittest_throttled', timeout=1):
+                    pass
+
+    def test_manifest_upload_locked(self):
+        """Ensure that the manifest upload can be locked by the callers"""
+        from robottelo.manifests import upload_manifest_locked
+
+        with func_locker.locking_function(upload_manifest_locked, fair=True):
+            pass
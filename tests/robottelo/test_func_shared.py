@@ -1,17 +1,23 @@
 import multiprocessing
 import os
 import time
+import uuid
+from importlib import import_module
+from unittest import mock
 
 from fauxfactory import gen_integer
 from fauxfactory import gen_string
 from unittest2 import TestCase
 
+from robottelo.decorators.func_shared.file_storage import FileStorageHandler
 from robottelo.decorators.func_shared.file_storage import get_temp_dir
 from robottelo.decorators.func_shared.file_storage import TEMP_FUNC_SHARED_DIR
 from robottelo.decorators.func_shared.file_storage import TEMP_ROOT_DIR
 from robottelo.decorators.func_shared.shared import _NAMESPACE_SCOPE_KEY_TYPE
 from robottelo.decorators.func_shared.shared import _set_configured
+from robottelo.decorators.func_shared.shared import clear_local_cache
 from robottelo.decorators.func_shared.shared import enable_shared_function
+from robottelo.decorators.func_shared.shared import recipe_hash
 from robottelo.decorators.func_shared.shared import set_default_scope
 from robottelo.decorators.func_shared.shared import shared
 from robottelo.decorators.func_shared.shared import SharedFunctionException
@@ -20,6 +26,8 @@ DEFAULT_POOL_SIZE = 8
 SIMPLE_TIMEOUT_VALUE = 3
 
 _this_module_name = 'tests.robottelo.test_func_shared'
+# the package exports the shared decorator under the name of its module
+shared_module = import_module('robottelo.decorators.func_shared.shared')
 _set_configured(True)
 
 
@@ -140,6 +148,39 @@ def basic_shared_counter_string(prefix='', suffix='', counter=0, increment_by=1)
     return '{}_{}_{}'.format(prefix, counter + increment_by, suffix)
 
 
+@shared
+def simple_shared_counter_local_cache(index=0):
+    """a simple shared function that return a new list each time called"""
+    return {'indexes': [index]}
+
+
+@shared
+def simple_shared_counter_replaced(index=0):
+    """a simple shared function whose stored result is replaced"""
+    return {'index': index}
+
+
+def replace_stored_result(key, result):
+    """replace the stored result, like an other process running the shared
+    function again"""
+    storage = FileStorageHandler()
+    value = storage.get(key)
+    value.update(id=uuid.uuid4().hex, result=result)
+    storage.set(key, value)
+
+
+@shared
+def simple_shared_counter_lock_free(index=0):
+    """a simple shared function each time called increment index"""
+    return {'index': index + 1}
+
+
+@shared(function_kw=['recipe'])
+def shared_recipe_counter(index=0, recipe=None):
+    """a shared function keyed by a recipe hash"""
+    return index + 1
+
+
 class NotRestorableException(Exception):
     """ this exception is not restorable as need mote args"""
 
@@ -519,3 +560,77 @@ class FunctionSharedTestCase(TestCase):
                 suffix=suffix, prefix=prefix, counter=counter_value
             )
             self.assertEqual(inc_string, inc_string_2)
+
+    def test_recipe_function_kw(self):
+        """The same recipe shares the result whatever the order of its keys,
+        the recipe of another organization gets its own result
+        """
+        recipe = recipe_hash(org=1, loc=2, os='rhel7')
+        self.assertEqual(recipe, recipe_hash(os='rhel7', loc=2, org=1))
+        other_recipe = recipe_hash(org=2, loc=2, os='rhel7')
+        self.assertNotEqual(recipe, other_recipe)
+        counter_value = gen_integer(min_value=2, max_value=10000)
+        result = shared_recipe_counter(index=counter_value, recipe=recipe)
+        self.assertEqual(result, counter_value + 1)
+        self.assertEqual(
+            shared_recipe_counter(
+                index=counter_value + 10, recipe=recipe_hash(os='rhel7', loc=2, org=1)
+            ),
+            result,
+        )
+        self.assertEqual(
+            shared_recipe_counter(index=counter_value + 10, recipe=other_recipe),
+            counter_value + 11,
+        )
+
+    def test_local_cache(self):
+        """The ready results are read from the storage only once per process
+        and the cached results are not modified by the caller
+        """
+        counter_value = gen_integer(min_value=2, max_value=10000)
+        result = simple_shared_counter_local_cache(index=counter_value)
+        self.assertEqual(result, {'indexes': [counter_value]})
+        result['indexes'].append(0)
+        with mock.patch.object(FileStorageHandler, 'lock') as lock:
+            result = simple_shared_counter_local_cache(index=counter_value + 1)
+            self.assertEqual(result, {'indexes': [counter_value]})
+            self.assertFalse(lock.called)
+
+    def test_local_cache_replaced_result(self):
+        """The cached result is replaced once checked again against the
+        storage, when an other process stored a new result
+        """
+        counter_value = gen_integer(min_value=2, max_value=10000)
+        result = simple_shared_counter_replaced(index=counter_value)
+        self.assertEqual(result, {'index': counter_value})
+        key = '.'.join(
+            [
+                self.scope,
+                _NAMESPACE_SCOPE_KEY_TYPE,
+                _this_module_name,
+                'simple_shared_counter_replaced',
+            ]
+        )
+        self.pool.apply(replace_stored_result, (key, {'index': counter_value + 1}))
+        result = simple_shared_counter_replaced(index=counter_value)
+        self.assertEqual(result, {'index': counter_value})
+        with mock.patch.object(shared_module, 'LOCAL_CACHE_TIMEOUT', 0):
+            result = simple_shared_counter_replaced(index=counter_value)
+        self.assertEqual(result, {'index': counter_value + 1})
+        result = simple_shared_counter_replaced(index=counter_value)
+        self.assertEqual(result, {'index': counter_value + 1})
+
+    def test_ready_result_read_without_lock(self):
+        """The ready results are read from the storage without locking"""
+        counter_value = gen_integer(min_value=2, max_value=10000)
+        result = simple_shared_counter_lock_free(index=counter_value)
+        self.assertEqual(result, {'index': counter_value + 1})
+        clear_local_cache()
+        with mock.patch.object(FileStorageHandler, 'lock') as lock:
+            result = simple_shared_counter_lock_free(index=counter_value + 1)
+            self.assertEqual(result, {'index': counter_value + 1})
+            self.assertFalse(lock.called)
+        # the values are written atomically using temporary files
+        self.assertFalse(
+            [name for name in os.listdir(FileStorageHandler()._root_dir) if name.endswith('.tmp')]
+        )
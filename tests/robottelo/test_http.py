@@ -0,0 +1,73 @@
+"""Tests for module ``robottelo.http``."""
+import threading
+from http.server import BaseHTTPRequestHandler
+from http.server import HTTPServer
+
+import pytest
+
+from robottelo import http
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        body = b'ok'
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server_url():
+    server = HTTPServer(('127.0.0.1', 0), KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield 'http://127.0.0.1:{}'.format(server.server_address[1])
+    http.close_sessions()
+    server.shutdown()
+    server.server_close()
+
+
+class TestSharedSession:
+    """Tests for the shared sessions."""
+
+    def test_same_session_per_host(self, server_url):
+        assert http.get_session(f'{server_url}/a') is http.get_session(f'{server_url}/b?c=d')
+        assert http.get_session(server_url) is not http.get_session('http://localhost:1')
+
+    def test_connection_reused(self, server_url):
+        """Many requests to the same host open a single connection"""
+        for index in range(10):
+            response = http.get(f'{server_url}/{index}')
+            assert response.status_code == 200
+            assert response.content == b'ok'
+        stats = http.get_stats()[server_url]
+        assert stats['requests'] == 10
+        assert stats['connections'] == 1
+
+    def test_close_sessions(self, server_url):
+        session = http.get_session(server_url)
+        http.get(server_url)
+        http.close_sessions()
+        assert http.get_stats() == {}
+        assert http.get_session(server_url) is not session
+
+    def test_pool_maxsize(self, server_url):
+        """The pools keep a connection per thread of the worker"""
+        assert http.POOL_MAXSIZE == http.BULK_MAX_WORKERS + http.CLEANUP_MAX_WORKERS + 2
+        adapter = http.get_session(server_url).get_adapter(server_url)
+        assert adapter.poolmanager.connection_pool_kw['maxsize'] == http.POOL_MAXSIZE
+
+    def test_stats_without_pools(self, server_url, monkeypatch):
+        """The requests are still counted when the pools cannot be read"""
+        http.get(server_url)
+        adapter = http.get_session(server_url).get_adapter(server_url)
+        monkeypatch.setattr(adapter.poolmanager, 'pools', object())
+        stats = http.get_stats()[server_url]
+        assert stats['requests'] == 1
+        assert stats['connections'] is None
@@ -0,0 +1,48 @@
+"""Tests for module ``robottelo.utils.lazy``."""
+import sys
+
+import pytest
+
+from robottelo.utils.lazy import LazyImport
+
+MODULE_NAME = 'robottelo_lazy_import_test_module'
+
+
+@pytest.fixture
+def lazy_module(tmp_path, monkeypatch):
+    (tmp_path / f'{MODULE_NAME}.py').write_text(
+        'class Command:\n'
+        '    command_base = "command"\n'
+        '    def __init__(self, name):\n'
+        '        self.name = name\n'
+        '    @classmethod\n'
+        '    def info(cls, options):\n'
+        '        return dict(options, command=cls.command_base)\n'
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield
+    sys.modules.pop(MODULE_NAME, None)
+
+
+def test_lazy_import_on_first_use(lazy_module):
+    Command = LazyImport(MODULE_NAME, 'Command')
+    assert MODULE_NAME not in sys.modules
+    assert Command.info({'id': 1}) == {'id': 1, 'command': 'command'}
+    assert MODULE_NAME in sys.modules
+    assert Command.__name__ == 'Command'
+    assert Command('name').name == 'name'
+    assert isinstance(Command('name'), sys.modules[MODULE_NAME].Command)
+
+
+def test_lazy_import_module(lazy_module):
+    module = LazyImport(MODULE_NAME)
+    assert MODULE_NAME not in sys.modules
+    assert module.Command.command_base == 'command'
+
+
+def test_lazy_import_error(lazy_module):
+    Command = LazyImport(MODULE_NAME, 'Unknown')
+    with pytest.raises(AttributeError):
+        Command.info({})
+    with pytest.raises(ImportError):
+        LazyImport('robottelo_unknown_module', 'Command').info({})
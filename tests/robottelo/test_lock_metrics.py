@@ -0,0 +1,91 @@
+import os
+
+import pytest
+
+from robottelo.decorators import func_locker
+from robottelo.decorators import lock_metrics
+
+NAMESPACE_SCOPE = 'lock_metrics_unittest_scope'
+
+
+@func_locker.lock_function(scope=NAMESPACE_SCOPE)
+def simple_locked_function():
+    return None
+
+
+@pytest.fixture(autouse=True)
+def metrics_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(lock_metrics, 'METRICS_FILE_PATH', str(tmp_path / 'lock_metrics.jsonl'))
+
+
+def _entry(name, wait, hold, test, kind='lock'):
+    return dict(
+        name=name, kind=kind, scope_path='/tmp', pid=1, test=test, wait=wait, hold=hold, time=0
+    )
+
+
+def test_lock_function_recorded():
+    simple_locked_function()
+    with func_locker.locking_function(simple_locked_function, scope=NAMESPACE_SCOPE):
+        pass
+    with func_locker.semaphore('unittest_metrics', capacity=1, scope=NAMESPACE_SCOPE):
+        pass
+    entries = lock_metrics.read()
+    assert [(entry['kind'], entry['name']) for entry in entries] == [
+        ('lock', 'tests.robottelo.test_lock_metrics.simple_locked_function'),
+        ('lock', 'tests.robottelo.test_lock_metrics.simple_locked_function'),
+        ('semaphore', 'unittest_metrics'),
+    ]
+    for entry in entries:
+        assert entry['scope_path'].endswith(NAMESPACE_SCOPE)
+        assert entry['test'] == (
+            'tests/robottelo/test_lock_metrics.py::test_lock_function_recorded'
+        )
+    lock_metrics.reset()
+    assert lock_metrics.read() == []
+
+
+def test_summarize():
+    entries = [
+        _entry('a', wait=1, hold=5, test='test_a1'),
+        _entry('a', wait=2, hold=7, test='test_a2'),
+        _entry('b', wait=10, hold=1, test='test_b'),
+        _entry('a', wait=0, hold=1, test='test_a3', kind='semaphore'),
+    ]
+    summary = lock_metrics.summarize(entries)
+    assert [(lock['kind'], lock['name']) for lock in summary] == [
+        ('lock', 'b'),
+        ('lock', 'a'),
+        ('semaphore', 'a'),
+    ]
+    lock_a = summary[1]
+    assert lock_a['count'] == 2
+    assert lock_a['total_wait'] == 3
+    assert lock_a['max_wait'] == 2
+    assert lock_a['max_hold'] == 7
+    assert lock_a['max_hold_test'] == 'test_a2'
+    report = lock_metrics.report(entries, size=1)
+    assert report.splitlines() == [
+        'worker-seconds lost waiting for locks: 13.0',
+        'lock b: 1 acquisitions, waited 10.0s (max 10.0s), longest hold 1.0s by test_b',
+    ]
+
+
+def test_session_file(monkeypatch):
+    """The metrics of a session are recorded to its own file, removed at the
+    end of the session"""
+    monkeypatch.setattr(lock_metrics, 'METRICS_FILE_PATH', None)
+    monkeypatch.delenv(lock_metrics.SESSION_ENV, raising=False)
+    lock_metrics.start_session()
+    try:
+        path = lock_metrics.get_metrics_file_path()
+        assert path.endswith(f'lock_metrics_{os.getpid()}.jsonl')
+        lock_metrics.record('unittest_session', '/tmp', 0, 0)
+        monkeypatch.setenv(lock_metrics.SESSION_ENV, 'other')
+        assert lock_metrics.read() == []
+        monkeypatch.setenv(lock_metrics.SESSION_ENV, str(os.getpid()))
+        assert [entry['name'] for entry in lock_metrics.read()] == ['unittest_session']
+    finally:
+        lock_metrics.end_session()
+    assert not os.path.exists(path)
+    assert lock_metrics.SESSION_ENV not in os.environ
@@ -0,0 +1,202 @@
+"""Tests for module ``robottelo.manifests``."""
+import io
+import json
+import struct
+import threading
+import zipfile
+from concurrent.futures import Future
+
+import pytest
+from cryptography.hazmat.backends import default_backend
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import padding
+from cryptography.hazmat.primitives.asymmetric import rsa
+
+from robottelo.manifests import ManifestCloner
+from robottelo.manifests import ManifestPool
+
+CONSUMER = dict(uuid='template', owner=dict(key='template'), contentAccessMode='entitlement')
+ENTRIES = {
+    'export/meta.json': b'{"version": "6.9"}',
+    'export/consumer.json': json.dumps(CONSUMER).encode(),
+    'export/entitlement_certificates/1.pem': b'certificate 1\n' * 100,
+    'export/entitlement_certificates/2.pem': b'certificate 2\n' * 100,
+    'export/entitlement_certificates/é.pem': b'certificate 3\n' * 100,
+}
+# an extended timestamp extra field
+EXTRA_FIELD = struct.pack('<2HBL', 0x5455, 5, 1, 1600000000)
+
+
+class Unseekable(io.RawIOBase):
+    def __init__(self):
+        self.content = io.BytesIO()
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        return self.content.write(data)
+
+
+def make_template(compress_type, seekable=True, force_zip64=False, extra=b''):
+    """Return a template manifest, its entries written with data descriptors
+    to an unseekable file, as java does"""
+    consumer_export = io.BytesIO() if seekable else Unseekable()
+    with zipfile.ZipFile(consumer_export, 'w', compress_type) as consumer_export_zip:
+        for name, content in ENTRIES.items():
+            info = zipfile.ZipInfo(name, (2021, 1, 2, 3, 4, 6))
+            info.compress_type = compress_type
+            info.extra = extra
+            with consumer_export_zip.open(info, 'w', force_zip64=force_zip64) as entry:
+                entry.write(content)
+    if not seekable:
+        consumer_export = consumer_export.content
+    template = io.BytesIO()
+    with zipfile.ZipFile(template, 'w', zipfile.ZIP_DEFLATED) as template_zip:
+        template_zip.writestr('consumer_export.zip', consumer_export.getvalue())
+        template_zip.writestr('signature', b'signature')
+    return template.getvalue()
+
+
+@pytest.fixture(scope='module')
+def private_key():
+    return rsa.generate_private_key(
+        public_exponent=65537, key_size=2048, backend=default_backend()
+    )
+
+
+@pytest.mark.parametrize(
+    'compress_type, template_options',
+    [
+        (zipfile.ZIP_STORED, {}),
+        (zipfile.ZIP_DEFLATED, {}),
+        (zipfile.ZIP_DEFLATED, dict(seekable=False)),
+        (zipfile.ZIP_DEFLATED, dict(force_zip64=True)),
+        (zipfile.ZIP_DEFLATED, dict(extra=EXTRA_FIELD)),
+    ],
+    ids=['stored', 'deflated', 'data_descriptors', 'zip64', 'extra_field'],
+)
+def test_clone(private_key, compress_type, template_options):
+    template = make_template(compress_type, **template_options)
+    with zipfile.ZipFile(io.BytesIO(template)) as template_zip:
+        template_export = template_zip.read('consumer_export.zip')
+    with zipfile.ZipFile(io.BytesIO(template_export)) as template_export_zip:
+        template_infos = {info.filename: info for info in template_export_zip.infolist()}
+    cloner = ManifestCloner(
+        template={'default': template},
+        private_key=private_key,
+        signing_key=b'signing key',
+    )
+    uuids = set()
+    for org_environment_access in (False, True, False):
+        with zipfile.ZipFile(cloner.clone(org_environment_access)) as manifest_zip:
+            assert manifest_zip.testzip() is None
+            consumer_export = manifest_zip.read('consumer_export.zip')
+            private_key.public_key().verify(
+                manifest_zip.read('signature'),
+                consumer_export,
+                padding.PKCS1v15(),
+                hashes.SHA256(),
+            )
+        with zipfile.ZipFile(io.BytesIO(consumer_export)) as consumer_export_zip:
+            assert consumer_export_zip.testzip() is None
+            assert consumer_export_zip.namelist() == list(ENTRIES)
+            for info in consumer_export_zip.infolist():
+                assert info.compress_type == compress_type
+                if info.filename != 'export/consumer.json':
+                    assert consumer_export_zip.read(info) == ENTRIES[info.filename]
+                    template_info = template_infos[info.filename]
+                    for attribute in ('date_time', 'flag_bits', 'CRC', 'extra', 'external_attr'):
+                        assert getattr(info, attribute) == getattr(template_info, attribute)
+            consumer = json.loads(consumer_export_zip.read('export/consumer.json'))
+        uuids.add(consumer.pop('uuid'))
+        if org_environment_access:
+            assert consumer == dict(
+                owner=dict(key='template', contentAccessModeList='entitlement,org_environment'),
+                contentAccessMode='org_environment',
+            )
+        else:
+            assert consumer == dict(owner=dict(key='template'), contentAccessMode='entitlement')
+    assert len(uuids) == 3
+
+
+class FakeCloner:
+    """Return numbered clones"""
+
+    def __init__(self):
+        self.clones = []
+
+    def clone(self, org_environment_access=False, name='default'):
+        self.clones.append((name, org_environment_access))
+        return io.BytesIO(f'{name} {org_environment_access} {len(self.clones)}'.encode())
+
+
+def wait_ready(pool, ready):
+    for clones in pool._clones.values():
+        for clone in list(clones)[:ready]:
+            clone.result()
+
+
+def test_pool_hits_and_misses():
+    cloner = FakeCloner()
+    pool = ManifestPool(cloner, size=2)
+    # the first clone is generated by the caller
+    assert pool.get().read() == b'default False 1'
+    assert pool.stats()['misses'] == 1
+    wait_ready(pool, 2)
+    assert pool.stats() == dict(hits=0, misses=1, ready=2)
+    assert pool.get().read() == b'default False 2'
+    assert pool.get().read() == b'default False 3'
+    assert pool.hits == 2
+
+
+def test_pool_clone_in_progress():
+    """A clone still in progress is waited for"""
+    pool = ManifestPool(FakeCloner(), size=0)
+    clone = Future()
+    pool._clones['default', False].append(clone)
+    threading.Timer(0.1, clone.set_result, [io.BytesIO(b'in progress')]).start()
+    assert pool.get().read() == b'in progress'
+    assert pool.stats() == dict(hits=0, misses=1, ready=0)
+
+
+def test_pool_by_name_and_flag():
+    cloner = FakeCloner()
+    pool = ManifestPool(cloner, size=1)
+    assert pool.get(org_environment_access=True).read() == b'default True 1'
+    assert pool.get(name='golden_ticket').read().startswith(b'golden_ticket False')
+    wait_ready(pool, 1)
+    assert set(pool._clones) == {('default', True), ('golden_ticket', False)}
+    assert pool.get(org_environment_access=True).read().startswith(b'default True')
+    assert pool.hits == 1
+
+
+def test_pool_disabled():
+    cloner = FakeCloner()
+    pool = ManifestPool(cloner, size=0)
+    pool.get()
+    pool.get()
+    assert len(cloner.clones) == 2
+    assert pool.stats() == dict(hits=0, misses=2, ready=0)
+
+
+def test_pool_background_failure():
+    """A failed background clone is generated again by the caller"""
+    cloner = FakeCloner()
+    pool = ManifestPool(cloner, size=1)
+    pool.get()
+    wait_ready(pool, 1)
+    pool._clones['default', False][0].result = lambda: 1 / 0
+    assert pool.get().read() == b'default False 3'
+
+
+def test_pool_close():
+    cloner = FakeCloner()
+    pool = ManifestPool(cloner, size=2)
+    pool.get()
+    pool.close()
+    assert pool.stats() == dict(hits=0, misses=1, ready=0)
+    assert pool._executor is None
+    # the pool is not filled anymore
+    assert pool.get().read().startswith(b'default False')
+    assert pool.stats() == dict(hits=0, misses=2, ready=0)
@@ -8,3 +8,33 @@ def test_share_timetout_validation():
     shared_function_settings.storage = 'file'
     shared_function_settings.storage = 'file'
     assert [] == shared_function_settings.validate()
+
+
+def test_facade_section_loader():
+    """Assert a section is loaded once, before its first read"""
+    from types import SimpleNamespace
+
+    from robottelo.config.facade import SettingsFacade
+
+    class Facade(SettingsFacade):
+        _cache = {}
+
+    loaded = []
+    Facade.set_configs(SimpleNamespace(server=SimpleNamespace(hostname='example.com', port=443)))
+    Facade.set_section_loader(loaded.append)
+    facade = Facade()
+    assert loaded == []
+    assert facade.get('server.hostname') == 'example.com'
+    assert facade.get('server.port') == 443
+    assert facade.get('server.hostname') == 'example.com'
+    assert loaded == ['server']
+
+
+def test_settings_generation():
+    """Assert the settings generation changes when the settings are compiled again"""
+    from robottelo.config import compile_settings
+    from robottelo.config import get_settings_generation
+
+    generation = get_settings_generation()
+    compile_settings()
+    assert get_settings_generation() != generation
@@ -0,0 +1,56 @@
+"""Tests for plugin ``pytest_plugins.settings_snapshot``."""
+import os
+import subprocess
+import sys
+from unittest import mock
+
+import execnet
+
+from pytest_plugins.settings_snapshot import SNAPSHOT_DIR_ENV
+from robottelo.config.base import get_project_root
+from robottelo.config.base import Settings
+from tests.robottelo.test_config_settings import get_valid_ini
+
+# imports the plugins in the conftest order, like a xdist worker does before
+# its pytest_configure. api_fixtures and the modules it imports read the
+# settings when imported.
+WORKER_SCRIPT = '''
+from robottelo.config.base import Settings
+
+
+def configure(self, *args, **kwargs):
+    raise AssertionError('the legacy settings were configured')
+
+
+Settings.configure = configure
+
+import pytest_plugins.settings_snapshot
+import pytest_fixtures.api_fixtures
+
+from robottelo.config import settings
+
+print(settings.server.hostname)
+'''
+
+
+def test_worker_never_configures(tmp_path):
+    """A worker imports the plugins with the settings of the controller
+    snapshot, it does not read the settings files"""
+    with mock.patch('builtins.open', new_callable=lambda: get_valid_ini):
+        with mock.patch('os.path.isfile', return_value=True):
+            legacy_settings = Settings()
+            legacy_settings.configure()
+    snapshot = dict(dynaconf={}, legacy=legacy_settings.to_dict())
+    overrides = {'server.hostname': 'gw0.example.com'}
+    (tmp_path / 'gw0').write_bytes(execnet.dumps((snapshot, overrides)))
+    env = dict(os.environ, PYTEST_XDIST_WORKER='gw0', **{SNAPSHOT_DIR_ENV: str(tmp_path)})
+    result = subprocess.run(
+        [sys.executable, '-c', WORKER_SCRIPT],
+        cwd=get_project_root(),
+        env=env,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.splitlines()[-1] == 'gw0.example.com'
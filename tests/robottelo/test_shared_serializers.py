@@ -0,0 +1,132 @@
+import os
+
+import pytest
+
+from robottelo.decorators.func_shared import serializers
+from robottelo.decorators.func_shared.file_storage import FileStorageHandler
+from robottelo.decorators.func_shared.sqlite_storage import SQLiteStorageHandler
+
+VALUE = dict(
+    state='READY',
+    result={'hosts': [{'id': index, 'name': f'host{index}'} for index in range(100)]},
+)
+
+CODECS = ['json', 'json+zlib', 'pickle', 'pickle+zlib']
+if serializers.msgpack is not None:
+    CODECS.append('msgpack')
+if serializers.lz4 is not None:
+    CODECS.append('pickle+lz4')
+
+
+@pytest.mark.parametrize('codec_name', CODECS)
+@pytest.mark.parametrize('out_of_line_threshold', [0, None], ids=['out_of_line', 'inline'])
+def test_encode_decode(tmp_path, codec_name, out_of_line_threshold):
+    codec = serializers.Codec(
+        codec_name, out_of_line_dir=str(tmp_path), out_of_line_threshold=out_of_line_threshold
+    )
+    encoded = codec.encode(VALUE)
+    assert codec.decode(encoded) == VALUE
+    # an handler with an other codec can decode the value, unless pickled
+    other_codec = serializers.Codec(out_of_line_dir=str(tmp_path))
+    if codec_name.startswith('pickle'):
+        with pytest.raises(serializers.CodecError):
+            other_codec.decode(encoded)
+    else:
+        assert other_codec.decode(encoded) == VALUE
+    assert bool(os.listdir(tmp_path)) == (out_of_line_threshold == 0)
+
+
+@pytest.mark.parametrize('codec_name', ['json', 'json+zlib'])
+def test_pickle_refused(codec_name, monkeypatch):
+    """A pickled value is never unpickled by a handler not configured to
+    pickle, whatever its header"""
+    encoded = serializers.Codec('pickle').encode(VALUE)
+    dumps, _ = serializers._serializers['pickle']
+    monkeypatch.setitem(serializers._serializers, 'pickle', (dumps, pytest.fail))
+    with pytest.raises(serializers.CodecError, match='refused'):
+        serializers.Codec(codec_name).decode(encoded)
+
+
+def test_json_encoded_as_text():
+    """The default codec values are plain json, as stored before the codecs"""
+    codec = serializers.Codec()
+    assert codec.encode({'a': 1}) == '{"a": 1}'
+    assert codec.decode('{"a": 1}') == {'a': 1}
+    assert codec.decode(b'{"a": 1}') == {'a': 1}
+
+
+def test_compression_metrics():
+    serializers.reset_metrics()
+    codec = serializers.Codec('json+zlib')
+    codec.decode(codec.encode(VALUE))
+    metrics = serializers.get_metrics()
+    assert metrics['encoded'] == metrics['decoded'] == 1
+    assert metrics['stored_bytes'] < metrics['serialized_bytes']
+
+
+def test_unknown_codec():
+    with pytest.raises(serializers.CodecError):
+        serializers.Codec('yaml')
+    with pytest.raises(serializers.CodecError):
+        serializers.Codec('json+bz3')
+
+
+def test_out_of_line_not_readable(tmp_path):
+    """A value stored out of line is not readable by an handler without
+    access to the out of line directory"""
+    encoded = serializers.Codec(out_of_line_dir=str(tmp_path), out_of_line_threshold=0).encode(
+        VALUE
+    )
+    with pytest.raises(serializers.CodecError):
+        serializers.Codec().decode(encoded)
+
+
+@pytest.mark.parametrize('handler_class', [FileStorageHandler, SQLiteStorageHandler])
+def test_storage_handler_codec(tmp_path, monkeypatch, handler_class):
+    monkeypatch.setattr(serializers, 'OUT_OF_LINE_THRESHOLD', 1024)
+    if handler_class is FileStorageHandler:
+        handler = handler_class(root_dir=str(tmp_path), codec='pickle+zlib')
+    else:
+        handler = handler_class(db_path=str(tmp_path / 'shared.sqlite'), codec='pickle+zlib')
+    small_value = dict(state='READY', result=1)
+    large_value = dict(state='READY', result=os.urandom(4096).hex())
+    handler.set('small', small_value)
+    handler.set('large', large_value)
+    assert handler.get('small') == small_value
+    assert handler.get('large') == large_value
+    assert len(os.listdir(tmp_path / '.out_of_line')) == 1
+
+
+@pytest.mark.parametrize('handler_class', [FileStorageHandler, SQLiteStorageHandler])
+def test_out_of_line_removed_with_value(tmp_path, monkeypatch, handler_class):
+    """The out of line file of a value is removed when the value is replaced"""
+    monkeypatch.setattr(serializers, 'OUT_OF_LINE_THRESHOLD', 0)
+    if handler_class is FileStorageHandler:
+        handler = handler_class(root_dir=str(tmp_path))
+    else:
+        handler = handler_class(db_path=str(tmp_path / 'shared.sqlite'))
+    out_of_line_dir = tmp_path / '.out_of_line'
+    for result in range(3):
+        handler.set('key', dict(state='READY', result=result))
+        assert handler.get('key') == dict(state='READY', result=result)
+        assert len(os.listdir(out_of_line_dir)) == 1
+    # the same value stored by two keys is stored in two files
+    handler.set('other_key', dict(state='READY', result=2))
+    assert len(os.listdir(out_of_line_dir)) == 2
+
+
+@pytest.mark.parametrize('delete', ['expire', 'purge'])
+def test_out_of_line_removed_with_entries(tmp_path, monkeypatch, delete):
+    """The out of line files of the expired and purged entries are removed"""
+    monkeypatch.setattr(serializers, 'OUT_OF_LINE_THRESHOLD', 0)
+    handler = SQLiteStorageHandler(db_path=str(tmp_path / 'shared.sqlite'))
+    for key in ('scope.a', 'scope.b', 'other'):
+        handler.set(key, dict(state='READY', result=1))
+    assert len(os.listdir(tmp_path / '.out_of_line')) == 3
+    if delete == 'expire':
+        assert handler.expire(-1) == 3
+        assert os.listdir(tmp_path / '.out_of_line') == []
+    else:
+        assert handler.purge('scope.*') == 2
+        assert len(os.listdir(tmp_path / '.out_of_line')) == 1
+        assert handler.get('other') == dict(state='READY', result=1)
@@ -0,0 +1,107 @@
+"""Tests for module ``robottelo.decorators.func_shared.sqlite_storage``."""
+import multiprocessing
+import os
+import signal
+import sys
+import time
+
+import pytest
+
+from robottelo.decorators.func_shared import sqlite_storage
+from robottelo.decorators.func_shared.shared import _set_configured
+from robottelo.decorators.func_shared.shared import clear_local_cache
+from robottelo.decorators.func_shared.shared import enable_shared_function
+from robottelo.decorators.func_shared.shared import shared
+from robottelo.decorators.func_shared.sqlite_storage import SQLiteLockTimeout
+from robottelo.decorators.func_shared.sqlite_storage import SQLiteStorageHandler
+
+_set_configured(True)
+# the package exports the shared decorator with the same name as the module
+shared_module = sys.modules['robottelo.decorators.func_shared.shared']
+
+
+@shared
+def sqlite_shared_counter(index=0):
+    """a simple shared function that return the calling process pid"""
+    return {'index': index + 1, 'pid': os.getpid()}
+
+
+def hold_lock(db_path, ready_event):
+    """Acquire the lock of key and hold it"""
+    with SQLiteStorageHandler(db_path=db_path).lock('key'):
+        ready_event.set()
+        time.sleep(60)
+
+
+@pytest.fixture
+def db_path(tmpdir):
+    return str(tmpdir.join('shared.sqlite'))
+
+
+@pytest.fixture
+def handler(db_path):
+    return SQLiteStorageHandler(db_path=db_path, lock_timeout=0.5)
+
+
+@pytest.fixture
+def sqlite_shared(db_path, monkeypatch):
+    monkeypatch.setattr(sqlite_storage, 'DB_PATH', db_path)
+    monkeypatch.setattr(shared_module, 'DEFAULT_STORAGE_HANDLER', 'sqlite')
+    enable_shared_function(True)
+    clear_local_cache()
+    yield
+    clear_local_cache()
+
+
+class TestSQLiteStorageHandler:
+    def test_get_set(self, handler):
+        assert handler.get('key') is None
+        handler.set('key', {'state': 'READY', 'result': [1, 2]})
+        assert handler.get('key') == {'state': 'READY', 'result': [1, 2]}
+        assert SQLiteStorageHandler(db_path=handler._db_path).get('key')['result'] == [1, 2]
+
+    def test_lock_is_exclusive(self, handler, db_path):
+        other_handler = SQLiteStorageHandler(db_path=db_path, lock_timeout=0.5)
+        with handler.lock('key'):
+            assert handler.items()[0]['owner_pid'] == os.getpid()
+            with pytest.raises(SQLiteLockTimeout):
+                with other_handler.lock('key'):
+                    pass
+        with other_handler.lock('key'):
+            pass
+        assert handler.items()[0]['owner_pid'] is None
+
+    def test_lock_owner_killed(self, handler, db_path):
+        ready_event = multiprocessing.Event()
+        owner = multiprocessing.Process(target=hold_lock, args=(db_path, ready_event))
+        owner.start()
+        assert ready_event.wait(10)
+        assert handler.items()[0]['owner_pid'] == owner.pid
+        os.kill(owner.pid, signal.SIGKILL)
+        owner.join()
+        with handler.lock('key', timeout=5):
+            assert handler.items()[0]['owner_pid'] == os.getpid()
+
+    def test_items_expire_purge(self, handler):
+        for key in ('scope.a', 'scope.b', 'other.c'):
+            handler.set(key, {'state': 'READY'})
+        assert [item['key'] for item in handler.items('scope.*')] == ['scope.a', 'scope.b']
+        assert handler.items('scope.a')[0]['state'] == 'READY'
+        assert handler.expire(3600) == 0
+        with handler.lock('scope.a'):
+            # locked entries are never deleted
+            assert handler.expire(-1) == 2
+        assert handler.purge('scope.*') == 1
+        assert handler.items() == []
+
+    def test_shared_function(self, sqlite_shared):
+        result = sqlite_shared_counter(index=1)
+        assert result['index'] == 2
+        clear_local_cache()
+        assert sqlite_shared_counter(index=10) == result
+
+    def test_shared_function_multiprocess(self, sqlite_shared):
+        with multiprocessing.Pool(4) as pool:
+            results = pool.map(sqlite_shared_counter, range(8))
+        assert len({result['pid'] for result in results}) == 1
+        assert len({result['index'] for result in results}) == 1